@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Parser throughput benchmark.
+
+Replays the recorded Claude Code panes in features/parser/claude_code/panes/
+and synthetic multi-MB scrollbacks through every parser, timing is_ready(),
+parse() and incremental parsing (feed() in 4KB chunks with an is_ready()
+check per chunk, then result()).
+
+For each case it reports throughput in MB/s and the peak memory allocated
+by one operation. Results can be saved as a baseline; later runs compared
+against it fail (exit 1) when any case is slower than the baseline by more
+than the threshold.
+
+Run with: uv run python features/parser/benchmark.py
+          uv run python features/parser/benchmark.py --save-baseline
+          uv run python features/parser/benchmark.py --sizes 1 10 50 --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from nerve.core.parsers import ClaudeCodeParser, GeminiParser, NoneParser, Parser
+
+PANES_DIR = Path(__file__).parent / "claude_code" / "panes"
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+
+PARSERS: dict[str, Callable[[], Parser]] = {
+    "claude_code": ClaudeCodeParser,
+    "gemini": GeminiParser,
+    "none": NoneParser,
+}
+
+# Chunk size used to replay output into incremental parsers
+CHUNK_SIZE = 4096
+
+MB = 1024 * 1024
+
+
+def load_panes() -> dict[str, str]:
+    """Load the recorded panes, keyed by file stem."""
+    return {path.stem: path.read_text() for path in sorted(PANES_DIR.glob("pane_*.txt"))}
+
+
+def synthetic_scrollback(panes: dict[str, str], size_mb: int) -> str:
+    """Build a scrollback of about size_mb MB from many turns.
+
+    Each recorded pane becomes one turn: its prompt/status footer is dropped
+    and a user prompt is placed before it, so the parsers see a long history
+    followed by the last (complete) pane.
+    """
+    target = size_mb * MB
+    bodies = [_strip_footer(content) for content in panes.values()]
+    last = list(panes.values())[-1]
+
+    turns: list[str] = []
+    size = len(last.encode())
+    turn = 0
+    while size < target:
+        body = f"> turn {turn}\n\n{bodies[turn % len(bodies)]}\n"
+        turns.append(body)
+        size += len(body.encode())
+        turn += 1
+
+    return "".join(turns) + f"> turn {turn}\n\n" + last
+
+
+def _strip_footer(content: str) -> str:
+    """Drop the trailing prompt/status area of a pane."""
+    lines = content.rstrip("\n").split("\n")
+    for i in range(len(lines) - 1, -1, -1):
+        if lines[i].startswith("─"):
+            end = i
+            while end > 0 and lines[end - 1].startswith("─"):
+                end -= 1
+            return "\n".join(lines[:end])
+    return content
+
+
+def _run_incremental(parser: Parser, content: str) -> None:
+    state = parser.incremental()
+    for i in range(0, len(content), CHUNK_SIZE):
+        state.feed(content[i : i + CHUNK_SIZE])
+        state.is_ready()
+    state.result()
+
+
+OPERATIONS: dict[str, Callable[[Parser, str], object]] = {
+    "is_ready": lambda parser, content: parser.is_ready(content),
+    "parse": lambda parser, content: parser.parse(content),
+    "incremental": _run_incremental,
+}
+
+
+def measure(
+    fn: Callable[[], object], nbytes: int, min_time: float, min_rounds: int
+) -> dict[str, float]:
+    """Time fn repeatedly, then measure its peak allocation once.
+
+    Returns:
+        Dict with median seconds per call, MB/s and peak KB allocated.
+    """
+    fn()  # Warm up
+
+    timings: list[float] = []
+    started = time.perf_counter()
+    while len(timings) < min_rounds or time.perf_counter() - started < min_time:
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+
+    # Allocation tracking slows execution, so it is measured separately
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "seconds": median,
+        "mb_per_s": (nbytes / MB) / median if median > 0 else float("inf"),
+        "peak_kb": peak / 1024,
+        "rounds": len(timings),
+    }
+
+
+def run(
+    corpora: dict[str, str], parsers: list[str], min_time: float, min_rounds: int
+) -> dict[str, dict[str, float]]:
+    """Run every (parser, operation, corpus) case.
+
+    Returns:
+        Results keyed by "parser/operation/corpus".
+    """
+    results: dict[str, dict[str, float]] = {}
+    for parser_name in parsers:
+        parser = PARSERS[parser_name]()
+        for op_name, op in OPERATIONS.items():
+            for corpus_name, content in corpora.items():
+                key = f"{parser_name}/{op_name}/{corpus_name}"
+                results[key] = measure(
+                    lambda: op(parser, content),
+                    len(content.encode()),
+                    min_time,
+                    min_rounds,
+                )
+                r = results[key]
+                print(
+                    f"  {key:<45} {r['mb_per_s']:>10.2f} MB/s"
+                    f" {r['seconds'] * 1000:>10.3f} ms {r['peak_kb']:>10.1f} KB peak"
+                )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Find cases whose throughput dropped by more than threshold.
+
+    Returns:
+        Human-readable regression descriptions (empty if none).
+    """
+    regressions: list[str] = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        change = result["mb_per_s"] / base["mb_per_s"] - 1
+        if change < -threshold:
+            regressions.append(
+                f"{key}: {base['mb_per_s']:.2f} -> {result['mb_per_s']:.2f} MB/s ({change:+.0%})"
+            )
+    return regressions
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument(
+        "--parsers", nargs="+", choices=sorted(PARSERS), default=sorted(PARSERS)
+    )
+    arg_parser.add_argument(
+        "--sizes",
+        nargs="*",
+        type=int,
+        default=[1],
+        help="Synthetic scrollback sizes in MB (default: 1)",
+    )
+    arg_parser.add_argument(
+        "--min-time", type=float, default=0.5, help="Minimum seconds per case"
+    )
+    arg_parser.add_argument("--min-rounds", type=int, default=3, help="Minimum calls per case")
+    arg_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    arg_parser.add_argument(
+        "--save-baseline", action="store_true", help="Write results as the new baseline"
+    )
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed throughput drop vs baseline (default: 0.25 = 25%%)",
+    )
+    args = arg_parser.parse_args()
+
+    panes = load_panes()
+    corpora = dict(panes)
+    for size_mb in args.sizes:
+        corpora[f"synthetic_{size_mb}mb"] = synthetic_scrollback(panes, size_mb)
+
+    print(f"Parser benchmark: {len(panes)} panes, synthetic sizes {args.sizes} MB\n")
+    results = run(corpora, args.parsers, args.min_time, args.min_rounds)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"\n✅ No regressions beyond {args.threshold:.0%} vs {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
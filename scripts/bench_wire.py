@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Compare socket wire formats: bytes on the wire and round-trip latency.
+
+Usage: uv run scripts/bench_wire.py [--rounds N]
+
+Part 1 encodes and decodes GET_BUFFER-like results in every wire format
+available here (install msgpack/orjson/zstandard to include them).
+Part 2 runs real round trips over a Unix socket with a server that echoes
+the payload back, once on JSON lines and once on the negotiated framing.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from nerve.server.protocols import Command, CommandResult, CommandType
+from nerve.transport.framing import CODECS, COMPRESSORS, JSON_LINES, WireFormat
+from nerve.transport.unix_socket import UnixSocketClient, UnixSocketServer
+
+SIZES = [1_000, 100_000, 2_000_000]
+
+
+def terminal_text(size: int) -> str:
+    """Terminal-like text: repetitive lines with some variation."""
+    lines = []
+    total = 0
+    i = 0
+    while total < size:
+        line = f"[{i:06d}] INFO  worker-{i % 7}: processed batch {i * 31 % 1009} in {i % 97}ms"
+        lines.append(line)
+        total += len(line) + 1
+        i += 1
+    return "\n".join(lines)[:size]
+
+
+def wire_formats() -> list[WireFormat]:
+    formats = [JSON_LINES]
+    for codec in CODECS.values():
+        formats.append(WireFormat(codec=codec))
+        formats.extend(WireFormat(codec=codec, compressor=c) for c in COMPRESSORS.values())
+    return formats
+
+
+async def bench_codecs(rounds: int) -> None:
+    print(f"{'format':<20} {'size':>10} {'wire bytes':>12} {'encode+decode':>15}")
+    for size in SIZES:
+        message = {"type": "result", "success": True, "data": {"buffer": terminal_text(size)}}
+        for wire in wire_formats():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                data = wire.encode(message)
+                reader = asyncio.StreamReader(limit=2**26)
+                reader.feed_data(data)
+                await wire.read(reader)
+            elapsed = (time.perf_counter() - start) / rounds
+            print(f"{wire.name:<20} {size:>10} {len(data):>12} {elapsed * 1000:>12.2f} ms")
+        print()
+
+
+class EchoEngine:
+    shutdown_requested = False
+
+    async def execute(self, command: Command) -> CommandResult:
+        return CommandResult(success=True, data=command.params, request_id=command.request_id)
+
+
+async def bench_socket(rounds: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    server = UnixSocketServer(path)
+    serving = asyncio.create_task(server.serve(EchoEngine()))  # type: ignore[arg-type]
+    while not os.path.exists(path):
+        await asyncio.sleep(0.01)
+
+    print(f"{'connection':<20} {'size':>10} {'p50 round trip':>15} {'p95':>10}")
+    for framing in (False, True):
+        client = UnixSocketClient(path, binary_framing=framing)
+        await client.connect()
+        for size in SIZES:
+            params = {"buffer": terminal_text(size)}
+            samples = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                await client.send_command(Command(type=CommandType.PING, params=params))
+                samples.append((time.perf_counter() - start) * 1000)
+            samples.sort()
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            print(
+                f"{client._wire.name:<20} {size:>10} "
+                f"{statistics.median(samples):>12.2f} ms {p95:>7.2f} ms"
+            )
+        await client.disconnect()
+
+    await server.stop()
+    serving.cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    asyncio.run(bench_codecs(args.rounds))
+    asyncio.run(bench_socket(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
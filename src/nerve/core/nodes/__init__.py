@@ -33,6 +33,7 @@ Agent capabilities:
     BudgetExceededError: Raised when budget exceeded
     CancellationToken: Cooperative cancellation
     CancelledError: Raised when execution cancelled
+    ConcurrencyLimiter: Per-node and per-resource-class execution limits
     StepTrace: Per-step execution trace
     ExecutionTrace: Full graph execution trace
 
@@ -76,6 +77,9 @@ from nerve.core.nodes.budget import Budget, BudgetExceededError, ResourceUsage
 # Agent capabilities: Cancellation
 from nerve.core.nodes.cancellation import CancellationToken, CancelledError
 
+# Agent capabilities: Concurrency limits
+from nerve.core.nodes.concurrency import ConcurrencyLimiter
+
 # Execution context
 from nerve.core.nodes.context import ExecutionContext
 
@@ -156,6 +160,8 @@ __all__ = [
     # Cancellation
     "CancellationToken",
     "CancelledError",
+    # Concurrency
+    "ConcurrencyLimiter",
     # Tracing
     "StepTrace",
     "ExecutionTrace",
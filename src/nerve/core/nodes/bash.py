@@ -18,7 +18,7 @@ import os
 import signal
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from nerve.core.nodes.base import NodeInfo, NodeState
 from nerve.core.nodes.context import ExecutionContext
@@ -91,6 +91,10 @@ class BashNode:
     timeout: float = 30.0
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Parallel execution: each call is its own subprocess, so no per-node limit
+    concurrency: ClassVar[int | None] = None
+    resource_class: ClassVar[str | None] = "bash"
+
     # Internal fields (not in __init__)
     persistent: bool = field(default=False, init=False)
     state: NodeState = field(default=NodeState.READY, init=False)
@@ -0,0 +1,186 @@
+"""Concurrency limits for parallel node execution.
+
+Once graph steps run in parallel, some nodes cannot safely take two inputs
+at once (a terminal pane, a chat conversation) while others can (bash
+subprocesses, stateless LLM calls). Nodes declare this with two optional
+attributes:
+
+- concurrency: Per-node capacity (None = unlimited). Terminal and chat
+  nodes use 1.
+- resource_class: Shared pool the node draws from, such as "terminal",
+  "bash" or "llm:openrouter". Limits per class are configured on the session.
+
+ConcurrencyLimiter enforces both with semaphores. Graph and WorkflowContext
+acquire a slot around every node execution, so one graph can saturate the
+LLM API while terminal nodes stay serialized.
+
+Example:
+    >>> session = Session(name="review", concurrency_limits={"llm:openrouter": 8})
+    >>> graph = Graph(id="fanout", session=session, max_parallel=16)
+    >>> # Up to 8 OpenRouter calls run at once; each terminal node runs one input at a time
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any
+
+
+def node_concurrency(node: Any) -> int | None:
+    """Get a node's declared per-node capacity.
+
+    Args:
+        node: Any node.
+
+    Returns:
+        Maximum concurrent executions, or None if unlimited.
+    """
+    capacity = getattr(node, "concurrency", None)
+    if capacity is None or capacity <= 0:
+        return None
+    return int(capacity)
+
+
+def node_resource_class(node: Any) -> str | None:
+    """Get a node's declared resource class.
+
+    Args:
+        node: Any node.
+
+    Returns:
+        Resource class name, or None if the node declares none.
+    """
+    resource_class = getattr(node, "resource_class", None)
+    return resource_class if isinstance(resource_class, str) and resource_class else None
+
+
+class ConcurrencyLimiter:
+    """Semaphores for per-node capacity and per-resource-class limits.
+
+    One limiter is owned by each Session, so every executor in the session
+    (graphs, workflows) shares the same slots. Semaphores are created lazily
+    on first use.
+
+    Slots are always acquired node first, then resource class, so holders
+    never wait on each other in a cycle.
+
+    Args:
+        class_limits: Maximum concurrent executions per resource class.
+            Classes without an entry are unlimited.
+
+    Example:
+        >>> limiter = ConcurrencyLimiter({"terminal": 4})
+        >>> async with limiter.slot(node):
+        ...     result = await node.execute(context)
+    """
+
+    def __init__(self, class_limits: dict[str, int] | None = None) -> None:
+        self._class_limits: dict[str, int] = dict(class_limits or {})
+        self._class_semaphores: dict[str, asyncio.Semaphore] = {}
+        # node_id -> (capacity, semaphore)
+        self._node_semaphores: dict[str, tuple[int, asyncio.Semaphore]] = {}
+        self._in_flight: dict[str, int] = {}
+
+    @property
+    def class_limits(self) -> dict[str, int]:
+        """Configured resource class limits (copy)."""
+        return dict(self._class_limits)
+
+    def set_class_limit(self, resource_class: str, limit: int | None) -> None:
+        """Set or clear the limit for a resource class.
+
+        Executions already holding a slot keep it; new executions use the
+        new limit.
+
+        Args:
+            resource_class: Resource class name (e.g., "llm:openrouter").
+            limit: Maximum concurrent executions, or None to remove the limit.
+
+        Raises:
+            ValueError: If limit is not positive.
+        """
+        if limit is not None and limit <= 0:
+            raise ValueError(f"Concurrency limit for '{resource_class}' must be > 0")
+
+        self._class_semaphores.pop(resource_class, None)
+        if limit is None:
+            self._class_limits.pop(resource_class, None)
+        else:
+            self._class_limits[resource_class] = limit
+
+    def forget_node(self, node_id: str) -> None:
+        """Drop the per-node semaphore for a deleted node.
+
+        Args:
+            node_id: ID of the node.
+        """
+        self._node_semaphores.pop(node_id, None)
+
+    @asynccontextmanager
+    async def slot(self, node: Any) -> AsyncIterator[None]:
+        """Hold an execution slot for a node.
+
+        Waits until both the node and its resource class have capacity.
+
+        Args:
+            node: The node about to execute.
+
+        Yields:
+            None while the slot is held.
+        """
+        resource_class = node_resource_class(node)
+        in_flight_key = resource_class or ""
+
+        async with AsyncExitStack() as stack:
+            node_semaphore = self._node_semaphore(node)
+            if node_semaphore is not None:
+                await stack.enter_async_context(node_semaphore)
+
+            class_semaphore = self._class_semaphore(resource_class)
+            if class_semaphore is not None:
+                await stack.enter_async_context(class_semaphore)
+
+            self._in_flight[in_flight_key] = self._in_flight.get(in_flight_key, 0) + 1
+            try:
+                yield
+            finally:
+                self._in_flight[in_flight_key] -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get current limits and in-flight executions per resource class.
+
+        Returns:
+            Dict with "limits" and "in_flight" (keyed by resource class;
+            unclassified nodes are counted under "").
+        """
+        return {
+            "limits": dict(self._class_limits),
+            "in_flight": {k: v for k, v in self._in_flight.items() if v},
+        }
+
+    def _node_semaphore(self, node: Any) -> asyncio.Semaphore | None:
+        capacity = node_concurrency(node)
+        node_id = getattr(node, "id", None)
+        if capacity is None or node_id is None:
+            return None
+
+        entry = self._node_semaphores.get(node_id)
+        if entry is None or entry[0] != capacity:
+            entry = (capacity, asyncio.Semaphore(capacity))
+            self._node_semaphores[node_id] = entry
+        return entry[1]
+
+    def _class_semaphore(self, resource_class: str | None) -> asyncio.Semaphore | None:
+        if resource_class is None:
+            return None
+        limit = self._class_limits.get(resource_class)
+        if limit is None:
+            return None
+
+        semaphore = self._class_semaphores.get(resource_class)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._class_semaphores[resource_class] = semaphore
+        return semaphore
@@ -5,14 +5,17 @@ Graph is a composable workflow that:
 - Executes in topological order
 - Supports nested graphs (Graph implements Node)
 - Integrates error policies, budgets, cancellation, and tracing
+- Compiles to a cached ExecutionPlan reused across runs
 """
 
 from nerve.core.nodes.graph.builder import GraphStep, GraphStepList
 from nerve.core.nodes.graph.events import StepEvent
 from nerve.core.nodes.graph.graph import Graph
+from nerve.core.nodes.graph.plan import ExecutionPlan
 from nerve.core.nodes.graph.step import Step
 
 __all__ = [
+    "ExecutionPlan",
     "Graph",
     "GraphStep",
     "GraphStepList",
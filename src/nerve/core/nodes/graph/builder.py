@@ -99,12 +99,14 @@ class GraphStep:
                     step.depends_on.append(self.step_id)
                     self._ensure_registered()
                     step._ensure_registered()
+            self.graph._invalidate_plan()
             return GraphStepList(other)
         elif isinstance(other, GraphStep):
             # A >> B
             other.depends_on.append(self.step_id)
             self._ensure_registered()
             other._ensure_registered()
+            self.graph._invalidate_plan()
             return other
         else:
             raise TypeError(f"Cannot use >> with {type(other)}")
@@ -138,6 +140,7 @@ class GraphStepList(list[GraphStep]):
                             downstream.depends_on.append(upstream.step_id)
                             upstream._ensure_registered()
                     downstream._ensure_registered()
+                    downstream.graph._invalidate_plan()
             return GraphStepList(other)
         elif isinstance(other, GraphStep):
             # [A, B] >> C
@@ -146,6 +149,7 @@ class GraphStepList(list[GraphStep]):
                     other.depends_on.append(upstream.step_id)
                     upstream._ensure_registered()
             other._ensure_registered()
+            other.graph._invalidate_plan()
             return other
         else:
             raise TypeError(f"Cannot use >> with {type(other)}")
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import time
-from collections.abc import AsyncIterator, Callable
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import replace
 from datetime import datetime
-from graphlib import TopologicalSorter
+from graphlib import CycleError
 from typing import TYPE_CHECKING, Any
 
 from nerve.core.nodes.base import FunctionNode, Node, NodeInfo, NodeState
 from nerve.core.nodes.graph.builder import GraphStep
 from nerve.core.nodes.graph.events import StepEvent
+from nerve.core.nodes.graph.plan import ExecutionPlan
 from nerve.core.nodes.graph.step import Step
 from nerve.core.nodes.policies import ErrorPolicy
 from nerve.core.nodes.run_logging import (
@@ -82,10 +85,11 @@ class Graph:
         self._session = session
         self._steps: dict[str, Step] = {}
         self._max_parallel = max_parallel
+        self._plan: ExecutionPlan | None = None  # Compiled lazily, dropped on structure change
 
         # Interrupt support
         self._current_context: ExecutionContext | None = None
-        self._current_node: Node | None = None
+        self._current_nodes: dict[str, Node] = {}  # step_id -> in-flight node
         self._interrupt_lock: asyncio.Lock = asyncio.Lock()
 
         # Auto-register with session
@@ -151,6 +155,7 @@ class Graph:
             error_policy=error_policy,
             parser=parser,
         )
+        self._invalidate_plan()
         return self
 
     def add_step_ref(
@@ -194,6 +199,7 @@ class Graph:
             error_policy=error_policy,
             parser=parser,
         )
+        self._invalidate_plan()
         return self
 
     def step(
@@ -280,6 +286,7 @@ class Graph:
                 step = self._steps[current_id]
                 if previous_id not in step.depends_on:
                     step.depends_on.append(previous_id)
+                    self._invalidate_plan()
 
         return self
 
@@ -293,6 +300,59 @@ class Graph:
         - Missing dependencies
         - Cycles
 
+        Returns:
+            List of error messages (empty if valid).
+        """
+        # A cached plan was compiled from this exact structure
+        if self._plan is not None:
+            return []
+
+        errors = self._structural_errors()
+
+        # Check for cycles (only if no other errors)
+        if not errors:
+            try:
+                ExecutionPlan.build(self._steps)
+            except CycleError as e:
+                errors.append(f"Cycle detected: {e}")
+
+        return errors
+
+    def compile(self) -> ExecutionPlan:
+        """Get the compiled execution plan, building it on first use.
+
+        The plan is cached and reused by every run until add_step,
+        add_step_ref, chain or the >> builder change the graph structure.
+
+        Returns:
+            The compiled ExecutionPlan.
+
+        Raises:
+            ValueError: If graph is invalid.
+        """
+        if self._plan is not None:
+            return self._plan
+
+        errors = self._structural_errors()
+        plan = None
+        if not errors:
+            try:
+                plan = ExecutionPlan.build(self._steps)
+            except CycleError as e:
+                errors.append(f"Cycle detected: {e}")
+        if plan is None:
+            raise ValueError(f"Invalid graph: {errors}")
+
+        self._plan = plan
+        return plan
+
+    def _invalidate_plan(self) -> None:
+        """Drop the compiled plan after a structural change."""
+        self._plan = None
+
+    def _structural_errors(self) -> list[str]:
+        """Check step IDs, inputs, node references and dependencies (not cycles).
+
         Returns:
             List of error messages (empty if valid).
         """
@@ -320,14 +380,6 @@ class Graph:
                 if dep_id not in self._steps:
                     errors.append(f"Step '{step_id}' depends on unknown step '{dep_id}'")
 
-        # Check for cycles (only if no other errors)
-        if not errors:
-            try:
-                graph = {sid: set(s.depends_on) for sid, s in self._steps.items()}
-                list(TopologicalSorter(graph).static_order())
-            except Exception as e:
-                errors.append(f"Cycle detected: {e}")
-
         return errors
 
     def execution_order(self) -> list[str]:
@@ -339,12 +391,7 @@ class Graph:
         Raises:
             ValueError: If graph is invalid.
         """
-        errors = self.validate()
-        if errors:
-            raise ValueError(f"Invalid graph: {errors}")
-
-        graph = {sid: set(s.depends_on) for sid, s in self._steps.items()}
-        return list(TopologicalSorter(graph).static_order())
+        return list(self.compile().order)
 
     def get_step(self, step_id: str) -> Step | None:
         """Get a step by ID.
@@ -366,7 +413,9 @@ class Graph:
         return list(self._steps.keys())
 
     async def execute(self, context: ExecutionContext) -> dict[str, Any]:
-        """Execute graph steps in topological order.
+        """Execute graph steps in dependency order.
+
+        Independent steps run concurrently, up to max_parallel at a time.
 
         Args:
             context: Execution context with session, input, and agent capabilities.
@@ -390,10 +439,7 @@ class Graph:
             BudgetExceededError: If budget limits are exceeded.
             CancelledError: If execution is cancelled.
         """
-        errors = self.validate()
-        if errors:
-            raise ValueError(f"Invalid graph: {errors}")
-
+        plan = self.compile()
         results: dict[str, Any] = {}
         trace = context.trace
 
@@ -420,7 +466,7 @@ class Graph:
         self._current_context = context
 
         # Log graph start
-        execution_order = self.execution_order()
+        execution_order = list(plan.order)
         graph_start_mono = time.monotonic()
         if graph_logger:
             log_start(
@@ -431,101 +477,101 @@ class Graph:
                 run_id=run_logger.run_id if run_logger else None,
             )
 
-        try:
-            for step_id in execution_order:
-                # Check cancellation and budget before each step
-                context.check_cancelled()
-                context.check_budget()
-
-                step = self._steps[step_id]
+        async def run_step(step_id: str) -> None:
+            step = self._steps[step_id]
+            node = plan.nodes.get(step_id)
+            if node is None:
                 node = self._resolve_node(step, context.session)
 
-                # Resolve input (pass graph input for {input} template expansion)
-                step_input = self._resolve_input(step, results, context.input)
+            # Resolve input (pass graph input for {input} template expansion)
+            step_input = self._resolve_input(step, results, context.input)
 
-                # Create step context
-                step_context = context.with_input(step_input).with_upstream(results)
-                if step.parser:
-                    step_context = step_context.with_parser(step.parser)
+            # Create step context
+            step_context = context.with_input(step_input).with_upstream(results)
+            if step.parser:
+                step_context = step_context.with_parser(step.parser)
 
-                # Log step start
+            # Log step start
+            if graph_logger:
+                log_start(
+                    graph_logger,
+                    self._id,
+                    "step_start",
+                    step=step_id,
+                    node=node.id,
+                    node_type=self._get_node_type(node),
+                    depends_on=step.depends_on,
+                )
+
+            # Execute with policy
+            start_time = datetime.now()
+            start_mono = time.monotonic()
+
+            # Track in-flight node for interrupt()
+            async with self._interrupt_lock:
+                self._current_nodes[step_id] = node
+
+            try:
+                result = await self._execute_with_policy(step, node, step_context, step_id)
+                error = None
+            except Exception as e:
+                result = None
+                error = str(e)
+                # Log step failure
                 if graph_logger:
-                    log_start(
+                    step_duration = time.monotonic() - start_mono
+                    log_error(
                         graph_logger,
                         self._id,
-                        "step_start",
+                        "step_failed",
+                        e,
                         step=step_id,
                         node=node.id,
-                        node_type=self._get_node_type(node),
-                        depends_on=step.depends_on,
+                        duration_s=f"{step_duration:.1f}",
                     )
+                raise
 
-                # Execute with policy
-                start_time = datetime.now()
-                start_mono = time.monotonic()
-
-                # Track current node for interrupt()
+            finally:
                 async with self._interrupt_lock:
-                    self._current_node = node
+                    self._current_nodes.pop(step_id, None)
+                end_time = datetime.now()
+                duration_ms = (time.monotonic() - start_mono) * 1000
+
+                # Record trace
+                if trace:
+                    step_trace = StepTrace(
+                        step_id=step_id,
+                        node_id=node.id,
+                        node_type=self._get_node_type(node),
+                        input=step_input,
+                        output=result,
+                        error=error,
+                        start_time=start_time,
+                        end_time=end_time,
+                        duration_ms=duration_ms,
+                    )
+                    trace.add_step(step_trace)
 
-                try:
-                    result = await self._execute_with_policy(step, node, step_context, step_id)
-                    error = None
-                except Exception as e:
-                    result = None
-                    error = str(e)
-                    # Log step failure
-                    if graph_logger:
-                        step_duration = time.monotonic() - start_mono
-                        log_error(
-                            graph_logger,
-                            self._id,
-                            "step_failed",
-                            e,
-                            step=step_id,
-                            node=node.id,
-                            duration_s=f"{step_duration:.1f}",
-                        )
-                    raise
-
-                finally:
-                    async with self._interrupt_lock:
-                        self._current_node = None
-                    end_time = datetime.now()
-                    duration_ms = (time.monotonic() - start_mono) * 1000
-
-                    # Record trace
-                    if trace:
-                        step_trace = StepTrace(
-                            step_id=step_id,
-                            node_id=node.id,
-                            node_type=self._get_node_type(node),
-                            input=step_input,
-                            output=result,
-                            error=error,
-                            start_time=start_time,
-                            end_time=end_time,
-                            duration_ms=duration_ms,
-                        )
-                        trace.add_step(step_trace)
+                # Update resource usage
+                if context.usage:
+                    context.usage.add_step()
 
-                    # Update resource usage
-                    if context.usage:
-                        context.usage.add_step()
+            # Log step complete (only if no error)
+            if graph_logger and error is None:
+                step_duration = time.monotonic() - start_mono
+                log_complete(
+                    graph_logger,
+                    self._id,
+                    "step_complete",
+                    step_duration,
+                    step=step_id,
+                    node=node.id,
+                )
 
-                # Log step complete (only if no error)
-                if graph_logger and error is None:
-                    step_duration = time.monotonic() - start_mono
-                    log_complete(
-                        graph_logger,
-                        self._id,
-                        "step_complete",
-                        step_duration,
-                        step=step_id,
-                        node=node.id,
-                    )
+            results[step_id] = result
 
-                results[step_id] = result
+        try:
+            await self._schedule(context, plan, run_step)
 
             # Log graph complete
             graph_duration = time.monotonic() - graph_start_mono
@@ -591,7 +637,7 @@ class Graph:
         finally:
             self._current_context = None
             async with self._interrupt_lock:
-                self._current_node = None
+                self._current_nodes.clear()
             # Cleanup run logger if we created it
             if owns_run_logger and run_logger:
                 run_logger.close()
@@ -599,24 +645,27 @@ class Graph:
     async def interrupt(self) -> None:
         """Request interruption of graph execution.
 
-        Sets the cancellation token (if present) AND interrupts the
-        currently executing node. This provides both:
-        - Immediate interruption of the current node
+        Sets the cancellation token (if present) AND interrupts every
+        in-flight node. This provides both:
+        - Immediate interruption of the running steps
         - Prevention of subsequent steps from starting
         """
         # Set cancellation token to prevent next steps
         if self._current_context and self._current_context.cancellation:
             self._current_context.cancellation.cancel()
 
-        # Interrupt the currently executing node
+        # Interrupt the currently executing nodes (once each, even if shared by steps)
         async with self._interrupt_lock:
-            node = self._current_node
-        if node is not None:
+            nodes = {id(node): node for node in self._current_nodes.values()}
+        for node in nodes.values():
             await node.interrupt()
 
     async def execute_stream(self, context: ExecutionContext) -> AsyncIterator[StepEvent]:
         """Execute graph steps and stream events as they occur.
 
+        Independent steps run concurrently, up to max_parallel at a time, so
+        events from different steps may interleave.
+
         Yields:
             StepEvent for each step lifecycle event.
 
@@ -632,10 +681,7 @@ class Graph:
             ...     elif event.event_type == "step_complete":
             ...         results[event.step_id] = event.data
         """
-        errors = self.validate()
-        if errors:
-            raise ValueError(f"Invalid graph: {errors}")
-
+        plan = self.compile()
         results: dict[str, Any] = {}
 
         # Setup run logging if not already configured
@@ -658,7 +704,7 @@ class Graph:
         self._current_context = context
 
         # Log graph start
-        execution_order = self.execution_order()
+        execution_order = list(plan.order)
         graph_start_mono = time.monotonic()
         if graph_logger:
             log_start(
@@ -669,85 +715,95 @@ class Graph:
                 run_id=run_logger.run_id if run_logger else None,
             )
 
-        try:
-            for step_id in execution_order:
-                context.check_cancelled()
-                context.check_budget()
+        events: asyncio.Queue[StepEvent | None] = asyncio.Queue()
 
-                step = self._steps[step_id]
+        async def run_step(step_id: str) -> None:
+            step = self._steps[step_id]
+            node = plan.nodes.get(step_id)
+            if node is None:
                 node = self._resolve_node(step, context.session)
 
-                # Resolve input (pass graph input for {input} template expansion)
-                step_input = self._resolve_input(step, results, context.input)
-                step_context = context.with_input(step_input).with_upstream(results)
-                if step.parser:
-                    step_context = step_context.with_parser(step.parser)
+            # Resolve input (pass graph input for {input} template expansion)
+            step_input = self._resolve_input(step, results, context.input)
+            step_context = context.with_input(step_input).with_upstream(results)
+            if step.parser:
+                step_context = step_context.with_parser(step.parser)
+
+            # Log step start
+            step_start_mono = time.monotonic()
+            if graph_logger:
+                log_start(
+                    graph_logger,
+                    self._id,
+                    "step_start",
+                    step=step_id,
+                    node=node.id,
+                    node_type=self._get_node_type(node),
+                    depends_on=step.depends_on,
+                )
+
+            events.put_nowait(StepEvent("step_start", step_id, node.id))
 
-                # Log step start
-                step_start_mono = time.monotonic()
+            # Track in-flight node for interrupt()
+            async with self._interrupt_lock:
+                self._current_nodes[step_id] = node
+
+            try:
+                # If terminal node with streaming support, stream chunks
+                if hasattr(node, "execute_stream") and callable(node.execute_stream):
+                    chunks = []
+                    async with self._slot(node, step_context):
+                        async for chunk in node.execute_stream(step_context):
+                            chunks.append(chunk)
+                            events.put_nowait(StepEvent("step_chunk", step_id, node.id, chunk))
+                    result = "".join(chunks) if chunks else None
+                else:
+                    result = await self._execute_with_policy(step, node, step_context, step_id)
+
+                results[step_id] = result
+
+                # Log step complete
                 if graph_logger:
-                    log_start(
+                    step_duration = time.monotonic() - step_start_mono
+                    log_complete(
                         graph_logger,
                         self._id,
-                        "step_start",
+                        "step_complete",
+                        step_duration,
                         step=step_id,
                         node=node.id,
-                        node_type=self._get_node_type(node),
-                        depends_on=step.depends_on,
                     )
 
-                yield StepEvent("step_start", step_id, node.id)
-
-                # Track current node for interrupt()
-                async with self._interrupt_lock:
-                    self._current_node = node
+                events.put_nowait(StepEvent("step_complete", step_id, node.id, result))
 
-                try:
-                    # If terminal node with streaming support, stream chunks
-                    if hasattr(node, "execute_stream") and callable(node.execute_stream):
-                        chunks = []
-                        async for chunk in node.execute_stream(step_context):
-                            chunks.append(chunk)
-                            yield StepEvent("step_chunk", step_id, node.id, chunk)
-                        result = "".join(chunks) if chunks else None
-                    else:
-                        result = await self._execute_with_policy(step, node, step_context, step_id)
-
-                    results[step_id] = result
-
-                    # Log step complete
-                    if graph_logger:
-                        step_duration = time.monotonic() - step_start_mono
-                        log_complete(
-                            graph_logger,
-                            self._id,
-                            "step_complete",
-                            step_duration,
-                            step=step_id,
-                            node=node.id,
-                        )
+            except Exception as e:
+                # Log step failure
+                if graph_logger:
+                    step_duration = time.monotonic() - step_start_mono
+                    log_error(
+                        graph_logger,
+                        self._id,
+                        "step_failed",
+                        e,
+                        step=step_id,
+                        node=node.id,
+                        duration_s=f"{step_duration:.1f}",
+                    )
+                events.put_nowait(StepEvent("step_error", step_id, node.id, str(e)))
+                raise
 
-                    yield StepEvent("step_complete", step_id, node.id, result)
+            finally:
+                async with self._interrupt_lock:
+                    self._current_nodes.pop(step_id, None)
 
-                except Exception as e:
-                    # Log step failure
-                    if graph_logger:
-                        step_duration = time.monotonic() - step_start_mono
-                        log_error(
-                            graph_logger,
-                            self._id,
-                            "step_failed",
-                            e,
-                            step=step_id,
-                            node=node.id,
-                            duration_s=f"{step_duration:.1f}",
-                        )
-                    yield StepEvent("step_error", step_id, node.id, str(e))
-                    raise
+        # Steps run in a background scheduler; their events are relayed in order
+        scheduler = asyncio.create_task(self._schedule(context, plan, run_step))
+        scheduler.add_done_callback(lambda _: events.put_nowait(None))
 
-                finally:
-                    async with self._interrupt_lock:
-                        self._current_node = None
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            await scheduler
 
             # Log graph complete
             graph_duration = time.monotonic() - graph_start_mono
@@ -774,13 +830,73 @@ class Graph:
             raise
 
         finally:
+            # The consumer stopped early or was cancelled: stop the steps too
+            if not scheduler.done():
+                scheduler.cancel()
+                try:
+                    await scheduler
+                except asyncio.CancelledError:
+                    pass
             self._current_context = None
             async with self._interrupt_lock:
-                self._current_node = None
+                self._current_nodes.clear()
             # Cleanup run logger if we created it
             if owns_run_logger and run_logger:
                 run_logger.close()
 
+    async def _schedule(
+        self,
+        context: ExecutionContext,
+        plan: ExecutionPlan,
+        run_step: Callable[[str], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Run steps as their dependencies complete, up to max_parallel at once.
+
+        Every ready step is dispatched as its own task. When a step finishes,
+        its dependents become ready immediately, so wall time follows the
+        critical path instead of the sum of all steps. With max_parallel=1
+        steps run one at a time in topological order.
+
+        Args:
+            context: Execution context (checked for cancellation and budget
+                before each dispatch).
+            plan: Compiled plan providing dependency and dependent adjacency.
+            run_step: Coroutine function that executes a single step by ID.
+
+        Raises:
+            Exception: The first step failure. Remaining in-flight steps are cancelled.
+        """
+        pending = {sid: len(deps) for sid, deps in plan.dependencies.items()}
+        ready: deque[str] = deque(plan.levels[0] if plan.levels else ())
+        running: dict[asyncio.Task[None], str] = {}
+        limit = max(1, self._max_parallel)
+
+        try:
+            while ready or running:
+                while ready and len(running) < limit:
+                    # Check cancellation and budget before each step
+                    context.check_cancelled()
+                    context.check_budget()
+
+                    step_id = ready.popleft()
+                    running[asyncio.create_task(run_step(step_id))] = step_id
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                # Handle completions in dispatch order for deterministic error reporting
+                for task in [t for t in running if t in done]:
+                    step_id = running.pop(task)
+                    task.result()
+                    for dependent in plan.dependents[step_id]:
+                        pending[dependent] -= 1
+                        if pending[dependent] == 0:
+                            ready.append(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
     def collect_persistent_nodes(self) -> list[Node]:
         """Recursively find all stateful nodes in this graph.
 
@@ -882,13 +998,15 @@ class Graph:
 
         for attempt in range(policy.retry_count + 1):
             try:
-                if policy.timeout_ms:
-                    return await asyncio.wait_for(
-                        node.execute(context),
-                        timeout=policy.timeout_ms / 1000,
-                    )
-                else:
-                    return await node.execute(context)
+                # Wait for a concurrency slot outside the timeout
+                async with self._slot(node, context):
+                    if policy.timeout_ms:
+                        return await asyncio.wait_for(
+                            node.execute(context),
+                            timeout=policy.timeout_ms / 1000,
+                        )
+                    else:
+                        return await node.execute(context)
 
             except TimeoutError as e:
                 if policy.should_retry(attempt):
@@ -1002,7 +1120,8 @@ class Graph:
                 )
             start_mono = time.monotonic()
             try:
-                result = await policy.fallback_node.execute(context)
+                async with self._slot(policy.fallback_node, context):
+                    result = await policy.fallback_node.execute(context)
                 # Log fallback complete
                 if graph_logger:
                     duration = time.monotonic() - start_mono
@@ -1032,6 +1151,20 @@ class Graph:
 
         raise error
 
+    def _slot(self, node: Node, context: ExecutionContext) -> AbstractAsyncContextManager[None]:
+        """Get the session concurrency slot for a node.
+
+        Args:
+            node: The node about to execute.
+            context: Execution context (its session owns the limiter).
+
+        Returns:
+            Async context manager holding the slot (no-op without a session).
+        """
+        if context.session is None:
+            return nullcontext()
+        return context.session.limiter.slot(node)
+
     def _get_node_type(self, node: Node) -> str:
         """Get type name for a node.
 
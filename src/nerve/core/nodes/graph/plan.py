@@ -0,0 +1,75 @@
+"""ExecutionPlan - compiled, reusable schedule for a graph.
+
+Validating a graph and sorting it topologically costs O(V+E) plus cycle
+detection. A Graph compiles its steps into an ExecutionPlan once and reuses
+it for every run until its structure changes (add_step, add_step_ref,
+chain, or the >> builder).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nerve.core.nodes.base import Node
+    from nerve.core.nodes.graph.step import Step
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Compiled schedule for a validated graph.
+
+    Attributes:
+        levels: Topological levels. Steps in a level depend only on steps in
+            earlier levels, so each level can run concurrently.
+        order: Flattened topological order (same as iterating levels).
+        dependencies: step_id -> step IDs it depends on.
+        dependents: step_id -> step IDs that depend on it.
+        nodes: step_id -> node for steps with a direct node reference.
+            Steps using node_ref are resolved from the session at run time,
+            since the session may replace the node between runs.
+    """
+
+    levels: tuple[tuple[str, ...], ...]
+    order: tuple[str, ...]
+    dependencies: dict[str, tuple[str, ...]]
+    dependents: dict[str, tuple[str, ...]]
+    nodes: dict[str, Node]
+
+    @classmethod
+    def build(cls, steps: dict[str, Step]) -> ExecutionPlan:
+        """Compile steps into a plan.
+
+        Args:
+            steps: Graph steps keyed by step ID (dependencies must exist).
+
+        Returns:
+            The compiled plan.
+
+        Raises:
+            graphlib.CycleError: If the dependencies contain a cycle.
+        """
+        dependencies = {sid: tuple(dict.fromkeys(s.depends_on)) for sid, s in steps.items()}
+
+        dependents: dict[str, list[str]] = {sid: [] for sid in steps}
+        for sid, deps in dependencies.items():
+            for dep_id in deps:
+                dependents[dep_id].append(sid)
+
+        sorter = TopologicalSorter({sid: set(deps) for sid, deps in dependencies.items()})
+        sorter.prepare()
+        levels: list[tuple[str, ...]] = []
+        while sorter.is_active():
+            level = sorter.get_ready()
+            levels.append(level)
+            sorter.done(*level)
+
+        return cls(
+            levels=tuple(levels),
+            order=tuple(sid for level in levels for sid in level),
+            dependencies=dependencies,
+            dependents={sid: tuple(ids) for sid, ids in dependents.items()},
+            nodes={sid: s.node for sid, s in steps.items() if s.node is not None},
+        )
@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from nerve.core.parsers.ansi import strip_ansi
 from nerve.core.validation import validate_name
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,9 @@ Tradeoff: Very long single-line outputs may be truncated. For v1, this is
 acceptable as the full buffer is still available in the terminal.
 """
 
+# Operations that send input to a node
+INPUT_OPS = frozenset({"send", "write", "run"})
+
 
 class HistoryError(Exception):
     """Error during history operations."""
@@ -266,6 +271,8 @@ class HistoryWriter:
     def log_read(self, buffer: str, lines: int = 50) -> int:
         """Log a read/buffer capture.
 
+        ANSI escape sequences are stripped from the buffer before writing.
+
         Args:
             buffer: Buffer contents.
             lines: Number of lines captured.
@@ -282,7 +289,7 @@ class HistoryWriter:
                 "seq": seq,
                 "op": "read",
                 "ts": self._now(),
-                "buffer": buffer,
+                "buffer": strip_ansi(buffer),
                 "lines": lines,
             }
         )
@@ -342,6 +349,7 @@ class HistoryWriter:
 
         Unlike log_send(), this captures the final buffer state rather than
         parsed sections, since streaming doesn't parse incrementally.
+        ANSI escape sequences are stripped from the buffer before writing.
 
         Args:
             input: Input text that was sent.
@@ -366,7 +374,7 @@ class HistoryWriter:
                 "ts_end": ts_end or self._now(),
                 "input": input,
                 "preceding_buffer_seq": preceding_buffer_seq,
-                "final_buffer": final_buffer,
+                "final_buffer": strip_ansi(final_buffer),
                 "parser": parser,
             }
         )
@@ -451,9 +459,8 @@ class HistoryWriter:
 class HistoryReader:
     """Reads node history from JSONL file.
 
-    Note: This implementation loads the entire file into memory.
-    For v1 this is acceptable as history files are typically small.
-    Consider streaming reads for v2 if files grow large.
+    Note: The get_* methods load the entire file into memory. Use
+    iter_entries() to stream large files.
 
     Example:
         >>> reader = HistoryReader.create("my-node", server_name="test", session_name="default")
@@ -506,21 +513,23 @@ class HistoryReader:
             file_path=file_path,
         )
 
-    def _load_entries(self) -> list[dict[str, Any]]:
-        """Load all entries from file.
+    def iter_entries(self) -> Iterator[dict[str, Any]]:
+        """Read entries one at a time, without loading the whole file.
 
         Skips malformed lines with a warning.
         """
-        entries = []
         with open(self.file_path, encoding="utf-8") as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if line:
                     try:
-                        entries.append(json.loads(line))
+                        yield json.loads(line)
                     except json.JSONDecodeError:
                         logger.warning(f"Malformed JSON at {self.file_path}:{line_num}, skipping")
-        return entries
+
+    def _load_entries(self) -> list[dict[str, Any]]:
+        """Load all entries from file."""
+        return list(self.iter_entries())
 
     def get_all(self) -> list[dict[str, Any]]:
         """Get all history entries."""
@@ -558,5 +567,4 @@ class HistoryReader:
 
     def get_inputs_only(self) -> list[dict[str, Any]]:
         """Get only input operations (send, write, run)."""
-        input_ops = {"send", "write", "run"}
-        return [e for e in self._load_entries() if e.get("op") in input_ops]
+        return [e for e in self._load_entries() if e.get("op") in INPUT_OPS]
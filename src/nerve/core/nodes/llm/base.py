@@ -116,6 +116,9 @@ class StatelessLLMNode:
     # HTTP backend: "aiohttp" (default) or "openai" (uses OpenAI SDK)
     http_backend: HttpBackend = "aiohttp"
 
+    # Parallel execution: independent API calls, limited only by resource class
+    concurrency: ClassVar[int | None] = None
+
     # Internal fields (not in __init__)
     persistent: bool = field(default=False, init=False)
     state: NodeState = field(default=NodeState.READY, init=False)
@@ -230,6 +233,11 @@ class StatelessLLMNode:
 
         self._tracer = RequestTracer(debug_dir=tracer_dir)
 
+    @property
+    def resource_class(self) -> str:
+        """Resource class for concurrency limits (e.g., "llm:openrouter")."""
+        return f"llm:{self.node_type}"
+
     async def execute(self, context: ExecutionContext) -> dict[str, Any]:
         """Execute an LLM request and return structured result.
 
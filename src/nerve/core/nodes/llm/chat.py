@@ -133,6 +133,9 @@ class StatefulLLMNode:
     # Conversation state
     messages: list[Message] = field(default_factory=list)
 
+    # Parallel execution: one turn at a time so the message history stays ordered
+    concurrency: ClassVar[int | None] = 1
+
     # Internal fields
     persistent: bool = field(default=True, init=False)  # Chat nodes are persistent
 
@@ -155,6 +158,11 @@ class StatefulLLMNode:
                 self.id, "StatefulLLMNode", persistent=self.persistent
             )
 
+    @property
+    def resource_class(self) -> str:
+        """Resource class for concurrency limits (shared with the underlying LLM)."""
+        return self.llm.resource_class
+
     async def execute(self, context: ExecutionContext) -> dict[str, Any]:
         """Execute a conversation turn.
 
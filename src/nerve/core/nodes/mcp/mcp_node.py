@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from nerve.core.mcp import MCPClient, MCPConnectionError
 from nerve.core.nodes.base import NodeInfo, NodeState
@@ -59,6 +59,10 @@ class MCPNode:
     _cwd: str | None = None
     _timeout: float = 30.0
 
+    # Parallel execution: MCP sessions multiplex requests, so no per-node limit
+    concurrency: ClassVar[int | None] = None
+    resource_class: ClassVar[str | None] = "mcp"
+
     # Internal state
     persistent: bool = field(default=True, init=False)
     state: NodeState = field(default=NodeState.CREATED, init=False)
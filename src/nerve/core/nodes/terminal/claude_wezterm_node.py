@@ -12,13 +12,14 @@ import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from nerve.core.nodes.base import NodeInfo, NodeState
 from nerve.core.nodes.history import HISTORY_BUFFER_LINES, HistoryWriter
 from nerve.core.nodes.run_logging import log_complete, log_error, log_start
+from nerve.core.nodes.terminal.rebind import rebind_node
 from nerve.core.nodes.terminal.wezterm_node import WezTermNode
-from nerve.core.types import ParserType
+from nerve.core.types import ParsedResponse, ParserType
 
 if TYPE_CHECKING:
     from nerve.core.nodes.context import ExecutionContext
@@ -58,6 +59,10 @@ class ClaudeWezTermNode:
     _inner: WezTermNode
     _command: str = ""
 
+    # Parallel execution: one input at a time, drawn from the shared terminal pool
+    concurrency: ClassVar[int | None] = 1
+    resource_class: ClassVar[str | None] = "terminal"
+
     # Internal fields (not in __init__)
     _default_parser: ParserType = field(default=ParserType.CLAUDE_CODE, init=False)
     _last_input: str = field(default="", init=False)
@@ -329,6 +334,49 @@ class ClaudeWezTermNode:
                 history_writer.close()
             raise
 
+    def rebind(
+        self,
+        id: str,
+        session: Session,
+        history: bool | None = None,
+        ready_timeout: float | None = None,
+        response_timeout: float | None = None,
+    ) -> None:
+        """Move this running node to another session under a new id.
+
+        Used to hand out pre-started nodes (see nerve.server.node_pool):
+        Claude keeps running in its pane, only the node's identity changes.
+        The node is removed from its current session and registered in the
+        new one, with a history writer for the new id.
+
+        Args:
+            id: New node identifier.
+            session: Session to register the node with.
+            history: Enable history logging (default: session.history_enabled).
+            ready_timeout: New ready timeout (default: keep current).
+            response_timeout: New response timeout (default: keep current).
+
+        Raises:
+            ValueError: If id is invalid or already exists in session.
+        """
+        rebind_node(
+            self,
+            id,
+            session,
+            history,
+            "ClaudeWezTermNode",
+            # Same first entry as create() writes
+            run_command=self._command,
+            command=self._command,
+        )
+        self._inner.id = id
+        if ready_timeout is not None:
+            self._ready_timeout = ready_timeout
+            self._inner._ready_timeout = ready_timeout
+        if response_timeout is not None:
+            self._response_timeout = response_timeout
+            self._inner._response_timeout = response_timeout
+
     @property
     def pane_id(self) -> str | None:
         """WezTerm pane ID."""
@@ -344,7 +392,12 @@ class ClaudeWezTermNode:
         """Current pane content."""
         return self._inner.buffer
 
-    def _capture_pending_buffer_if_needed(self) -> None:
+    @property
+    def stream_response(self) -> ParsedResponse | None:
+        """Parsed response of the last execute_stream() that finished, if any."""
+        return self._inner.stream_response
+
+    async def _capture_pending_buffer_if_needed(self) -> None:
         """Capture buffer from previous run/write if needed.
 
         Called at the start of operations to capture deferred buffer
@@ -352,7 +405,7 @@ class ClaudeWezTermNode:
         """
         if self._history_writer and self._history_writer.enabled:
             if self._history_writer.needs_buffer_capture():
-                buffer_content = self._inner.read_tail(HISTORY_BUFFER_LINES)
+                buffer_content = await self._inner.backend.capture_tail(HISTORY_BUFFER_LINES)
                 self._history_writer.log_read(buffer_content, lines=HISTORY_BUFFER_LINES)
 
     async def execute(self, context: ExecutionContext) -> dict[str, Any]:
@@ -381,7 +434,7 @@ class ClaudeWezTermNode:
             - attributes: dict - Contains raw, sections, is_ready, is_complete, tokens, parser
         """
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         self._last_input = str(context.input) if context.input else ""
 
@@ -438,7 +491,7 @@ class ClaudeWezTermNode:
                 "terminal_complete",
                 duration,
                 exec_id=exec_id,
-                output_len=len(self._inner.buffer),
+                output_len=len(result["attributes"]["raw"]),
                 sections=len(result.get("sections", [])),
             )
 
@@ -523,26 +576,30 @@ class ClaudeWezTermNode:
         from nerve.core.parsers import get_parser
 
         parser = get_parser(self._default_parser)  # Use Claude parser
-        start = time.monotonic()
 
         ready_count = 0
         consecutive_required = 2  # Match WezTermNode behavior
 
-        while time.monotonic() - start < timeout:
-            # Check FULL buffer (same as _wait_for_ready does)
-            check_content = self._inner.buffer
-
-            if parser.is_ready(check_content):
-                ready_count += 1
-                if ready_count >= consecutive_required:
-                    await asyncio.sleep(0.3)
-                    return  # Ready!
-            else:
-                ready_count = 0
-
-            await asyncio.sleep(2.0)  # Match WezTermNode poll interval
-
-        raise TimeoutError(f"Terminal did not become ready within {timeout}s")
+        try:
+            # Not busy: the terminal is idle or finishing someone else's work,
+            # so the shared poller may tick slowly for it
+            async with (
+                asyncio.timeout(timeout),
+                self._inner.backend.watch(busy=False) as pane,
+            ):
+                while True:
+                    # Same window as _wait_for_ready checks
+                    check_content = await pane.next()
+
+                    if parser.is_ready(check_content):
+                        ready_count += 1
+                        if ready_count >= consecutive_required:
+                            await asyncio.sleep(0.3)
+                            return  # Ready!
+                    else:
+                        ready_count = 0
+        except TimeoutError:
+            raise TimeoutError(f"Terminal did not become ready within {timeout}s") from None
 
     async def execute_stream(self, context: ExecutionContext) -> AsyncIterator[str]:
         """Execute and stream output chunks.
@@ -554,7 +611,7 @@ class ClaudeWezTermNode:
             Output chunks as they arrive.
         """
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         self._last_input = str(context.input) if context.input else ""
 
@@ -606,7 +663,7 @@ class ClaudeWezTermNode:
 
             # History: log streaming operation
             if self._history_writer and self._history_writer.enabled and ts_start is not None:
-                final_buffer = self._inner.read_tail(HISTORY_BUFFER_LINES)
+                final_buffer = await self._inner.backend.capture_tail(HISTORY_BUFFER_LINES)
                 self._history_writer.log_send_stream(
                     input=self._last_input,
                     final_buffer=final_buffer,
@@ -672,7 +729,7 @@ class ClaudeWezTermNode:
     async def write(self, data: str) -> None:
         """Write raw data."""
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         await self._inner.backend.write(data)
 
@@ -690,7 +747,7 @@ class ClaudeWezTermNode:
             command: Command to start.
         """
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         # WezTerm needs text and \r sent separately with a delay
         await self._inner.backend.write(command)
@@ -709,6 +766,10 @@ class ClaudeWezTermNode:
         """Read last N lines."""
         return self._inner.read_tail(lines)
 
+    async def capture_tail(self, lines: int = 50) -> str:
+        """Read last N lines without blocking the event loop."""
+        return await self._inner.capture_tail(lines)
+
     def clear_buffer(self) -> None:
         """Clear the buffer."""
         self._inner.clear_buffer()
@@ -731,7 +792,7 @@ class ClaudeWezTermNode:
     async def stop(self) -> None:
         """Stop the node and release resources."""
         # Capture pending buffer from previous run/write before closing
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         if self._history_writer and self._history_writer.enabled:
             self._history_writer.log_delete()
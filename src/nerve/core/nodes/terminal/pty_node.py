@@ -9,12 +9,13 @@ import asyncio
 import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from nerve.core.nodes.base import NodeInfo, NodeState
 from nerve.core.nodes.history import HISTORY_BUFFER_LINES, HistoryWriter
 from nerve.core.nodes.run_logging import log_complete, log_error, log_start
-from nerve.core.parsers import get_parser
+from nerve.core.nodes.terminal.rebind import rebind_node
+from nerve.core.parsers import IncrementalParser, get_parser
 from nerve.core.pty import BackendConfig
 from nerve.core.pty.pty_backend import PTYBackend
 from nerve.core.types import ParserType
@@ -23,6 +24,11 @@ if TYPE_CHECKING:
     from nerve.core.nodes.context import ExecutionContext
     from nerve.core.session.session import Session
 
+# Quiet period (seconds) required after the parser reports ready, to debounce redraws.
+# Claude's TUI repaints in several bursts after a response, so it gets a longer window.
+READY_QUIET_PERIOD = 0.05
+CLAUDE_READY_QUIET_PERIOD = 0.3
+
 
 @dataclass
 class PTYNode:
@@ -31,10 +37,10 @@ class PTYNode:
     IMPORTANT: Cannot be instantiated directly. Use PTYNode.create() instead.
 
     BUFFER SEMANTICS: Continuous accumulation.
-    - Buffer grows continuously as output is received
-    - Use buffer_start position for incremental parsing
-    - Background reader task captures output
-    - Polling interval: 0.3 seconds for ready detection
+    - Buffer grows continuously as output is received (last 2MB retained)
+    - Use backend.output_offset / read_since() for incremental parsing
+    - The backend's event-loop reader captures output
+    - Ready detection is event-driven: re-checked whenever new output arrives
 
     The node owns the process and maintains its lifecycle.
     Input comes from ExecutionContext.input (string).
@@ -59,13 +65,16 @@ class PTYNode:
     command: str | None = None
     state: NodeState = NodeState.STARTING
 
+    # Parallel execution: one input at a time, drawn from the shared terminal pool
+    concurrency: ClassVar[int | None] = 1
+    resource_class: ClassVar[str | None] = "terminal"
+
     # Internal fields (not in __init__)
     persistent: bool = field(default=True, init=False)
     _default_parser: ParserType = field(default=ParserType.NONE, init=False)
     _last_input: str = field(default="", init=False, repr=False)
     _ready_timeout: float = field(default=60.0, init=False, repr=False)
     _response_timeout: float = field(default=1800.0, init=False, repr=False)
-    _reader_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
     _history_writer: HistoryWriter | None = field(default=None, init=False, repr=False)
     _created_via_create: bool = field(default=False, init=False, repr=False)
 
@@ -182,11 +191,9 @@ class PTYNode:
             node._last_input = ""
             node._ready_timeout = ready_timeout
             node._response_timeout = response_timeout
-            node._reader_task = None
             node._history_writer = history_writer
 
-            # Start background reader
-            node._start_reader()
+            # Output is buffered by the backend's event-loop reader
 
             # Give the shell a moment to start
             await asyncio.sleep(0.5)
@@ -315,7 +322,7 @@ class PTYNode:
         parser_instance = get_parser(parser_type)
 
         # Mark buffer position before sending
-        buffer_start = len(self.backend.buffer)
+        buffer_start = self.backend.output_offset
 
         try:
             # Send input
@@ -335,16 +342,15 @@ class PTYNode:
 
             self.state = NodeState.BUSY
 
-            # Wait for response
+            # Wait for response, parsing only the NEW output as it arrives
+            stream = parser_instance.incremental()
             await self._wait_for_ready(
                 timeout=timeout,
                 parser_type=parser_type,
                 buffer_start=buffer_start,
+                stream=stream,
             )
-
-            # Parse only the NEW output
-            new_output = self.backend.buffer[buffer_start:]
-            parsed_response = parser_instance.parse(new_output)
+            parsed_response = stream.result()
 
             # Convert ParsedResponse to dict format
             result["success"] = True
@@ -376,7 +382,7 @@ class PTYNode:
                 "terminal_complete",
                 duration,
                 exec_id=exec_id,
-                output_len=len(new_output),
+                output_len=self.backend.output_offset - buffer_start,
                 sections=len(parsed_response.sections),
             )
 
@@ -401,11 +407,7 @@ class PTYNode:
             duration = time.monotonic() - start_mono
             result["error"] = str(e)
             result["error_type"] = "timeout"
-            result["attributes"]["raw"] = (
-                self.backend.buffer[buffer_start:]
-                if buffer_start < len(self.backend.buffer)
-                else ""
-            )
+            result["attributes"]["raw"] = self.backend.read_since(buffer_start)
             log_error(
                 log_ctx.logger,
                 self.id,
@@ -421,11 +423,7 @@ class PTYNode:
             duration = time.monotonic() - start_mono
             result["error"] = f"{type(e).__name__}: {e}"
             result["error_type"] = "internal_error"
-            result["attributes"]["raw"] = (
-                self.backend.buffer[buffer_start:]
-                if buffer_start < len(self.backend.buffer)
-                else ""
-            )
+            result["attributes"]["raw"] = self.backend.read_since(buffer_start)
             log_error(
                 log_ctx.logger,
                 self.id,
@@ -637,6 +635,17 @@ class PTYNode:
         """
         return self.backend.read_tail(lines)
 
+    async def capture_tail(self, lines: int = 50) -> str:
+        """Read last N lines from buffer (async counterpart of read_tail()).
+
+        Args:
+            lines: Number of lines to read.
+
+        Returns:
+            Last N lines of buffer.
+        """
+        return self.backend.read_tail(lines)
+
     def clear_buffer(self) -> None:
         """Clear the accumulated buffer."""
         self.backend.clear_buffer()
@@ -668,14 +677,6 @@ class PTYNode:
             self._history_writer.log_delete()
             self._history_writer.close()
 
-        if self._reader_task:
-            self._reader_task.cancel()
-            try:
-                await self._reader_task
-            except asyncio.CancelledError:
-                pass
-            self._reader_task = None
-
         await self.backend.stop()
         self.state = NodeState.STOPPED
 
@@ -693,51 +694,83 @@ class PTYNode:
         self.backend.clear_buffer()
         self._last_input = ""
 
-    def _start_reader(self) -> None:
-        """Start background task to continuously read and buffer output."""
+    def rebind(
+        self,
+        id: str,
+        session: Session,
+        history: bool | None = None,
+        ready_timeout: float | None = None,
+        response_timeout: float | None = None,
+    ) -> None:
+        """Move this running node to another session under a new id.
+
+        Used to hand out pre-started nodes (see nerve.server.node_pool):
+        the process keeps running, only the node's identity changes. The
+        node is removed from its current session and registered in the new
+        one, with a history writer for the new id.
 
-        async def reader_loop() -> None:
-            try:
-                async for _chunk in self.backend.read_stream():
-                    pass  # Output accumulated in backend.buffer
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                pass
+        Args:
+            id: New node identifier.
+            session: Session to register the node with.
+            history: Enable history logging (default: session.history_enabled).
+            ready_timeout: New ready timeout (default: keep current).
+            response_timeout: New response timeout (default: keep current).
 
-        self._reader_task = asyncio.create_task(reader_loop())
+        Raises:
+            ValueError: If id is invalid or already exists in session.
+        """
+        rebind_node(
+            self, id, session, history, "PTYNode", command=self.command, pid=self.backend.pid
+        )
+        if ready_timeout is not None:
+            self._ready_timeout = ready_timeout
+        if response_timeout is not None:
+            self._response_timeout = response_timeout
 
     async def _wait_for_ready(
         self,
         timeout: float,
         parser_type: ParserType = ParserType.NONE,
         buffer_start: int = 0,
+        stream: IncrementalParser | None = None,
     ) -> None:
-        """Wait for terminal to be ready for input."""
-        parser = get_parser(parser_type)
-        start = asyncio.get_event_loop().time()
+        """Wait for terminal to be ready for input.
+
+        Re-checks readiness only when the backend reports new output. Once the
+        parser sees a ready state, the output must stay quiet for a short
+        debounce period (catching TUI redraws) before the turn is complete.
+
+        Output since buffer_start is fed to stream chunk by chunk, so each
+        check only parses what arrived since the previous one. On return,
+        stream holds all output up to the ready state.
+        """
+        if stream is None:
+            stream = get_parser(parser_type).incremental()
+        offset = buffer_start
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
         if parser_type == ParserType.CLAUDE_CODE:
             await self._wait_for_processing_start(timeout=10.0, buffer_start=buffer_start)
+            quiet_period = CLAUDE_READY_QUIET_PERIOD
+        else:
+            quiet_period = READY_QUIET_PERIOD
 
-        ready_count = 0
-        consecutive_required = 2
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Terminal did not become ready within {timeout}s")
 
-        while asyncio.get_event_loop().time() - start < timeout:
-            check_content = self.backend.buffer[buffer_start:]
+            stream.feed(self.backend.read_since(offset))
+            offset = self.backend.output_offset
 
-            if parser.is_ready(check_content):
-                ready_count += 1
-                if ready_count >= consecutive_required:
-                    await asyncio.sleep(0.5)
+            if stream.is_ready():
+                # Debounce: ready only if no further output arrives
+                if not await self.backend.wait_for_output(timeout=min(quiet_period, remaining)):
                     self.state = NodeState.READY
                     return
             else:
-                ready_count = 0
-
-            await asyncio.sleep(0.3)
-
-        raise TimeoutError(f"Terminal did not become ready within {timeout}s")
+                await self.backend.wait_for_output(timeout=remaining)
 
     async def _wait_for_processing_start(
         self,
@@ -745,17 +778,20 @@ class PTYNode:
         buffer_start: int = 0,
     ) -> bool:
         """Wait for Claude to start processing."""
-        start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
-        while asyncio.get_event_loop().time() - start < timeout:
-            check_content = self.backend.buffer[buffer_start:]
+        while True:
+            check_content = self.backend.read_since(buffer_start)
 
             if self._is_processing(check_content):
                 return True
 
-            await asyncio.sleep(0.1)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
 
-        return False
+            await self.backend.wait_for_output(timeout=remaining)
 
     def _is_processing(self, content: str) -> bool:
         """Check if Claude is currently processing."""
@@ -772,6 +808,7 @@ class PTYNode:
             metadata={
                 "command": self.command,
                 "last_input": self._last_input,
+                "reader": self.backend.reader_stats,
             },
         )
 
@@ -0,0 +1,84 @@
+"""Identity handover for pre-started terminal nodes.
+
+PTYNode.rebind() and ClaudeWezTermNode.rebind() move a running node to
+another session under a new id (see nerve.server.node_pool). The shared
+part lives here: re-registering the node and replacing its history writer.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from nerve.core.nodes.history import HistoryError, HistoryWriter
+from nerve.core.validation import validate_name
+
+if TYPE_CHECKING:
+    from nerve.core.nodes.terminal.claude_wezterm_node import ClaudeWezTermNode
+    from nerve.core.nodes.terminal.pty_node import PTYNode
+    from nerve.core.session.session import Session
+
+logger = logging.getLogger(__name__)
+
+
+def rebind_node(
+    node: PTYNode | ClaudeWezTermNode,
+    id: str,
+    session: Session,
+    history: bool | None,
+    node_type: str,
+    run_command: str | None = None,
+    command: str | None = None,
+    pid: int | None = None,
+) -> None:
+    """Move a node to session under id, with a history writer for the new id.
+
+    The node is removed from its current session, its old history writer
+    is closed, and it is registered in the new session.
+
+    Args:
+        node: The node to move.
+        id: New node identifier.
+        session: Session to register the node with.
+        history: Enable history logging (default: session.history_enabled).
+        node_type: Node type for the session's lifecycle log.
+        run_command: Logged as the new history's first "run" entry, if given.
+        command: Command for the lifecycle log.
+        pid: Process ID for the lifecycle log.
+
+    Raises:
+        ValueError: If id is invalid or already exists in session.
+    """
+    validate_name(id, "node")
+    session.validate_unique_id(id, "node")
+
+    if node.session.nodes.get(node.id) is node:
+        del node.session.nodes[node.id]
+    if node._history_writer is not None:
+        node._history_writer.close()
+        node._history_writer = None
+
+    node.id = id
+    node.session = session
+
+    use_history = history if history is not None else session.history_enabled
+    if use_history:
+        try:
+            node._history_writer = HistoryWriter.create(
+                node_id=id,
+                server_name=session.server_name,
+                session_name=session.name,
+                base_dir=session.history_base_dir,
+                enabled=True,
+            )
+            if run_command is not None:
+                node._history_writer.log_run(run_command)
+        except (HistoryError, ValueError) as e:
+            logger.warning(f"Failed to create history writer for {id}: {e}")
+
+    session.nodes[id] = node
+
+    if session.session_logger:
+        session.session_logger.log_node_lifecycle(
+            id, node_type, persistent=True, started=True, command=command, pid=pid
+        )
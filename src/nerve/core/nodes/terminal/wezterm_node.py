@@ -9,15 +9,15 @@ import asyncio
 import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from nerve.core.nodes.base import NodeInfo, NodeState
 from nerve.core.nodes.history import HISTORY_BUFFER_LINES, HistoryWriter
 from nerve.core.nodes.run_logging import log_complete, log_error, log_start
 from nerve.core.parsers import get_parser
 from nerve.core.pty import BackendConfig
-from nerve.core.pty.wezterm_backend import WezTermBackend
-from nerve.core.types import ParserType
+from nerve.core.pty.wezterm_backend import DELTA_WINDOW_LINES, WezTermBackend
+from nerve.core.types import ParsedResponse, ParserType
 
 if TYPE_CHECKING:
     from nerve.core.nodes.context import ExecutionContext
@@ -32,9 +32,12 @@ class WezTermNode:
 
     BUFFER SEMANTICS: Always-fresh query.
     - WezTerm maintains pane content internally
-    - Every buffer read queries WezTerm directly
+    - Reads capture pane content asynchronously; concurrent reads share
+      one capture and reuse a snapshot for a few milliseconds
     - No background reader needed
     - Polling interval: 2.0 seconds for ready detection
+    - execute()/execute_stream() parse only the pane text from where the
+      output ended when the input was sent, not the whole scrollback
 
     Example:
         >>> session = Session("my-session")
@@ -56,6 +59,10 @@ class WezTermNode:
     command: str | None = None
     state: NodeState = NodeState.STARTING
 
+    # Parallel execution: one input at a time, drawn from the shared terminal pool
+    concurrency: ClassVar[int | None] = 1
+    resource_class: ClassVar[str | None] = "terminal"
+
     # Internal fields (not in __init__)
     persistent: bool = field(default=True, init=False)
     _default_parser: ParserType = field(default=ParserType.NONE, init=False)
@@ -64,6 +71,7 @@ class WezTermNode:
     _response_timeout: float = field(default=1800.0, init=False, repr=False)
     _history_writer: HistoryWriter | None = field(default=None, init=False, repr=False)
     _created_via_create: bool = field(default=False, init=False, repr=False)
+    _stream_response: ParsedResponse | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Prevent direct instantiation."""
@@ -399,7 +407,12 @@ class WezTermNode:
         """Current pane content (always fresh from WezTerm)."""
         return self.backend.buffer
 
-    def _capture_pending_buffer_if_needed(self) -> None:
+    @property
+    def stream_response(self) -> ParsedResponse | None:
+        """Parsed response of the last execute_stream() that finished, if any."""
+        return self._stream_response
+
+    async def _capture_pending_buffer_if_needed(self) -> None:
         """Capture buffer from previous run/write if needed.
 
         Called at the start of operations to capture deferred buffer
@@ -407,7 +420,7 @@ class WezTermNode:
         """
         if self._history_writer and self._history_writer.enabled:
             if self._history_writer.needs_buffer_capture():
-                buffer_content = self.read_tail(HISTORY_BUFFER_LINES)
+                buffer_content = await self.backend.capture_tail(HISTORY_BUFFER_LINES)
                 self._history_writer.log_read(buffer_content, lines=HISTORY_BUFFER_LINES)
 
     async def execute(self, context: ExecutionContext) -> dict[str, Any]:
@@ -453,7 +466,7 @@ class WezTermNode:
             return result
 
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         input_str = str(context.input) if context.input is not None else ""
         self._last_input = input_str
@@ -490,6 +503,9 @@ class WezTermNode:
         parser_instance = get_parser(parser_type)
 
         try:
+            # Mark the end of the pane's output before sending
+            cursor = await self.backend.cursor()
+
             # Send input (WezTerm sends keystrokes via CLI - no INSERT mode needed)
             if is_claude:
                 # WezTerm + Claude: Just text + Enter
@@ -509,7 +525,8 @@ class WezTermNode:
 
             await asyncio.sleep(0.5)
 
-            buffer = self.backend.buffer
+            # Parse only this turn's part of the pane, not the whole scrollback
+            buffer = await self.backend.capture_since(cursor)
             parsed_response = parser_instance.parse(buffer)
 
             # Convert ParsedResponse to dict format
@@ -567,7 +584,7 @@ class WezTermNode:
             duration = time.monotonic() - start_mono
             result["error"] = str(e)
             result["error_type"] = "timeout"
-            result["attributes"]["raw"] = self.backend.buffer
+            result["attributes"]["raw"] = await self.backend.capture()
             log_error(
                 log_ctx.logger,
                 self.id,
@@ -583,7 +600,7 @@ class WezTermNode:
             duration = time.monotonic() - start_mono
             result["error"] = f"{type(e).__name__}: {e}"
             result["error_type"] = "internal_error"
-            result["attributes"]["raw"] = self.backend.buffer
+            result["attributes"]["raw"] = await self.backend.capture()
             log_error(
                 log_ctx.logger,
                 self.id,
@@ -608,7 +625,7 @@ class WezTermNode:
             return
 
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         input_str = str(context.input) if context.input is not None else ""
         self._last_input = input_str
@@ -641,8 +658,12 @@ class WezTermNode:
         parser_type = context.parser or self._default_parser
         parser_instance = get_parser(parser_type)
         is_claude = parser_type == ParserType.CLAUDE_CODE
+        self._stream_response = None
 
         try:
+            # Stream only output that follows the input
+            cursor = await self.backend.cursor()
+
             # Send input (WezTerm sends keystrokes via CLI - no INSERT mode needed)
             if is_claude:
                 # WezTerm + Claude: Just text + Enter
@@ -654,14 +675,20 @@ class WezTermNode:
 
             self.state = NodeState.BUSY
 
-            async for chunk in self.backend.read_stream():
+            async for chunk in self.backend.read_stream(since=cursor):
                 chunks_count += 1
                 yield chunk
 
-                if parser_instance.is_ready(self.backend.buffer):
+                # Readiness is judged on the screen, not on the deltas: a TUI
+                # redraws in place and removed lines never appear as output.
+                # The poller just fetched this window, so this reuses it.
+                recent = await self.backend.capture(scrollback=DELTA_WINDOW_LINES)
+                if parser_instance.is_ready(recent):
                     self.state = NodeState.READY
                     break
 
+            self._stream_response = parser_instance.parse(await self.backend.capture_since(cursor))
+
             # Log terminal stream complete
             duration = time.monotonic() - start_mono
             log_complete(
@@ -675,7 +702,7 @@ class WezTermNode:
 
             # History: log streaming operation
             if self._history_writer and self._history_writer.enabled and ts_start is not None:
-                final_buffer = self.read_tail(HISTORY_BUFFER_LINES)
+                final_buffer = await self.backend.capture_tail(HISTORY_BUFFER_LINES)
                 self._history_writer.log_send_stream(
                     input=input_str,
                     final_buffer=final_buffer,
@@ -743,7 +770,7 @@ class WezTermNode:
     async def write(self, data: str) -> None:
         """Write raw data to the terminal."""
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         await self.backend.write(data)
 
@@ -761,7 +788,7 @@ class WezTermNode:
             command: Command to start.
         """
         # Capture pending buffer from previous run/write
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         # WezTerm needs text and \r sent separately with a delay
         await self.backend.write(command)
@@ -774,12 +801,16 @@ class WezTermNode:
 
     async def read(self) -> str:
         """Read current pane content (fresh from WezTerm)."""
-        return self.backend.buffer
+        return await self.backend.capture()
 
     def read_tail(self, lines: int = 50) -> str:
         """Read last N lines from pane."""
         return self.backend.read_tail(lines)
 
+    async def capture_tail(self, lines: int = 50) -> str:
+        """Read last N lines from pane without blocking the event loop."""
+        return await self.backend.capture_tail(lines)
+
     def clear_buffer(self) -> None:
         """Clear the buffer."""
         self.backend.clear_buffer()
@@ -806,7 +837,7 @@ class WezTermNode:
     async def stop(self) -> None:
         """Stop the node and release resources."""
         # Capture pending buffer from previous run/write before closing
-        self._capture_pending_buffer_if_needed()
+        await self._capture_pending_buffer_if_needed()
 
         if self._history_writer and self._history_writer.enabled:
             self._history_writer.log_delete()
@@ -832,28 +863,31 @@ class WezTermNode:
         timeout: float,
         parser_type: ParserType = ParserType.NONE,
     ) -> None:
-        """Wait for terminal to be ready for input."""
+        """Wait for terminal to be ready for input.
+
+        Pane text comes from the shared poller: a new check runs whenever
+        the pane changes, and at least every couple of seconds.
+        """
         parser = get_parser(parser_type)
-        start = asyncio.get_event_loop().time()
 
         ready_count = 0
         consecutive_required = 2
 
-        while asyncio.get_event_loop().time() - start < timeout:
-            check_content = self.backend.buffer
-
-            if parser.is_ready(check_content):
-                ready_count += 1
-                if ready_count >= consecutive_required:
-                    await asyncio.sleep(0.3)
-                    self.state = NodeState.READY
-                    return
-            else:
-                ready_count = 0
-
-            await asyncio.sleep(2.0)
-
-        raise TimeoutError(f"Terminal did not become ready within {timeout}s")
+        try:
+            async with asyncio.timeout(timeout), self.backend.watch(busy=True) as pane:
+                while True:
+                    check_content = await pane.next()
+
+                    if parser.is_ready(check_content):
+                        ready_count += 1
+                        if ready_count >= consecutive_required:
+                            await asyncio.sleep(0.3)
+                            self.state = NodeState.READY
+                            return
+                    else:
+                        ready_count = 0
+        except TimeoutError:
+            raise TimeoutError(f"Terminal did not become ready within {timeout}s") from None
 
     def to_info(self) -> NodeInfo:
         """Get node information."""
@@ -5,12 +5,15 @@ No PTY knowledge, no session awareness, no events.
 
 Classes:
     Parser: Abstract base for parsers.
+    IncrementalParser: Per-execution parse state fed with output chunks.
     ClaudeCodeParser: Parser for Claude Code CLI output.
     GeminiParser: Parser for Gemini CLI output.
     NoneParser: No-op parser for raw output.
+    AnsiStripper: Streaming ANSI escape sequence stripper.
 
 Functions:
     get_parser: Get parser instance for a parser type.
+    strip_ansi: Strip ANSI escape sequences from text.
 
 Example:
     >>> from nerve.core.parsers import ClaudeCodeParser
@@ -27,7 +30,8 @@ Example:
     ...     print(f"[{section.type}] {section.content}")
 """
 
-from nerve.core.parsers.base import Parser
+from nerve.core.parsers.ansi import AnsiStripper, strip_ansi
+from nerve.core.parsers.base import IncrementalParser, Parser
 from nerve.core.parsers.claude_code import ClaudeCodeParser
 from nerve.core.parsers.gemini import GeminiParser
 from nerve.core.parsers.none import NoneParser
@@ -59,4 +63,13 @@ def get_parser(parser_type: ParserType) -> Parser:
     return parser_class()
 
 
-__all__ = ["Parser", "ClaudeCodeParser", "GeminiParser", "NoneParser", "get_parser"]
+__all__ = [
+    "Parser",
+    "IncrementalParser",
+    "ClaudeCodeParser",
+    "GeminiParser",
+    "NoneParser",
+    "AnsiStripper",
+    "strip_ansi",
+    "get_parser",
+]
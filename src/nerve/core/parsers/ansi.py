@@ -0,0 +1,120 @@
+"""ANSI escape sequence stripping.
+
+Terminal output from a PTY carries colors, cursor movement and terminal
+mode switches as escape sequences. These helpers remove them with a single
+precompiled pattern, either over a whole string (strip_ansi) or over a
+stream of chunks (AnsiStripper), where a sequence may be split between
+chunks.
+
+Example:
+    >>> strip_ansi("\\x1b[1mbold\\x1b[0m")
+    'bold'
+    >>> stripper = AnsiStripper()
+    >>> stripper.feed("\\x1b[3") + stripper.feed("1mred") + stripper.flush()
+    'red'
+"""
+
+from __future__ import annotations
+
+import re
+
+# Alternatives are tried in order: OSC must come before the two-character
+# form, which would otherwise match its "ESC ]" introducer.
+ANSI_ESCAPE_RE = re.compile(
+    r"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC (window title, hyperlinks)
+    r"|\x1b\[[0-?]*[ -/]*[@-~]"  # CSI (colors, cursor, modes)
+    r"|\x1b[()][0-9A-Za-z]"  # Character set designation
+    r"|\x1b[@-Z\\-_]"  # Other two-character sequences
+)
+
+# A trailing sequence that is not complete yet (more input may finish it)
+_INCOMPLETE_RE = re.compile(r"\x1b(?:\][^\x07\x1b]*\x1b?|\[[0-?]*[ -/]*|[()])?\Z")
+
+# Longest incomplete sequence held back between chunks. An OSC string that
+# never terminates is released (with only its introducer stripped) after this.
+MAX_PENDING = 4096
+
+
+def strip_ansi(text: str) -> str:
+    """Strip ANSI escape sequences from text.
+
+    Args:
+        text: Terminal output.
+
+    Returns:
+        Text without escape sequences.
+    """
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE_RE.sub("", text)
+
+
+def last_visible_line(content: str) -> str:
+    """Get the last line with visible text, without escape sequences.
+
+    Walks back from the end of content, so the cost depends on the trailing
+    lines only, not on the size of content.
+
+    Args:
+        content: Terminal output.
+
+    Returns:
+        The stripped line, or "" if content has no visible text.
+    """
+    end = len(content)
+    while end > 0:
+        start = content.rfind("\n", 0, end) + 1
+        line = strip_ansi(content[start:end]).strip()
+        if line:
+            return line
+        end = start - 1
+    return ""
+
+
+class AnsiStripper:
+    """Strips ANSI escape sequences from a stream of chunks.
+
+    A sequence split across chunks is held back until it completes, so the
+    concatenated output equals strip_ansi() of the concatenated input.
+
+    Example:
+        >>> stripper = AnsiStripper()
+        >>> async for chunk in backend.read_stream():
+        ...     clean = stripper.feed(chunk)
+        >>> clean = stripper.flush()
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+
+    @property
+    def pending(self) -> str:
+        """Held-back input that may be the start of an escape sequence."""
+        return self._pending
+
+    def feed(self, chunk: str) -> str:
+        """Strip a chunk of output.
+
+        Args:
+            chunk: New output.
+
+        Returns:
+            Stripped output that is final (may lag the input by an
+            incomplete escape sequence).
+        """
+        text = self._pending + chunk if self._pending else chunk
+        if "\x1b" not in text:
+            self._pending = ""
+            return text
+
+        hold = len(text)
+        match = _INCOMPLETE_RE.search(text, max(0, len(text) - MAX_PENDING))
+        if match:
+            hold = match.start()
+        self._pending = text[hold:]
+        return ANSI_ESCAPE_RE.sub("", text[:hold])
+
+    def flush(self) -> str:
+        """Strip any held-back output at the end of the stream."""
+        text, self._pending = self._pending, ""
+        return strip_ansi(text)
@@ -17,6 +17,9 @@ class Parser(ABC):
     Subclasses must implement:
         - is_ready(): Check if CLI is ready for input
         - parse(): Parse output into structured response
+
+    Subclasses may override incremental() to return a stateful parser
+    that consumes output chunk by chunk instead of re-scanning it.
     """
 
     @abstractmethod
@@ -57,3 +60,58 @@ class Parser(ABC):
             Parsed response (may be incomplete).
         """
         return self.parse(buffer)
+
+    def incremental(self) -> "IncrementalParser":
+        """Create per-execution parse state fed with output chunks.
+
+        Returns:
+            An IncrementalParser. The default re-runs is_ready()/parse() on
+            the accumulated output.
+        """
+        return IncrementalParser(self)
+
+
+class IncrementalParser:
+    """Stateful parser for the output of one execution.
+
+    Callers feed() output chunks as they arrive, poll is_ready(), and call
+    result() once the CLI is ready. This base implementation accumulates the
+    chunks and delegates to the stateless parser; parsers whose formats
+    allow it return subclasses that answer in O(new output) per chunk.
+
+    Example:
+        >>> state = parser.incremental()
+        >>> state.feed(chunk)
+        >>> if state.is_ready():
+        ...     response = state.result()
+    """
+
+    def __init__(self, parser: Parser) -> None:
+        self._parser = parser
+        self._chunks: list[str] = []
+        self._text: str | None = ""
+
+    def feed(self, chunk: str) -> None:
+        """Consume a chunk of output.
+
+        Args:
+            chunk: New output (may split lines or characters anywhere).
+        """
+        if chunk:
+            self._chunks.append(chunk)
+            self._text = None
+
+    def text(self) -> str:
+        """Get all output fed so far."""
+        if self._text is None:
+            self._text = "".join(self._chunks)
+            self._chunks = [self._text]
+        return self._text
+
+    def is_ready(self) -> bool:
+        """Check if the output fed so far shows the CLI ready for input."""
+        return self._parser.is_ready(self.text())
+
+    def result(self) -> ParsedResponse:
+        """Parse the output fed so far."""
+        return self._parser.parse(self.text())
@@ -8,6 +8,10 @@ Output Structure:
     - Tool calls: "⏺ ToolName(args)" with results starting with "⎿"
     - Text response: "⏺ " followed by regular text
     - Ready state: "-- INSERT --" with empty ">" prompt
+
+While a response streams in, ClaudeCodeIncrementalParser consumes output
+chunk by chunk: each complete line is classified once, so is_ready() costs
+O(new output) and result() only walks the response itself.
 """
 
 from __future__ import annotations
@@ -15,11 +19,59 @@ from __future__ import annotations
 import logging
 import re
 
-from nerve.core.parsers.base import Parser
+from nerve.core.parsers.base import IncrementalParser, Parser
 from nerve.core.types import ParsedResponse, Section
 
 logger = logging.getLogger(__name__)
 
+# is_ready() looks for interrupt hints in this many trailing lines
+READY_WINDOW_LINES = 50
+
+# Shown while Claude is processing
+_INTERRUPT_HINTS = ("esc to interrupt", "esc to cancel", "ctrl+c to interrupt")
+_INTERRUPT_HINT_RE = re.compile("|".join(map(re.escape, _INTERRUPT_HINTS)), re.IGNORECASE)
+# Characters kept from an unterminated line so hints split across chunks match
+_HINT_OVERLAP = max(map(len, _INTERRUPT_HINTS)) - 1
+
+_TOOL_CALL_RE = re.compile(r"^⏺\s+(\w+)\((.*)$")
+_TOKENS_RE = re.compile(r"(\d+)\s*tokens")
+
+
+def _is_user_prompt(line: str) -> bool:
+    """Check for a submitted prompt ("> " or "❯ " with text, not a suggestion)."""
+    return line.startswith(("> ", "❯ ")) and len(line.strip()) > 1 and "(tab to accept)" not in line
+
+
+def _is_compaction(line: str) -> bool:
+    """Check for the auto-compaction separator.
+
+    Real compaction lines start with ─ (box drawing char) like:
+    ──── Conversation compacted ────────────────────────────────
+    """
+    stripped = line.strip()
+    return stripped.startswith("─") and "conversation compacted" in stripped.lower()
+
+
+def _is_section_start(line: str) -> bool:
+    """Check for a response marker (must be the first character of the line)."""
+    return line.startswith(("∴", "⏺"))
+
+
+def _status_tokens(line: str) -> int | None:
+    """Extract the token count from a status line.
+
+    Valid status line patterns (must start with these to avoid diff/quoted content):
+    - "-- INSERT --" (insert mode)
+    - "?" (shortcuts hint)
+    - "⏵⏵" (bypass permissions mode)
+    """
+    if "tokens" not in line:
+        return None
+    if not line.strip().startswith(("-- INSERT --", "?", "⏵⏵")):
+        return None
+    match = _TOKENS_RE.search(line)
+    return int(match.group(1)) if match else None
+
 
 class ClaudeCodeParser(Parser):
     """Parser for Claude Code CLI output.
@@ -49,25 +101,23 @@ class ClaudeCodeParser(Parser):
         Returns:
             True if Claude is waiting for input.
         """
-        lines = content.strip().split("\n")
-        if len(lines) < 3:
-            return False
+        content = content.strip()
+
+        # Walk back over the last 50 lines without splitting the whole content
+        window_start = len(content)
+        newlines = 0
+        while newlines < READY_WINDOW_LINES:
+            window_start = content.rfind("\n", 0, window_start)
+            if window_start == -1:
+                break
+            newlines += 1
 
-        # Check bottom 50 lines
-        check_lines = lines[-50:] if len(lines) > 50 else lines
+        if newlines < 2:  # Fewer than 3 lines
+            return False
 
         # If any interrupt hint is present, still processing
         # Covers: "esc to interrupt", "esc to cancel", "ctrl+c to interrupt"
-        for line in check_lines:
-            line_lower = line.lower()
-            if (
-                "esc to interrupt" in line_lower
-                or "esc to cancel" in line_lower
-                or "ctrl+c to interrupt" in line_lower
-            ):
-                return False
-
-        return True
+        return _INTERRUPT_HINT_RE.search(content, window_start + 1) is None
 
     def parse(self, content: str) -> ParsedResponse:
         """Parse Claude output into structured response.
@@ -78,76 +128,29 @@ class ClaudeCodeParser(Parser):
         Returns:
             ParsedResponse with sections.
         """
-        raw = self._extract_response(content)
-        sections = self._parse_sections(raw)
-        tokens = self._extract_tokens(content)
-        is_ready = self.is_ready(content)
+        state = self.incremental()
+        state.feed(content)
+        return state.result()
 
-        # Count section types for logging
-        section_counts: dict[str, int] = {}
-        for s in sections:
-            section_counts[s.type] = section_counts.get(s.type, 0) + 1
+    def incremental(self) -> ClaudeCodeIncrementalParser:
+        """Create per-execution parse state fed with output chunks.
 
-        logger.debug(
-            "parse_complete: sections=%d, types=%s, tokens=%s, is_ready=%s, raw_len=%d",
-            len(sections),
-            section_counts,
-            tokens,
-            is_ready,
-            len(raw),
-        )
+        Returns:
+            A ClaudeCodeIncrementalParser.
+        """
+        return ClaudeCodeIncrementalParser(self)
 
-        return ParsedResponse(
-            raw=raw,
-            sections=tuple(sections),
-            is_complete=True,
-            is_ready=is_ready,
-            tokens=tokens,
-        )
+    def _extract_response(self, lines: list[str], start_idx: int) -> list[str]:
+        """Extract response lines between the start line and the current prompt.
 
-    def _extract_response(self, content: str) -> str:
-        """Extract response between last user prompt and current prompt.
+        Args:
+            lines: All output lines.
+            start_idx: Index of the last user prompt or compaction separator
+                (the response starts on the next line).
 
-        Handles two cases:
-        1. Normal: line starting with "> " followed by actual content
-        2. Auto-compacted: "Conversation compacted" separator line
+        Returns:
+            Response lines.
         """
-        lines = content.split("\n")
-
-        # First, check for compaction separator (takes precedence)
-        # Real compaction lines start with ─ (box drawing char) like:
-        # ──── Conversation compacted ────────────────────────────────
-        compaction_idx = -1
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith("─") and "conversation compacted" in stripped.lower():
-                compaction_idx = i
-
-        # Find last user prompt ("> " or "❯ " followed by actual text, not suggestions)
-        last_prompt_idx = -1
-        for i, line in enumerate(lines):
-            is_prompt = line.startswith("> ") or line.startswith("❯ ")
-            if is_prompt and len(line.strip()) > 1:
-                if "(tab to accept)" not in line:
-                    last_prompt_idx = i
-
-        # Determine start point
-        if compaction_idx > last_prompt_idx:
-            # Compaction happened after last prompt - use compaction as start
-            start_idx = compaction_idx
-        elif last_prompt_idx != -1:
-            # Normal case - use last prompt
-            start_idx = last_prompt_idx
-        else:
-            # Fallback: if content starts with Claude response markers, use beginning
-            # Markers must be first character of line (no leading whitespace)
-            for i, line in enumerate(lines):
-                if line.startswith("∴") or line.startswith("⏺"):
-                    start_idx = i - 1
-                    break
-            else:
-                return ""
-
         # Find end (empty prompt before status line)
         # Status lines start with "-- INSERT --" or "⏵⏵" (after stripping whitespace)
         end_idx = len(lines)
@@ -176,9 +179,7 @@ class ClaudeCodeParser(Parser):
         response_lines = lines[start_idx + 1 : end_idx]
 
         # Strip trailing prompt/status area (dash line followed by ">")
-        response_lines = self._strip_trailing_prompt(response_lines)
-
-        return "\n".join(response_lines)
+        return self._strip_trailing_prompt(response_lines)
 
     def _strip_trailing_prompt(self, lines: list[str]) -> list[str]:
         """Strip trailing prompt/status area from response.
@@ -252,8 +253,8 @@ class ClaudeCodeParser(Parser):
         # Consider it a dash line if > 50% are dashes and at least 10 dashes
         return dash_count >= 10 and dash_count / len(line) > 0.5
 
-    def _parse_sections(self, response: str) -> list[Section]:
-        """Parse response text into sections.
+    def _parse_sections(self, lines: list[str]) -> list[Section]:
+        """Parse response lines into sections.
 
         Handles:
         - Thinking blocks (∴ Thinking...)
@@ -261,7 +262,6 @@ class ClaudeCodeParser(Parser):
         - Text responses (⏺ followed by text)
         """
         sections: list[Section] = []
-        lines = response.split("\n")
         i = 0
 
         while i < len(lines):
@@ -287,7 +287,7 @@ class ClaudeCodeParser(Parser):
 
             # Tool call or text (both start with ⏺) - marker must be first character
             if line.startswith("⏺"):
-                tool_match = re.match(r"^⏺\s+(\w+)\((.*)$", line)
+                tool_match = _TOOL_CALL_RE.match(line)
                 if tool_match:
                     # Tool call - collect full args and result
                     tool_name = tool_match.group(1)
@@ -361,22 +361,185 @@ class ClaudeCodeParser(Parser):
 
         return sections
 
-    def _extract_tokens(self, content: str) -> int | None:
-        """Extract token count from status line."""
-        for line in reversed(content.split("\n")):
-            stripped = line.strip()
-            # Look for token count in status lines
-            # Valid status line patterns (must start with these to avoid diff/quoted content):
-            # - "-- INSERT --" (insert mode)
-            # - "?" (shortcuts hint)
-            # - "⏵⏵" (bypass permissions mode)
-            is_status_line = (
-                stripped.startswith("-- INSERT --")
-                or stripped.startswith("?")
-                or stripped.startswith("⏵⏵")
-            )
-            if is_status_line and "tokens" in line:
-                match = re.search(r"(\d+)\s*tokens", line)
-                if match:
-                    return int(match.group(1))
-        return None
+
+class ClaudeCodeIncrementalParser(IncrementalParser):
+    """Incremental Claude Code parser for one execution.
+
+    Each complete line is classified once as it arrives (content, interrupt
+    hint, user prompt, compaction separator, response marker, token count).
+    The unterminated last line is tracked piecewise, so a long line arriving
+    in many chunks is never re-scanned.
+
+    Example:
+        >>> state = ClaudeCodeParser().incremental()
+        >>> async for chunk in backend.read_stream():
+        ...     state.feed(chunk)
+        ...     if state.is_ready():
+        ...         break
+        >>> response = state.result()
+    """
+
+    def __init__(self, parser: ClaudeCodeParser) -> None:
+        super().__init__(parser)
+        self._claude = parser
+        self._lines: list[str] = []
+
+        # Unterminated last line
+        self._pieces: list[str] = []
+        self._partial_tail = ""
+        self._partial_hint = False
+        self._partial_content = False
+
+        # Indices into _lines (-1 = none yet)
+        self._first_content = -1
+        self._last_content = -1
+        self._last_hint = -1
+        self._last_prompt = -1
+        self._compaction = -1
+        self._first_marker = -1
+        self._tokens: int | None = None
+
+    def feed(self, chunk: str) -> None:
+        """Consume a chunk of output.
+
+        Args:
+            chunk: New output (may split lines anywhere).
+        """
+        if not chunk:
+            return
+        if "\n" not in chunk:
+            self._extend_partial(chunk)
+            return
+
+        parts = chunk.split("\n")
+        self._pieces.append(parts[0])
+        self._add_line("".join(self._pieces))
+        for line in parts[1:-1]:
+            self._add_line(line)
+
+        self._pieces = []
+        self._partial_tail = ""
+        self._partial_hint = False
+        self._partial_content = False
+        self._extend_partial(parts[-1])
+
+    def text(self) -> str:
+        """Get all output fed so far."""
+        return "\n".join([*self._lines, "".join(self._pieces)])
+
+    def is_ready(self) -> bool:
+        """Check if Claude is ready for input.
+
+        Same answer as ClaudeCodeParser.is_ready() on the output fed so far.
+        """
+        if self._partial_content:
+            last = len(self._lines)
+            first = self._first_content if self._first_content >= 0 else last
+        else:
+            last, first = self._last_content, self._first_content
+
+        if last < 0 or last - first < 2:  # Fewer than 3 lines
+            return False
+        if self._partial_hint:
+            return False
+        return self._last_hint < max(first, last - READY_WINDOW_LINES + 1)
+
+    def result(self) -> ParsedResponse:
+        """Parse the output fed so far.
+
+        Returns:
+            ParsedResponse with sections.
+        """
+        partial = "".join(self._pieces)
+        partial_idx = len(self._lines)
+
+        last_prompt = partial_idx if _is_user_prompt(partial) else self._last_prompt
+        compaction = partial_idx if _is_compaction(partial) else self._compaction
+        first_marker = self._first_marker
+        if first_marker < 0 and _is_section_start(partial):
+            first_marker = partial_idx
+        tokens = _status_tokens(partial)
+        if tokens is None:
+            tokens = self._tokens
+
+        # Determine start point
+        if compaction > last_prompt:
+            # Compaction happened after last prompt - use compaction as start
+            start_idx: int | None = compaction
+        elif last_prompt != -1:
+            # Normal case - use last prompt
+            start_idx = last_prompt
+        elif first_marker != -1:
+            # Fallback: content starts with Claude response markers
+            start_idx = first_marker - 1
+        else:
+            start_idx = None
+
+        self._lines.append(partial)
+        try:
+            if start_idx is None:
+                response_lines: list[str] = []
+            else:
+                response_lines = self._claude._extract_response(self._lines, start_idx)
+        finally:
+            self._lines.pop()
+
+        raw = "\n".join(response_lines)
+        sections = self._claude._parse_sections(response_lines)
+        is_ready = self.is_ready()
+
+        # Count section types for logging
+        section_counts: dict[str, int] = {}
+        for s in sections:
+            section_counts[s.type] = section_counts.get(s.type, 0) + 1
+
+        logger.debug(
+            "parse_complete: sections=%d, types=%s, tokens=%s, is_ready=%s, raw_len=%d",
+            len(sections),
+            section_counts,
+            tokens,
+            is_ready,
+            len(raw),
+        )
+
+        return ParsedResponse(
+            raw=raw,
+            sections=tuple(sections),
+            is_complete=True,
+            is_ready=is_ready,
+            tokens=tokens,
+        )
+
+    def _add_line(self, line: str) -> None:
+        idx = len(self._lines)
+        self._lines.append(line)
+        if not line or line.isspace():
+            return
+
+        if self._first_content < 0:
+            self._first_content = idx
+        self._last_content = idx
+
+        if _INTERRUPT_HINT_RE.search(line):
+            self._last_hint = idx
+        if _is_user_prompt(line):
+            self._last_prompt = idx
+        if _is_compaction(line):
+            self._compaction = idx
+        if self._first_marker < 0 and _is_section_start(line):
+            self._first_marker = idx
+        tokens = _status_tokens(line)
+        if tokens is not None:
+            self._tokens = tokens
+
+    def _extend_partial(self, text: str) -> None:
+        if not text:
+            return
+        self._pieces.append(text)
+
+        window = self._partial_tail + text
+        if not self._partial_hint and _INTERRUPT_HINT_RE.search(window):
+            self._partial_hint = True
+        if not self._partial_content and not text.isspace():
+            self._partial_content = True
+        self._partial_tail = window[-_HINT_OVERLAP:]
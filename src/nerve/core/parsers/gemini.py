@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 
+from nerve.core.parsers.ansi import last_visible_line
 from nerve.core.parsers.base import Parser
 from nerve.core.types import ParsedResponse, Section
 
@@ -41,13 +42,9 @@ class GeminiParser(Parser):
         Returns:
             True if Gemini is waiting for input.
         """
-        lines = content.strip().split("\n")
-        if not lines:
-            return False
-
         # TODO: Detect Gemini CLI ready state
         # This is a placeholder - needs actual Gemini CLI observation
-        last_line = lines[-1].strip()
+        last_line = last_visible_line(content)
 
         # Gemini might show a prompt like ">" or "gemini>"
         if last_line in (">", "gemini>", ">>> "):
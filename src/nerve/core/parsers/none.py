@@ -5,11 +5,15 @@ Use when you don't need structured parsing of CLI output.
 
 import logging
 
-from nerve.core.parsers.base import Parser
+from nerve.core.parsers.ansi import AnsiStripper, last_visible_line, strip_ansi
+from nerve.core.parsers.base import IncrementalParser, Parser
 from nerve.core.types import ParsedResponse, Section
 
 logger = logging.getLogger(__name__)
 
+# Common prompt endings (">" also covers ">>>")
+PROMPT_SUFFIXES = (">", "$", "%", "#", "❯")
+
 
 class NoneParser(Parser):
     """No-op parser that returns raw output without parsing.
@@ -30,9 +34,9 @@ class NoneParser(Parser):
     def is_ready(self, content: str) -> bool:
         """Check if ready for input.
 
-        For NoneParser, we consider it ready if:
-        - Content ends with a common prompt pattern (>, $, %, #)
-        - Handles prompts with or without trailing space
+        For NoneParser, we consider it ready if the last line with visible
+        text (ANSI escape codes stripped) ends with a common prompt pattern
+        (>, $, %, #, ❯), with or without trailing space.
 
         Args:
             content: Terminal output to check.
@@ -40,35 +44,7 @@ class NoneParser(Parser):
         Returns:
             True if appears ready for input.
         """
-        if not content:
-            return False
-
-        lines = content.strip().split("\n")
-        if not lines:
-            return False
-
-        # Strip ANSI escape codes from last line
-        last_line = self._strip_ansi(lines[-1]).strip()
-
-        # Common prompt patterns (with or without trailing space)
-        prompt_patterns = [">", ">>>", "$", "%", "#", "❯"]
-        for pattern in prompt_patterns:
-            # Exact match
-            if last_line == pattern:
-                return True
-            # Ends with pattern (with or without trailing space)
-            if last_line.endswith(pattern) or last_line.endswith(pattern + " "):
-                return True
-
-        return False
-
-    @staticmethod
-    def _strip_ansi(text: str) -> str:
-        """Strip ANSI escape codes from text."""
-        import re
-
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        return last_visible_line(content).endswith(PROMPT_SUFFIXES)
 
     def parse(self, content: str) -> ParsedResponse:
         """Return content as-is in a single text section.
@@ -94,3 +70,63 @@ class NoneParser(Parser):
             is_ready=is_ready,
             tokens=None,
         )
+
+    def incremental(self) -> "NoneIncrementalParser":
+        """Create per-execution parse state fed with output chunks.
+
+        Returns:
+            A NoneIncrementalParser.
+        """
+        return NoneIncrementalParser(self)
+
+
+class NoneIncrementalParser(IncrementalParser):
+    """Incremental NoneParser for one execution.
+
+    Each chunk is stripped of escape sequences once as it arrives, and only
+    the last visible line is kept for prompt detection, so is_ready() does
+    not re-scan earlier output.
+    """
+
+    def __init__(self, parser: NoneParser) -> None:
+        super().__init__(parser)
+        self._stripper = AnsiStripper()
+        self._line: list[str] = []  # Stripped pieces of the current line
+        self._last_visible = ""  # Last complete line with visible text
+
+    def feed(self, chunk: str) -> None:
+        """Consume a chunk of output.
+
+        Args:
+            chunk: New output (may split lines or escape sequences anywhere).
+        """
+        super().feed(chunk)
+        clean = self._stripper.feed(chunk)
+        if "\n" not in clean:
+            if clean:
+                self._line.append(clean)
+            return
+
+        parts = clean.split("\n")
+        self._line.append(parts[0])
+        complete = ["".join(self._line), *parts[1:-1]]
+        for line in reversed(complete):
+            if line.strip():
+                self._last_visible = line.strip()
+                break
+        self._line = [parts[-1]] if parts[-1] else []
+
+    def is_ready(self) -> bool:
+        """Check if the output fed so far ends at a prompt."""
+        # An incomplete sequence held back by the stripper is judged as
+        # strip_ansi() would judge it at the end of the output
+        line = "".join(self._line)
+        self._line = [line] if line else []
+        tail = line + strip_ansi(self._stripper.pending)
+
+        last_line = self._last_visible
+        for line in reversed(tail.split("\n")):
+            if line.strip():
+                last_line = line.strip()
+                break
+        return last_line.endswith(PROMPT_SUFFIXES)
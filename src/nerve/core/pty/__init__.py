@@ -7,10 +7,13 @@ available for integration with WezTerm.
 Backends:
     PTYBackend: Direct pseudo-terminal using pty.fork() (default)
     WezTermBackend: Uses WezTerm CLI to manage panes
+    WezTermCLI: Bounded, instrumented executor for `wezterm cli` commands
+    PanePoller: One polling loop shared by all watched WezTerm panes
 
 Classes:
     Backend: Abstract base class for backends
     BackendConfig: Configuration for backends
+    OutputBuffer: Bounded output storage with absolute offsets
 
 Legacy (deprecated, use backends instead):
     PTYProcess: Alias for PTYBackend
@@ -32,6 +35,7 @@ Example:
 
 from nerve.core.pty.backend import Backend, BackendConfig
 from nerve.core.pty.manager import PTYManager
+from nerve.core.pty.output_buffer import OutputBuffer
 
 # Legacy aliases for backwards compatibility
 from nerve.core.pty.process import PTYConfig, PTYProcess
@@ -42,13 +46,22 @@ from nerve.core.pty.wezterm_backend import (
     is_wezterm_available,
     is_wezterm_installed,
 )
+from nerve.core.pty.wezterm_cli import CLIResult, WezTermCLI, get_wezterm_cli
+from nerve.core.pty.wezterm_poller import PanePoller, PaneWatch, get_pane_poller
 
 __all__ = [
     # Backend API
     "Backend",
     "BackendConfig",
+    "OutputBuffer",
     "PTYBackend",
     "WezTermBackend",
+    "WezTermCLI",
+    "CLIResult",
+    "get_wezterm_cli",
+    "PanePoller",
+    "PaneWatch",
+    "get_pane_poller",
     "is_wezterm_available",
     "is_wezterm_installed",
     "ensure_wezterm_running",
@@ -0,0 +1,220 @@
+"""OutputBuffer - bounded, segmented storage for terminal output.
+
+A PTY produces output as a stream of small chunks. Keeping it in one string
+(``buffer += chunk`` followed by ``buffer[-limit:]``) copies the whole buffer
+on every append once the limit is reached, and every tail read splits the
+entire buffer into lines.
+
+OutputBuffer keeps chunks as separate segments plus an index of newline
+positions:
+
+- append() is O(len(chunk)) regardless of how much output is retained.
+- tail() is O(lines) to locate the start, then copies only the tail.
+- Positions are absolute byte offsets (UTF-8 bytes written since the buffer
+  was created), so they line up with the byte stream read from the terminal.
+  They keep counting across trimming and clear(), so an offset taken before
+  sending input still identifies "new output" later.
+
+Example:
+    >>> buf = OutputBuffer(max_size=1024)
+    >>> start = buf.end
+    >>> buf.append("hello\\nworld\\n")
+    >>> buf.since(start)
+    'hello\\nworld\\n'
+    >>> buf.tail(1)
+    ''
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+
+class OutputBuffer:
+    """Ring buffer of output segments with a newline index.
+
+    Sizes and offsets are in UTF-8 bytes. For ASCII output (the common case)
+    bytes and characters coincide and no extra work is done.
+
+    Args:
+        max_size: Maximum retained bytes. Oldest output is dropped first.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self._max_size = max_size
+        # (text, size in bytes) per appended chunk
+        self._segments: deque[tuple[str, int]] = deque()
+        # Absolute byte offset of the first retained character
+        self._start = 0
+        # Absolute byte offset just past the last character (total ever written)
+        self._end = 0
+        # Absolute byte offsets of retained "\n" characters, ascending
+        self._newlines: deque[int] = deque()
+        # Joined text, valid until the next mutation
+        self._text: str | None = ""
+
+    @property
+    def start(self) -> int:
+        """Absolute byte offset of the oldest retained character."""
+        return self._start
+
+    @property
+    def end(self) -> int:
+        """Absolute byte offset just past the newest character."""
+        return self._end
+
+    @property
+    def max_size(self) -> int:
+        """Maximum retained bytes."""
+        return self._max_size
+
+    def __len__(self) -> int:
+        """Retained size in bytes."""
+        return self._end - self._start
+
+    def __str__(self) -> str:
+        return self.text()
+
+    def append(self, chunk: str) -> None:
+        """Append a chunk, dropping the oldest output beyond max_size.
+
+        Args:
+            chunk: Text to append.
+        """
+        if not chunk:
+            return
+
+        base = self._end
+        if chunk.isascii():
+            size = len(chunk)
+            pos = chunk.find("\n")
+            while pos != -1:
+                self._newlines.append(base + pos)
+                pos = chunk.find("\n", pos + 1)
+        else:
+            # UTF-8 never uses 0x0A inside a multibyte sequence, so newline
+            # byte positions can be found in the encoded chunk directly
+            data = chunk.encode("utf-8", errors="replace")
+            size = len(data)
+            pos = data.find(b"\n")
+            while pos != -1:
+                self._newlines.append(base + pos)
+                pos = data.find(b"\n", pos + 1)
+
+        self._segments.append((chunk, size))
+        self._end += size
+        self._text = None
+        self._trim()
+
+    def text(self) -> str:
+        """Get all retained output.
+
+        The joined string is cached until the next append or clear, so
+        repeated reads between chunks cost nothing.
+
+        Returns:
+            Retained output.
+        """
+        if self._text is None:
+            self._text = "".join(text for text, _ in self._segments)
+        return self._text
+
+    def since(self, offset: int) -> str:
+        """Get output written at or after an absolute offset.
+
+        Only the requested suffix is copied, so reading new output after a
+        turn costs O(new output), not O(buffer).
+
+        Args:
+            offset: Absolute byte offset (e.g., a previous value of end).
+                Offsets before start return everything retained.
+
+        Returns:
+            Output from offset to end.
+        """
+        if offset >= self._end:
+            return ""
+        if offset <= self._start:
+            return self.text()
+
+        # Walk segments from the newest until offset is covered
+        parts: list[str] = []
+        seg_end = self._end
+        for text, size in reversed(self._segments):
+            seg_start = seg_end - size
+            if seg_start <= offset:
+                parts.append(_drop_bytes(text, size, offset - seg_start))
+                break
+            parts.append(text)
+            seg_end = seg_start
+        parts.reverse()
+        return "".join(parts)
+
+    def tail(self, lines: int) -> str:
+        """Get the last N lines.
+
+        Equivalent to ``"\\n".join(text().split("\\n")[-lines:])``.
+
+        Args:
+            lines: Number of lines.
+
+        Returns:
+            Last N lines of retained output.
+        """
+        if lines <= 0:
+            return self.text()
+        if len(self._newlines) < lines:
+            return self.text()
+        return self.since(self._newlines[-lines] + 1)
+
+    def clear(self) -> None:
+        """Drop all retained output (offsets keep counting)."""
+        self._segments.clear()
+        self._newlines.clear()
+        self._start = self._end
+        self._text = ""
+
+    def _trim(self) -> None:
+        excess = (self._end - self._start) - self._max_size
+        if excess <= 0:
+            return
+
+        new_start = self._start + excess
+        while self._segments:
+            text, size = self._segments[0]
+            head_end = self._start + size
+            if head_end <= new_start:
+                self._segments.popleft()
+                self._start = head_end
+                continue
+            # Cut inside the head segment (rounded up to a character boundary)
+            text = _drop_bytes(text, size, new_start - self._start)
+            remaining = len(text) if text.isascii() else len(text.encode("utf-8", "replace"))
+            self._segments[0] = (text, remaining)
+            self._start = head_end - remaining
+            break
+        else:
+            self._start = new_start
+
+        while self._newlines and self._newlines[0] < self._start:
+            self._newlines.popleft()
+
+
+def _drop_bytes(text: str, size: int, count: int) -> str:
+    """Drop the first count UTF-8 bytes of text.
+
+    Args:
+        text: Segment text.
+        size: Segment size in bytes.
+        count: Bytes to drop. A partial character at the cut is dropped too.
+
+    Returns:
+        The remaining text.
+    """
+    if count <= 0:
+        return text
+    if size == len(text):  # ASCII: bytes and characters coincide
+        return text[count:]
+    return text.encode("utf-8", "replace")[count:].decode("utf-8", "ignore")
@@ -3,23 +3,52 @@
 This is the default backend that uses Python's pty module to directly
 spawn and manage processes. It's simple, fast, and works everywhere
 Python runs.
+
+Output is read natively on the event loop: the master fd is registered with
+loop.add_reader() when the process starts, so an idle PTY costs no thread
+and no periodic wakeups. Each readable callback reads whatever is available,
+appends it to the buffer and fans it out to every read_stream() consumer.
+
+Bytes are decoded with an incremental UTF-8 decoder, so characters split
+across reads are reassembled instead of turning into U+FFFD. The read size
+grows while output is bursty (reads fill the buffer) and shrinks back when
+output is interactive.
 """
 
 from __future__ import annotations
 
 import asyncio
+import codecs
 import fcntl
 import os
 import pty
 import struct
 import termios
+import time
 from collections.abc import AsyncIterator
 
 from nerve.core.pty.backend import Backend, BackendConfig
+from nerve.core.pty.output_buffer import OutputBuffer
 
 # Maximum buffer size (2MB) - prevents unbounded growth for TUI apps
 MAX_BUFFER_SIZE = 2 * 1024 * 1024
 
+# Adaptive read size bounds (bytes per os.read)
+MIN_READ_SIZE = 4096
+MAX_READ_SIZE = 64 * 1024
+
+# Reader counters summed over every PTYBackend this process has run
+_reader_totals = {"wakeups": 0, "chunks": 0, "bytes": 0}
+
+
+def get_reader_totals() -> dict[str, int]:
+    """Process-wide reader counters: "wakeups", "chunks" and "bytes".
+
+    Unlike the per-backend reader_stats, these never go down when a
+    backend stops, so they can be exported as counters.
+    """
+    return dict(_reader_totals)
+
 
 class PTYBackend(Backend):
     """Direct PTY backend using pty.fork().
@@ -47,9 +76,25 @@ class PTYBackend(Backend):
         self._config = config or BackendConfig()
         self._master_fd: int | None = None
         self._pid: int | None = None
-        self._buffer: str = ""
+        self._buffer = OutputBuffer(MAX_BUFFER_SIZE)
         self._running = False
 
+        # Native reader: fd registered with the loop, chunks fanned out to
+        # one queue per read_stream() consumer (None marks end of output)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader_registered = False
+        self._eof = False
+        self._stream_queues: set[asyncio.Queue[str | None]] = set()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._read_size = MIN_READ_SIZE
+        self._reader_wakeups = 0
+        self._bytes_read = 0
+        self._chunks_read = 0
+
+        # Output notifications: replaced on every arrival so all waiters wake
+        self._output_event = asyncio.Event()
+        self._last_output_at: float | None = None
+
     @property
     def pid(self) -> int | None:
         """Process ID of the child process."""
@@ -63,13 +108,86 @@ class PTYBackend(Backend):
     @property
     def buffer(self) -> str:
         """Current accumulated output buffer."""
-        return self._buffer
+        return self._buffer.text()
+
+    @property
+    def output_offset(self) -> int:
+        """Absolute byte offset just past the newest output.
+
+        Unlike len(buffer), this keeps growing after the buffer is trimmed
+        or cleared. Take it before sending input and pass it to read_since()
+        to get exactly the output produced afterwards.
+        """
+        return self._buffer.end
+
+    def read_since(self, offset: int) -> str:
+        """Read output written at or after an absolute byte offset.
+
+        Copies only the requested output, not the whole buffer.
+
+        Args:
+            offset: Value previously returned by output_offset.
+
+        Returns:
+            Output since offset (or all retained output if the beginning
+            was already trimmed).
+        """
+        return self._buffer.since(offset)
 
     @property
     def config(self) -> BackendConfig:
         """Backend configuration."""
         return self._config
 
+    @property
+    def reader_stats(self) -> dict[str, int]:
+        """Reader counters.
+
+        Returns:
+            Dict with "wakeups" (readable callbacks run by the event loop),
+            "chunks" and "bytes" read from the PTY, and the current
+            "read_size".
+        """
+        return {
+            "wakeups": self._reader_wakeups,
+            "chunks": self._chunks_read,
+            "bytes": self._bytes_read,
+            "read_size": self._read_size,
+        }
+
+    @property
+    def last_output_at(self) -> float | None:
+        """time.monotonic() of the most recent output chunk, or None if none yet."""
+        return self._last_output_at
+
+    async def wait_for_output(self, timeout: float | None = None) -> bool:
+        """Wait until new output arrives.
+
+        Lets readiness checks react to output instead of polling the buffer.
+        Callers check the buffer first and then wait; since the check and the
+        wait run without yielding to the event loop, no chunk can slip between them.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if output arrived (or the process exited), False on timeout.
+        """
+        event = self._output_event
+        if timeout is not None and timeout <= 0:
+            return event.is_set()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    def _notify_output(self) -> None:
+        """Wake every task waiting in wait_for_output()."""
+        self._last_output_at = time.monotonic()
+        event, self._output_event = self._output_event, asyncio.Event()
+        event.set()
+
     async def start(self) -> None:
         """Start the PTY process.
 
@@ -101,6 +219,11 @@ class PTYBackend(Backend):
             flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
             fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
 
+            # Read output on the event loop as soon as it is available
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(master_fd, self._on_readable)
+            self._reader_registered = True
+
     async def write(self, data: str) -> None:
         """Write data to PTY stdin.
 
@@ -118,8 +241,13 @@ class PTYBackend(Backend):
     async def read_stream(self, chunk_size: int = 4096) -> AsyncIterator[str]:
         """Stream output chunks as they arrive.
 
+        Every call gets its own queue, so concurrent consumers each see
+        every chunk read after they started iterating. Reading itself is
+        driven by the event loop (see _on_readable), not by this iterator.
+
         Args:
-            chunk_size: Maximum bytes to read at once.
+            chunk_size: Kept for the Backend interface. Reads are sized
+                adaptively between MIN_READ_SIZE and MAX_READ_SIZE.
 
         Yields:
             Output chunks as strings.
@@ -130,30 +258,86 @@ class PTYBackend(Backend):
         if not self._master_fd:
             raise RuntimeError("PTY not started")
 
-        loop = asyncio.get_event_loop()
-
-        while self._running:
-            try:
-                # Wait for data with timeout
-                await loop.run_in_executor(None, lambda: self._wait_for_data(timeout=0.1))
-
-                data = os.read(self._master_fd, chunk_size)
-                if data:
-                    chunk = data.decode("utf-8", errors="replace")
-                    self._buffer += chunk
-
-                    # Rolling buffer: keep only last 2MB to prevent unbounded growth
-                    # This is important for TUI apps that redraw frequently
-                    if len(self._buffer) > MAX_BUFFER_SIZE:
-                        self._buffer = self._buffer[-MAX_BUFFER_SIZE:]
-
-                    yield chunk
-
-            except BlockingIOError:
-                await asyncio.sleep(0.01)
-            except OSError:
-                # Process likely terminated
-                break
+        if self._eof:
+            return
+
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._stream_queues.add(queue)
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            self._stream_queues.discard(queue)
+
+    def _on_readable(self) -> None:
+        """Read available output (called by the event loop when the fd is readable)."""
+        self._reader_wakeups += 1
+        _reader_totals["wakeups"] += 1
+        if self._master_fd is None:
+            return
+
+        try:
+            data = os.read(self._master_fd, self._read_size)
+        except BlockingIOError:
+            return  # Spurious wakeup
+        except OSError:
+            data = b""  # EIO: child closed its side of the PTY
+
+        if not data:
+            self._finish_reading()
+            return
+
+        self._chunks_read += 1
+        self._bytes_read += len(data)
+        _reader_totals["chunks"] += 1
+        _reader_totals["bytes"] += len(data)
+        self._adapt_read_size(len(data))
+
+        # Incomplete multibyte sequences stay in the decoder until the next read
+        self._publish(self._decoder.decode(data))
+
+    def _adapt_read_size(self, n: int) -> None:
+        """Grow the read size while reads fill it, shrink when output trickles."""
+        if n >= self._read_size:
+            self._read_size = min(self._read_size * 2, MAX_READ_SIZE)
+        elif n < self._read_size // 4:
+            self._read_size = max(self._read_size // 2, MIN_READ_SIZE)
+
+    def _publish(self, chunk: str) -> None:
+        """Buffer decoded output and hand it to waiters and stream consumers."""
+        if not chunk:
+            return
+
+        # Rolling buffer: keeps only the last 2MB (important for TUI apps
+        # that redraw frequently)
+        self._buffer.append(chunk)
+
+        self._notify_output()
+        for queue in self._stream_queues:
+            queue.put_nowait(chunk)
+
+    def _finish_reading(self) -> None:
+        """Unregister the reader and end every read_stream() consumer."""
+        self._remove_reader()
+        if self._eof:
+            return
+        self._eof = True
+        self._publish(self._decoder.decode(b"", final=True))
+
+        # Process likely terminated; wake waiters so they see it
+        self._notify_output()
+        for queue in self._stream_queues:
+            queue.put_nowait(None)
+
+    def _remove_reader(self) -> None:
+        """Unregister the master fd from the event loop."""
+        if self._reader_registered and self._loop is not None and self._master_fd is not None:
+            if not self._loop.is_closed():
+                self._loop.remove_reader(self._master_fd)
+        self._reader_registered = False
 
     def read_buffer(self, clear: bool = False) -> str:
         """Read the accumulated output buffer.
@@ -164,9 +348,9 @@ class PTYBackend(Backend):
         Returns:
             The buffer contents.
         """
-        content = self._buffer
+        content = self._buffer.text()
         if clear:
-            self._buffer = ""
+            self._buffer.clear()
         return content
 
     def read_tail(self, lines: int = 20) -> str:
@@ -178,12 +362,11 @@ class PTYBackend(Backend):
         Returns:
             Last N lines of output.
         """
-        all_lines = self._buffer.split("\n")
-        return "\n".join(all_lines[-lines:])
+        return self._buffer.tail(lines)
 
     def clear_buffer(self) -> None:
         """Clear the output buffer."""
-        self._buffer = ""
+        self._buffer.clear()
 
     async def resize(self, rows: int, cols: int) -> None:
         """Resize the PTY window.
@@ -240,6 +423,7 @@ class PTYBackend(Backend):
 
         self._running = False
         self._pid = None
+        self._finish_reading()
 
         if self._master_fd:
             try:
@@ -265,12 +449,3 @@ class PTYBackend(Backend):
         if self._master_fd:
             winsize = struct.pack("HHHH", rows, cols, 0, 0)
             fcntl.ioctl(self._master_fd, termios.TIOCSWINSZ, winsize)
-
-    def _wait_for_data(self, timeout: float) -> bool:
-        """Wait for data to be available on the PTY."""
-        import select
-
-        if self._master_fd:
-            r, _, _ = select.select([self._master_fd], [], [], timeout)
-            return bool(r)
-        return False
@@ -8,18 +8,121 @@ in WezTerm panes. Useful when you want to:
 
 Key difference from PTY: WezTerm maintains pane content internally,
 so we query it directly instead of maintaining a separate buffer.
+
+Pane text is captured asynchronously (capture()). Each backend keeps the
+latest snapshot for a short time and shares one in-flight `get-text`
+between concurrent readers, so polling loops do not block the event loop
+or spawn one process per reader.
+
+All `wezterm cli` processes go through a shared WezTermCLI executor, which
+bounds how many run at once and records spawn counts and latency. Writes
+are queued per pane and adjacent writes are merged into one send-text.
+
+Code waiting for pane output uses watch(), which subscribes to the shared
+PanePoller instead of running a polling loop per pane.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import os
 import subprocess
+import time
+from collections import deque
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from difflib import SequenceMatcher
 from typing import Any, cast
 
 from nerve.core.pty.backend import Backend, BackendConfig
+from nerve.core.pty.wezterm_cli import WezTermCLI, get_wezterm_cli
+from nerve.core.pty.wezterm_poller import PanePoller, PaneWatch, get_pane_poller
+
+logger = logging.getLogger(__name__)
+
+# Scrollback lines included in a full pane capture
+SCROLLBACK_LINES = 50000
+
+# Seconds a captured snapshot may be reused by capture() (writes invalidate it)
+SNAPSHOT_TTL = 0.05
+
+# Scrollback lines fetched per read_since() poll, and the factor the window
+# grows by when the cursor's lines are not in it
+DELTA_WINDOW_LINES = 200
+DELTA_WINDOW_GROWTH = 8
+
+# Matching lines needed to locate a cursor's position in a new window
+ANCHOR_LINES = 3
+
+
+@dataclass(frozen=True)
+class PaneCursor:
+    """Position in a pane's output, as seen by the last read.
+
+    Holds the most recent lines of the pane (trailing blank lines dropped)
+    so the next read can locate them in a small window of fresh output.
+    Obtain one from WezTermBackend.cursor() or read_since().
+    """
+
+    lines: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    text: str
+    taken_at: float
+    generation: int
+
+
+def _content_lines(content: str) -> tuple[str, ...]:
+    """Split pane text into lines, dropping blank lines below the output."""
+    content = content.rstrip()
+    return tuple(content.split("\n")) if content else ()
+
+
+def _old_start(matcher: SequenceMatcher[str], old_len: int) -> int | None:
+    """Index in the new lines where the old lines begin.
+
+    Returns:
+        The index (negative if the first old lines are above the new
+        window), or None if the old lines cannot be located.
+    """
+    anchor = max(matcher.get_matching_blocks(), key=lambda block: block.size)
+    # The last line may have grown since, so it need not be part of the anchor
+    if anchor.size < min(ANCHOR_LINES, max(1, old_len - 1)):
+        return None
+    return anchor.b - anchor.a
+
+
+def _line_delta(old: tuple[str, ...], new: tuple[str, ...]) -> str | None:
+    """Text in new that was not in old.
+
+    Returns:
+        The new text, or None if old's lines cannot be located in new.
+    """
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    first_new = _old_start(matcher, len(old))
+    if first_new is None:
+        return None
+
+    # Lines above where old begins are older history that a wider window
+    # brought in, not new output
+    parts: list[str] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag not in ("insert", "replace") or j2 <= first_new:
+            continue
+        if tag == "replace" and i2 - i1 == 1 and new[j1].startswith(old[i1]):
+            # Line grew in place: only the added characters are new, then
+            # any lines that followed it
+            parts.append(new[j1][len(old[i1]) :])
+            if j2 - j1 > 1:
+                parts.append("\n" + "\n".join(new[j1 + 1 : j2]))
+            continue
+        parts.append("\n" + "\n".join(new[j1:j2]))
+    return "".join(parts)
 
 
 class WezTermBackend(Backend):
@@ -29,8 +132,10 @@ class WezTermBackend(Backend):
     commands for all operations.
 
     Unlike PTY backend, WezTerm maintains pane content internally.
-    The `buffer` property queries WezTerm directly for fresh content
-    rather than maintaining a cached copy.
+    Use `await capture()` to get pane content: it reuses a snapshot taken
+    within the last SNAPSHOT_TTL seconds (and since the last write) and
+    joins a capture already in flight. The synchronous `buffer` property
+    is kept for compatibility and blocks when no fresh snapshot exists.
 
     Requirements:
         - WezTerm must be running
@@ -41,13 +146,13 @@ class WezTermBackend(Backend):
         >>> backend = WezTermBackend(["claude"], BackendConfig(cwd="/project"))
         >>> await backend.start()  # Creates new pane in WezTerm
         >>> await backend.write("hello\\n")
-        >>> content = backend.buffer  # Queries WezTerm directly
+        >>> content = await backend.capture()  # Queries WezTerm
         >>> await backend.stop()  # Kills the pane
         >>>
         >>> # Attach to existing pane
         >>> backend = WezTermBackend([], pane_id="4")
         >>> await backend.attach("4")
-        >>> content = backend.buffer
+        >>> content = await backend.capture()
     """
 
     def __init__(
@@ -55,6 +160,8 @@ class WezTermBackend(Backend):
         command: list[str],
         config: BackendConfig | None = None,
         pane_id: str | None = None,
+        cli: WezTermCLI | None = None,
+        poller: PanePoller | None = None,
     ) -> None:
         """Initialize WezTerm backend.
 
@@ -62,13 +169,50 @@ class WezTermBackend(Backend):
             command: Command and arguments to run (e.g., ["claude"]).
             config: Backend configuration options.
             pane_id: Existing pane ID to attach to (skips spawn).
+            cli: Executor for `wezterm cli` commands (default: the shared one).
+            poller: Poller serving watch() (default: the shared one).
         """
         self._command = command
         self._config = config or BackendConfig()
+        self._cli = cli or get_wezterm_cli()
+        self._poller = poller
         self._pane_id: str | None = pane_id
         self._running = pane_id is not None  # Already running if attaching
         self._attached = pane_id is not None  # Track if we attached vs spawned
 
+        # Snapshot cache per scrollback window: valid while younger than the
+        # caller's max_age and no write has happened since (writes bump the
+        # generation)
+        self._generation = 0
+        self._snapshots: dict[int, _Snapshot] = {}
+        self._capture_tasks: dict[int, tuple[asyncio.Task[str], int]] = {}
+        self._captures = 0
+        self._capture_bytes = 0
+        self._cache_hits = 0
+        self._coalesced = 0
+        self._anchor_misses = 0
+
+        # Writes waiting to be sent, drained in order by one task
+        self._send_queue: deque[tuple[str, asyncio.Future[None]]] = deque()
+        self._send_task: asyncio.Task[None] | None = None
+        self._sends = 0
+        self._writes = 0
+
+    @property
+    def cli(self) -> WezTermCLI:
+        """Executor running this backend's `wezterm cli` commands."""
+        return self._cli
+
+    @property
+    def send_stats(self) -> dict[str, int]:
+        """Write counters.
+
+        Returns:
+            Dict with "writes" (write() calls) and "sends" (send-text
+            processes they needed after chunking and merging).
+        """
+        return {"writes": self._writes, "sends": self._sends}
+
     @property
     def pane_id(self) -> str | None:
         """WezTerm pane ID."""
@@ -81,14 +225,230 @@ class WezTermBackend(Backend):
 
     @property
     def buffer(self) -> str:
-        """Current pane content - always fresh from WezTerm.
+        """Current pane content.
 
-        Unlike PTY backend which maintains a cached buffer, WezTerm
-        backend queries the pane content directly each time.
+        Returns the cached snapshot if it is still fresh, otherwise queries
+        WezTerm synchronously (blocking the event loop). Prefer
+        `await capture()` in async code.
         """
         if not self._pane_id:
             return ""
-        return self._get_pane_text_sync()
+        snapshot = self._fresh_snapshot(SCROLLBACK_LINES, SNAPSHOT_TTL)
+        if snapshot is not None:
+            self._cache_hits += 1
+            return snapshot
+        generation = self._generation
+        text = self._get_pane_text_sync()
+        self._store_snapshot(SCROLLBACK_LINES, text, generation)
+        return text
+
+    @property
+    def capture_stats(self) -> dict[str, int]:
+        """Capture counters.
+
+        Returns:
+            Dict with "captures" (get-text calls made) and "bytes" they
+            returned, "cache_hits" (reads served from a fresh snapshot),
+            "coalesced" (reads that joined a capture already in flight) and
+            "anchor_misses" (read_since() calls that had to widen the window).
+        """
+        return {
+            "captures": self._captures,
+            "bytes": self._capture_bytes,
+            "cache_hits": self._cache_hits,
+            "coalesced": self._coalesced,
+            "anchor_misses": self._anchor_misses,
+        }
+
+    async def capture(
+        self, max_age: float = SNAPSHOT_TTL, scrollback: int = SCROLLBACK_LINES
+    ) -> str:
+        """Get pane content without blocking the event loop.
+
+        Concurrent callers asking for the same window share one
+        `wezterm cli get-text` process.
+
+        Args:
+            max_age: Reuse a snapshot taken at most this many seconds ago
+                (and after the last write). Pass 0 to force a new capture,
+                which is still shared with other callers waiting for one.
+            scrollback: Lines of scrollback to include above the visible
+                screen. Small windows are much cheaper than full captures.
+
+        Returns:
+            Pane text ("" if no pane).
+        """
+        if not self._pane_id:
+            return ""
+        if max_age > 0:
+            snapshot = self._fresh_snapshot(scrollback, max_age)
+            if snapshot is not None:
+                self._cache_hits += 1
+                return snapshot
+
+        pending = self._capture_tasks.get(scrollback)
+        if pending is not None and not pending[0].done() and pending[1] == self._generation:
+            task = pending[0]
+            self._coalesced += 1
+        else:
+            task = asyncio.create_task(self._capture(scrollback, self._generation))
+            self._capture_tasks[scrollback] = (task, self._generation)
+
+        # Shield: one cancelled reader must not cancel the capture for others
+        return await asyncio.shield(task)
+
+    async def capture_tail(self, lines: int = 20, max_age: float = SNAPSHOT_TTL) -> str:
+        """Get the last N lines of pane content without blocking.
+
+        Only fetches a window of about N lines from WezTerm.
+
+        Args:
+            lines: Number of lines to return.
+            max_age: Snapshot reuse window (see capture()).
+
+        Returns:
+            Last N lines of pane content.
+        """
+        content = await self.capture(max_age, scrollback=lines)
+        return "\n".join(content.rsplit("\n", lines)[-lines:])
+
+    async def cursor(self) -> PaneCursor:
+        """Get a cursor at the current end of the pane's output.
+
+        Returns:
+            Cursor to pass to read_since().
+        """
+        content = await self.capture(max_age=0, scrollback=DELTA_WINDOW_LINES)
+        return PaneCursor(_content_lines(content)[-DELTA_WINDOW_LINES:])
+
+    @asynccontextmanager
+    async def watch(
+        self, busy: bool = True, scrollback: int = DELTA_WINDOW_LINES
+    ) -> AsyncIterator[PaneWatch]:
+        """Subscribe to pane updates from the shared poller.
+
+        The poller fetches this pane's text only when WezTerm reports a
+        change (or every MAX_STALENESS seconds), so many waiting nodes cost
+        one `wezterm cli list` per tick instead of one get-text each.
+
+        Args:
+            busy: Whether the caller is waiting for output (polls fast)
+                rather than idly monitoring (polls slowly).
+            scrollback: Lines of pane text each update carries.
+
+        Yields:
+            Watch whose next() returns the current text, then each update.
+
+        Example:
+            >>> async with backend.watch() as pane:
+            ...     while not parser.is_ready(await pane.next()):
+            ...         pass
+        """
+        poller = self._poller or get_pane_poller()
+        watch = poller.watch(self, scrollback=scrollback, busy=busy)
+        try:
+            yield watch
+        finally:
+            poller.unwatch(watch)
+
+    async def read_since(self, cursor: PaneCursor, max_age: float = 0) -> tuple[str, PaneCursor]:
+        """Read text that appeared in the pane since a cursor.
+
+        Fetches only the last DELTA_WINDOW_LINES lines and compares them with
+        the lines the cursor saw. Lines inserted since then (and lines
+        redrawn in place, such as a TUI status line) are returned; a line
+        that only grew returns just the added characters. If the cursor's
+        lines are no longer in the window (more output than the window
+        holds), the window is widened up to SCROLLBACK_LINES. If they are
+        gone entirely (e.g. the screen was cleared), the recent window is
+        returned as new text.
+
+        Args:
+            cursor: Cursor from cursor() or a previous read_since().
+            max_age: Snapshot reuse window (see capture()). The default
+                always fetches.
+
+        Returns:
+            Tuple of (new text, cursor to pass to the next call).
+        """
+        window = DELTA_WINDOW_LINES
+        first_lines: tuple[str, ...] | None = None
+        while True:
+            content = await self.capture(max_age=max_age, scrollback=window)
+            lines = _content_lines(content)
+            if first_lines is None:
+                first_lines = lines
+            if not cursor.lines:
+                text = "\n".join(lines)
+                break
+            delta = _line_delta(cursor.lines, lines)
+            if delta is not None:
+                text = delta
+                break
+            self._anchor_misses += 1
+            if window >= SCROLLBACK_LINES:
+                # Anchor lost: treat the recent window as new output
+                lines = first_lines
+                text = "\n".join(lines)
+                break
+            window = min(window * DELTA_WINDOW_GROWTH, SCROLLBACK_LINES)
+
+        return text, PaneCursor(lines[-DELTA_WINDOW_LINES:])
+
+    async def capture_since(self, cursor: PaneCursor) -> str:
+        """Capture the pane from a cursor's position to the end of the output.
+
+        Uses the same growing window as read_since(), but returns whole lines
+        as the pane shows them (the cursor's own lines included) rather than
+        a delta, so the text parses like a full capture while costing only
+        the output since the cursor. If the cursor's lines are gone, the
+        full SCROLLBACK_LINES capture is returned.
+
+        Args:
+            cursor: Cursor from cursor() or read_since().
+
+        Returns:
+            Pane text starting where the cursor's lines begin.
+        """
+        window = DELTA_WINDOW_LINES
+        while True:
+            content = await self.capture(max_age=0, scrollback=window)
+            if not cursor.lines:
+                return content
+            lines = _content_lines(content)
+            matcher = SequenceMatcher(None, cursor.lines, lines, autojunk=False)
+            start = _old_start(matcher, len(cursor.lines))
+            if start is not None:
+                return "\n".join(lines[max(start, 0) :])
+            self._anchor_misses += 1
+            if window >= SCROLLBACK_LINES:
+                return content
+            window = min(window * DELTA_WINDOW_GROWTH, SCROLLBACK_LINES)
+
+    async def _capture(self, scrollback: int, generation: int) -> str:
+        text = await self._get_pane_text(start_line=-scrollback)
+        self._store_snapshot(scrollback, text, generation)
+        return text
+
+    def _fresh_snapshot(self, scrollback: int, max_age: float) -> str | None:
+        snapshot = self._snapshots.get(scrollback)
+        if (
+            snapshot is None
+            or snapshot.generation != self._generation
+            or time.monotonic() - snapshot.taken_at > max_age
+        ):
+            return None
+        return snapshot.text
+
+    def _store_snapshot(self, scrollback: int, text: str, generation: int) -> None:
+        # A capture started before a write must not be cached as current
+        if generation != self._generation:
+            return
+        self._snapshots[scrollback] = _Snapshot(text, time.monotonic(), generation)
+
+    def _invalidate_snapshot(self) -> None:
+        self._generation += 1
+        self._snapshots.clear()
 
     @property
     def config(self) -> BackendConfig:
@@ -109,7 +469,7 @@ class WezTermBackend(Backend):
         if not await ensure_wezterm_running():
             raise RuntimeError("Failed to start WezTerm. Please start WezTerm manually.")
 
-        cmd = ["wezterm", "cli", "spawn"]
+        args: list[str] = []
 
         # If not running from within WezTerm, we need to specify where to spawn
         if not os.environ.get("WEZTERM_PANE"):
@@ -119,32 +479,27 @@ class WezTermBackend(Backend):
                 # Use the first existing pane's window
                 first_pane_id = str(existing_panes[0].get("pane_id", ""))
                 if first_pane_id:
-                    cmd.extend(["--pane-id", first_pane_id])
+                    args.extend(["--pane-id", first_pane_id])
             else:
                 # No existing panes, create a new window
-                cmd.append("--new-window")
+                args.append("--new-window")
 
         if self._config.cwd:
-            cmd.extend(["--cwd", self._config.cwd])
+            args.extend(["--cwd", self._config.cwd])
 
         # Only add command if provided
         if self._command:
-            cmd.append("--")
-            cmd.extend(self._command)
+            args.append("--")
+            args.extend(self._command)
 
         try:
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await result.communicate()
+            result = await self._cli.run("spawn", *args)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"wezterm spawn failed: {stderr.decode()}")
+            if not result.ok:
+                raise RuntimeError(f"wezterm spawn failed: {result.error}")
 
             # spawn outputs the pane ID
-            self._pane_id = stdout.decode().strip()
+            self._pane_id = result.text.strip()
             self._running = True
 
         except FileNotFoundError as err:
@@ -162,18 +517,11 @@ class WezTermBackend(Backend):
             RuntimeError: If pane doesn't exist.
         """
         # Verify pane exists by trying to get its text
-        cmd = ["wezterm", "cli", "get-text", "--pane-id", pane_id]
-
         try:
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _, stderr = await result.communicate()
+            result = await self._cli.run("get-text", "--pane-id", pane_id)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Pane {pane_id} not found: {stderr.decode()}")
+            if not result.ok:
+                raise RuntimeError(f"Pane {pane_id} not found: {result.error}")
 
             self._pane_id = pane_id
             self._running = True
@@ -194,60 +542,113 @@ class WezTermBackend(Backend):
 
         Large text is sent in chunks to work around WezTerm's send-text limitation
         where characters can get scrambled or dropped with large payloads.
+        Writes are queued and sent in order; writes queued while an earlier
+        one is being sent are merged into the same send-text (up to
+        CHUNK_SIZE characters), so they cost one process instead of several.
 
         Args:
             data: Text to send to the pane.
 
         Raises:
-            RuntimeError: If pane is not started.
+            RuntimeError: If pane is not started or send-text fails.
         """
         if not self._pane_id:
             raise RuntimeError("WezTerm pane not started")
 
         # Convert \n to \r for terminal (Enter key is carriage return)
         data = data.replace("\n", "\r")
-
-        # Send in chunks to avoid WezTerm's large text issues
-        for i in range(0, len(data), self.CHUNK_SIZE):
-            chunk = data[i : i + self.CHUNK_SIZE]
-            await self._send_chunk(chunk)
-            # Delay between chunks (but not after the last one)
-            if i + self.CHUNK_SIZE < len(data):
+        self._invalidate_snapshot()
+        self._writes += 1
+        if not data:
+            return
+
+        sent: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._send_queue.append((data, sent))
+        if self._send_task is None or self._send_task.done():
+            self._send_task = asyncio.create_task(self._drain_send_queue())
+        await sent
+
+    async def _drain_send_queue(self) -> None:
+        """Send queued writes in CHUNK_SIZE pieces until the queue is empty."""
+        first = True
+        while self._send_queue:
+            if not first:
+                # Delay between chunks; writes queued meanwhile join the next one
                 await asyncio.sleep(self.CHUNK_DELAY)
+            first = False
+
+            chunk, completed = self._next_chunk()
+            try:
+                await self._send_chunk(chunk)
+            except Exception as err:
+                # The rest of the queue would arrive out of context: fail it too
+                failed = completed + [sent for _, sent in self._send_queue]
+                self._send_queue.clear()
+                for sent in failed:
+                    if not sent.done():
+                        sent.set_exception(err)
+                return
+
+            for sent in completed:
+                if not sent.done():
+                    sent.set_result(None)
+
+    def _next_chunk(self) -> tuple[str, list[asyncio.Future[None]]]:
+        """Take up to CHUNK_SIZE characters from the front of the send queue.
+
+        Returns:
+            Tuple of (chunk text, futures of the writes it completes).
+        """
+        parts: list[str] = []
+        size = 0
+        completed: list[asyncio.Future[None]] = []
+        while self._send_queue and size < self.CHUNK_SIZE:
+            data, sent = self._send_queue[0]
+            room = self.CHUNK_SIZE - size
+            if len(data) > room:
+                parts.append(data[:room])
+                self._send_queue[0] = (data[room:], sent)
+                break
+            parts.append(data)
+            size += len(data)
+            completed.append(sent)
+            self._send_queue.popleft()
+        return "".join(parts), completed
 
     async def _send_chunk(self, data: str) -> None:
         """Send a single chunk of text to the WezTerm pane."""
-        cmd = [
-            "wezterm",
-            "cli",
+        if not self._pane_id:
+            raise RuntimeError("WezTerm pane not started")
+
+        self._sends += 1
+        result = await self._cli.run(
             "send-text",
             "--pane-id",
             self._pane_id,
             "--no-paste",  # Send directly, not as bracketed paste
             data,
-        ]
-
-        result = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
         )
-        _, stderr = await result.communicate()
 
-        if result.returncode != 0:
-            raise RuntimeError(f"wezterm send-text failed: {stderr.decode()}")
+        if not result.ok:
+            raise RuntimeError(f"wezterm send-text failed: {result.error}")
 
-    async def read_stream(self, chunk_size: int = 4096) -> AsyncIterator[str]:
+    async def read_stream(
+        self, chunk_size: int = 4096, since: PaneCursor | None = None
+    ) -> AsyncIterator[str]:
         """Stream output by polling WezTerm pane content.
 
-        Since WezTerm CLI doesn't support true streaming, this polls
-        get-text and yields new content as it appears.
+        Since WezTerm CLI doesn't support true streaming, this watches the
+        pane through the shared poller and yields read_since() deltas as
+        they appear. Without a cursor, the first chunk is the recent window
+        of the pane (up to DELTA_WINDOW_LINES lines).
 
         Note: For WezTerm, this is mainly useful for compatibility.
         Direct buffer access via the `buffer` property is preferred.
 
         Args:
             chunk_size: Not used (kept for interface compatibility).
+            since: Cursor to stream from (e.g. taken before sending input),
+                so only output after it is yielded.
 
         Yields:
             Output chunks as strings.
@@ -258,32 +659,54 @@ class WezTermBackend(Backend):
         if not self._pane_id:
             raise RuntimeError("WezTerm pane not started")
 
-        last_content = ""
-        while self._running:
-            try:
-                new_content = self._get_pane_text_sync()
+        cursor = since or PaneCursor()
+        async with self.watch(busy=True) as pane:
+            while self._running:
+                try:
+                    await pane.next()
+                    # The poller just refreshed the snapshot read_since() needs
+                    chunk, cursor = await self.read_since(cursor, max_age=SNAPSHOT_TTL)
+                    if chunk:
+                        yield chunk
 
-                # Find new content by comparing with last seen
-                if len(new_content) > len(last_content):
-                    chunk = new_content[len(last_content) :]
-                    last_content = new_content
-                    yield chunk
-                elif new_content != last_content:
-                    # Content changed but didn't grow (scrollback limit?)
-                    last_content = new_content
+                except Exception:
+                    # Pane might be gone
+                    break
 
-                await asyncio.sleep(0.1)  # Poll interval
+    async def _get_pane_text(self, start_line: int | None = -SCROLLBACK_LINES) -> str:
+        """Get text content from the pane without blocking.
 
-            except Exception:
-                # Pane might be gone
-                break
+        Args:
+            start_line: Starting line (negative for scrollback).
+                        Default includes SCROLLBACK_LINES of scrollback.
 
-    def _get_pane_text_sync(self, start_line: int | None = -50000) -> str:
+        Returns:
+            Pane text content ("" if the pane is gone).
+        """
+        if not self._pane_id:
+            return ""
+
+        args = ["--pane-id", self._pane_id]
+        if start_line is not None:
+            args.extend(["--start-line", str(start_line)])
+
+        self._captures += 1
+        try:
+            result = await self._cli.run("get-text", *args)
+        except (FileNotFoundError, TimeoutError):
+            return ""
+
+        self._capture_bytes += len(result.stdout)
+        return result.text if result.ok else ""
+
+    def _get_pane_text_sync(self, start_line: int | None = -SCROLLBACK_LINES) -> str:
         """Synchronously get text content from the pane.
 
+        Blocks the calling thread; only used by the synchronous accessors.
+
         Args:
             start_line: Starting line (negative for scrollback).
-                        Default is -50000 to include scrollback buffer.
+                        Default includes SCROLLBACK_LINES of scrollback.
 
         Returns:
             Pane text content.
@@ -291,21 +714,21 @@ class WezTermBackend(Backend):
         if not self._pane_id:
             return ""
 
-        cmd = ["wezterm", "cli", "get-text", "--pane-id", self._pane_id]
-
+        args = ["--pane-id", self._pane_id]
         if start_line is not None:
-            cmd.extend(["--start-line", str(start_line)])
+            args.extend(["--start-line", str(start_line)])
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
+        self._captures += 1
+        result = self._cli.run_sync("get-text", *args)
+        self._capture_bytes += len(result.stdout)
 
-        return result.stdout if result.returncode == 0 else ""
+        return result.text if result.ok else ""
 
     def get_tail(self, lines: int = 20) -> str:
-        """Get the last N lines from the pane - fresh from WezTerm.
+        """Get the last N lines from the pane.
+
+        Synchronous; served from a fresh snapshot when one exists,
+        otherwise fetches only about N lines.
 
         Args:
             lines: Number of lines to fetch.
@@ -313,10 +736,14 @@ class WezTermBackend(Backend):
         Returns:
             Last N lines of pane content.
         """
-        # Use negative start-line to get from scrollback
-        content = self._get_pane_text_sync()
-        all_lines = content.split("\n")
-        return "\n".join(all_lines[-lines:])
+        content = self._fresh_snapshot(lines, SNAPSHOT_TTL)
+        if content is None:
+            content = self._fresh_snapshot(SCROLLBACK_LINES, SNAPSHOT_TTL)
+        if content is None:
+            content = self._get_pane_text_sync(start_line=-lines)
+        else:
+            self._cache_hits += 1
+        return "\n".join(content.rsplit("\n", lines)[-lines:])
 
     def read_buffer(self, clear: bool = False) -> str:
         """Read pane content.
@@ -350,13 +777,13 @@ class WezTermBackend(Backend):
     async def sync_buffer(self) -> str:
         """Get fresh pane content.
 
-        For WezTerm, this is equivalent to accessing the buffer property
-        since we always query fresh content. Kept for interface compatibility.
+        Always captures (joining a capture already in flight) instead of
+        reusing a cached snapshot.
 
         Returns:
             Current pane content.
         """
-        return self.buffer
+        return await self.capture(max_age=0)
 
     async def stop(self) -> None:
         """Stop the backend.
@@ -365,53 +792,34 @@ class WezTermBackend(Backend):
         For attached panes, just disconnects (doesn't kill).
         """
         if self._pane_id and not self._attached:
-            # Only kill panes we spawned, not ones we attached to
-            cmd = ["wezterm", "cli", "kill-pane", "--pane-id", self._pane_id]
-
+            # Only kill panes we spawned, not ones we attached to.
             # Use synchronous subprocess to avoid asyncio cancellation during cleanup
-            import subprocess
-
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
+                result = self._cli.run_sync(
+                    "kill-pane",
+                    "--pane-id",
+                    self._pane_id,
                     timeout=5,  # 5 second timeout
                 )
-                if result.returncode != 0:
-                    import logging
-
-                    logging.getLogger(__name__).warning(
+                if not result.ok:
+                    logger.warning(
                         "Failed to kill WezTerm pane %s: %s",
                         self._pane_id,
-                        result.stderr.decode() if result.stderr else "unknown error",
+                        result.error or "unknown error",
                     )
             except subprocess.TimeoutExpired:
-                import logging
-
-                logging.getLogger(__name__).warning(
-                    "Timeout killing WezTerm pane %s", self._pane_id
-                )
+                logger.warning("Timeout killing WezTerm pane %s", self._pane_id)
             except Exception as e:
-                import logging
-
-                logging.getLogger(__name__).warning(
-                    "Error killing WezTerm pane %s: %s", self._pane_id, e
-                )
+                logger.warning("Error killing WezTerm pane %s: %s", self._pane_id, e)
 
         self._running = False
         self._pane_id = None
+        self._invalidate_snapshot()
 
     async def focus(self) -> None:
         """Focus (activate) the WezTerm pane."""
         if self._pane_id:
-            cmd = ["wezterm", "cli", "activate-pane", "--pane-id", self._pane_id]
-
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await result.communicate()
+            await self._cli.run("activate-pane", "--pane-id", self._pane_id)
 
     async def get_pane_info(self) -> dict[str, Any] | None:
         """Get information about the pane.
@@ -422,18 +830,11 @@ class WezTermBackend(Backend):
         if not self._pane_id:
             return None
 
-        cmd = ["wezterm", "cli", "list", "--format", "json"]
-
-        result = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await result.communicate()
+        result = await self._cli.run("list", "--format", "json")
 
-        if result.returncode == 0:
+        if result.ok:
             try:
-                panes: list[dict[str, Any]] = json.loads(stdout.decode())
+                panes: list[dict[str, Any]] = json.loads(result.text)
                 for pane in panes:
                     if str(pane.get("pane_id")) == self._pane_id:
                         return pane
@@ -450,13 +851,9 @@ def list_wezterm_panes() -> list[dict[str, Any]]:
         List of pane info dicts.
     """
     try:
-        result = subprocess.run(
-            ["wezterm", "cli", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            return cast(list[dict[str, Any]], json.loads(result.stdout))
+        result = get_wezterm_cli().run_sync("list", "--format", "json")
+        if result.ok:
+            return cast(list[dict[str, Any]], json.loads(result.text))
     except (FileNotFoundError, json.JSONDecodeError):
         pass
 
@@ -470,12 +867,7 @@ def is_wezterm_available() -> bool:
         True if wezterm CLI is available and WezTerm is running.
     """
     try:
-        result = subprocess.run(
-            ["wezterm", "cli", "list"],
-            capture_output=True,
-            timeout=5,
-        )
-        return result.returncode == 0
+        return get_wezterm_cli().run_sync("list", timeout=5).ok
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
@@ -0,0 +1,249 @@
+"""Shared executor for `wezterm cli` subcommands.
+
+Every WezTerm operation (send-text, get-text, list, ...) runs a short-lived
+`wezterm cli` process. WezTermCLI runs them with bounded concurrency, so
+many backends polling at once queue up instead of forking without limit,
+and records per-subcommand spawn counts and latency.
+
+Example:
+    >>> cli = get_wezterm_cli()
+    >>> result = await cli.run("get-text", "--pane-id", "4")
+    >>> result.ok, result.text
+    (True, '$ ')
+    >>> cli.stats["operations"]["get-text"]["calls"]
+    1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import subprocess
+import time
+from dataclasses import dataclass
+from typing import Any
+
+# Concurrent `wezterm cli` processes allowed per executor (per event loop)
+CLI_MAX_CONCURRENCY = 8
+
+# Seconds before a `wezterm cli` process that has not exited is killed
+CLI_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class CLIResult:
+    """Outcome of one `wezterm cli` invocation."""
+
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command exited successfully."""
+        return self.returncode == 0
+
+    @property
+    def text(self) -> str:
+        """Decoded stdout."""
+        return self.stdout.decode(errors="replace")
+
+    @property
+    def error(self) -> str:
+        """Decoded stderr."""
+        return self.stderr.decode(errors="replace")
+
+
+class _OperationStats:
+    __slots__ = ("calls", "failures", "total_ms", "max_ms", "wait_ms")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.wait_ms = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "max_ms": self.max_ms,
+            "wait_ms": self.wait_ms,
+        }
+
+
+class WezTermCLI:
+    """Runs `wezterm cli` subcommands with bounded concurrency.
+
+    Async runs hold one of max_concurrency slots while their process is
+    alive; callers beyond that wait for a slot. Synchronous runs
+    (run_sync(), for the blocking accessors) are not bounded but are
+    counted in the same stats.
+
+    Args:
+        max_concurrency: Processes allowed to run at once.
+        executable: Path or name of the wezterm binary.
+    """
+
+    def __init__(
+        self, max_concurrency: int = CLI_MAX_CONCURRENCY, executable: str = "wezterm"
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._executable = executable
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._operations: dict[str, _OperationStats] = {}
+        self._spawns = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @property
+    def max_concurrency(self) -> int:
+        """Processes allowed to run at once."""
+        return self._max_concurrency
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Executor metrics.
+
+        Returns:
+            Dict with "spawns" (processes started), "in_flight" and
+            "peak_in_flight" (processes alive now / at most), and
+            "operations": per-subcommand dicts of "calls", "failures",
+            "total_ms", "mean_ms", "max_ms" (process run time) and "wait_ms"
+            (time spent waiting for a slot).
+        """
+        return {
+            "spawns": self._spawns,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "operations": {name: op.as_dict() for name, op in self._operations.items()},
+        }
+
+    def reset_stats(self) -> None:
+        """Clear all counters."""
+        self._operations.clear()
+        self._spawns = 0
+        self._peak_in_flight = self._in_flight
+
+    async def run(
+        self, subcommand: str, *args: str, timeout: float | None = CLI_TIMEOUT
+    ) -> CLIResult:
+        """Run `wezterm cli <subcommand> <args>` without blocking.
+
+        If the timeout expires or the caller is cancelled, the process is
+        killed and reaped before this returns, so it never outlives the
+        call or keeps holding its slot.
+
+        Args:
+            subcommand: CLI subcommand (e.g. "get-text").
+            *args: Subcommand arguments.
+            timeout: Seconds before the process is killed (None: no limit).
+
+        Returns:
+            The process result.
+
+        Raises:
+            FileNotFoundError: If the wezterm executable is not found.
+            TimeoutError: If the timeout expires.
+        """
+        op = self._operations.setdefault(subcommand, _OperationStats())
+        queued_at = time.perf_counter()
+        async with self._get_semaphore():
+            started = time.perf_counter()
+            op.wait_ms += (started - queued_at) * 1000
+            self._begin(op)
+            returncode = -1
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self._executable,
+                    "cli",
+                    subcommand,
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    async with asyncio.timeout(timeout):
+                        stdout, stderr = await process.communicate()
+                except (TimeoutError, asyncio.CancelledError) as e:
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                    await process.wait()
+                    if isinstance(e, TimeoutError):
+                        raise TimeoutError(
+                            f"wezterm cli {subcommand} timed out after {timeout}s"
+                        ) from None
+                    raise
+                returncode = process.returncode if process.returncode is not None else -1
+            finally:
+                self._end(op, started, returncode)
+
+        return CLIResult(returncode, stdout, stderr)
+
+    def run_sync(self, subcommand: str, *args: str, timeout: float | None = None) -> CLIResult:
+        """Run `wezterm cli <subcommand> <args>`, blocking the calling thread.
+
+        Args:
+            subcommand: CLI subcommand (e.g. "list").
+            *args: Subcommand arguments.
+            timeout: Seconds before the process is killed.
+
+        Returns:
+            The process result.
+
+        Raises:
+            FileNotFoundError: If the wezterm executable is not found.
+            subprocess.TimeoutExpired: If the timeout expires.
+        """
+        op = self._operations.setdefault(subcommand, _OperationStats())
+        started = time.perf_counter()
+        self._begin(op)
+        returncode = -1
+        try:
+            result = subprocess.run(
+                [self._executable, "cli", subcommand, *args],
+                capture_output=True,
+                timeout=timeout,
+            )
+            returncode = result.returncode
+        finally:
+            self._end(op, started, returncode)
+
+        return CLIResult(returncode, result.stdout, result.stderr)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; the executor is shared
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def _begin(self, op: _OperationStats) -> None:
+        op.calls += 1
+        self._spawns += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _end(self, op: _OperationStats, started: float, returncode: int) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._in_flight -= 1
+        op.total_ms += elapsed_ms
+        op.max_ms = max(op.max_ms, elapsed_ms)
+        if returncode != 0:
+            op.failures += 1
+
+
+_default_cli: WezTermCLI | None = None
+
+
+def get_wezterm_cli() -> WezTermCLI:
+    """Get the process-wide executor shared by WezTerm backends."""
+    global _default_cli
+    if _default_cli is None:
+        _default_cli = WezTermCLI()
+    return _default_cli
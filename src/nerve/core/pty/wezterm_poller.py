@@ -0,0 +1,296 @@
+"""Shared polling loop for WezTerm panes.
+
+Nodes waiting on WezTerm panes used to poll their own pane text, so N
+nodes meant N independent `get-text` loops. PanePoller runs one loop per
+process instead: each tick makes a single `wezterm cli list` call, compares
+every watched pane's cursor position, title and size with the previous
+tick, and fetches text only for panes that changed (or that have not been
+fetched for max_staleness seconds, since a TUI can redraw without moving
+the cursor). The text is delivered to every watcher of that pane.
+
+The tick is fast_interval while any watcher is busy (waiting for output)
+and idle_interval otherwise; the loop stops when nothing is watched.
+
+Example:
+    >>> poller = get_pane_poller()
+    >>> watch = poller.watch(backend, scrollback=200)
+    >>> try:
+    ...     text = await watch.next()  # Current text, then one per change
+    ... finally:
+    ...     poller.unwatch(watch)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from nerve.core.pty.wezterm_cli import WezTermCLI, get_wezterm_cli
+
+if TYPE_CHECKING:
+    from nerve.core.pty.wezterm_backend import WezTermBackend
+
+logger = logging.getLogger(__name__)
+
+# Tick interval while a watcher is busy / while all watchers are idle
+FAST_INTERVAL = 0.1
+IDLE_INTERVAL = 2.0
+
+# Longest a watched pane goes without a text fetch when `list` shows no change
+MAX_STALENESS = 2.0
+
+# Fields of `wezterm cli list` whose change means the pane text may have changed
+_SIGNATURE_FIELDS = ("title", "cursor_x", "cursor_y", "cursor_visibility", "size")
+
+
+class PaneWatch:
+    """A watcher's view of one pane, created by PanePoller.watch().
+
+    Attributes:
+        busy: Whether the watcher is waiting for output. Busy watchers make
+            the poller tick at its fast interval.
+    """
+
+    def __init__(
+        self, poller: PanePoller, backend: WezTermBackend, busy: bool, scrollback: int
+    ) -> None:
+        self._poller = poller
+        self.backend = backend
+        self.scrollback = scrollback
+        self._busy = busy
+        self._text = ""
+        self._updates = 0
+        self._event = asyncio.Event()
+
+    @property
+    def busy(self) -> bool:
+        """Whether the watcher is waiting for output."""
+        return self._busy
+
+    @busy.setter
+    def busy(self, value: bool) -> None:
+        self._busy = value
+        if value:
+            self._poller._wake()
+
+    @property
+    def updates(self) -> int:
+        """Number of texts delivered so far."""
+        return self._updates
+
+    async def next(self) -> str:
+        """Wait for the next pane text.
+
+        The first call returns the current text; later calls return when
+        the pane changed or was refreshed. If several updates arrived since
+        the last call, only the latest is returned.
+
+        Returns:
+            Pane text (the last `scrollback` lines).
+        """
+        await self._event.wait()
+        self._event.clear()
+        return self._text
+
+    def _deliver(self, text: str) -> None:
+        self._text = text
+        self._updates += 1
+        self._event.set()
+
+
+@dataclass
+class _PaneState:
+    signature: tuple[Any, ...] | None = None
+    fetched_at: float = 0.0
+
+
+class PanePoller:
+    """One polling loop shared by all watched WezTerm panes.
+
+    Args:
+        cli: Executor for `wezterm cli` (default: the shared one).
+        fast_interval: Seconds between ticks while a watcher is busy.
+        idle_interval: Seconds between ticks while all watchers are idle.
+        max_staleness: Seconds after which a watched pane's text is fetched
+            even if `list` shows no change.
+    """
+
+    def __init__(
+        self,
+        cli: WezTermCLI | None = None,
+        fast_interval: float = FAST_INTERVAL,
+        idle_interval: float = IDLE_INTERVAL,
+        max_staleness: float = MAX_STALENESS,
+    ) -> None:
+        self._cli = cli or get_wezterm_cli()
+        self.fast_interval = fast_interval
+        self.idle_interval = idle_interval
+        self.max_staleness = max_staleness
+
+        self._watches: dict[str, list[PaneWatch]] = {}
+        self._panes: dict[str, _PaneState] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake_event: asyncio.Event | None = None
+
+        self._ticks = 0
+        self._fetches = 0
+        self._skipped = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Poller counters.
+
+        Returns:
+            Dict with "ticks" (list calls), "fetches" (pane texts fetched),
+            "skipped" (watched panes left unfetched because nothing changed),
+            "watched_panes" and the current "interval".
+        """
+        return {
+            "ticks": self._ticks,
+            "fetches": self._fetches,
+            "skipped": self._skipped,
+            "watched_panes": len(self._watches),
+            "interval": self._interval(),
+        }
+
+    def watch(self, backend: WezTermBackend, scrollback: int, busy: bool = True) -> PaneWatch:
+        """Start watching a backend's pane.
+
+        Args:
+            backend: Backend whose pane to watch (its capture() does the
+                fetching, so the fetched text also refreshes its snapshot).
+            scrollback: Lines of pane text to deliver.
+            busy: Whether the watcher is waiting for output.
+
+        Returns:
+            Watch to read updates from; pass it to unwatch() when done.
+
+        Raises:
+            RuntimeError: If the backend has no pane.
+        """
+        pane_id = backend.pane_id
+        if not pane_id:
+            raise RuntimeError("WezTerm pane not started")
+
+        self._ensure_running()
+        watch = PaneWatch(self, backend, busy, scrollback)
+        self._watches.setdefault(pane_id, []).append(watch)
+        self._wake()
+        return watch
+
+    def unwatch(self, watch: PaneWatch) -> None:
+        """Stop delivering updates to a watch."""
+        for pane_id, watches in list(self._watches.items()):
+            if watch in watches:
+                watches.remove(watch)
+                if not watches:
+                    del self._watches[pane_id]
+                    self._panes.pop(pane_id, None)
+                    self._wake()  # Let the loop exit if nothing is left
+                break
+
+    def _interval(self) -> float:
+        busy = any(w.busy for watches in self._watches.values() for w in watches)
+        return self.fast_interval if busy else self.idle_interval
+
+    def _wake(self) -> None:
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Watches from another (finished) event loop cannot be served
+            self._loop = loop
+            self._watches.clear()
+            self._panes.clear()
+            self._task = None
+            self._wake_event = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wake_event is not None
+        while self._watches:
+            self._wake_event.clear()
+            try:
+                await self._tick()
+            except Exception as e:
+                # The loop serves every watcher; one bad tick must not end it
+                logger.warning("WezTerm pane poll failed: %s", e)
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), self._interval())
+            except TimeoutError:
+                pass
+
+    async def _tick(self) -> None:
+        self._ticks += 1
+        signatures = await self._list_signatures()
+        now = time.monotonic()
+
+        due: list[str] = []
+        for pane_id, watches in self._watches.items():
+            state = self._panes.setdefault(pane_id, _PaneState())
+            signature = signatures.get(pane_id) if signatures is not None else None
+            changed = signatures is None or signature != state.signature
+            stale = now - state.fetched_at >= self.max_staleness
+            waiting = any(w.updates == 0 for w in watches)
+            state.signature = signature
+            if changed or stale or waiting:
+                due.append(pane_id)
+            else:
+                self._skipped += 1
+
+        await asyncio.gather(*(self._fetch(pane_id) for pane_id in due))
+
+    async def _fetch(self, pane_id: str) -> None:
+        watches = list(self._watches.get(pane_id, ()))
+        if not watches:
+            return
+        scrollback = max(w.scrollback for w in watches)
+        self._fetches += 1
+        try:
+            text = await watches[0].backend.capture(max_age=0, scrollback=scrollback)
+        except Exception:
+            text = ""
+        self._panes.setdefault(pane_id, _PaneState()).fetched_at = time.monotonic()
+        for watch in watches:
+            if watch.scrollback < scrollback:
+                watch._deliver("\n".join(text.rsplit("\n", watch.scrollback)[-watch.scrollback :]))
+            else:
+                watch._deliver(text)
+
+    async def _list_signatures(self) -> dict[str, tuple[Any, ...]] | None:
+        """Get each pane's change signature, or None if `list` failed."""
+        try:
+            result = await self._cli.run("list", "--format", "json")
+            if not result.ok:
+                return None
+            panes = json.loads(result.text)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(panes, list):
+            return None
+        return {
+            str(pane.get("pane_id")): tuple(
+                json.dumps(pane.get(field), sort_keys=True) for field in _SIGNATURE_FIELDS
+            )
+            for pane in panes
+            if isinstance(pane, dict)
+        }
+
+
+_default_poller: PanePoller | None = None
+
+
+def get_pane_poller() -> PanePoller:
+    """Get the process-wide poller shared by WezTerm backends."""
+    global _default_poller
+    if _default_poller is None:
+        _default_poller = PanePoller()
+    return _default_poller
@@ -36,6 +36,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from nerve.core.nodes.base import Node, NodeInfo
+    from nerve.core.nodes.concurrency import ConcurrencyLimiter
     from nerve.core.nodes.graph import Graph
     from nerve.core.nodes.session_logging import SessionLogger
     from nerve.core.workflow import Workflow, WorkflowRun, WorkflowRunInfo, WorkflowState
@@ -61,6 +62,8 @@ class Session:
         server_name: Name used for history file paths.
         history_enabled: Whether to enable history by default.
         history_base_dir: Base directory for history files.
+        concurrency_limits: Max concurrent executions per resource class
+            (e.g., {"llm:openrouter": 8}), enforced by graphs and workflows.
 
     Example:
         >>> from nerve.core.session import Session
@@ -105,6 +108,9 @@ class Session:
     history_enabled: bool = True
     history_base_dir: Path | None = None
 
+    # Parallel execution limits per resource class
+    concurrency_limits: dict[str, int] = field(default_factory=dict)
+
     # Logging configuration
     file_logging: bool = True
     console_logging: bool = False
@@ -112,11 +118,15 @@ class Session:
     # Session logging (internal)
     _session_logger: SessionLogger | None = field(default=None, repr=False)
     _start_time: float | None = field(default=None, repr=False)
+    _limiter: ConcurrencyLimiter = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize session logger and auto-create identity node."""
+        from nerve.core.nodes.concurrency import ConcurrencyLimiter
         from nerve.core.nodes.session_logging import SessionLogger
 
+        self._limiter = ConcurrencyLimiter(self.concurrency_limits)
+
         self._session_logger = SessionLogger.create(
             session_name=self.name,
             server_name=self.server_name,
@@ -139,6 +149,11 @@ class Session:
         """Session ID (same as name for compatibility)."""
         return self.name
 
+    @property
+    def limiter(self) -> ConcurrencyLimiter:
+        """Concurrency limiter shared by all executors in this session."""
+        return self._limiter
+
     # =========================================================================
     # Registry Access
     # =========================================================================
@@ -363,6 +378,7 @@ class Session:
             return False
         if hasattr(node, "stop"):
             await node.stop()
+        self._limiter.forget_node(node_id)
         logger.debug("[%s] delete_node: node_id=%s, found=True", self.name, node_id)
 
         # Log to session logger
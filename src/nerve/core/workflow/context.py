@@ -107,15 +107,16 @@ class WorkflowContext:
             **kwargs,
         )
 
-        # Execute with optional timeout
+        # Execute with optional timeout, once the node's concurrency slot is free
         try:
-            if timeout:
-                result = await asyncio.wait_for(
-                    node.execute(exec_ctx),
-                    timeout=timeout,
-                )
-            else:
-                result = await node.execute(exec_ctx)
+            async with self.session.limiter.slot(node):
+                if timeout:
+                    result = await asyncio.wait_for(
+                        node.execute(exec_ctx),
+                        timeout=timeout,
+                    )
+                else:
+                    result = await node.execute(exec_ctx)
         except TimeoutError:
             self.emit("node_timeout", {"node_id": node_id, "timeout": timeout})
             raise
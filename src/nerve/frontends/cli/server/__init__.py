@@ -149,7 +149,59 @@ def server() -> None:
 @click.option("--port", default=8080, help="Port for network transport")
 @click.option("--tcp", "use_tcp", is_flag=True, help="Use TCP socket transport (requires --host)")
 @click.option("--http", "use_http", is_flag=True, help="Use HTTP transport (requires --host)")
-def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool) -> None:
+@click.option(
+    "--warm",
+    "warm_specs",
+    multiple=True,
+    metavar="BACKEND:SIZE:COMMAND",
+    help="Keep SIZE pre-started pty/claude-wezterm nodes running COMMAND (repeatable)",
+)
+@click.option("--warm-cwd", default=None, help="Working directory for --warm nodes")
+@click.option(
+    "--client-queue",
+    default=1024,
+    show_default=True,
+    help="Events a slow client may have queued before --overflow applies",
+)
+@click.option(
+    "--overflow",
+    type=click.Choice(["drop-oldest", "coalesce", "disconnect"]),
+    default="drop-oldest",
+    show_default=True,
+    help="What a full client queue does with new events",
+)
+@click.option(
+    "--json-lines",
+    is_flag=True,
+    help="Decline binary framing offers; always speak JSON lines (unix/tcp)",
+)
+@click.option(
+    "--limit",
+    "limit_specs",
+    multiple=True,
+    metavar="COMMAND_TYPE=N",
+    help="Run at most N commands of this type at once, e.g. EXECUTE_INPUT=8 (repeatable)",
+)
+@click.option(
+    "--max-queued",
+    type=int,
+    default=None,
+    help="Reject commands of a --limit type once this many are waiting (default: no bound)",
+)
+def start(
+    name: str,
+    host: str | None,
+    port: int,
+    use_tcp: bool,
+    use_http: bool,
+    warm_specs: tuple[str, ...],
+    warm_cwd: str | None,
+    client_queue: int,
+    overflow: str,
+    json_lines: bool,
+    limit_specs: tuple[str, ...],
+    max_queued: int | None,
+) -> None:
     """Start the nerve daemon.
 
     NAME determines the socket path (/tmp/nerve-NAME.sock). Defaults to "local".
@@ -159,7 +211,11 @@ def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool)
 
         Unix socket (default): Local-only, fast IPC via /tmp/nerve-NAME.sock
 
-        TCP socket (--tcp): Network-capable, same JSON-line protocol
+        TCP socket (--tcp): Network-capable, same protocol as Unix sockets
+
+        Unix and TCP clients negotiate binary length-prefixed frames
+        (msgpack/orjson, zstd/deflate when installed); older clients keep
+        JSON lines. --json-lines turns negotiation off for debugging.
 
         HTTP (--http): REST API + WebSocket for web clients
 
@@ -170,6 +226,27 @@ def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool)
         nerve server start myproject
 
         nerve server start myproject --tcp --host 0.0.0.0 --port 8080
+
+    **Warm nodes:**
+
+        nerve server start --warm "claude-wezterm:2:claude --dangerously-skip-permissions"
+
+        Node creations with the same backend, command and cwd (none, or
+        --warm-cwd) get a pre-started node immediately.
+
+    **Slow clients:**
+
+        Each client has its own event queue, so a stalled client never
+        delays the others. When a queue is full, --overflow drops the
+        oldest event, coalesces output chunks, or disconnects the client.
+
+    **Admission limits:**
+
+        nerve server start --limit EXECUTE_INPUT=8 --limit EXECUTE_GRAPH=2 --max-queued 100
+
+        Commands beyond a limit wait their turn; with --max-queued, further
+        ones are rejected with a retry_after hint. Interrupt, cancel, list
+        and get commands are never limited.
     """
     from nerve.core.validation import validate_name
 
@@ -184,6 +261,27 @@ def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool)
     if (use_tcp or use_http) and not host:
         error_exit("--tcp and --http require --host")
 
+    from nerve.server import NodePool, PoolTemplate
+
+    node_pool: NodePool | None = None
+    if warm_specs:
+        try:
+            node_pool = NodePool([PoolTemplate.parse(spec, cwd=warm_cwd) for spec in warm_specs])
+        except ValueError as e:
+            error_exit(str(e))
+
+    from nerve.server import AdmissionController
+    from nerve.server.admission import parse_limit
+
+    admission: AdmissionController | None = None
+    if limit_specs:
+        try:
+            admission = AdmissionController(
+                dict(parse_limit(spec) for spec in limit_specs), max_queued=max_queued
+            )
+        except ValueError as e:
+            error_exit(str(e))
+
     socket_path = f"/tmp/nerve-{name}.sock"
     pid_file = f"/tmp/nerve-{name}.pid"
     http_file = f"/tmp/nerve-{name}.http"
@@ -204,7 +302,7 @@ def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool)
     click.echo(f"Starting nerve daemon '{name}'...")
 
     from nerve.server import build_nerve_engine
-    from nerve.transport import HTTPServer, TCPSocketServer, UnixSocketServer
+    from nerve.transport import HTTPServer, OverflowPolicy, TCPSocketServer, UnixSocketServer
 
     # Determine transport type
     transport_type = "unix"  # default
@@ -219,17 +317,35 @@ def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool)
     transport: HTTPServer | TCPSocketServer | UnixSocketServer
     if transport_type == "http":
         assert host is not None  # Type narrowing
-        transport = HTTPServer(host=host, port=port)
+        transport = HTTPServer(
+            host=host,
+            port=port,
+            max_client_queue=client_queue,
+            overflow_policy=OverflowPolicy(overflow),
+        )
         click.echo(f"Listening on http://{host}:{port}")
     elif transport_type == "tcp":
         assert host is not None  # Type narrowing
-        transport = TCPSocketServer(host=host, port=port)
+        transport = TCPSocketServer(
+            host=host,
+            port=port,
+            max_client_queue=client_queue,
+            overflow_policy=OverflowPolicy(overflow),
+            binary_framing=not json_lines,
+        )
         click.echo(f"Listening on tcp://{host}:{port}")
     else:
-        transport = UnixSocketServer(socket_path)
+        transport = UnixSocketServer(
+            socket_path,
+            max_client_queue=client_queue,
+            overflow_policy=OverflowPolicy(overflow),
+            binary_framing=not json_lines,
+        )
         click.echo(f"Listening on {socket_path}")
 
-    engine = build_nerve_engine(event_sink=transport, server_name=name)
+    engine = build_nerve_engine(
+        event_sink=transport, server_name=name, node_pool=node_pool, admission=admission
+    )
 
     # Create new process group so we can kill all children on force stop
     os.setpgrp()
@@ -288,10 +404,17 @@ def start(name: str, host: str | None, port: int, use_tcp: bool, use_http: bool)
         loop.add_signal_handler(sig.SIGINT, lambda: handle_shutdown("SIGINT"))
 
         try:
+            if node_pool is not None:
+                await node_pool.start()
             await transport.serve(engine)
         finally:
             # Clean up all nodes before exiting
             click.echo("Cleaning up nodes...")
+            if node_pool is not None:
+                try:
+                    await node_pool.stop()
+                except Exception:
+                    pass  # Best effort cleanup
             for session in engine.session_registry.get_all_sessions():
                 for _node_id, node in list(session.nodes.items()):
                     try:
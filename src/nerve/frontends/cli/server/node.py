@@ -684,21 +684,22 @@ async def node_read(node_name: str, server_name: str, lines: int | None) -> None
     from nerve.server.protocols import Command, CommandType
 
     async with server_connection(server_name) as client:
-        params: dict[str, str | int] = {"node_id": node_name}
+        # Streamed in parts, so megabyte buffers print as they arrive
+        params: dict[str, str | int] = {"node_id": node_name, "chunk_size": 64 * 1024}
         if lines:
             params["lines"] = lines
 
-        result = await client.send_command(
-            Command(
-                type=CommandType.GET_BUFFER,
-                params=params,
-            )
-        )
-
-        if result.success and result.data:
-            click.echo(result.data.get("buffer", ""))
-        else:
-            error_exit(result.error or "Unknown error")
+        try:
+            async for part in client.send_command_stream(
+                Command(
+                    type=CommandType.GET_BUFFER,
+                    params=params,
+                )
+            ):
+                click.echo(part.get("buffer", ""), nl=False)
+        except RuntimeError as e:
+            error_exit(str(e))
+        click.echo()
 
 
 @node.command("send")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from nerve.server.protocols import CommandResult, Event
+    from nerve.server.protocols import Command, CommandResult, Event, EventFilter
 
 
 @dataclass
@@ -73,32 +74,36 @@ class RemoteNode:
         Yields:
             Output chunks.
         """
-        from nerve.server.protocols import Command, CommandType
-
-        # Subscribe to events for this node
-        async def get_chunks() -> AsyncIterator[str]:
-            async for event in self._client.events():
-                if event.node_id == self.id:
-                    if event.type.name == "OUTPUT_CHUNK":
-                        yield event.data.get("chunk", "")
-                    elif event.type.name == "NODE_READY":
-                        break
+        from nerve.server.protocols import Command, CommandType, EventFilter, EventType
 
-        # Send the command
-        await self._client._send_command(
-            Command(
-                type=CommandType.EXECUTE_INPUT,
-                params={
-                    "node_id": self.id,
-                    "text": text,
-                    "parser": parser,
-                    "stream": True,
-                },
-            )
+        # Subscribe before sending so no chunk is missed; the server then
+        # sends this connection only this node's chunks and ready event
+        event_filter = EventFilter(
+            event_types=frozenset({EventType.OUTPUT_CHUNK, EventType.NODE_READY}),
+            node_ids=frozenset({self.id}),
         )
+        subscription_id = await self._client._subscribe(event_filter)
+        try:
+            await self._client._send_command(
+                Command(
+                    type=CommandType.EXECUTE_INPUT,
+                    params={
+                        "node_id": self.id,
+                        "text": text,
+                        "parser": parser,
+                        "stream": True,
+                    },
+                )
+            )
 
-        async for chunk in get_chunks():
-            yield chunk
+            async for event in self._client._transport.events():
+                if not event_filter.matches(event):
+                    continue
+                if event.type is EventType.NODE_READY:
+                    break
+                yield event.data.get("chunk", "")
+        finally:
+            await self._client._unsubscribe(subscription_id)
 
     async def interrupt(self) -> None:
         """Send interrupt signal."""
@@ -198,18 +203,24 @@ class NerveClient:
     _nodes: dict[str, RemoteNode] = field(default_factory=dict)
 
     @classmethod
-    async def connect(cls, socket_path: str) -> NerveClient:
+    async def connect(cls, socket_path: str, pool_size: int = 1) -> NerveClient:
         """Connect to a nerve server via Unix socket.
 
         Args:
             socket_path: Path to the Unix socket.
+            pool_size: Number of connections. Above 1, requests are spread
+                over a ClientPool that reconnects dropped connections.
 
         Returns:
             Connected client.
         """
-        from nerve.transport import UnixSocketClient
+        from nerve.transport import ClientPool, UnixSocketClient
 
-        transport = UnixSocketClient(socket_path)
+        transport: UnixSocketClient | ClientPool
+        if pool_size > 1:
+            transport = ClientPool.unix(socket_path, size=pool_size)
+        else:
+            transport = UnixSocketClient(socket_path)
         await transport.connect()
 
         client = cls(_transport=transport)
@@ -398,15 +409,130 @@ class NerveClient:
             return nodes
         return []
 
-    async def events(self) -> AsyncIterator[Event]:
+    async def batch(
+        self,
+        commands: Sequence[Command],
+        sequential: bool = False,
+        after: Mapping[int, Iterable[int]] | None = None,
+        stop_on_error: bool = False,
+    ) -> list[CommandResult]:
+        """Send many commands without a round trip per command.
+
+        Unordered commands are pipelined: all of them are written to the
+        connection before any result is awaited, and results are matched
+        up by request_id. Ordered commands (sequential, after or
+        stop_on_error) are sent as one BATCH command and the server runs
+        them in order, so they still cost a single round trip.
+
+        Args:
+            commands: Commands to send.
+            sequential: Run the commands one after another.
+            after: Maps a command's index to the indexes of earlier
+                commands it must wait for; the others run concurrently.
+            stop_on_error: Skip the commands not yet started once one fails.
+
+        Returns:
+            One result per command, in order. A command skipped because
+            one it waited for failed has an error saying so.
+
+        Raises:
+            RuntimeError: If there is no transport, or the server rejected
+                the batch (e.g. an "after" naming a later command).
+
+        Example:
+            >>> results = await client.batch(
+            ...     [Command(CommandType.CREATE_NODE, {"node_id": f"w{i}"}) for i in range(20)]
+            ... )
+            >>> failed = [r.error for r in results if not r.success]
+        """
+        from nerve.server.protocols import Command, CommandResult, CommandType
+
+        if not commands:
+            return []
+        if not (sequential or after or stop_on_error):
+            return list(await asyncio.gather(*(self._send_command(c) for c in commands)))
+
+        after = after or {}
+        result = await self._send_command(
+            Command(
+                type=CommandType.BATCH,
+                params={
+                    "commands": [
+                        {
+                            "type": command.type.name,
+                            "params": command.params,
+                            "after": sorted(after.get(index, ())),
+                        }
+                        for index, command in enumerate(commands)
+                    ],
+                    "sequential": sequential,
+                    "stop_on_error": stop_on_error,
+                },
+            )
+        )
+        if not result.success:
+            raise RuntimeError(result.error)
+
+        return [
+            CommandResult(success=r["success"], data=r.get("data"), error=r.get("error"))
+            for r in (result.data or {}).get("results", [])
+        ]
+
+    async def events(
+        self,
+        event_types: set[str] | None = None,
+        node_ids: set[str] | None = None,
+        session_ids: set[str] | None = None,
+    ) -> AsyncIterator[Event]:
         """Subscribe to events.
 
+        The server only sends the events asked for, so narrow filters
+        save serialization and bandwidth on busy servers.
+
+        Args:
+            event_types: Event type names to receive (default: all).
+            node_ids: Nodes whose events to receive (default: all).
+            session_ids: Sessions whose events to receive (default: all).
+
         Yields:
             Events from the server.
+
+        Raises:
+            ValueError: If an event type name is unknown.
         """
-        if self._transport:
+        from nerve.server.protocols import EventFilter
+
+        if not self._transport:
+            return
+
+        event_filter = EventFilter.from_params(
+            {"event_types": event_types, "node_ids": node_ids, "session_ids": session_ids}
+        )
+        subscription_id = await self._subscribe(event_filter)
+        try:
             async for event in self._transport.events():
-                yield event
+                # The connection may carry other subscriptions' events too
+                if event_filter.matches(event):
+                    yield event
+        finally:
+            await self._unsubscribe(subscription_id)
+
+    async def _subscribe(self, event_filter: EventFilter) -> str | None:
+        """Subscribe the transport's connection, if it supports subscriptions."""
+        subscribe = getattr(self._transport, "subscribe", None)
+        if subscribe is None:
+            return None
+        subscription_id: str = await subscribe(event_filter)
+        return subscription_id
+
+    async def _unsubscribe(self, subscription_id: str | None) -> None:
+        """Undo _subscribe(). Best effort: the connection may be gone."""
+        if subscription_id is None:
+            return
+        try:
+            await self._transport.unsubscribe(subscription_id)
+        except (RuntimeError, TimeoutError, ConnectionError):
+            pass
 
     async def _send_command(self, command: Any) -> CommandResult:
         """Send a command via transport."""
@@ -14,6 +14,8 @@ Classes:
     EventSink: Protocol for event consumers.
     Command: Command message type.
     Event: Event message type.
+    NodePool: Pre-started terminal nodes claimed by CREATE_NODE.
+    AdmissionController: Per-command-type concurrency limits.
 
 Example:
     >>> from nerve.server import build_nerve_engine, Command, CommandType
@@ -30,14 +32,19 @@ Example:
     ... ))
 """
 
+from nerve.server.admission import AdmissionController
 from nerve.server.engine import NerveEngine, build_nerve_engine
+from nerve.server.metrics import MetricsRegistry
+from nerve.server.node_pool import NodePool, PoolTemplate
 from nerve.server.protocols import (
     Command,
     CommandResult,
     CommandType,
     Event,
+    EventFilter,
     EventSink,
     EventType,
+    StreamedResult,
 )
 from nerve.server.proxy_manager import (
     ProviderConfig,
@@ -53,9 +60,18 @@ __all__ = [
     "EventSink",
     "Event",
     "EventType",
+    "EventFilter",
     "Command",
     "CommandType",
     "CommandResult",
+    "StreamedResult",
+    # Admission control
+    "AdmissionController",
+    # Metrics
+    "MetricsRegistry",
+    # Node pool
+    "NodePool",
+    "PoolTemplate",
     # Proxy management
     "ProxyManager",
     "ProxyInstance",
@@ -0,0 +1,216 @@
+"""AdmissionController - Per-command-type concurrency limits for the engine.
+
+NerveEngine.execute() used to start every command as soon as it arrived,
+so a burst of EXECUTE_INPUT or EXECUTE_GRAPH commands started dozens of
+LLM calls and terminal interactions at once. With an AdmissionController,
+command types that have a limit run at most that many at a time; the
+rest wait in a FIFO queue for their type. When max_queued commands of a
+type are already waiting, new ones are rejected with a retry-after hint
+(estimated from recent execution times) instead of queueing.
+
+Control and query commands (interrupt, cancel, list, get, ping) are a
+priority lane: they cannot be limited and never wait behind queued work.
+BATCH cannot be limited either; each command in a batch is admitted on
+its own.
+
+Example:
+    >>> admission = AdmissionController(
+    ...     limits={CommandType.EXECUTE_INPUT: 8, CommandType.EXECUTE_GRAPH: 2},
+    ...     max_queued=100,
+    ... )
+    >>> engine = build_nerve_engine(event_sink=transport, admission=admission)
+    >>> admission.stats["EXECUTE_INPUT"]["queued"]
+    0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from nerve.server.protocols import CommandType
+
+# Commands that are never limited or queued
+PRIORITY_COMMANDS: frozenset[CommandType] = frozenset(
+    {
+        CommandType.SEND_INTERRUPT,
+        CommandType.CANCEL_GRAPH,
+        CommandType.CANCEL_WORKFLOW,
+        CommandType.ANSWER_GATE,
+        CommandType.LIST_NODES,
+        CommandType.GET_NODE,
+        CommandType.LIST_NODE_TOOLS,
+        CommandType.LIST_GRAPHS,
+        CommandType.GET_GRAPH,
+        CommandType.LIST_SESSIONS,
+        CommandType.GET_SESSION,
+        CommandType.LIST_WORKFLOWS,
+        CommandType.GET_WORKFLOW_RUN,
+        CommandType.LIST_WORKFLOW_RUNS,
+        CommandType.STOP,
+        CommandType.PING,
+        CommandType.GET_METRICS,
+    }
+)
+
+# Weight of the latest execution in a type's average duration
+_DURATION_SMOOTHING = 0.2
+
+
+class AdmissionRejectedError(Exception):
+    """A command was rejected because its type's queue is full.
+
+    Attributes:
+        command_type: The rejected command's type.
+        retry_after: Suggested seconds to wait before retrying.
+    """
+
+    def __init__(self, command_type: CommandType, retry_after: float):
+        super().__init__(f"Server busy: too many {command_type.name} commands queued")
+        self.command_type = command_type
+        self.retry_after = retry_after
+
+
+def parse_limit(spec: str) -> tuple[CommandType, int]:
+    """Parse a "COMMAND_TYPE=N" limit, e.g. "EXECUTE_INPUT=8".
+
+    Raises:
+        ValueError: If the spec is malformed, names an unknown command
+            type, or the limit is not positive.
+    """
+    name, sep, value = spec.partition("=")
+    if not sep:
+        raise ValueError(f"Invalid limit '{spec}': expected COMMAND_TYPE=N")
+    try:
+        command_type = CommandType[name.strip().upper()]
+    except KeyError:
+        raise ValueError(f"Invalid limit '{spec}': unknown command type '{name}'") from None
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid limit '{spec}': '{value}' is not a number") from None
+    if limit <= 0:
+        raise ValueError(f"Invalid limit '{spec}': must be > 0")
+    return command_type, limit
+
+
+class _Lane:
+    """Slots and FIFO queue for one limited command type."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.running = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.avg_seconds = 0.0
+
+    def retry_after(self) -> float:
+        """Seconds until a newly queued command would likely start."""
+        per_command = self.avg_seconds or 1.0
+        return round(max(0.1, per_command * (len(self.waiters) + 1) / self.limit), 2)
+
+    def release(self, seconds: float) -> None:
+        if self.avg_seconds:
+            self.avg_seconds += _DURATION_SMOOTHING * (seconds - self.avg_seconds)
+        else:
+            self.avg_seconds = seconds
+        self.hand_over()
+
+    def hand_over(self) -> None:
+        """Pass a freed slot to the next waiter, or give it back."""
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.running -= 1
+
+
+class AdmissionController:
+    """Per-command-type concurrency limits with bounded FIFO queues.
+
+    Args:
+        limits: Maximum concurrently running commands per type. Types
+            without an entry are not limited.
+        max_queued: Commands of one type that may wait for a slot before
+            new ones are rejected (None = wait without bound).
+
+    Raises:
+        ValueError: If a limit is not positive, or a priority command or
+            BATCH is limited.
+    """
+
+    def __init__(
+        self, limits: dict[CommandType, int] | None = None, max_queued: int | None = None
+    ) -> None:
+        self.max_queued = max_queued
+        self._lanes: dict[CommandType, _Lane] = {}
+        for command_type, limit in (limits or {}).items():
+            if limit <= 0:
+                raise ValueError(f"Limit for {command_type.name} must be > 0")
+            if command_type in PRIORITY_COMMANDS or command_type is CommandType.BATCH:
+                raise ValueError(f"{command_type.name} cannot be limited")
+            self._lanes[command_type] = _Lane(limit)
+
+    @asynccontextmanager
+    async def slot(self, command_type: CommandType) -> AsyncIterator[None]:
+        """Hold an execution slot for a command of this type.
+
+        Returns at once for types without a limit.
+
+        Raises:
+            AdmissionRejectedError: If the type's queue is full.
+        """
+        lane = self._lanes.get(command_type)
+        if lane is None:
+            yield
+            return
+
+        await self._acquire(command_type, lane)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            lane.release(time.monotonic() - start)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Limit, running, queued, admitted and rejected counts per limited type."""
+        return {
+            command_type.name: {
+                "limit": lane.limit,
+                "running": lane.running,
+                "queued": len(lane.waiters),
+                "admitted": lane.admitted,
+                "rejected": lane.rejected,
+                "avg_seconds": round(lane.avg_seconds, 3),
+            }
+            for command_type, lane in self._lanes.items()
+        }
+
+    async def _acquire(self, command_type: CommandType, lane: _Lane) -> None:
+        if lane.running < lane.limit and not lane.waiters:
+            lane.running += 1
+            lane.admitted += 1
+            return
+        if self.max_queued is not None and len(lane.waiters) >= self.max_queued:
+            lane.rejected += 1
+            raise AdmissionRejectedError(command_type, lane.retry_after())
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        lane.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after being handed a slot: pass it on
+                lane.hand_over()
+            elif waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+            raise
+        lane.admitted += 1
@@ -14,11 +14,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+import time
+from collections.abc import AsyncGenerator, Callable, Coroutine
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from nerve.core.session import Session
+from nerve.server.admission import AdmissionRejectedError
 from nerve.server.factories.node_factory import NodeFactory
 from nerve.server.handlers.graph_handler import GraphHandler
 from nerve.server.handlers.node_interaction_handler import NodeInteractionHandler
@@ -28,22 +30,32 @@ from nerve.server.handlers.repl_command_handler import ReplCommandHandler
 from nerve.server.handlers.server_handler import ServerHandler
 from nerve.server.handlers.session_handler import SessionHandler
 from nerve.server.handlers.workflow_handler import WorkflowHandler
+from nerve.server.metrics import MeteredEventSink, MetricsRegistry
 from nerve.server.protocols import (
     Command,
     CommandResult,
     CommandType,
     Event,
     EventType,
+    StreamedResult,
 )
 from nerve.server.proxy_manager import ProxyHealthError, ProxyManager, ProxyStartError
 from nerve.server.session_registry import SessionRegistry
 from nerve.server.validation import ValidationHelpers
 
 if TYPE_CHECKING:
+    from nerve.server.admission import AdmissionController
+    from nerve.server.node_pool import NodePool
     from nerve.server.protocols import EventSink
 
 logger = logging.getLogger(__name__)
 
+# Command handler: params in, result data (or a StreamedResult) out
+Handler = Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any] | StreamedResult]]
+
+# Most commands one BATCH may carry
+MAX_BATCH_COMMANDS = 1000
+
 
 @dataclass
 class NerveEngine:
@@ -78,11 +90,12 @@ class NerveEngine:
     python_executor: PythonExecutor
     repl_command_handler: ReplCommandHandler
     server_handler: ServerHandler
+    node_pool: NodePool | None = None
+    admission: AdmissionController | None = None
+    metrics: MetricsRegistry = field(default_factory=MetricsRegistry)
 
     # Handler map (built in __post_init__)
-    _handlers: dict[
-        CommandType, Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]
-    ] = field(default_factory=dict, repr=False)
+    _handlers: dict[CommandType, Handler] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize handler map."""
@@ -100,7 +113,12 @@ class NerveEngine:
     async def execute(self, command: Command) -> CommandResult:
         """Dispatch command to appropriate handler.
 
+        Command types with an admission limit wait for a slot first. The
+        time until the result is ready (including any wait for a slot, not
+        including sending a streamed result's parts) is recorded in metrics.
+
         Error Handling Strategy:
+        - AdmissionRejectedError: Queue full (result data has "retry_after")
         - ValueError: User/validation errors (expected)
         - ProxyError: Infrastructure errors (emit event)
         - CancelledError: Propagate (don't swallow)
@@ -112,6 +130,12 @@ class NerveEngine:
         Returns:
             CommandResult with success/failure and data.
         """
+        start = time.perf_counter()
+        result = await self._dispatch(command)
+        self.metrics.observe_command(command.type, time.perf_counter() - start, result.success)
+        return result
+
+    async def _dispatch(self, command: Command) -> CommandResult:
         handler = self._handlers.get(command.type)
         if not handler:
             return CommandResult(
@@ -121,12 +145,31 @@ class NerveEngine:
             )
 
         try:
-            data = await handler(command.params)
+            if self.admission is None:
+                data = await handler(command.params)
+            else:
+                async with self.admission.slot(command.type):
+                    data = await handler(command.params)
+            if isinstance(data, StreamedResult):
+                return CommandResult(
+                    success=True,
+                    data=data.data,
+                    request_id=command.request_id,
+                    parts=data.parts,
+                )
             return CommandResult(
                 success=True,
                 data=data,
                 request_id=command.request_id,
             )
+        except AdmissionRejectedError as e:
+            # Overloaded - the client may retry later
+            return CommandResult(
+                success=False,
+                data={"retry_after": e.retry_after},
+                error=str(e),
+                request_id=command.request_id,
+            )
         except ValueError as e:
             # Validation/user errors - expected, no event
             return CommandResult(
@@ -165,9 +208,7 @@ class NerveEngine:
                 request_id=command.request_id,
             )
 
-    def _build_handler_map(
-        self,
-    ) -> dict[CommandType, Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]]:
+    def _build_handler_map(self) -> dict[CommandType, Handler]:
         """Build command type → handler method mapping."""
         return {
             # Node lifecycle
@@ -211,12 +252,109 @@ class NerveEngine:
             # Server control
             CommandType.STOP: self.server_handler.stop,
             CommandType.PING: self.server_handler.ping,
+            CommandType.GET_METRICS: self.server_handler.get_metrics,
+            # Batching
+            CommandType.BATCH: self._execute_batch,
+        }
+
+    async def _execute_batch(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run several commands sent as one BATCH message.
+
+        Commands run concurrently unless ordered: a command first waits for
+        the commands listed in its "after", and "sequential" orders every
+        command after the previous one. A command is skipped if one it
+        waits for failed, or, with "stop_on_error", once any command has
+        failed. Streamed results (chunk_size) cannot be batched.
+
+        Parameters:
+            commands: List of {"type": name, "params": {...}, "after": [index, ...]};
+                "after" may only name earlier commands.
+            sequential: Run the commands one after another (default: False).
+            stop_on_error: Skip commands not yet started after a failure (default: False).
+
+        Returns:
+            {"results": [{"success", "data", "error"}, ...] in command order,
+             "failed": number of commands that failed or were skipped}
+        """
+        commands, prerequisites = _parse_batch(params)
+        stop_on_error = bool(params.get("stop_on_error", False))
+        results = [CommandResult(success=False) for _ in commands]
+        done = [asyncio.Event() for _ in commands]
+        failed_any = False
+
+        async def run(index: int) -> None:
+            nonlocal failed_any
+            for i in prerequisites[index]:
+                await done[i].wait()
+            failed = next((i for i in prerequisites[index] if not results[i].success), None)
+            if failed is not None:
+                result = CommandResult(success=False, error=f"Skipped: command {failed} failed")
+            elif stop_on_error and failed_any:
+                result = CommandResult(success=False, error="Skipped: an earlier command failed")
+            else:
+                result = await self.execute(commands[index])
+                if result.parts is not None:
+                    if isinstance(result.parts, AsyncGenerator):
+                        await result.parts.aclose()
+                    result = CommandResult(
+                        success=False, error="Streamed results cannot be batched (omit chunk_size)"
+                    )
+            results[index] = result
+            failed_any = failed_any or not result.success
+            done[index].set()
+
+        async with asyncio.TaskGroup() as tasks:
+            for index in range(len(commands)):
+                tasks.create_task(run(index))
+
+        return {
+            "results": [{"success": r.success, "data": r.data, "error": r.error} for r in results],
+            "failed": sum(1 for r in results if not r.success),
         }
 
 
+def _parse_batch(params: dict[str, Any]) -> tuple[list[Command], list[list[int]]]:
+    """Validate BATCH params into commands and, per command, those it waits for.
+
+    Raises:
+        ValueError: If the batch is malformed.
+    """
+    entries = params.get("commands")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("commands must be a non-empty list")
+    if len(entries) > MAX_BATCH_COMMANDS:
+        raise ValueError(f"At most {MAX_BATCH_COMMANDS} commands per batch")
+    sequential = bool(params.get("sequential", False))
+
+    commands: list[Command] = []
+    prerequisites: list[list[int]] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Command {index}: expected an object")
+        type_name = entry.get("type")
+        if not isinstance(type_name, str) or type_name not in CommandType.__members__:
+            raise ValueError(f"Command {index}: unknown command type {type_name!r}")
+        command_type = CommandType[type_name]
+        if command_type is CommandType.BATCH:
+            raise ValueError(f"Command {index}: batches cannot be nested")
+        after = entry.get("after") or []
+        if not isinstance(after, list) or not all(
+            isinstance(i, int) and 0 <= i < index for i in after
+        ):
+            raise ValueError(f"Command {index}: 'after' may only name earlier commands")
+        if sequential and index > 0:
+            after = [*after, index - 1]
+        commands.append(Command(type=command_type, params=entry.get("params") or {}))
+        prerequisites.append(sorted(set(after)))
+    return commands, prerequisites
+
+
 def build_nerve_engine(
     event_sink: EventSink,
     server_name: str = "default",
+    node_pool: NodePool | None = None,
+    admission: AdmissionController | None = None,
+    metrics: MetricsRegistry | None = None,
 ) -> NerveEngine:
     """Build fully-wired NerveEngine with all handlers.
 
@@ -226,6 +364,12 @@ def build_nerve_engine(
     Args:
         event_sink: EventSink for emitting events.
         server_name: Server name for session/history paths.
+        node_pool: Pre-started nodes for CREATE_NODE to claim (optional).
+            The caller starts it; the engine stops it on server stop.
+        admission: Per-command-type concurrency limits (optional).
+        metrics: Registry to record into (optional, a new one by default).
+            If event_sink has a TrafficCounter "traffic", it is registered
+            as the "transport" metrics source.
 
     Returns:
         Fully-wired NerveEngine instance.
@@ -240,12 +384,19 @@ def build_nerve_engine(
 
     # Identity node is auto-created in Session.__post_init__
 
+    # Metrics: count every event on its way to the transport
+    metrics = metrics or MetricsRegistry()
+    traffic = getattr(event_sink, "traffic", None)
+    if traffic is not None:
+        metrics.add_source("transport", lambda: traffic.stats)
+    event_sink = MeteredEventSink(event_sink, metrics)
+
     # Shared dependencies
     proxy_manager = ProxyManager()
     validation = ValidationHelpers()
 
     # Factories
-    node_factory = NodeFactory()
+    node_factory = NodeFactory(pool=node_pool)
 
     # Handlers (ALL take session_registry, not raw state)
     node_lifecycle_handler = NodeLifecycleHandler(
@@ -262,6 +413,7 @@ def build_nerve_engine(
         validation=validation,
         session_registry=session_registry,
         server_name=server_name,
+        metrics=metrics,
     )
 
     python_executor = PythonExecutor(
@@ -298,6 +450,9 @@ def build_nerve_engine(
         proxy_manager=proxy_manager,
         session_registry=session_registry,
         graph_handler=graph_handler,
+        node_pool=node_pool,
+        admission=admission,
+        metrics=metrics,
     )
 
     # Engine (dispatcher)
@@ -312,4 +467,7 @@ def build_nerve_engine(
         python_executor=python_executor,
         repl_command_handler=repl_command_handler,
         server_handler=server_handler,
+        node_pool=node_pool,
+        admission=admission,
+        metrics=metrics,
     )
@@ -8,12 +8,14 @@ the Open/Closed Principle:
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 if TYPE_CHECKING:
     from nerve.core.nodes import Node
     from nerve.core.nodes.llm.base import StatelessLLMNode
     from nerve.core.session import Session
+    from nerve.server.node_pool import NodePool
 
 # HTTP backend type
 HttpBackend = Literal["aiohttp", "openai"]
@@ -27,6 +29,9 @@ class NodeFactory:
     - Test node creation in isolation
     - Maintain consistent error messages
 
+    With a NodePool, terminal nodes matching one of its templates are
+    claimed from the pool instead of being started cold.
+
     Example:
         >>> factory = NodeFactory()
         >>> node = await factory.create(
@@ -51,6 +56,14 @@ class NodeFactory:
         "mcp",
     )
 
+    def __init__(self, pool: NodePool | None = None) -> None:
+        """Initialize the factory.
+
+        Args:
+            pool: Pre-started nodes to claim from (optional).
+        """
+        self.pool = pool
+
     async def create(
         self,
         backend: str,
@@ -141,6 +154,33 @@ class NodeFactory:
             WezTermNode,
         )
 
+        # Claim a pre-started node when the request is one a template serves as-is
+        pooled = (
+            self.pool is not None
+            and not pane_id
+            and proxy_url is None
+            and claude_session_id is None
+            and not mcp_config
+            and not strict_mcp_config
+            and self.pool.matches(backend, command, cwd)
+        )
+        cold_start = time.perf_counter()
+        if pooled:
+            assert self.pool is not None  # Type narrowing
+            claimed = await self.pool.claim(
+                backend=backend,
+                command=command,
+                cwd=cwd,
+                node_id=str(node_id),
+                session=session,
+                history=history,
+                ready_timeout=ready_timeout,
+                response_timeout=response_timeout,
+            )
+            if claimed is not None:
+                return claimed
+            cold_start = time.perf_counter()
+
         node: (
             PTYNode
             | WezTermNode
@@ -375,4 +415,7 @@ class NodeFactory:
         else:
             raise ValueError(f"Unknown backend: '{backend}'. Valid backends: {self.VALID_BACKENDS}")
 
+        if pooled and self.pool is not None:
+            self.pool.record_cold_start(backend, command, cwd, time.perf_counter() - cold_start)
+
         return node
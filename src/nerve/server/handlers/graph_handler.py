@@ -167,6 +167,7 @@ class GraphHandler:
             graph_id: Graph ID (required)
             session_id: Session ID (optional, defaults to default session)
             steps: List of step definitions (optional)
+            max_parallel: Maximum concurrent step executions (optional, default 1)
 
         Step format:
             {
@@ -185,7 +186,7 @@ class GraphHandler:
         graph_id = self.validation.require_param(params, "graph_id")
 
         # Create empty graph (auto-registers with session in __init__)
-        graph = Graph(id=graph_id, session=session)
+        graph = Graph(id=graph_id, session=session, max_parallel=params.get("max_parallel", 1))
 
         # Optional: add steps if provided
         steps = params.get("steps")
@@ -210,6 +211,7 @@ class GraphHandler:
             Event(
                 type=EventType.GRAPH_CREATED,
                 data={"graph_id": graph_id, "step_count": len(graph.list_steps())},
+                session_id=session.name,
             )
         )
 
@@ -236,6 +238,7 @@ class GraphHandler:
             Event(
                 type=EventType.GRAPH_DELETED,
                 data={"graph_id": graph_id},
+                session_id=session.name,
             )
         )
 
@@ -250,6 +253,7 @@ class GraphHandler:
             graph_id: Graph ID (optional, defaults to "graph_0")
             steps: List of step definitions (required)
             session_id: Session ID (optional)
+            max_parallel: Maximum concurrent step executions (optional, default 1)
 
         Returns:
             {"graph_id": str, "results": dict}
@@ -274,7 +278,7 @@ class GraphHandler:
                 raise ValueError(f"Step at index {i} missing required 'id' key")
 
         # Build Graph from step definitions
-        graph = Graph(id=graph_id, session=session)
+        graph = Graph(id=graph_id, session=session, max_parallel=params.get("max_parallel", 1))
 
         for step_data in steps_data:
             step_id = step_data["id"]  # Safe now - validated above
@@ -445,6 +449,8 @@ class GraphHandler:
         Returns:
             {"graph_id": str, "results": dict}
         """
+        session_id = context.session.name if context.session else None
+
         # Register current task for cancellation support
         current_task = asyncio.current_task()
         if current_task:
@@ -455,6 +461,7 @@ class GraphHandler:
                 Event(
                     type=EventType.GRAPH_STARTED,
                     data={"graph_id": graph_id},
+                    session_id=session_id,
                 )
             )
 
@@ -466,6 +473,7 @@ class GraphHandler:
                         Event(
                             type=EventType.STEP_STARTED,
                             data={"step_id": event.step_id},
+                            session_id=session_id,
                         )
                     )
                 elif event.event_type == "step_complete":
@@ -474,6 +482,7 @@ class GraphHandler:
                         Event(
                             type=EventType.STEP_COMPLETED,
                             data={"step_id": event.step_id, "output": str(event.data)[:500]},
+                            session_id=session_id,
                         )
                     )
                 elif event.event_type == "step_error":
@@ -481,6 +490,7 @@ class GraphHandler:
                         Event(
                             type=EventType.STEP_FAILED,
                             data={"step_id": event.step_id, "error": str(event.data)},
+                            session_id=session_id,
                         )
                     )
 
@@ -488,6 +498,7 @@ class GraphHandler:
                 Event(
                     type=EventType.GRAPH_COMPLETED,
                     data={"graph_id": graph_id, "step_count": len(results)},
+                    session_id=session_id,
                 )
             )
 
@@ -8,20 +8,23 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from nerve.core.nodes import ExecutionContext
-from nerve.core.nodes.history import HistoryReader
+from nerve.core.nodes.history import INPUT_OPS, HistoryReader
 from nerve.core.nodes.terminal.claude_wezterm_node import ClaudeWezTermNode
 from nerve.core.parsers import get_parser
 from nerve.core.types import ParserType
-from nerve.server.protocols import Event, EventType
+from nerve.server.protocols import Event, EventType, StreamedResult
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from nerve.core.types import ParsedResponse
+    from nerve.server.metrics import MetricsRegistry
     from nerve.server.protocols import EventSink
     from nerve.server.session_registry import SessionRegistry
     from nerve.server.validation import ValidationHelpers
@@ -41,6 +44,7 @@ class NodeInteractionHandler:
     validation: ValidationHelpers
     session_registry: SessionRegistry
     server_name: str
+    metrics: MetricsRegistry | None = None
 
     async def run_command(self, params: dict[str, Any]) -> dict[str, Any]:
         """Run a command in a node (fire and forget).
@@ -102,6 +106,7 @@ class NodeInteractionHandler:
             Event(
                 type=EventType.NODE_BUSY,
                 node_id=node_id,
+                session_id=session.name,
             )
         )
 
@@ -127,13 +132,19 @@ class NodeInteractionHandler:
                         type=EventType.OUTPUT_CHUNK,
                         data={"chunk": chunk},
                         node_id=node_id,
+                        session_id=session.name,
                     )
                 )
 
-            # Parse final response
-            actual_parser = parser_type or ParserType.NONE
-            parser = get_parser(actual_parser)
-            response = parser.parse(node.buffer)  # type: ignore[attr-defined]
+            # Parse final response. WezTerm nodes already parsed this turn's
+            # output while streaming; others are parsed from their buffer.
+            stream_response = getattr(node, "stream_response", None)
+            if stream_response is not None:
+                response = stream_response
+            else:
+                actual_parser = parser_type or ParserType.NONE
+                parser = get_parser(actual_parser)
+                response = parser.parse(await node.read())  # type: ignore[attr-defined]
         else:
             # Wait for complete response using ExecutionContext (immutable pattern)
             if parser_type is not None:
@@ -159,6 +170,7 @@ class NodeInteractionHandler:
                     type=EventType.OUTPUT_PARSED,
                     data=response_data,
                     node_id=node_id,
+                    session_id=session.name,
                 )
             )
         else:
@@ -178,6 +190,7 @@ class NodeInteractionHandler:
                         "tokens": response.tokens,
                     },
                     node_id=node_id,
+                    session_id=session.name,
                 )
             )
 
@@ -185,10 +198,13 @@ class NodeInteractionHandler:
             Event(
                 type=EventType.NODE_READY,
                 node_id=node_id,
+                session_id=session.name,
             )
         )
 
         duration = time.monotonic() - start_time
+        if self.metrics is not None:
+            self.metrics.observe_node(session.name, node_id, duration)
         logger.debug(
             "execute_complete: node_id=%s, duration=%.2fs, response_type=%s",
             node_id,
@@ -234,29 +250,37 @@ class NodeInteractionHandler:
 
         return {"written": len(data)}
 
-    async def get_buffer(self, params: dict[str, Any]) -> dict[str, Any]:
+    async def get_buffer(self, params: dict[str, Any]) -> dict[str, Any] | StreamedResult:
         """Get terminal buffer contents.
 
         Args:
-            params: Must contain "node_id". Optional "lines" for tail.
+            params: Must contain "node_id". Optional "lines" for tail, and
+                "chunk_size" to send the buffer in parts of that many
+                characters.
 
         Returns:
-            {"buffer": str}
+            {"buffer": str}, or with chunk_size a StreamedResult of
+            {"buffer": str} parts and final {"length": int}.
         """
         session = self.session_registry.get_session(params.get("session_id"))
         node_id = self.validation.require_param(params, "node_id")
         lines = params.get("lines")
+        chunk_size = _chunk_size(params)
 
         node = self.validation.get_node(session, node_id, require_terminal=True)
 
         if lines:
-            buffer = node.read_tail(lines)  # type: ignore[attr-defined]
+            buffer = await node.capture_tail(lines)  # type: ignore[attr-defined]
         else:
             buffer = await node.read()  # type: ignore[attr-defined]
 
+        if chunk_size:
+            return StreamedResult(
+                parts=_buffer_parts(buffer, chunk_size), data={"length": len(buffer)}
+            )
         return {"buffer": buffer}
 
-    async def get_history(self, params: dict[str, Any]) -> dict[str, Any]:
+    async def get_history(self, params: dict[str, Any]) -> dict[str, Any] | StreamedResult:
         """Get node history.
 
         Reads the JSONL history file for a node.
@@ -267,12 +291,17 @@ class NodeInteractionHandler:
             last: Limit to last N entries (optional)
             op: Filter by operation type (optional)
             inputs_only: Filter to input operations only (optional)
+            chunk_size: Send entries in parts of this many, reading the
+                file incrementally (optional)
 
         Returns:
-            Dict with node_id, server_name, entries, and total count.
+            Dict with node_id, server_name, entries, and total count. With
+            chunk_size, a StreamedResult of {"entries": [...]} parts and
+            the same dict without entries.
         """
         session = self.session_registry.get_session(params.get("session_id"))
         node_id = self.validation.require_param(params, "node_id")
+        chunk_size = _chunk_size(params)
 
         server_name = params.get("server_name", self.server_name)
         last = params.get("last")
@@ -287,6 +316,11 @@ class NodeInteractionHandler:
                 base_dir=session.history_base_dir,
             )
 
+            if chunk_size:
+                data = {"node_id": node_id, "server_name": server_name, "total": 0}
+                parts = _history_parts(reader, data, chunk_size, last, op, inputs_only)
+                return StreamedResult(parts=parts, data=data)
+
             # Apply filters
             if inputs_only:
                 entries = reader.get_inputs_only()
@@ -335,3 +369,47 @@ class NodeInteractionHandler:
             "is_complete": response.is_complete,
             "is_ready": response.is_ready,
         }
+
+
+def _chunk_size(params: dict[str, Any]) -> int | None:
+    """Validated "chunk_size" param, if given."""
+    chunk_size = params.get("chunk_size")
+    if chunk_size is None:
+        return None
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+    return chunk_size
+
+
+async def _buffer_parts(buffer: str, chunk_size: int) -> AsyncIterator[dict[str, Any]]:
+    for start in range(0, len(buffer), chunk_size):
+        yield {"buffer": buffer[start : start + chunk_size]}
+
+
+async def _history_parts(
+    reader: HistoryReader,
+    data: dict[str, Any],
+    chunk_size: int,
+    last: int | None,
+    op: str | None,
+    inputs_only: bool,
+) -> AsyncIterator[dict[str, Any]]:
+    """Stream filtered history entries, counting them in data["total"]."""
+    entries: Iterable[dict[str, Any]] = reader.iter_entries()
+    if inputs_only:
+        entries = (e for e in entries if e.get("op") in INPUT_OPS)
+    elif op:
+        entries = (e for e in entries if e.get("op") == op)
+    if last is not None:
+        entries = deque(entries, maxlen=last)
+
+    batch: list[dict[str, Any]] = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) == chunk_size:
+            data["total"] += len(batch)
+            yield {"entries": batch}
+            batch = []
+    if batch:
+        data["total"] += len(batch)
+        yield {"entries": batch}
@@ -188,6 +188,7 @@ class NodeLifecycleHandler:
             Event(
                 type=EventType.NODE_CREATED,
                 node_id=node.id,
+                session_id=session.name,
                 data={
                     "command": command,
                     "cwd": cwd,
@@ -336,6 +337,7 @@ class NodeLifecycleHandler:
             Event(
                 type=EventType.NODE_DELETED,
                 node_id=str(node_id),
+                session_id=session.name,
             )
         )
 
@@ -506,6 +508,7 @@ class NodeLifecycleHandler:
             Event(
                 type=EventType.NODE_CREATED,
                 node_id=forked.id,
+                session_id=session.name,
                 data={
                     "forked_from": str(source_id),
                     "persistent": forked.persistent,
@@ -535,6 +538,7 @@ class NodeLifecycleHandler:
                         Event(
                             type=EventType.NODE_READY,
                             node_id=node.id,
+                            session_id=node.session.name,
                         )
                     )
                 elif node.state == NodeState.BUSY:
@@ -542,6 +546,7 @@ class NodeLifecycleHandler:
                         Event(
                             type=EventType.NODE_BUSY,
                             node_id=node.id,
+                            session_id=node.session.name,
                         )
                     )
 
@@ -1,6 +1,6 @@
 """ServerHandler - Server control and cleanup coordination.
 
-Commands: STOP, PING
+Commands: STOP, PING, GET_METRICS
 
 State:
 - shutdown_requested: bool (exposed via property)
@@ -16,10 +16,17 @@ import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from nerve.core.pty.pty_backend import get_reader_totals
+from nerve.core.pty.wezterm_cli import get_wezterm_cli
+from nerve.core.pty.wezterm_poller import get_pane_poller
+from nerve.core.workflow import WorkflowState
 from nerve.server.protocols import Event, EventType
 
 if TYPE_CHECKING:
+    from nerve.server.admission import AdmissionController
     from nerve.server.handlers.graph_handler import GraphHandler
+    from nerve.server.metrics import MetricsRegistry
+    from nerve.server.node_pool import NodePool
     from nerve.server.protocols import EventSink
     from nerve.server.proxy_manager import ProxyManager
     from nerve.server.session_registry import SessionRegistry
@@ -29,7 +36,7 @@ if TYPE_CHECKING:
 class ServerHandler:
     """Server control and cleanup coordination.
 
-    Commands: STOP, PING
+    Commands: STOP, PING, GET_METRICS
 
     State:
     - _shutdown_requested: bool (exposed via property)
@@ -41,6 +48,9 @@ class ServerHandler:
     proxy_manager: ProxyManager
     session_registry: SessionRegistry
     graph_handler: GraphHandler
+    node_pool: NodePool | None = None
+    admission: AdmissionController | None = None
+    metrics: MetricsRegistry | None = None
 
     # Owned state
     _shutdown_requested: bool = field(default=False)
@@ -78,12 +88,19 @@ class ServerHandler:
         """Background cleanup during stop.
 
         1. Cancel all running graphs (via GraphHandler)
-        2. Stop all sessions (which stops all nodes)
-        3. Stop all proxies
+        2. Stop the node pool (unclaimed pre-started nodes)
+        3. Stop all sessions (which stops all nodes)
+        4. Stop all proxies
         """
         # Cancel running graphs via GraphHandler (proper encapsulation)
         await self.graph_handler.cancel_all_graphs()
 
+        if self.node_pool is not None:
+            try:
+                await self.node_pool.stop()
+            except Exception:
+                pass  # Best effort
+
         # Stop all sessions (get_all_sessions returns Session objects)
         for session in self.session_registry.get_all_sessions():
             try:
@@ -101,14 +118,67 @@ class ServerHandler:
         """Ping server to check if alive.
 
         Returns:
-            {"pong": True, "nodes": int, "graphs": int, "sessions": int}
+            {"pong": True, "nodes": int, "graphs": int, "sessions": int}, plus
+            "admission" (running/queued per limited command type) if limits
+            are configured.
         """
         sessions = self.session_registry.get_all_sessions()
         total_nodes = sum(len(s.nodes) for s in sessions)
 
-        return {
+        result: dict[str, Any] = {
             "pong": True,
             "nodes": total_nodes,
             "graphs": self.graph_handler.running_graph_count,
             "sessions": len(sessions),
         }
+        if self.admission is not None:
+            result["admission"] = self.admission.stats
+        return result
+
+    async def get_metrics(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Get server metrics.
+
+        Returns:
+            The metrics registry's snapshot ("commands", "nodes", "events",
+            "gauges"; see MetricsRegistry.snapshot()) with the server's own
+            gauges added: sessions, nodes, running graphs and workflows, PTY
+            reader and WezTerm polling counters. Plus "admission" (see
+            AdmissionController.stats) if limits are configured.
+        """
+        snapshot: dict[str, Any] = (
+            self.metrics.snapshot()
+            if self.metrics is not None
+            else {"commands": {}, "nodes": [], "events": {}, "gauges": {}}
+        )
+
+        sessions = self.session_registry.get_all_sessions()
+        nodes = [node for session in sessions for node in session.nodes.values()]
+        workflows_running = sum(
+            len(session.list_workflow_runs(state=state))
+            for session in sessions
+            for state in (WorkflowState.RUNNING, WorkflowState.WAITING)
+        )
+        reader = get_reader_totals()
+        poller = get_pane_poller().stats
+        cli = get_wezterm_cli().stats
+
+        snapshot["gauges"].update(
+            {
+                "sessions": len(sessions),
+                "nodes": len(nodes),
+                "graphs_running": self.graph_handler.running_graph_count,
+                "workflows_running": workflows_running,
+                "pty_reader_wakeups_total": reader["wakeups"],
+                "pty_reader_chunks_total": reader["chunks"],
+                "pty_reader_bytes_total": reader["bytes"],
+                "wezterm_poll_ticks_total": poller["ticks"],
+                "wezterm_poll_fetches_total": poller["fetches"],
+                "wezterm_poll_skipped_total": poller["skipped"],
+                "wezterm_watched_panes": poller["watched_panes"],
+                "wezterm_cli_spawns_total": cli["spawns"],
+                "wezterm_cli_in_flight": cli["in_flight"],
+            }
+        )
+        if self.admission is not None:
+            snapshot["admission"] = self.admission.stats
+        return snapshot
@@ -44,6 +44,7 @@ class SessionHandler:
             name: Session name (required)
             description: Session description (optional)
             tags: Session tags (optional)
+            concurrency_limits: Max concurrent executions per resource class (optional)
 
         Returns:
             {"session_id": str, "name": str}
@@ -51,6 +52,7 @@ class SessionHandler:
         name = self.validation.require_param(params, "name")
         description = params.get("description", "")
         tags = params.get("tags", [])
+        concurrency_limits = params.get("concurrency_limits") or {}
 
         # Check for duplicate (uses proper encapsulation)
         if self.session_registry.has_session(name):
@@ -61,6 +63,7 @@ class SessionHandler:
             description=description,
             tags=tags,
             server_name=self.server_name,
+            concurrency_limits=concurrency_limits,
         )
 
         # Identity node is auto-created in Session.__post_init__
@@ -78,6 +81,7 @@ class SessionHandler:
             Event(
                 type=EventType.SESSION_CREATED,
                 data={"session_id": name, "name": name},
+                session_id=name,
             )
         )
 
@@ -117,6 +121,7 @@ class SessionHandler:
             Event(
                 type=EventType.SESSION_DELETED,
                 data={"session_id": session_id},
+                session_id=session_id,
             )
         )
 
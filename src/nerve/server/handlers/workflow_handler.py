@@ -72,6 +72,7 @@ class WorkflowHandler:
                             "event_type": event.event_type,
                             **event.data,
                         },
+                        session_id=session.name,
                     )
                 )
 
@@ -243,6 +244,7 @@ class WorkflowHandler:
                     "run_id": run_id,
                     "answer": answer,
                 },
+                session_id=session.name,
             )
         )
 
@@ -0,0 +1,243 @@
+"""MetricsRegistry - Built-in server metrics.
+
+The only insight into a running server used to be debug log lines
+(execute_start/execute_complete durations). The registry records:
+
+- a latency histogram and error count per command type (NerveEngine.execute)
+- a latency histogram per node for EXECUTE_INPUT
+- events emitted per event type (MeteredEventSink)
+- gauges read on demand from registered sources (transport traffic, etc.)
+
+GET_METRICS returns snapshot() plus the server's gauges (see
+ServerHandler.get_metrics); HTTPServer serves the same data as Prometheus
+text on GET /metrics (see render_prometheus()).
+
+Recording is cheap enough for every command: histograms are preallocated
+lists of bucket counts, command and event counters exist for every type
+up front, and observing a value is a bisect and three additions.
+
+Example:
+    >>> metrics = MetricsRegistry()
+    >>> metrics.observe_command(CommandType.PING, 0.0004, success=True)
+    >>> metrics.snapshot()["commands"]["PING"]["count"]
+    1
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from nerve.server.protocols import CommandType, EventType
+
+if TYPE_CHECKING:
+    from nerve.server.protocols import Event, EventSink
+
+# Histogram bucket upper bounds in seconds, from a PING to a long agent turn
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    1800.0,
+)
+
+# Nodes with their own execute histogram; the oldest is dropped beyond this
+MAX_NODE_SERIES = 1000
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values.
+
+    Args:
+        bounds: Ascending bucket upper bounds. Values above the last bound
+            fall in an implicit +Inf bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Count, sum, and cumulative bucket counts as [upper_bound, count] pairs.
+
+        The last pair's bound is None (+Inf) and its count equals "count".
+        """
+        buckets: list[list[Any]] = []
+        total = 0
+        for bound, count in zip((*self.bounds, None), self.counts, strict=True):
+            total += count
+            buckets.append([bound, total])
+        return {"count": self.count, "sum": round(self.sum, 6), "buckets": buckets}
+
+
+class MetricsRegistry:
+    """Server-wide metrics.
+
+    Args:
+        buckets: Bucket bounds for latency histograms, in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self._commands = {t: Histogram(buckets) for t in CommandType}
+        self._command_errors = dict.fromkeys(CommandType, 0)
+        self._nodes: dict[tuple[str, str], Histogram] = {}
+        self._events = dict.fromkeys(EventType, 0)
+        self._sources: dict[str, Callable[[], dict[str, float]]] = {}
+
+    def observe_command(self, command_type: CommandType, seconds: float, success: bool) -> None:
+        """Record one executed command."""
+        self._commands[command_type].observe(seconds)
+        if not success:
+            self._command_errors[command_type] += 1
+
+    def observe_node(self, session_id: str, node_id: str, seconds: float) -> None:
+        """Record one EXECUTE_INPUT on a node."""
+        key = (session_id, node_id)
+        histogram = self._nodes.get(key)
+        if histogram is None:
+            if len(self._nodes) >= MAX_NODE_SERIES:
+                del self._nodes[next(iter(self._nodes))]
+            histogram = self._nodes[key] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def count_event(self, event: Event) -> None:
+        """Record one emitted event."""
+        self._events[event.type] += 1
+
+    def add_source(self, name: str, read: Callable[[], dict[str, float]]) -> None:
+        """Register gauges read at snapshot time.
+
+        Args:
+            name: Prefix for the source's gauges, e.g. "transport".
+            read: Returns gauge name -> value, e.g. {"bytes_in_total": 1024}.
+        """
+        self._sources[name] = read
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current values.
+
+        Returns:
+            Dict with "commands" (per executed command type: histogram
+            stats plus "errors"), "nodes" (per node: "session_id",
+            "node_id" and histogram stats), "events" (count per emitted
+            event type) and "gauges" (name -> value from the sources).
+        """
+        commands: dict[str, Any] = {}
+        for command_type, histogram in self._commands.items():
+            if histogram.count:
+                commands[command_type.name] = {
+                    **histogram.stats,
+                    "errors": self._command_errors[command_type],
+                }
+        gauges: dict[str, float] = {}
+        for name, read in self._sources.items():
+            for key, value in read().items():
+                gauges[f"{name}_{key}"] = value
+        return {
+            "commands": commands,
+            "nodes": [
+                {"session_id": session_id, "node_id": node_id, **histogram.stats}
+                for (session_id, node_id), histogram in self._nodes.items()
+            ],
+            "events": {t.name: count for t, count in self._events.items() if count},
+            "gauges": gauges,
+        }
+
+
+class MeteredEventSink:
+    """EventSink wrapper counting events per type before passing them on."""
+
+    def __init__(self, sink: EventSink, metrics: MetricsRegistry):
+        self.sink = sink
+        self.metrics = metrics
+
+    async def emit(self, event: Event) -> None:
+        self.metrics.count_event(event)
+        await self.sink.emit(event)
+
+
+def render_prometheus(snapshot: dict[str, Any]) -> str:
+    """Render a GET_METRICS result in the Prometheus text format.
+
+    Gauges whose name ends in "_total" are typed as counters.
+    """
+    lines: list[str] = []
+
+    def header(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    def histogram(name: str, labels: str, stats: dict[str, Any]) -> None:
+        for bound, count in stats["buckets"]:
+            le = "+Inf" if bound is None else repr(float(bound))
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {stats['sum']}")
+        lines.append(f"{name}_count{{{labels}}} {stats['count']}")
+
+    commands = snapshot.get("commands", {})
+    if commands:
+        header("nerve_command_duration_seconds", "histogram", "Command execution time.")
+        for command_type, stats in commands.items():
+            histogram("nerve_command_duration_seconds", f'command="{command_type}"', stats)
+        header("nerve_command_errors_total", "counter", "Commands that failed.")
+        for command_type, stats in commands.items():
+            errors = stats["errors"]
+            lines.append(f'nerve_command_errors_total{{command="{command_type}"}} {errors}')
+
+    nodes = snapshot.get("nodes", [])
+    if nodes:
+        header("nerve_node_execute_duration_seconds", "histogram", "EXECUTE_INPUT time per node.")
+        for stats in nodes:
+            labels = f'session="{_escape(stats["session_id"])}",node="{_escape(stats["node_id"])}"'
+            histogram("nerve_node_execute_duration_seconds", labels, stats)
+
+    events = snapshot.get("events", {})
+    if events:
+        header("nerve_events_total", "counter", "Events emitted.")
+        for event_type, count in events.items():
+            lines.append(f'nerve_events_total{{type="{event_type}"}} {count}')
+
+    for name, value in snapshot.get("gauges", {}).items():
+        metric = f"nerve_{name}"
+        lines.append(f"# TYPE {metric} {'counter' if name.endswith('_total') else 'gauge'}")
+        lines.append(f"{metric} {value}")
+
+    admission = snapshot.get("admission", {})
+    for key, metric, kind in (
+        ("running", "nerve_admission_running", "gauge"),
+        ("queued", "nerve_admission_queued", "gauge"),
+        ("rejected", "nerve_admission_rejected_total", "counter"),
+    ):
+        if admission:
+            lines.append(f"# TYPE {metric} {kind}")
+        for command_type, stats in admission.items():
+            lines.append(f'{metric}{{command="{command_type}"}} {stats[key]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,334 @@
+"""NodePool - Pre-started terminal nodes for instant node creation.
+
+Starting a terminal node is slow: a Claude node spawns a pane, types the
+command and waits for Claude to come up, which takes seconds before the
+node is usable. A NodePool keeps a configured number of nodes per
+template (backend + command + cwd) started ahead of time in a private
+staging session. When CREATE_NODE asks for a matching node, the factory
+claims one from the pool and rebinds it to the caller's id and session
+(see PTYNode.rebind / ClaudeWezTermNode.rebind), then the pool starts a
+replacement in the background.
+
+Only requests that a pre-started node can serve as-is are claimed:
+"pty" and "claude-wezterm" nodes without a pane to attach to, a proxy, an
+explicit Claude session ID or MCP config. Forks resume a specific Claude
+session, so they always start cold.
+
+Example:
+    >>> pool = NodePool([PoolTemplate("claude-wezterm", "claude", size=2)])
+    >>> await pool.start()
+    >>> engine = build_nerve_engine(event_sink=transport, node_pool=pool)
+    >>> # CREATE_NODE with backend="claude-wezterm", command="claude" now
+    >>> # returns a running node immediately
+    >>> pool.stats["templates"]["claude-wezterm:claude"]["claims"]
+    1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import shlex
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from nerve.core.nodes import NodeState
+from nerve.core.session import Session
+
+if TYPE_CHECKING:
+    from nerve.core.nodes.terminal import ClaudeWezTermNode, PTYNode
+
+logger = logging.getLogger(__name__)
+
+# Backends whose nodes can be started ahead of time and rebound on claim
+POOLABLE_BACKENDS: tuple[str, ...] = ("pty", "claude-wezterm")
+
+
+def normalize_command(backend: str, command: str | list[str] | None) -> str:
+    """Command string a node of this backend ends up running.
+
+    Matches the normalization done by the node factory and PTYNode.create(),
+    so a request and a template compare equal when they start the same
+    process.
+    """
+    if command is None:
+        return "bash" if backend == "pty" else ""
+    if isinstance(command, str):
+        return command
+    if backend == "claude-wezterm":
+        return " ".join(shlex.quote(arg) for arg in command)
+    return " ".join(command)
+
+
+@dataclass(frozen=True)
+class PoolTemplate:
+    """Kind of node to keep pre-started.
+
+    Attributes:
+        backend: Node backend ("pty" or "claude-wezterm").
+        command: Command the node runs.
+        cwd: Working directory (None matches requests without a cwd).
+        size: Number of ready nodes to keep.
+    """
+
+    backend: str
+    command: str
+    cwd: str | None = None
+    size: int = 1
+
+    def __post_init__(self) -> None:
+        if self.backend not in POOLABLE_BACKENDS:
+            raise ValueError(
+                f"Backend '{self.backend}' cannot be pooled. Poolable: {POOLABLE_BACKENDS}"
+            )
+        if self.size < 0:
+            raise ValueError(f"Pool size must be >= 0, got {self.size}")
+
+    @classmethod
+    def parse(cls, spec: str, cwd: str | None = None) -> PoolTemplate:
+        """Parse a "BACKEND:SIZE:COMMAND" template spec.
+
+        Example:
+            >>> PoolTemplate.parse("claude-wezterm:2:claude --dangerously-skip-permissions")
+        """
+        parts = spec.split(":", 2)
+        if len(parts) != 3 or not parts[1].isdigit() or not parts[2].strip():
+            raise ValueError(f"Invalid pool template '{spec}'. Expected BACKEND:SIZE:COMMAND")
+        backend, size, command = parts
+        return cls(backend=backend, command=command.strip(), cwd=cwd, size=int(size))
+
+    @property
+    def key(self) -> str:
+        """Identifier used in stats ("backend:command", plus "@cwd" if set)."""
+        key = f"{self.backend}:{self.command}"
+        return f"{key}@{self.cwd}" if self.cwd else key
+
+
+@dataclass
+class _TemplateState:
+    template: PoolTemplate
+    ready: deque[PTYNode | ClaudeWezTermNode] = field(default_factory=deque)
+    warming: set[asyncio.Task[None]] = field(default_factory=set)
+    claims: int = 0
+    misses: int = 0
+    failures: int = 0
+    claim_seconds: float = 0.0
+    cold_starts: int = 0
+    cold_start_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "size": self.template.size,
+            "ready": len(self.ready),
+            "warming": len(self.warming),
+            "claims": self.claims,
+            "misses": self.misses,
+            "failures": self.failures,
+            "claim_ms": self.claim_seconds / self.claims * 1000 if self.claims else None,
+            "cold_start_ms": (
+                self.cold_start_seconds / self.cold_starts * 1000 if self.cold_starts else None
+            ),
+        }
+
+
+@dataclass
+class NodePool:
+    """Keeps pre-started terminal nodes ready to be claimed.
+
+    Nodes live in a private staging session (no history, no session log)
+    until claimed. start() fills every template; each claim triggers a
+    background refill. Warm-up failures are logged and counted, and the
+    template retries on the next claim.
+    """
+
+    templates: list[PoolTemplate] = field(default_factory=list)
+
+    _states: dict[tuple[str, str, str | None], _TemplateState] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _staging: Session = field(init=False, repr=False)
+    _started: bool = field(default=False, init=False)
+    _ids: itertools.count[int] = field(default_factory=itertools.count, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._staging = Session(
+            name="warm-pool", history_enabled=False, file_logging=False, console_logging=False
+        )
+        for template in self.templates:
+            self._states[self._key(template.backend, template.command, template.cwd)] = (
+                _TemplateState(template)
+            )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Pool metrics.
+
+        Returns:
+            Dict with "templates": per template key, "size", "ready" and
+            "warming" node counts, "claims" served, "misses" (matching
+            requests that found the pool empty), warm-up "failures", mean
+            "claim_ms" and mean "cold_start_ms" (time to start a node from
+            scratch, measured on warm-ups and on misses).
+        """
+        return {"templates": {s.template.key: s.as_dict() for s in self._states.values()}}
+
+    async def start(self) -> None:
+        """Start filling every template in the background."""
+        self._started = True
+        for state in self._states.values():
+            self._refill(state)
+
+    async def stop(self) -> None:
+        """Cancel warm-ups and stop every unclaimed node."""
+        self._started = False
+        for state in self._states.values():
+            for task in list(state.warming):
+                task.cancel()
+            if state.warming:
+                await asyncio.gather(*state.warming, return_exceptions=True)
+            while state.ready:
+                node = state.ready.popleft()
+                try:
+                    await node.stop()
+                except Exception as e:
+                    logger.warning("Failed to stop pooled node %s: %s", node.id, e)
+
+    async def claim(
+        self,
+        backend: str,
+        command: str | list[str] | None,
+        cwd: str | None,
+        node_id: str,
+        session: Session,
+        history: bool | None = None,
+        ready_timeout: float | None = None,
+        response_timeout: float | None = None,
+    ) -> PTYNode | ClaudeWezTermNode | None:
+        """Take a ready node matching the request, if any.
+
+        The node is rebound to node_id in session and a replacement starts
+        in the background.
+
+        Args:
+            backend: Requested node backend.
+            command: Requested command.
+            cwd: Requested working directory.
+            node_id: Id for the claimed node.
+            session: Session to register the claimed node with.
+            history: Enable history logging (default: session.history_enabled).
+            ready_timeout: Ready timeout for the claimed node.
+            response_timeout: Response timeout for the claimed node.
+
+        Returns:
+            The claimed node, or None if no template matches or none is ready.
+
+        Raises:
+            ValueError: If node_id is invalid or already exists in session.
+        """
+        state = self._states.get(self._key(backend, command, cwd))
+        if state is None:
+            return None
+
+        started = time.perf_counter()
+        node = self._pop_alive(state)
+        if node is None:
+            state.misses += 1
+            self._refill(state)
+            return None
+
+        try:
+            node.rebind(
+                node_id,
+                session,
+                history=history,
+                ready_timeout=ready_timeout,
+                response_timeout=response_timeout,
+            )
+        except Exception:
+            # Invalid id: the node is still good, put it back
+            state.ready.appendleft(node)
+            raise
+
+        state.claims += 1
+        state.claim_seconds += time.perf_counter() - started
+        self._refill(state)
+        return node
+
+    def record_cold_start(
+        self, backend: str, command: str | list[str] | None, cwd: str | None, seconds: float
+    ) -> None:
+        """Record how long a node matching a template took to start cold."""
+        state = self._states.get(self._key(backend, command, cwd))
+        if state is not None:
+            state.cold_starts += 1
+            state.cold_start_seconds += seconds
+
+    def matches(self, backend: str, command: str | list[str] | None, cwd: str | None) -> bool:
+        """Whether a request falls under one of the pool's templates."""
+        return self._key(backend, command, cwd) in self._states
+
+    @staticmethod
+    def _key(
+        backend: str, command: str | list[str] | None, cwd: str | None
+    ) -> tuple[str, str, str | None]:
+        return (backend, normalize_command(backend, command), cwd)
+
+    def _pop_alive(self, state: _TemplateState) -> PTYNode | ClaudeWezTermNode | None:
+        while state.ready:
+            node = state.ready.popleft()
+            backend = getattr(node, "backend", None)
+            if node.state is not NodeState.STOPPED and getattr(backend, "is_running", True):
+                return node
+            logger.warning("Discarding dead pooled node %s", node.id)
+            self._staging.nodes.pop(node.id, None)
+        return None
+
+    def _refill(self, state: _TemplateState) -> None:
+        if not self._started:
+            return
+        missing = state.template.size - len(state.ready) - len(state.warming)
+        for _ in range(missing):
+            task = asyncio.create_task(self._warm(state))
+            state.warming.add(task)
+            task.add_done_callback(state.warming.discard)
+
+    async def _warm(self, state: _TemplateState) -> None:
+        template = state.template
+        started = time.perf_counter()
+        try:
+            node = await self._create(template, f"warm-{next(self._ids)}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state.failures += 1
+            logger.warning("Failed to pre-start node for %s: %s", template.key, e)
+            return
+
+        state.cold_starts += 1
+        state.cold_start_seconds += time.perf_counter() - started
+        if not self._started:
+            await node.stop()
+            return
+        state.ready.append(node)
+
+    async def _create(self, template: PoolTemplate, node_id: str) -> PTYNode | ClaudeWezTermNode:
+        from nerve.core.nodes.terminal import ClaudeWezTermNode, PTYNode
+
+        if template.backend == "pty":
+            return await PTYNode.create(
+                id=node_id,
+                session=self._staging,
+                command=template.command,
+                cwd=template.cwd,
+                history=False,
+            )
+        return await ClaudeWezTermNode.create(
+            id=node_id,
+            session=self._staging,
+            command=template.command,
+            cwd=template.cwd,
+            history=False,
+        )
@@ -6,6 +6,7 @@ These protocols define the contract between server and transport layers.
 from __future__ import annotations
 
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Protocol
@@ -120,6 +121,14 @@ class CommandType(Enum):
     # Server control
     STOP = auto()
     PING = auto()
+    GET_METRICS = auto()
+
+    # Several commands in one message (see NerveEngine._execute_batch)
+    BATCH = auto()
+
+    # Event subscriptions (handled by the transport, per connection)
+    SUBSCRIBE = auto()
+    UNSUBSCRIBE = auto()
 
 
 # Node type to backend name mapping (protocol-level constant)
@@ -146,12 +155,89 @@ class Event:
         node_id: Associated node ID (if applicable).
         data: Event payload.
         timestamp: When the event occurred.
+        session_id: Session the event belongs to (if applicable).
     """
 
     type: EventType
     data: dict[str, Any] = field(default_factory=dict)
     node_id: str | None = None
     timestamp: float = field(default_factory=time.time)
+    session_id: str | None = None
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Which events a subscription receives.
+
+    Each field restricts one attribute of the event; None places no
+    restriction. An event matches when every restricted attribute is in
+    the given set, so a node or session filter excludes events that have
+    no node or session.
+
+    Attributes:
+        event_types: Event types to receive.
+        node_ids: Nodes whose events to receive.
+        session_ids: Sessions whose events to receive.
+
+    Example:
+        >>> EventFilter(event_types=frozenset({EventType.OUTPUT_CHUNK}), node_ids=frozenset({"a"}))
+    """
+
+    event_types: frozenset[EventType] | None = None
+    node_ids: frozenset[str] | None = None
+    session_ids: frozenset[str] | None = None
+
+    def matches(self, event: Event) -> bool:
+        """Whether the event passes this filter."""
+        return (
+            (self.event_types is None or event.type in self.event_types)
+            and (self.node_ids is None or event.node_id in self.node_ids)
+            and (self.session_ids is None or event.session_id in self.session_ids)
+        )
+
+    @classmethod
+    def from_params(cls, params: dict[str, Any]) -> EventFilter:
+        """Build a filter from SUBSCRIBE params.
+
+        Args:
+            params: Optional "event_types" (event type names), "node_ids"
+                and "session_ids" lists.
+
+        Raises:
+            ValueError: If a field is not a list of strings, or an event
+                type name is unknown.
+        """
+        if not isinstance(params, dict):
+            raise ValueError("Subscription params must be an object")
+        for key in ("event_types", "node_ids", "session_ids"):
+            value = params.get(key)
+            if value is not None and (
+                not isinstance(value, list) or not all(isinstance(v, str) for v in value)
+            ):
+                raise ValueError(f"{key} must be a list of strings")
+        event_types = params.get("event_types")
+        node_ids = params.get("node_ids")
+        session_ids = params.get("session_ids")
+        try:
+            types = None if event_types is None else frozenset(EventType[t] for t in event_types)
+        except KeyError as e:
+            raise ValueError(f"Unknown event type: {e.args[0]}") from None
+        return cls(
+            event_types=types,
+            node_ids=None if node_ids is None else frozenset(node_ids),
+            session_ids=None if session_ids is None else frozenset(session_ids),
+        )
+
+    def to_params(self) -> dict[str, Any]:
+        """Inverse of from_params()."""
+        params: dict[str, Any] = {}
+        if self.event_types is not None:
+            params["event_types"] = sorted(t.name for t in self.event_types)
+        if self.node_ids is not None:
+            params["node_ids"] = sorted(self.node_ids)
+        if self.session_ids is not None:
+            params["session_ids"] = sorted(self.session_ids)
+        return params
 
 
 @dataclass(frozen=True)
@@ -178,12 +264,34 @@ class CommandResult:
         data: Result data (if successful).
         error: Error message (if failed).
         request_id: Correlation ID from the command.
+        parts: For streamed results (see StreamedResult), the parts still
+            to be sent. Transports send each part as a "result_part"
+            message with the request_id, then the result itself.
     """
 
     success: bool
     data: dict[str, Any] | None = None
     error: str | None = None
     request_id: str | None = None
+    parts: AsyncIterator[dict[str, Any]] | None = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class StreamedResult:
+    """Handler return value for a result sent in parts.
+
+    Lets large results (a multi-megabyte buffer, a long history) be sent
+    piece by piece instead of as one message both ends must hold whole.
+    data is sent after the last part, so the parts iterator may fill in
+    totals as it goes.
+
+    Attributes:
+        parts: Async iterator of result parts.
+        data: Final result data.
+    """
+
+    parts: AsyncIterator[dict[str, Any]]
+    data: dict[str, Any] = field(default_factory=dict)
 
 
 class EventSink(Protocol):
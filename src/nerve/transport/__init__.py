@@ -8,6 +8,7 @@ Available transports:
     InProcessTransport: Direct in-process communication (no IPC).
     UnixSocketTransport: Unix domain socket communication.
     HTTPTransport: HTTP REST + WebSocket communication.
+    ClientPool: Several socket client connections used as one client.
 
 Example (in-process):
     >>> from nerve.transport import InProcessTransport
@@ -30,8 +31,10 @@ Example (socket server):
     >>> await transport.serve(engine)
 """
 
+from nerve.transport.fanout import ClientChannel, OverflowPolicy, TrafficCounter
 from nerve.transport.http import HTTPClient, HTTPServer
 from nerve.transport.in_process import InProcessTransport
+from nerve.transport.pool import ClientPool
 from nerve.transport.protocol import ClientTransport, ServerTransport, Transport
 from nerve.transport.tcp_socket import TCPSocketClient, TCPSocketServer
 from nerve.transport.unix_socket import UnixSocketClient, UnixSocketServer
@@ -49,4 +52,9 @@ __all__ = [
     "TCPSocketClient",
     "HTTPServer",
     "HTTPClient",
+    "ClientPool",
+    # Per-client send queues
+    "ClientChannel",
+    "OverflowPolicy",
+    "TrafficCounter",
 ]
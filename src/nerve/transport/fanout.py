@@ -0,0 +1,475 @@
+"""Per-client send queues for server transports.
+
+Server transports used to broadcast an event by writing it to each client
+in turn and awaiting drain(), so one slow client (a paused TUI, a laggy
+SSH tunnel) held up the emitting handler and every other client. Each
+client now has a ClientChannel: a bounded queue drained by its own writer
+task. emit() serializes the event once and offers the result to every
+channel without waiting; a channel whose client falls behind applies its
+OverflowPolicy.
+
+Command responses go through the same channel, so they never interleave
+with events on the wire, but they are never dropped. Streamed results
+(see stream_result()) are paced instead, so at most STREAM_WINDOW of their
+parts wait in a client's queue.
+
+A client receives every event until it subscribes (SUBSCRIBE command, see
+handle_subscription_command()); from then on it receives only events
+matching one of its subscriptions. Transports check this before
+serializing, so events nobody wants cost nothing.
+
+Example:
+    >>> channel = ClientChannel(send=write_lines, encode=encode_line, name="client-1")
+    >>> channel.start()
+    >>> channel.offer(event, encode_line(event_message(event)))  # Never blocks
+    >>> channel.send(encode_line(response))
+    >>> channel.stats["dropped"]
+    0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import replace
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nerve.server.protocols import Command, CommandResult, Event, EventFilter
+
+logger = logging.getLogger(__name__)
+
+# Messages a client may have queued before its overflow policy applies
+CLIENT_QUEUE_SIZE = 1024
+
+# Queued messages above which a streamed result waits before its next part
+STREAM_WINDOW = 8
+
+# Parts a client buffers for a streamed result before it stops reading
+STREAM_QUEUE_SIZE = 16
+
+
+class OverflowPolicy(Enum):
+    """What a full client queue does with a new event."""
+
+    DROP_OLDEST = "drop-oldest"  # Discard the oldest queued event
+    COALESCE = "coalesce"  # Merge output chunks of the same node, else drop oldest
+    DISCONNECT = "disconnect"  # Close the client's connection
+
+
+def event_message(event: Event) -> dict[str, Any]:
+    """Wire form of an event, shared by all transports."""
+    return {
+        "type": "event",
+        "event_type": event.type.name,
+        "node_id": event.node_id,
+        "data": event.data,
+        "timestamp": event.timestamp,
+        "session_id": event.session_id,
+    }
+
+
+def result_message(result: CommandResult) -> dict[str, Any]:
+    """Wire form of a command result, shared by the socket transports."""
+    return {
+        "type": "result",
+        "success": result.success,
+        "data": result.data,
+        "error": result.error,
+        "request_id": result.request_id,
+    }
+
+
+def result_part_message(request_id: str | None, part: dict[str, Any]) -> dict[str, Any]:
+    """Wire form of one part of a streamed result."""
+    return {"type": "result_part", "request_id": request_id, "data": part}
+
+
+async def stream_result(
+    result: CommandResult, write: Callable[[dict[str, Any]], Awaitable[bool]]
+) -> None:
+    """Write a command result as wire messages, its parts first.
+
+    Each part goes out as a "result_part" message with the result's
+    request_id, then the result itself with data["parts"] set to the
+    number of parts. If producing a part fails, the final result reports
+    the error.
+
+    Args:
+        result: The result; without parts it is written as one message.
+        write: Writes one message; returns False once the client is gone,
+            which ends the stream.
+    """
+    from nerve.server.protocols import CommandResult
+
+    parts = result.parts
+    if parts is not None:
+        count = 0
+        try:
+            async for part in parts:
+                if not await write(result_part_message(result.request_id, part)):
+                    return
+                count += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Streamed result %s failed: %s", result.request_id, e)
+            result = CommandResult(
+                success=False, error=f"Result stream failed: {e}", request_id=result.request_id
+            )
+        else:
+            result = CommandResult(
+                success=result.success,
+                data={**(result.data or {}), "parts": count},
+                error=result.error,
+                request_id=result.request_id,
+            )
+        finally:
+            if isinstance(parts, AsyncGenerator):
+                await parts.aclose()
+    await write(result_message(result))
+
+
+async def send_result[T](channel: ClientChannel[T], result: CommandResult) -> None:
+    """Queue a command result on a client's channel (see stream_result()).
+
+    Parts are paced with wait_writable(), so a slow client holds up only
+    its own stream and never has more than STREAM_WINDOW messages queued.
+    """
+    if result.parts is None:
+        channel.send(channel.encode(result_message(result)))
+        return
+
+    async def write(message: dict[str, Any]) -> bool:
+        await channel.wait_writable(STREAM_WINDOW)
+        if channel.closed:
+            return False
+        channel.send(channel.encode(message))
+        return True
+
+    await stream_result(result, write)
+
+
+def handle_subscription_command(channel: ClientChannel[Any], command: Command) -> CommandResult:
+    """Apply a SUBSCRIBE or UNSUBSCRIBE command to a client's channel.
+
+    SUBSCRIBE params are those of EventFilter.from_params() and return
+    {"subscription_id": ...}. UNSUBSCRIBE takes an optional
+    "subscription_id" (omitted: remove all) and returns {"unsubscribed": bool}.
+    """
+    from nerve.server.protocols import CommandResult, CommandType, EventFilter
+
+    try:
+        if not isinstance(command.params, dict):
+            raise ValueError("params must be an object")
+        if command.type is CommandType.SUBSCRIBE:
+            subscription_id = channel.subscribe(EventFilter.from_params(command.params))
+            data: dict[str, Any] = {"subscription_id": subscription_id}
+        else:
+            data = {"unsubscribed": channel.unsubscribe(command.params.get("subscription_id"))}
+    except ValueError as e:
+        return CommandResult(success=False, error=str(e), request_id=command.request_id)
+    return CommandResult(success=True, data=data, request_id=command.request_id)
+
+
+def broadcast[T](channels: list[ClientChannel[T]], event: Event) -> list[ClientChannel[T]]:
+    """Offer an event to every channel that wants it.
+
+    The event is serialized once per distinct encoder (wire format), not
+    once per client, and not at all if no channel wants it.
+
+    Returns:
+        Channels that are closed and should be dropped.
+    """
+    message: dict[str, Any] | None = None
+    payloads: dict[Callable[[dict[str, Any]], T], T] = {}
+    closed = []
+    for channel in channels:
+        if not channel.wants(event):
+            continue
+        if message is None:
+            message = event_message(event)
+        payload = payloads.get(channel.encode)
+        if payload is None:
+            payload = payloads[channel.encode] = channel.encode(message)
+        if not channel.offer(event, payload):
+            closed.append(channel)
+    return closed
+
+
+class TrafficCounter:
+    """Bytes and messages a server transport has received and sent.
+
+    Totals cover every client since the server started, including clients
+    that have disconnected.
+    """
+
+    __slots__ = ("bytes_in", "bytes_out", "messages_in", "messages_out")
+
+    def __init__(self) -> None:
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.messages_in = 0
+        self.messages_out = 0
+
+    def received(self, size: int) -> None:
+        """Count one message of size bytes from a client."""
+        self.bytes_in += size
+        self.messages_in += 1
+
+    def sent(self, size: int, messages: int = 1) -> None:
+        """Count messages totalling size bytes written to a client."""
+        self.bytes_out += size
+        self.messages_out += messages
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters named for MetricsRegistry.add_source()."""
+        return {
+            "bytes_in_total": self.bytes_in,
+            "bytes_out_total": self.bytes_out,
+            "messages_in_total": self.messages_in,
+            "messages_out_total": self.messages_out,
+        }
+
+
+class _Item[T]:
+    __slots__ = ("payload", "event", "encode")
+
+    def __init__(
+        self,
+        payload: T,
+        event: Event | None,
+        encode: Callable[[dict[str, Any]], T] | None = None,
+    ) -> None:
+        self.payload = payload
+        self.event = event  # None for responses, which are never dropped
+        self.encode = encode  # Encoder of the payload, to re-encode coalesced events
+
+
+class ClientChannel[T]:
+    """Bounded send queue and writer task for one connected client.
+
+    Args:
+        send: Coroutine writing a batch of payloads to the client, in order.
+            Raising marks the client as gone.
+        encode: Serializer for wire messages. Public attribute: a
+            transport replaces it when the connection switches wire format;
+            messages already queued keep their encoding.
+        name: Client label for logs and stats.
+        max_queue: Queued messages before the overflow policy applies.
+        policy: What to do with an event when the queue is full.
+        on_close: Called once when the channel closes on its own (send
+            failed or the DISCONNECT policy fired), to close the connection.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[T]], Awaitable[None]],
+        encode: Callable[[dict[str, Any]], T],
+        name: str = "client",
+        max_queue: int = CLIENT_QUEUE_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        self.name = name
+        self.max_queue = max_queue
+        self.policy = policy
+        self.encode = encode
+        self._send = send
+        self._on_close = on_close
+
+        self._subscriptions: dict[str, EventFilter] = {}
+        self._subscription_ids = itertools.count(1)
+
+        self._queue: deque[_Item[T]] = deque()
+        self._wakeup = asyncio.Event()
+        self._written = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._sent = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._peak_depth = 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether the channel no longer accepts messages."""
+        return self._closed
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Channel metrics.
+
+        Returns:
+            Dict with "name", "policy", number of "subscriptions", queue
+            "depth" now and "peak_depth", messages "sent", events "dropped"
+            and "coalesced" on overflow, and whether the channel is "closed".
+        """
+        return {
+            "name": self.name,
+            "policy": self.policy.value,
+            "subscriptions": len(self._subscriptions),
+            "depth": len(self._queue),
+            "peak_depth": self._peak_depth,
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "closed": self._closed,
+        }
+
+    def wants(self, event: Event) -> bool:
+        """Whether the client receives this event.
+
+        True for every event until the client subscribes, then for events
+        matching any of its subscriptions.
+        """
+        if not self._subscriptions:
+            return True
+        return any(f.matches(event) for f in self._subscriptions.values())
+
+    def subscribe(self, event_filter: EventFilter) -> str:
+        """Add a subscription.
+
+        Returns:
+            Subscription ID for unsubscribe().
+        """
+        subscription_id = f"sub-{next(self._subscription_ids)}"
+        self._subscriptions[subscription_id] = event_filter
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: str | None = None) -> bool:
+        """Remove a subscription, or all of them if subscription_id is None.
+
+        Returns:
+            Whether anything was removed.
+        """
+        if subscription_id is None:
+            removed = bool(self._subscriptions)
+            self._subscriptions.clear()
+            return removed
+        return self._subscriptions.pop(subscription_id, None) is not None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._write_loop())
+
+    def offer(self, event: Event, payload: T) -> bool:
+        """Queue an event without waiting.
+
+        Args:
+            event: The event (used by the COALESCE policy).
+            payload: The event already serialized with self.encode.
+
+        Returns:
+            False if the channel is closed (or was just closed by the
+            DISCONNECT policy), True otherwise.
+        """
+        if self._closed:
+            return False
+        if len(self._queue) >= self.max_queue:
+            if self.policy is OverflowPolicy.DISCONNECT:
+                logger.warning(
+                    "Client %s fell %d messages behind, disconnecting", self.name, len(self._queue)
+                )
+                self._close_connection()
+                return False
+            if self.policy is OverflowPolicy.COALESCE and self._coalesce(event):
+                return True
+            self._drop_oldest()
+        self._push(_Item(payload, event, self.encode))
+        return True
+
+    def send(self, payload: T) -> None:
+        """Queue a response. Responses are never dropped."""
+        if not self._closed:
+            self._push(_Item(payload, None))
+
+    async def wait_writable(self, limit: int) -> None:
+        """Wait until fewer than limit messages are queued (or the channel closes).
+
+        For producers of many responses, which are never dropped, to pace
+        themselves to the client.
+        """
+        while len(self._queue) >= limit and not self._closed:
+            self._written.clear()
+            await self._written.wait()
+
+    def close(self) -> None:
+        """Stop the writer task and discard queued messages."""
+        self._closed = True
+        self._queue.clear()
+        self._written.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def _push(self, item: _Item[T]) -> None:
+        self._queue.append(item)
+        self._peak_depth = max(self._peak_depth, len(self._queue))
+        self._wakeup.set()
+
+    def _drop_oldest(self) -> None:
+        # Responses stay queued; only events are dropped
+        for i, item in enumerate(self._queue):
+            if item.event is not None:
+                del self._queue[i]
+                self._dropped += 1
+                return
+
+    def _coalesce(self, event: Event) -> bool:
+        """Merge an output chunk into its node's last queued message.
+
+        Only the node's most recent queued message may absorb the chunk (and
+        only if it is a chunk too), so output never moves ahead of another
+        event for the same node.
+
+        Returns:
+            True if the chunk was merged and must not be queued itself.
+        """
+        from nerve.server.protocols import EventType
+
+        if event.type is not EventType.OUTPUT_CHUNK:
+            return False
+        for item in reversed(self._queue):
+            if item.event is None or item.event.node_id != event.node_id:
+                continue
+            if item.event.type is not EventType.OUTPUT_CHUNK:
+                return False
+            chunk = item.event.data.get("chunk", "") + event.data.get("chunk", "")
+            item.event = replace(item.event, data={**item.event.data, "chunk": chunk})
+            item.payload = (item.encode or self.encode)(event_message(item.event))
+            self._coalesced += 1
+            return True
+        return False
+
+    def _close_connection(self) -> None:
+        self.close()
+        if self._on_close is not None:
+            try:
+                self._on_close()
+            except Exception as e:
+                logger.debug("Error closing client %s: %s", self.name, e)
+
+    async def _write_loop(self) -> None:
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._queue and not self._closed:
+                batch = [item.payload for item in self._queue]
+                self._queue.clear()
+                try:
+                    await self._send(batch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug("Client %s write failed: %s", self.name, e)
+                    self._close_connection()
+                    return
+                self._sent += len(batch)
+                self._written.set()
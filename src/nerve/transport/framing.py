@@ -0,0 +1,338 @@
+"""Wire formats for the Unix/TCP socket transports.
+
+The socket protocol started as newline-delimited JSON, which is easy to
+debug with socat but slow for large payloads: megabyte GET_BUFFER and
+GET_HISTORY responses go through stdlib json, and a single long line can
+exceed the StreamReader limit. Connections can now negotiate a binary
+framing instead:
+
+    frame = length (4 bytes, big endian) + flags (1 byte) + body
+
+The body is one message encoded with the negotiated codec (msgpack or
+orjson when installed via the "wire" extra, else stdlib json), and
+compressed with the negotiated compressor (zstd when installed, else
+deflate) if it is at least COMPRESS_THRESHOLD bytes. TCP clients offer
+compression; Unix socket clients do not, since compressing costs more
+than copying the bytes locally (see scripts/bench_wire.py).
+
+Negotiation keeps the JSON-lines protocol as the default, so old clients
+and servers keep working:
+
+    1. The client sends one JSON line: hello_message().
+    2. A server that supports framing answers with one JSON line naming
+       its choices (see negotiate()) and switches the connection to
+       frames. An older server answers "Unknown message type" and the
+       client stays on JSON lines.
+
+Example:
+    >>> wire = negotiate(hello_message())
+    >>> data = wire.encode({"type": "result", "data": {"buffer": "..."}})
+    >>> message = await wire.read(reader)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import zlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nerve.transport.fanout import TrafficCounter
+
+# Bodies at least this large are compressed (when compression is negotiated)
+COMPRESS_THRESHOLD = 16 * 1024
+
+# Larger frames are treated as a corrupt stream
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+_HEADER = struct.Struct(">IB")
+_FLAG_COMPRESSED = 0x01
+
+
+class MessageDecodeError(ValueError):
+    """A message could not be decoded. The stream itself is still usable."""
+
+
+class FramingError(ConnectionError):
+    """The stream is out of sync (e.g. an impossible frame length)."""
+
+
+@dataclass(frozen=True)
+class Codec:
+    """Serializer for message bodies."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+@dataclass(frozen=True)
+class Compressor:
+    """Compression for large message bodies.
+
+    decompress(body, limit) raises MessageDecodeError rather than return
+    more than limit bytes, so a small frame cannot inflate without bound.
+    """
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes, int], bytes]
+
+
+def _available_codecs() -> dict[str, Codec]:
+    """Codecs this process can use, fastest first."""
+    codecs: dict[str, Codec] = {}
+    try:
+        import msgpack  # type: ignore[import-not-found]
+
+        codecs["msgpack"] = Codec(
+            "msgpack",
+            lambda obj: msgpack.packb(obj, use_bin_type=True),
+            lambda data: msgpack.unpackb(data, raw=False),
+        )
+    except ImportError:
+        pass
+    try:
+        import orjson  # type: ignore[import-not-found]
+
+        codecs["orjson"] = Codec("orjson", orjson.dumps, orjson.loads)
+    except ImportError:
+        pass
+    codecs["json"] = Codec("json", lambda obj: json.dumps(obj).encode(), json.loads)
+    return codecs
+
+
+def _available_compressors() -> dict[str, Compressor]:
+    """Compressors this process can use, best first."""
+    compressors: dict[str, Compressor] = {}
+    try:
+        import zstandard  # type: ignore[import-not-found]
+
+        decompressor = zstandard.ZstdDecompressor()
+
+        def unzstd(data: bytes, limit: int) -> bytes:
+            # A stream reader stops at limit even if the frame header claims more
+            with decompressor.stream_reader(data) as reader:
+                body: bytes = reader.read(limit + 1)
+            if len(body) > limit:
+                raise MessageDecodeError(f"Decompressed frame exceeds {limit} bytes")
+            return body
+
+        compressors["zstd"] = Compressor("zstd", zstandard.ZstdCompressor(level=3).compress, unzstd)
+    except ImportError:
+        pass
+    # Level 1: large terminal buffers compress well even at the fastest level
+    compressors["deflate"] = Compressor("deflate", lambda data: zlib.compress(data, 1), _inflate)
+    return compressors
+
+
+def _inflate(data: bytes, limit: int) -> bytes:
+    """zlib.decompress() that stops at limit bytes of output."""
+    inflater = zlib.decompressobj()
+    body = inflater.decompress(data, limit)
+    if inflater.unconsumed_tail:
+        raise MessageDecodeError(f"Decompressed frame exceeds {limit} bytes")
+    if not inflater.eof:
+        raise MessageDecodeError("Truncated compressed frame")
+    return body
+
+
+CODECS = _available_codecs()
+COMPRESSORS = _available_compressors()
+
+
+@dataclass(frozen=True)
+class WireFormat:
+    """How messages are encoded on one connection.
+
+    Attributes:
+        codec: Body codec, or None for the original JSON-lines protocol.
+        compressor: Compression for bodies of at least compress_threshold
+            bytes, or None.
+        compress_threshold: Smallest body size worth compressing.
+        max_size: Largest frame body accepted, before and after
+            decompression.
+    """
+
+    codec: Codec | None = None
+    compressor: Compressor | None = None
+    compress_threshold: int = COMPRESS_THRESHOLD
+    max_size: int = MAX_FRAME_SIZE
+
+    @property
+    def name(self) -> str:
+        """Short description for logs, e.g. "msgpack+zstd" or "json-lines"."""
+        if self.codec is None:
+            return "json-lines"
+        if self.compressor is None:
+            return self.codec.name
+        return f"{self.codec.name}+{self.compressor.name}"
+
+    def encode(self, message: dict[str, Any]) -> bytes:
+        """Serialize one message for the wire."""
+        if self.codec is None:
+            return (json.dumps(message) + "\n").encode()
+
+        body = self.codec.dumps(message)
+        flags = 0
+        if self.compressor is not None and len(body) >= self.compress_threshold:
+            body = self.compressor.compress(body)
+            flags |= _FLAG_COMPRESSED
+        return _HEADER.pack(len(body), flags) + body
+
+    async def read(
+        self, reader: asyncio.StreamReader, traffic: TrafficCounter | None = None
+    ) -> Any:
+        """Read one message.
+
+        Args:
+            reader: The connection's reader.
+            traffic: Counts the message's size on the wire (optional).
+
+        Returns:
+            The decoded message, or None at end of stream.
+
+        Raises:
+            MessageDecodeError: If the message could not be decoded; the
+                next read() continues with the following message.
+            FramingError: If the stream is corrupt.
+        """
+        if self.codec is None:
+            line = await reader.readline()
+            if not line:
+                return None
+            if traffic is not None:
+                traffic.received(len(line))
+            try:
+                return json.loads(line.decode())
+            except ValueError as e:
+                raise MessageDecodeError(f"Invalid JSON: {e}") from e
+
+        try:
+            header = await reader.readexactly(_HEADER.size)
+            length, flags = _HEADER.unpack(header)
+            if length > self.max_size:
+                raise FramingError(f"Frame of {length} bytes exceeds {self.max_size}")
+            body = await reader.readexactly(length)
+        except asyncio.IncompleteReadError:
+            return None
+        if traffic is not None:
+            traffic.received(_HEADER.size + length)
+
+        try:
+            if flags & _FLAG_COMPRESSED:
+                if self.compressor is None:
+                    raise MessageDecodeError("Compressed frame but no compression negotiated")
+                body = self.compressor.decompress(body, self.max_size)
+            return self.codec.loads(body)
+        except MessageDecodeError:
+            raise
+        except Exception as e:
+            raise MessageDecodeError(f"Invalid {self.name} frame: {e}") from e
+
+
+# The original protocol: one JSON object per line
+JSON_LINES = WireFormat()
+
+
+def hello_message(compress: bool = True) -> dict[str, Any]:
+    """Client's framing offer, sent as the first JSON line.
+
+    Args:
+        compress: Offer compression. Worth it over networks; on a Unix
+            socket compressing costs more time than copying the bytes.
+    """
+    return {
+        "type": "hello",
+        "codecs": list(CODECS),
+        "compression": list(COMPRESSORS) if compress else [],
+    }
+
+
+def is_hello(message: Any) -> bool:
+    """Whether a message is a framing offer or answer."""
+    return isinstance(message, dict) and message.get("type") == "hello"
+
+
+def negotiate(hello: dict[str, Any]) -> WireFormat:
+    """Server side: pick the wire format for a client's offer.
+
+    Takes the client's first (preferred) codec and compressor that this
+    process also supports.
+    """
+    codec = next((CODECS[n] for n in hello.get("codecs", []) if n in CODECS), CODECS["json"])
+    compressor = next(
+        (COMPRESSORS[n] for n in hello.get("compression", []) if n in COMPRESSORS), None
+    )
+    return WireFormat(codec=codec, compressor=compressor)
+
+
+def hello_reply(wire: WireFormat) -> dict[str, Any]:
+    """Server's answer to hello_message(), sent as a JSON line."""
+    return {
+        "type": "hello",
+        "codec": wire.codec.name if wire.codec else None,
+        "compression": wire.compressor.name if wire.compressor else None,
+    }
+
+
+def accept_reply(reply: dict[str, Any]) -> WireFormat:
+    """Client side: the wire format named in a server's hello_reply().
+
+    Raises:
+        ValueError: If the server chose something this process never offered.
+    """
+    codec_name = reply.get("codec")
+    compression = reply.get("compression")
+    if codec_name not in CODECS or (compression is not None and compression not in COMPRESSORS):
+        raise ValueError(f"Server chose unsupported framing: {codec_name}/{compression}")
+    return WireFormat(
+        codec=CODECS[codec_name],
+        compressor=COMPRESSORS[compression] if compression else None,
+    )
+
+
+async def client_handshake(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    on_message: Callable[[Any], Awaitable[None]],
+    compress: bool = True,
+    timeout: float = 5.0,
+) -> WireFormat:
+    """Client side: offer framing and return the wire format to use.
+
+    Falls back to JSON_LINES if the server predates framing (it answers
+    the offer with an error) or does not answer within timeout.
+
+    Args:
+        reader: The connection's reader, not yet used by anything else.
+        writer: The connection's writer.
+        on_message: Receives messages (events) that arrive before the answer.
+        compress: Offer compression (see hello_message()).
+        timeout: Seconds to wait for the answer.
+    """
+    writer.write(JSON_LINES.encode(hello_message(compress)))
+    await writer.drain()
+
+    async def wait_for_answer() -> WireFormat:
+        while True:
+            try:
+                message = await JSON_LINES.read(reader)
+            except MessageDecodeError:
+                continue
+            if message is None:
+                raise ConnectionError("Connection closed during handshake")
+            if is_hello(message):
+                return accept_reply(message)
+            if isinstance(message, dict) and message.get("type") == "error":
+                return JSON_LINES  # Server predates framing
+            await on_message(message)
+
+    try:
+        return await asyncio.wait_for(wait_for_answer(), timeout=timeout)
+    except TimeoutError:
+        return JSON_LINES
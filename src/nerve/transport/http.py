@@ -13,9 +13,19 @@ from collections.abc import AsyncIterator
 from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
+from nerve.transport.fanout import (
+    CLIENT_QUEUE_SIZE,
+    ClientChannel,
+    OverflowPolicy,
+    TrafficCounter,
+    broadcast,
+    handle_subscription_command,
+    stream_result,
+)
+
 if TYPE_CHECKING:
     from nerve.server import NerveEngine
-    from nerve.server.protocols import Command, CommandResult, Event
+    from nerve.server.protocols import Command, CommandResult, Event, EventFilter
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +37,14 @@ class HTTPServer:
     Provides:
     - POST /api/command - Send commands (REST)
     - GET /api/events - Subscribe to events (WebSocket)
+    - GET /metrics - Server metrics in the Prometheus text format
+
+    Each WebSocket client has its own bounded send queue (see
+    ClientChannel); when it is full, overflow_policy applies. A WebSocket
+    client receives every event until it sends a SUBSCRIBE command over the
+    socket, then only the events its subscriptions match.
+
+    traffic counts request and response bodies and WebSocket messages.
 
     Example:
         >>> transport = HTTPServer(host="0.0.0.0", port=8080)
@@ -39,33 +57,22 @@ class HTTPServer:
     _engine: NerveEngine | None = None
     _app: Any = None  # aiohttp.web.Application
     _runner: Any = None  # aiohttp.web.AppRunner
-    _websockets: list[Any] = field(default_factory=list)
+    max_client_queue: int = CLIENT_QUEUE_SIZE
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    traffic: TrafficCounter = field(default_factory=TrafficCounter)
+    _websockets: list[ClientChannel[str]] = field(default_factory=list)
     _running: bool = False
 
-    async def emit(self, event: Event) -> None:
-        """Broadcast event to all WebSocket clients."""
-        if not self._websockets:
-            return
-
-        data = json.dumps(
-            {
-                "type": "event",
-                "event_type": event.type.name,
-                "node_id": event.node_id,
-                "data": event.data,
-                "timestamp": event.timestamp,
-            }
-        )
-
-        dead_sockets = []
-        for ws in self._websockets:
-            try:
-                await ws.send_str(data)
-            except Exception:
-                dead_sockets.append(ws)
+    @property
+    def client_stats(self) -> list[dict[str, Any]]:
+        """Send queue metrics of each WebSocket client (see ClientChannel.stats)."""
+        return [channel.stats for channel in self._websockets]
 
-        for ws in dead_sockets:
-            self._websockets.remove(ws)
+    async def emit(self, event: Event) -> None:
+        """Broadcast event to subscribed WebSocket clients without waiting on them."""
+        for channel in broadcast(self._websockets, event):
+            if channel in self._websockets:
+                self._websockets.remove(channel)
 
     async def serve(self, engine: NerveEngine) -> None:
         """Start the HTTP server."""
@@ -84,6 +91,7 @@ class HTTPServer:
         self._app.router.add_post("/api/shutdown", self._handle_shutdown)
         self._app.router.add_get("/api/events", self._handle_websocket)
         self._app.router.add_get("/health", self._handle_health)
+        self._app.router.add_get("/metrics", self._handle_metrics)
 
         self._runner = web.AppRunner(self._app)
         await self._runner.setup()
@@ -120,6 +128,7 @@ class HTTPServer:
                 status=503,
             )
 
+        self.traffic.received(request.content_length or 0)
         try:
             body = await request.json()
         except json.JSONDecodeError:
@@ -141,8 +150,10 @@ class HTTPServer:
             )
 
         result = await self._engine.execute(command)
+        if result.parts is not None:
+            return await self._stream_result(request, result)
 
-        return web.json_response(
+        response = web.json_response(
             {
                 "success": result.success,
                 "data": result.data,
@@ -150,6 +161,32 @@ class HTTPServer:
                 "request_id": result.request_id,
             }
         )
+        self.traffic.sent(response.content_length or 0)
+        return response
+
+    async def _stream_result(self, request: Any, result: CommandResult) -> Any:
+        """Send a streamed result as NDJSON: one line per part, then the result.
+
+        Each write waits for the client, so parts are produced only as fast
+        as it reads them.
+        """
+        from aiohttp import web
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+
+        async def write(message: dict[str, Any]) -> bool:
+            data = (json.dumps(message) + "\n").encode()
+            try:
+                await response.write(data)
+            except ConnectionResetError:
+                return False
+            self.traffic.sent(len(data))
+            return True
+
+        await stream_result(result, write)
+        await response.write_eof()
+        return response
 
     async def _handle_websocket(self, request: Any) -> Any:
         """Handle GET /api/events (WebSocket)."""
@@ -160,25 +197,98 @@ class HTTPServer:
 
         client_addr = request.remote or "unknown"
         logger.debug("WebSocket client connected: %s", client_addr)
-        self._websockets.append(ws)
+
+        async def send_batch(messages: list[str]) -> None:
+            for message in messages:
+                await ws.send_str(message)
+            self.traffic.sent(sum(len(m) for m in messages), len(messages))
+
+        close_tasks: set[asyncio.Task[Any]] = set()
+
+        def close_ws() -> None:
+            task = asyncio.create_task(ws.close())
+            close_tasks.add(task)
+            task.add_done_callback(close_tasks.discard)
+
+        channel: ClientChannel[str] = ClientChannel(
+            send=send_batch,
+            encode=json.dumps,
+            name=str(client_addr),
+            max_queue=self.max_client_queue,
+            policy=self.overflow_policy,
+            on_close=close_ws,
+        )
+        channel.start()
+        self._websockets.append(channel)
 
         try:
-            async for _msg in ws:
-                # We don't expect messages from client on this endpoint
-                pass
+            async for msg in ws:
+                # Clients only send (UN)SUBSCRIBE commands on this endpoint
+                if msg.type == web.WSMsgType.TEXT:
+                    self.traffic.received(len(msg.data))
+                    channel.send(json.dumps(self._handle_ws_message(msg.data, channel)))
         finally:
-            if ws in self._websockets:
-                self._websockets.remove(ws)
+            if channel in self._websockets:
+                self._websockets.remove(channel)
+            channel.close()
             logger.debug("WebSocket client disconnected: %s", client_addr)
 
         return ws
 
+    def _handle_ws_message(self, text: str, channel: ClientChannel[str]) -> dict[str, Any]:
+        """Handle a command sent over a client's WebSocket."""
+        from nerve.server.protocols import Command, CommandType
+
+        try:
+            message = json.loads(text)
+            command_type = CommandType[message["command_type"]]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return {"type": "error", "error": "Invalid message"}
+
+        if command_type not in (CommandType.SUBSCRIBE, CommandType.UNSUBSCRIBE):
+            return {"type": "error", "error": "Use POST /api/command for commands"}
+
+        result = handle_subscription_command(
+            channel,
+            Command(
+                type=command_type,
+                params=message.get("params", {}),
+                request_id=message.get("request_id"),
+            ),
+        )
+        return {
+            "type": "result",
+            "success": result.success,
+            "data": result.data,
+            "error": result.error,
+            "request_id": result.request_id,
+        }
+
     async def _handle_health(self, request: Any) -> Any:
         """Handle GET /health."""
         from aiohttp import web
 
         return web.json_response({"status": "ok"})
 
+    async def _handle_metrics(self, request: Any) -> Any:
+        """Handle GET /metrics (GET_METRICS as Prometheus text)."""
+        from aiohttp import web
+
+        from nerve.server.metrics import render_prometheus
+        from nerve.server.protocols import Command, CommandType
+
+        if not self._engine:
+            return web.Response(text="Engine not available", status=503)
+
+        result = await self._engine.execute(Command(type=CommandType.GET_METRICS))
+        if not result.success:
+            return web.Response(text=result.error or "Metrics unavailable", status=500)
+
+        return web.Response(
+            body=render_prometheus(result.data or {}).encode(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
     async def _handle_shutdown(self, request: Any) -> Any:
         """Handle POST /api/shutdown."""
         from aiohttp import web
@@ -216,6 +326,7 @@ class HTTPClient:
     _session: Any = None  # aiohttp.ClientSession
     _ws: Any = None  # aiohttp.ClientWebSocketResponse
     _event_queue: asyncio.Queue = field(default_factory=asyncio.Queue)  # type: ignore[type-arg]
+    _pending_requests: dict[str, asyncio.Future[Any]] = field(default_factory=dict)
     _connected: bool = False
     _reader_task: asyncio.Task[Any] | None = None
     _last_error: Exception | None = field(default=None, repr=False)
@@ -317,8 +428,124 @@ class HTTPClient:
         except TimeoutError:
             raise TimeoutError(f"Command timed out after {timeout}s") from None
 
+    async def send_command_stream(
+        self, command: Command, timeout: float = 300.0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Send a command and iterate over its result as it arrives in parts.
+
+        For results the server streams (GET_BUFFER and GET_HISTORY with a
+        "chunk_size" param), which arrive as an NDJSON response read
+        incrementally.
+
+        Args:
+            command: The command to send.
+            timeout: Seconds to wait for each part.
+
+        Yields:
+            Result parts, then the result's own data (e.g. GET_BUFFER's
+            "length") with "parts" set to the number of parts. A result
+            that is not streamed (e.g. from an older server) is yielded
+            whole, as a single item.
+
+        Raises:
+            RuntimeError: If not connected, or the command failed.
+        """
+        import aiohttp
+
+        if not self._session or not self._connected:
+            raise RuntimeError("Not connected")
+
+        if command.request_id is None:
+            command = replace(command, request_id=str(uuid.uuid4()))
+
+        async with self._session.post(
+            f"{self.base_url}/api/command",
+            json={
+                "command_type": command.type.name,
+                "params": command.params,
+                "request_id": command.request_id,
+            },
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=timeout),
+        ) as response:
+            if response.content_type != "application/x-ndjson":
+                reply = await response.json()
+                if not reply.get("success"):
+                    raise RuntimeError(reply.get("error") or "Command failed")
+                yield reply.get("data") or {}
+                return
+
+            pending = b""
+            async for chunk in response.content.iter_any():
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    reply = json.loads(line)
+                    if reply["type"] == "result_part":
+                        yield reply.get("data") or {}
+                    elif not reply.get("success"):
+                        raise RuntimeError(reply.get("error") or "Command failed")
+                    else:
+                        yield reply.get("data") or {}
+
+    async def subscribe(self, event_filter: EventFilter | None = None) -> str:
+        """Ask the server to send the event WebSocket only matching events.
+
+        The server sends every event until the socket's first subscription,
+        then only events matching any of its subscriptions. Requires
+        connect(with_events=True).
+
+        Args:
+            event_filter: Events to receive (default: all).
+
+        Returns:
+            Subscription ID for unsubscribe().
+
+        Raises:
+            RuntimeError: If there is no event WebSocket or the server
+                rejected the subscription.
+        """
+        from nerve.server.protocols import Command, CommandType, EventFilter
+
+        params = (event_filter or EventFilter()).to_params()
+        result = await self._send_ws_command(Command(type=CommandType.SUBSCRIBE, params=params))
+        if not result.success or not result.data:
+            raise RuntimeError(f"Subscribe failed: {result.error}")
+        return str(result.data["subscription_id"])
+
+    async def unsubscribe(self, subscription_id: str | None = None) -> None:
+        """Remove a subscription, or all of them if subscription_id is None."""
+        from nerve.server.protocols import Command, CommandType
+
+        params = {} if subscription_id is None else {"subscription_id": subscription_id}
+        await self._send_ws_command(Command(type=CommandType.UNSUBSCRIBE, params=params))
+
+    async def _send_ws_command(self, command: Command, timeout: float = 30.0) -> CommandResult:
+        """Send a command over the event WebSocket and wait for its result."""
+        if not self._ws or not self._connected:
+            raise RuntimeError("Event WebSocket not connected")
+
+        request_id = str(uuid.uuid4())
+        future: asyncio.Future[CommandResult] = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = future
+        try:
+            await self._ws.send_str(
+                json.dumps(
+                    {
+                        "type": "command",
+                        "command_type": command.type.name,
+                        "params": command.params,
+                        "request_id": request_id,
+                    }
+                )
+            )
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Command timed out after {timeout}s") from None
+        finally:
+            self._pending_requests.pop(request_id, None)
+
     async def events(self) -> AsyncIterator[Event]:
-        """Subscribe to events."""
+        """Iterate over events from the event WebSocket (see subscribe())."""
         from nerve.server.protocols import Event, EventType
 
         while self._connected:
@@ -329,14 +556,19 @@ class HTTPClient:
                     node_id=item.get("node_id"),
                     data=item.get("data", {}),
                     timestamp=item.get("timestamp", 0),
+                    session_id=item.get("session_id"),
                 )
 
     async def _read_loop(self) -> None:
         """Background loop to read WebSocket messages.
 
-        Reads JSON messages from the WebSocket and puts them in the event queue.
-        Errors are logged and tracked in _last_error and _error_count.
+        Reads JSON messages from the WebSocket. Results of (un)subscribe
+        commands go to their pending futures; everything else goes to the
+        event queue. Errors are logged and tracked in _last_error and
+        _error_count.
         """
+        from nerve.server.protocols import CommandResult
+
         if not self._ws:
             return
 
@@ -345,7 +577,20 @@ class HTTPClient:
                 if msg.type == 1:  # TEXT
                     try:
                         data = json.loads(msg.data)
-                        await self._event_queue.put(data)
+                        future = None
+                        if isinstance(data, dict) and data.get("type") == "result":
+                            future = self._pending_requests.get(data.get("request_id") or "")
+                        if future is None:
+                            await self._event_queue.put(data)
+                        elif not future.done():
+                            future.set_result(
+                                CommandResult(
+                                    success=data["success"],
+                                    data=data.get("data"),
+                                    error=data.get("error"),
+                                    request_id=data.get("request_id"),
+                                )
+                            )
                     except json.JSONDecodeError as e:
                         self._error_count += 1
                         self._last_error = e
@@ -4,18 +4,27 @@ Useful for:
 - Testing
 - Embedding nerve in an application
 - Single-process use cases
+
+Commands go straight to NerveEngine.execute() and events are handed over
+as the Event objects themselves; nothing is serialized. Events are stored
+once in a BroadcastRing that every subscriber reads at its own pace.
 """
 
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from nerve.transport.ring import RING_CAPACITY, BroadcastRing, RingReader
 
 if TYPE_CHECKING:
     from nerve.server import NerveEngine
-    from nerve.server.protocols import Command, CommandResult, Event
+    from nerve.server.protocols import Command, CommandResult, Event, EventFilter
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -23,7 +32,9 @@ class InProcessTransport:
     """In-process transport - no IPC, direct communication.
 
     Both server and client in the same process.
-    Events are queued and can be consumed by the client.
+    Events are kept in a ring of the latest ring_capacity events; a
+    subscriber that falls further behind skips the oldest ones, and the
+    skipped count shows up in event_stats.
 
     Example:
         >>> transport = InProcessTransport()
@@ -40,9 +51,15 @@ class InProcessTransport:
         ...     print(event.type)
     """
 
+    ring_capacity: int = RING_CAPACITY
     _engine: NerveEngine | None = None
-    _event_queue: asyncio.Queue[Event] = field(default_factory=asyncio.Queue)
-    _subscribers: list[asyncio.Queue[Event]] = field(default_factory=list)
+    _ring: BroadcastRing[Event] = field(init=False, repr=False)
+    _next_event_reader: RingReader[Event] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._ring = BroadcastRing(self.ring_capacity)
+        # next_event() sees every event from the start, like the old queue
+        self._next_event_reader = self._ring.reader(name="next_event", from_start=True)
 
     def bind(self, engine: NerveEngine) -> None:
         """Bind to an engine.
@@ -53,19 +70,16 @@ class InProcessTransport:
         self._engine = engine
 
     async def emit(self, event: Event) -> None:
-        """Receive event from engine and broadcast to subscribers.
+        """Receive event from engine and publish it to subscribers.
 
-        Called by the engine when events occur.
+        Called by the engine when events occur. Never waits for subscribers.
         """
-        # Put in main queue
-        await self._event_queue.put(event)
+        self._ring.publish(event)
 
-        # Broadcast to all subscribers
-        for queue in self._subscribers:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                pass  # Drop if subscriber is slow
+    @property
+    def event_stats(self) -> dict[str, Any]:
+        """Events published, and each subscriber's backlog and skipped count."""
+        return self._ring.stats
 
     async def send_command(self, command: Command) -> CommandResult:
         """Send a command to the engine.
@@ -84,21 +98,57 @@ class InProcessTransport:
 
         return await self._engine.execute(command)
 
-    async def events(self) -> AsyncIterator[Event]:
+    async def send_command_stream(self, command: Command) -> AsyncIterator[dict[str, Any]]:
+        """Send a command and iterate over its result parts.
+
+        Same contract as the socket clients' send_command_stream(), without
+        serialization: parts come straight from the handler, followed by
+        the result's own data with "parts" set to the number of parts.
+
+        Raises:
+            RuntimeError: If not bound to an engine, or the command failed.
+        """
+        result = await self.send_command(command)
+        if not result.success:
+            raise RuntimeError(result.error or "Command failed")
+        parts = result.parts
+        if parts is None:
+            yield result.data or {}
+            return
+        count = 0
+        try:
+            async for part in parts:
+                yield part
+                count += 1
+        finally:
+            if isinstance(parts, AsyncGenerator):
+                await parts.aclose()
+        yield {**(result.data or {}), "parts": count}
+
+    async def events(self, event_filter: EventFilter | None = None) -> AsyncIterator[Event]:
         """Subscribe to events.
 
+        Args:
+            event_filter: Only receive matching events (default: all).
+
         Yields:
             Events as they occur.
         """
-        queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=100)
-        self._subscribers.append(queue)
-
+        reader = self._ring.reader(name="events")
+        lagged = 0
         try:
             while True:
-                event = await queue.get()
-                yield event
+                event = await reader.next()
+                if reader.lagged != lagged:
+                    logger.warning(
+                        "Event subscriber fell behind; skipped %d events",
+                        reader.lagged - lagged,
+                    )
+                    lagged = reader.lagged
+                if event_filter is None or event_filter.matches(event):
+                    yield event
         finally:
-            self._subscribers.remove(queue)
+            reader.close()
 
     async def next_event(self, timeout: float | None = None) -> Event | None:
         """Get the next event.
@@ -111,15 +161,11 @@ class InProcessTransport:
         """
         try:
             if timeout:
-                return await asyncio.wait_for(self._event_queue.get(), timeout=timeout)
-            return await self._event_queue.get()
+                return await asyncio.wait_for(self._next_event_reader.next(), timeout=timeout)
+            return await self._next_event_reader.next()
         except TimeoutError:
             return None
 
     def clear_events(self) -> None:
         """Clear pending events."""
-        while not self._event_queue.empty():
-            try:
-                self._event_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._next_event_reader.skip_to_end()
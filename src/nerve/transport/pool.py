@@ -0,0 +1,317 @@
+"""Connection pool for the Unix/TCP socket clients.
+
+A single UnixSocketClient/TCPSocketClient funnels every request through
+one connection, and when that connection drops its requests fail and the
+caller has to reconnect. ClientPool keeps several connections to the same
+server behind the same interface as one client:
+
+- Each request goes to the connection with the fewest requests in flight.
+- A dropped connection fails only its own in-flight requests (requests
+  are not retried, since a command may already have run) and is
+  reconnected in the background with exponential backoff. Meanwhile
+  requests go to the other connections, or wait for one to come back.
+- Events arrive over one connection, the first. Subscriptions made
+  through the pool are replayed when it reconnects; events emitted while
+  it was down are lost. The other connections subscribe to no events,
+  so the server does not send them any.
+
+Example:
+    >>> pool = ClientPool.unix("/tmp/nerve.sock", size=4)
+    >>> await pool.connect()
+    >>> results = await asyncio.gather(*(pool.send_command(c) for c in commands))
+    >>> pool.stats["in_flight"]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from nerve.transport.tcp_socket import TCPSocketClient
+from nerve.transport.unix_socket import UnixSocketClient
+
+if TYPE_CHECKING:
+    from nerve.server.protocols import Command, CommandResult, Event, EventFilter
+
+logger = logging.getLogger(__name__)
+
+SocketClient = UnixSocketClient | TCPSocketClient
+
+
+@dataclass
+class _Connection:
+    """One pooled connection and its counters."""
+
+    index: int
+    client: SocketClient | None = None
+    in_flight: int = 0
+    sent: int = 0
+    failed: int = 0
+    reconnects: int = 0
+    last_error: Exception | None = None
+    supervisor: asyncio.Task[None] | None = None
+
+    @property
+    def up(self) -> bool:
+        return self.client is not None and self.client.connected
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "connected": self.up,
+            "in_flight": self.in_flight,
+            "sent": self.sent,
+            "failed": self.failed,
+            "reconnects": self.reconnects,
+            "last_error": str(self.last_error) if self.last_error else None,
+        }
+
+
+@dataclass
+class ClientPool:
+    """Several socket connections to one server, used as one client.
+
+    Attributes:
+        factory: Creates an unconnected client (see unix() and tcp()).
+        size: Number of connections.
+        backoff_initial: First reconnect delay in seconds; doubles on
+            each failed attempt.
+        backoff_max: Longest reconnect delay in seconds.
+    """
+
+    factory: Callable[[], SocketClient]
+    size: int = 4
+    backoff_initial: float = 0.1
+    backoff_max: float = 10.0
+    _connections: list[_Connection] = field(default_factory=list, repr=False)
+    _subscriptions: dict[str, tuple[EventFilter | None, str]] = field(
+        default_factory=dict, repr=False
+    )
+    _subscription_counter: int = field(default=0, repr=False)
+    _event_queue: asyncio.Queue[Event] = field(default_factory=asyncio.Queue, repr=False)
+    _forwarder: asyncio.Task[None] | None = field(default=None, repr=False)
+    _up: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _closed: bool = field(default=True, repr=False)
+
+    @classmethod
+    def unix(cls, socket_path: str, size: int = 4, **kwargs: Any) -> ClientPool:
+        """Pool of UnixSocketClient connections."""
+        return cls(factory=lambda: UnixSocketClient(socket_path), size=size, **kwargs)
+
+    @classmethod
+    def tcp(cls, host: str, port: int, size: int = 4, **kwargs: Any) -> ClientPool:
+        """Pool of TCPSocketClient connections."""
+        return cls(factory=lambda: TCPSocketClient(host, port), size=size, **kwargs)
+
+    async def connect(self) -> None:
+        """Open the connections.
+
+        Connections that fail to open are retried in the background.
+
+        Raises:
+            OSError: If no connection could be opened.
+        """
+        if self.size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._closed = False
+        self._connections = [_Connection(index=i) for i in range(self.size)]
+        errors = await asyncio.gather(
+            *(self._open(conn) for conn in self._connections), return_exceptions=True
+        )
+        if not any(conn.up for conn in self._connections):
+            self._closed = True
+            error = errors[0]
+            raise error if isinstance(error, BaseException) else ConnectionError("Not connected")
+        for conn in self._connections:
+            conn.supervisor = asyncio.create_task(self._supervise(conn))
+
+    async def disconnect(self) -> None:
+        """Close all connections and stop reconnecting."""
+        self._closed = True
+        tasks = [c.supervisor for c in self._connections if c.supervisor] + [self._forwarder]
+        for task in tasks:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*(t for t in tasks if t is not None), return_exceptions=True)
+        for conn in self._connections:
+            if conn.client is not None:
+                await conn.client.disconnect()
+                conn.client = None
+        self._up.clear()
+
+    async def send_command(self, command: Command, timeout: float = 300.0) -> CommandResult:
+        """Send a command over the least busy connection.
+
+        Waits up to timeout for a connection if all of them are down.
+
+        Raises:
+            RuntimeError: If the pool is not connected.
+            ConnectionError: If the connection is lost before the result
+                arrives. The command may or may not have run.
+            TimeoutError: If no result (or connection) within timeout.
+        """
+        conn = await self._acquire(timeout)
+        assert conn.client is not None  # Checked by _acquire
+        conn.in_flight += 1
+        conn.sent += 1
+        try:
+            return await conn.client.send_command(command, timeout=timeout)
+        except ConnectionError:
+            conn.failed += 1
+            raise
+        finally:
+            conn.in_flight -= 1
+
+    async def send_command_stream(
+        self, command: Command, timeout: float = 300.0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Send a command over the least busy connection and iterate over
+        its result parts (see UnixSocketClient.send_command_stream()).
+
+        The stream counts as in flight on its connection until it ends.
+        """
+        conn = await self._acquire(timeout)
+        assert conn.client is not None  # Checked by _acquire
+        conn.in_flight += 1
+        conn.sent += 1
+        try:
+            async for part in conn.client.send_command_stream(command, timeout=timeout):
+                yield part
+        finally:
+            conn.in_flight -= 1
+
+    async def subscribe(self, event_filter: EventFilter | None = None) -> str:
+        """Subscribe to events; the subscription survives reconnects.
+
+        Returns:
+            Subscription ID for unsubscribe().
+
+        Raises:
+            RuntimeError: If the event connection is down or the server
+                rejected the subscription.
+        """
+        client = self._event_client()
+        server_id = await client.subscribe(event_filter)
+        self._subscription_counter += 1
+        subscription_id = f"pool-sub-{self._subscription_counter}"
+        self._subscriptions[subscription_id] = (event_filter, server_id)
+        return subscription_id
+
+    async def unsubscribe(self, subscription_id: str | None = None) -> None:
+        """Remove a subscription, or all of them if subscription_id is None."""
+        if subscription_id is None:
+            self._subscriptions.clear()
+            server_id = None
+        elif subscription_id in self._subscriptions:
+            server_id = self._subscriptions.pop(subscription_id)[1]
+        else:
+            return
+        conn = self._connections[0] if self._connections else None
+        if conn is not None and conn.up:
+            assert conn.client is not None  # Checked by up
+            await conn.client.unsubscribe(server_id)
+
+    async def events(self) -> AsyncIterator[Event]:
+        """Iterate over events, across reconnects of the event connection."""
+        while not self._closed:
+            yield await self._event_queue.get()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Pool totals and per-connection counters."""
+        connections = [conn.stats for conn in self._connections]
+        return {
+            "size": self.size,
+            "connected": sum(1 for c in connections if c["connected"]),
+            "in_flight": sum(c["in_flight"] for c in connections),
+            "subscriptions": len(self._subscriptions),
+            "connections": connections,
+        }
+
+    async def _acquire(self, timeout: float) -> _Connection:
+        """The up connection with the fewest requests in flight."""
+        if self._closed:
+            raise RuntimeError("Not connected")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            candidates = [conn for conn in self._connections if conn.up]
+            if candidates:
+                return min(candidates, key=lambda c: (c.in_flight, c.sent))
+            self._up.clear()
+            try:
+                await asyncio.wait_for(self._up.wait(), timeout=deadline - loop.time())
+            except TimeoutError:
+                raise TimeoutError(f"No connection to server within {timeout}s") from None
+            if self._closed:
+                raise RuntimeError("Not connected")
+
+    def _event_client(self) -> SocketClient:
+        conn = self._connections[0] if self._connections else None
+        if conn is None or not conn.up:
+            raise RuntimeError("Event connection is down")
+        assert conn.client is not None  # Checked by up
+        return conn.client
+
+    async def _open(self, conn: _Connection) -> None:
+        """Open conn's connection and restore its event subscriptions."""
+        from nerve.server.protocols import EventFilter
+
+        client = self.factory()
+        await client.connect()
+        try:
+            if conn.index == 0:
+                for subscription_id, (event_filter, _) in list(self._subscriptions.items()):
+                    server_id = await client.subscribe(event_filter)
+                    self._subscriptions[subscription_id] = (event_filter, server_id)
+                self._forwarder = asyncio.create_task(self._forward_events(client))
+            else:
+                try:
+                    await client.subscribe(EventFilter(event_types=frozenset()))
+                except RuntimeError:
+                    pass  # Server predates subscriptions; its events are ignored
+        except BaseException:
+            await client.disconnect()
+            raise
+        conn.client = client
+        conn.last_error = None
+        self._up.set()
+
+    async def _supervise(self, conn: _Connection) -> None:
+        """Reconnect conn whenever it drops, until the pool is closed."""
+        attempt = 0
+        while not self._closed:
+            if conn.client is None:
+                try:
+                    await self._open(conn)
+                except (OSError, RuntimeError) as e:
+                    conn.last_error = e
+                    delay = min(self.backoff_max, self.backoff_initial * 2**attempt)
+                    attempt += 1
+                    # Jitter so connections do not reconnect in lockstep
+                    await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+                    continue
+                attempt = 0
+                conn.reconnects += 1
+                logger.info("Pool connection %d reconnected", conn.index)
+
+            assert conn.client is not None
+            await conn.client.wait_closed()
+            if self._closed:
+                return
+            conn.last_error = conn.client.last_error or ConnectionError("Connection closed")
+            logger.warning("Pool connection %d lost: %s", conn.index, conn.last_error)
+            await conn.client.disconnect()
+            conn.client = None
+            if conn.index == 0 and self._forwarder is not None:
+                self._forwarder.cancel()
+                self._forwarder = None
+
+    async def _forward_events(self, client: SocketClient) -> None:
+        async for event in client.events():
+            await self._event_queue.put(event)
@@ -0,0 +1,137 @@
+"""Broadcast ring buffer for in-process event subscribers.
+
+InProcessTransport used to copy every event into a bounded asyncio.Queue
+per subscriber and silently drop it when the queue was full. With a
+BroadcastRing each event is stored once, in a fixed-size ring, and every
+subscriber reads it at its own cursor. Publishing never waits and never
+allocates per subscriber. A subscriber that falls more than `capacity`
+items behind skips the items that were overwritten, and its `lagged`
+counter says how many it missed.
+
+The ring is only touched from the event loop's thread, so it needs no
+locks; readers waiting for the next item share one future.
+
+Example:
+    >>> ring = BroadcastRing[Event](capacity=4096)
+    >>> reader = ring.reader()
+    >>> ring.publish(event)  # Never blocks
+    >>> item = await reader.next()
+    >>> reader.lagged
+    0
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+# Items kept for subscribers that fall behind
+RING_CAPACITY = 4096
+
+
+class BroadcastRing[T]:
+    """Fixed-size ring of the latest published items.
+
+    Items are numbered by publish order; `head` is the number the next
+    published item gets.
+    """
+
+    def __init__(self, capacity: int = RING_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Ring capacity must be at least 1")
+        self.capacity = capacity
+        self.head = 0
+        self._slots: list[T | None] = [None] * capacity
+        self._waiter: asyncio.Future[None] | None = None
+        self._readers: list[RingReader[T]] = []
+
+    @property
+    def tail(self) -> int:
+        """Number of the oldest item still in the ring."""
+        return max(0, self.head - self.capacity)
+
+    def publish(self, item: T) -> None:
+        """Store an item, overwriting the oldest one if the ring is full."""
+        self._slots[self.head % self.capacity] = item
+        self.head += 1
+        if self._waiter is not None:
+            if not self._waiter.done():
+                self._waiter.set_result(None)
+            self._waiter = None
+
+    def reader(self, name: str = "", from_start: bool = False) -> RingReader[T]:
+        """A new reader, positioned at the next item to be published.
+
+        Args:
+            name: Label for stats.
+            from_start: Start at the oldest item still in the ring instead.
+        """
+        reader = RingReader(self, self.tail if from_start else self.head, name)
+        self._readers.append(reader)
+        return reader
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Ring position and each open reader's backlog and losses."""
+        return {
+            "capacity": self.capacity,
+            "published": self.head,
+            "readers": [
+                {
+                    "name": r.name,
+                    "pending": self.head - max(r.position, self.tail),
+                    "lagged": r.lagged,
+                }
+                for r in self._readers
+            ],
+        }
+
+    def _get(self, position: int) -> T:
+        item = self._slots[position % self.capacity]
+        assert item is not None  # Every slot below head was published
+        return item
+
+    async def _wait(self) -> None:
+        if self._waiter is None:
+            self._waiter = asyncio.get_running_loop().create_future()
+        await asyncio.shield(self._waiter)
+
+
+class RingReader[T]:
+    """One subscriber's cursor into a BroadcastRing."""
+
+    def __init__(self, ring: BroadcastRing[T], position: int, name: str = ""):
+        self.ring = ring
+        self.position = position
+        self.name = name
+        # Items overwritten before this reader got to them
+        self.lagged = 0
+
+    def poll(self) -> T | None:
+        """The next item if one is available, without waiting."""
+        ring = self.ring
+        if self.position == ring.head:
+            return None
+        if self.position < ring.tail:
+            self.lagged += ring.tail - self.position
+            self.position = ring.tail
+        item = ring._get(self.position)
+        self.position += 1
+        return item
+
+    async def next(self) -> T:
+        """Wait for and return the next item."""
+        while True:
+            item = self.poll()
+            if item is not None:
+                return item
+            await self.ring._wait()
+
+    def skip_to_end(self) -> None:
+        """Discard every item published so far."""
+        self.position = self.ring.head
+
+    def close(self) -> None:
+        """Stop tracking this reader in the ring's stats."""
+        if self in self.ring._readers:
+            self.ring._readers.remove(self)
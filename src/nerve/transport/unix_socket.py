@@ -7,7 +7,6 @@ Efficient for local IPC with persistent daemon processes.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import uuid
 from collections.abc import AsyncIterator
@@ -15,9 +14,29 @@ from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from nerve.transport.fanout import (
+    CLIENT_QUEUE_SIZE,
+    STREAM_QUEUE_SIZE,
+    ClientChannel,
+    OverflowPolicy,
+    TrafficCounter,
+    broadcast,
+    handle_subscription_command,
+    send_result,
+)
+from nerve.transport.framing import (
+    JSON_LINES,
+    MessageDecodeError,
+    WireFormat,
+    client_handshake,
+    hello_reply,
+    is_hello,
+    negotiate,
+)
+
 if TYPE_CHECKING:
     from nerve.server import NerveEngine
-    from nerve.server.protocols import Command, CommandResult, Event
+    from nerve.server.protocols import Command, CommandResult, Event, EventFilter
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +46,15 @@ class UnixSocketServer:
     """Unix socket server transport.
 
     Listens on a Unix domain socket and handles client connections.
-    Broadcasts events to all connected clients.
+    Broadcasts events to connected clients: every event until a client
+    subscribes, then only the events its subscriptions match (see
+    EventFilter). Each client has its own bounded send queue (see
+    ClientChannel), so a slow client only delays itself; when its queue is
+    full, overflow_policy applies.
+
+    Connections speak JSON lines until the client offers binary framing
+    (see nerve.transport.framing); binary_framing=False declines offers.
+    traffic counts the bytes and messages exchanged with all clients.
 
     Example:
         >>> transport = UnixSocketServer("/tmp/nerve.sock")
@@ -36,40 +63,28 @@ class UnixSocketServer:
     """
 
     socket_path: str
+    max_client_queue: int = CLIENT_QUEUE_SIZE
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    binary_framing: bool = True
+    traffic: TrafficCounter = field(default_factory=TrafficCounter)
     _engine: NerveEngine | None = None
     _server: asyncio.Server | None = None
-    _clients: list[asyncio.StreamWriter] = field(default_factory=list)
+    _clients: list[ClientChannel[bytes]] = field(default_factory=list)
     _running: bool = False
 
-    async def emit(self, event: Event) -> None:
-        """Broadcast event to all connected clients."""
-        if not self._clients:
-            return
-
-        # Serialize event
-        data = json.dumps(
-            {
-                "type": "event",
-                "event_type": event.type.name,
-                "node_id": event.node_id,
-                "data": event.data,
-                "timestamp": event.timestamp,
-            }
-        )
-        message = (data + "\n").encode()
+    @property
+    def client_stats(self) -> list[dict[str, Any]]:
+        """Send queue metrics of each connected client (see ClientChannel.stats)."""
+        return [channel.stats for channel in self._clients]
 
-        # Send to all clients
-        dead_clients = []
-        for writer in self._clients:
-            try:
-                writer.write(message)
-                await writer.drain()
-            except Exception:
-                dead_clients.append(writer)
+    async def emit(self, event: Event) -> None:
+        """Broadcast event to subscribed clients without waiting on them."""
+        for channel in broadcast(self._clients, event):
+            self._remove_client(channel)
 
-        # Remove dead clients
-        for writer in dead_clients:
-            self._clients.remove(writer)
+    def _remove_client(self, channel: ClientChannel[bytes]) -> None:
+        if channel in self._clients:
+            self._clients.remove(channel)
 
     async def serve(self, engine: NerveEngine) -> None:
         """Start serving.
@@ -110,8 +125,8 @@ class UnixSocketServer:
             await self._server.wait_closed()
 
         # Close all client connections
-        for writer in self._clients:
-            writer.close()
+        for channel in self._clients:
+            channel.close()
         self._clients.clear()
 
         # Remove socket file
@@ -127,51 +142,72 @@ class UnixSocketServer:
         writer: asyncio.StreamWriter,
     ) -> None:
         """Handle a client connection."""
-        self._clients.append(writer)
         client_addr = writer.get_extra_info("peername") or "unknown"
+
+        async def write_batch(messages: list[bytes]) -> None:
+            data = b"".join(messages)
+            writer.write(data)
+            await writer.drain()
+            self.traffic.sent(len(data), len(messages))
+
+        # All writes to this client go through its channel, in order
+        channel: ClientChannel[bytes] = ClientChannel(
+            send=write_batch,
+            encode=JSON_LINES.encode,
+            name=str(client_addr),
+            max_queue=self.max_client_queue,
+            policy=self.overflow_policy,
+            on_close=writer.close,
+        )
+        channel.start()
+        self._clients.append(channel)
         logger.debug("Client connected: %s", client_addr)
 
-        # Lock to prevent concurrent writes from interleaving
-        write_lock = asyncio.Lock()
         # Track active handler tasks for cleanup
         handler_tasks: set[asyncio.Task[None]] = set()
 
         async def handle_and_respond(message: dict[str, Any]) -> None:
             """Handle a message and write response (runs concurrently)."""
             try:
-                response = await self._handle_message(message)
+                response = await self._handle_message(message, channel)
             except Exception as e:
                 logger.error("Error handling message: %s", e, exc_info=True)
                 response = {"type": "error", "error": str(e)}
 
-            # Write response with lock to prevent interleaving
-            async with write_lock:
-                try:
-                    writer.write((json.dumps(response) + "\n").encode())
-                    await writer.drain()
-                except Exception as e:
-                    logger.warning("Error writing response to %s: %s", client_addr, e)
+            try:
+                if isinstance(response, dict):
+                    channel.send(channel.encode(response))
+                else:
+                    await send_result(channel, response)
+            except Exception as e:
+                logger.warning("Error encoding response to %s: %s", client_addr, e)
 
+        wire = JSON_LINES
         try:
             while self._running:
-                line = await reader.readline()
-                if not line:
+                try:
+                    message = await wire.read(reader, self.traffic)
+                except MessageDecodeError as e:
+                    logger.warning("Invalid message from client %s: %s", client_addr, e)
+                    channel.send(channel.encode({"type": "error", "error": str(e)}))
+                    continue
+                if message is None:
                     logger.debug("Client disconnected: %s", client_addr)
                     break
 
-                try:
-                    message = json.loads(line.decode())
-                    # Spawn concurrent handler task instead of awaiting
-                    task = asyncio.create_task(handle_and_respond(message))
-                    handler_tasks.add(task)
-                    # Clean up completed tasks
-                    handler_tasks = {t for t in handler_tasks if not t.done()}
-                except json.JSONDecodeError as e:
-                    logger.warning("Invalid JSON from client %s: %s", client_addr, e)
-                    error = {"type": "error", "error": "Invalid JSON"}
-                    async with write_lock:
-                        writer.write((json.dumps(error) + "\n").encode())
-                        await writer.drain()
+                if wire is JSON_LINES and self.binary_framing and is_hello(message):
+                    # Answer as a JSON line, then switch both directions to frames
+                    wire = negotiate(message)
+                    channel.send(JSON_LINES.encode(hello_reply(wire)))
+                    channel.encode = wire.encode
+                    logger.debug("Client %s switched to %s", client_addr, wire.name)
+                    continue
+
+                # Spawn concurrent handler task instead of awaiting
+                task = asyncio.create_task(handle_and_respond(message))
+                handler_tasks.add(task)
+                # Clean up completed tasks
+                handler_tasks = {t for t in handler_tasks if not t.done()}
 
         except asyncio.CancelledError:
             logger.debug("Client handler cancelled: %s", client_addr)
@@ -184,12 +220,18 @@ class UnixSocketServer:
             # Cancel all active handler tasks
             for task in handler_tasks:
                 task.cancel()
-            if writer in self._clients:
-                self._clients.remove(writer)
+            self._remove_client(channel)
+            channel.close()
             writer.close()
 
-    async def _handle_message(self, message: dict[str, Any]) -> dict[str, Any]:
-        """Handle an incoming message."""
+    async def _handle_message(
+        self, message: dict[str, Any], channel: ClientChannel[bytes]
+    ) -> CommandResult | dict[str, Any]:
+        """Handle an incoming message from the client behind channel.
+
+        Returns:
+            The command's result, or an error message for bad messages.
+        """
         from nerve.server.protocols import Command, CommandType
 
         if message.get("type") != "command":
@@ -204,15 +246,9 @@ class UnixSocketServer:
             request_id=message.get("request_id"),
         )
 
-        result = await self._engine.execute(command)
-
-        return {
-            "type": "result",
-            "success": result.success,
-            "data": result.data,
-            "error": result.error,
-            "request_id": result.request_id,
-        }
+        if command.type in (CommandType.SUBSCRIBE, CommandType.UNSUBSCRIBE):
+            return handle_subscription_command(channel, command)
+        return await self._engine.execute(command)
 
 
 @dataclass
@@ -220,6 +256,9 @@ class UnixSocketClient:
     """Unix socket client transport.
 
     Connects to a Unix socket server to send commands and receive events.
+    On connect it offers binary framing (see nerve.transport.framing) and
+    falls back to JSON lines if the server declines; binary_framing=False
+    skips the offer.
 
     Example:
         >>> client = UnixSocketClient("/tmp/nerve.sock")
@@ -235,10 +274,13 @@ class UnixSocketClient:
     """
 
     socket_path: str
+    binary_framing: bool = True
     _reader: asyncio.StreamReader | None = None
     _writer: asyncio.StreamWriter | None = None
+    _wire: WireFormat = JSON_LINES
     _event_queue: asyncio.Queue[Any] = field(default_factory=asyncio.Queue)
     _pending_requests: dict[str, asyncio.Future[Any]] = field(default_factory=dict)
+    _pending_streams: dict[str, asyncio.Queue[dict[str, Any]]] = field(default_factory=dict)
     _connected: bool = False
     _reader_task: asyncio.Task[Any] | None = None
     _last_error: Exception | None = field(default=None, repr=False)
@@ -252,7 +294,14 @@ class UnixSocketClient:
             limit=16 * 1024 * 1024,  # 16MB limit
         )
         self._connected = True
-        logger.debug("Unix socket client connected to %s", self.socket_path)
+
+        # Offer binary framing; servers that predate it keep JSON lines
+        if self.binary_framing:
+            # No compression: local copies are cheaper than compressing
+            self._wire = await client_handshake(
+                self._reader, self._writer, self._event_queue.put, compress=False
+            )
+        logger.debug("Unix socket client connected to %s (%s)", self.socket_path, self._wire.name)
 
         # Start background reader
         self._reader_task = asyncio.create_task(self._read_loop())
@@ -289,6 +338,7 @@ class UnixSocketClient:
 
         Raises:
             RuntimeError: If not connected.
+            ConnectionError: If the connection is lost before the result arrives.
             TimeoutError: If response not received within timeout.
         """
 
@@ -315,7 +365,7 @@ class UnixSocketClient:
                 "request_id": request_id,
             }
 
-            self._writer.write((json.dumps(message) + "\n").encode())
+            self._writer.write(self._wire.encode(message))
             await self._writer.drain()
 
             # Wait for THIS request's response (matched by request_id in _read_loop)
@@ -327,8 +377,100 @@ class UnixSocketClient:
             # Clean up pending request
             self._pending_requests.pop(request_id, None)
 
+    async def send_command_stream(
+        self, command: Command, timeout: float = 300.0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Send a command and iterate over its result as it arrives in parts.
+
+        For results the server streams (GET_BUFFER and GET_HISTORY with a
+        "chunk_size" param). At most STREAM_QUEUE_SIZE parts are buffered;
+        beyond that the connection stops reading until the caller catches
+        up, so memory stays bounded on both ends.
+
+        Args:
+            command: The command to send.
+            timeout: Seconds to wait for each part.
+
+        Yields:
+            Result parts, then the result's own data (e.g. GET_BUFFER's
+            "length") with "parts" set to the number of parts. A result
+            that is not streamed (e.g. from an older server) is yielded
+            whole, as a single item.
+
+        Raises:
+            RuntimeError: If not connected, or the command failed.
+            TimeoutError: If a part does not arrive within timeout.
+        """
+        if not self._writer or not self._connected:
+            raise RuntimeError("Not connected")
+
+        if command.request_id is None:
+            command = replace(command, request_id=str(uuid.uuid4()))
+        request_id = command.request_id
+        assert request_id is not None  # Type narrowing for mypy
+
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self._pending_streams[request_id] = queue
+        try:
+            message = {
+                "type": "command",
+                "command_type": command.type.name,
+                "params": command.params,
+                "request_id": request_id,
+            }
+            self._writer.write(self._wire.encode(message))
+            await self._writer.drain()
+
+            while True:
+                try:
+                    reply = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except TimeoutError:
+                    raise TimeoutError(f"No result part within {timeout}s") from None
+                if reply["type"] == "result_part":
+                    yield reply.get("data") or {}
+                    continue
+                if not reply.get("success"):
+                    raise RuntimeError(reply.get("error") or "Command failed")
+                yield reply.get("data") or {}
+                return
+        finally:
+            self._pending_streams.pop(request_id, None)
+            # Unblock the read loop if it is waiting to queue a part
+            while not queue.empty():
+                queue.get_nowait()
+
+    async def subscribe(self, event_filter: EventFilter | None = None) -> str:
+        """Ask the server to send this connection only matching events.
+
+        The server sends every event until the connection's first
+        subscription, then only events matching any of its subscriptions.
+
+        Args:
+            event_filter: Events to receive (default: all).
+
+        Returns:
+            Subscription ID for unsubscribe().
+
+        Raises:
+            RuntimeError: If the server rejected the subscription.
+        """
+        from nerve.server.protocols import Command, CommandType, EventFilter
+
+        params = (event_filter or EventFilter()).to_params()
+        result = await self.send_command(Command(type=CommandType.SUBSCRIBE, params=params))
+        if not result.success or not result.data:
+            raise RuntimeError(f"Subscribe failed: {result.error}")
+        return str(result.data["subscription_id"])
+
+    async def unsubscribe(self, subscription_id: str | None = None) -> None:
+        """Remove a subscription, or all of them if subscription_id is None."""
+        from nerve.server.protocols import Command, CommandType
+
+        params = {} if subscription_id is None else {"subscription_id": subscription_id}
+        await self.send_command(Command(type=CommandType.UNSUBSCRIBE, params=params))
+
     async def events(self) -> AsyncIterator[Event]:
-        """Subscribe to events."""
+        """Iterate over events sent to this connection (see subscribe())."""
         from nerve.server.protocols import Event, EventType
 
         while self._connected:
@@ -339,6 +481,7 @@ class UnixSocketClient:
                     node_id=item.get("node_id"),
                     data=item.get("data", {}),
                     timestamp=item.get("timestamp", 0),
+                    session_id=item.get("session_id"),
                 )
 
     async def _read_loop(self) -> None:
@@ -346,9 +489,12 @@ class UnixSocketClient:
 
         Routes messages based on type:
         - "result" messages: Matched to pending requests by request_id
+        - "result_part" messages (and their final "result"): Queued for
+          the send_command_stream() call with that request_id
         - "event" messages: Put in event queue for events() iterator
 
         Errors are logged and tracked in _last_error and _error_count.
+        When the loop ends, requests still waiting for results fail.
         """
         from nerve.server.protocols import CommandResult
 
@@ -357,16 +503,27 @@ class UnixSocketClient:
 
         try:
             while self._connected:
-                line = await self._reader.readline()
-                if not line:
-                    logger.debug("Socket closed by server (empty read)")
-                    break
-
                 try:
-                    message = json.loads(line.decode())
-
+                    message = await self._wire.read(self._reader)
+                    if message is None:
+                        logger.debug("Socket closed by server (empty read)")
+                        break
+
+                    message_type = message.get("type") if isinstance(message, dict) else None
+                    stream = None
+                    if message_type is not None:
+                        stream = self._pending_streams.get(message.get("request_id") or "")
+
+                    # Route streamed results to their consumer; waits when it falls behind
+                    if message_type in ("result", "result_part") and stream is not None:
+                        await stream.put(message)
+                    elif message_type == "result_part":
+                        logger.debug(
+                            "Received result part for unknown request_id: %s",
+                            message.get("request_id"),
+                        )
                     # Route command results to their specific futures
-                    if isinstance(message, dict) and message.get("type") == "result":
+                    elif message_type == "result":
                         request_id = message.get("request_id")
                         if request_id and request_id in self._pending_requests:
                             future = self._pending_requests[request_id]
@@ -389,14 +546,10 @@ class UnixSocketClient:
                         # Events and other messages go to the event queue
                         await self._event_queue.put(message)
 
-                except json.JSONDecodeError as e:
+                except MessageDecodeError as e:
                     self._error_count += 1
                     self._last_error = e
-                    logger.warning(
-                        "Failed to parse JSON from server: %s (line: %s...)",
-                        e,
-                        line[:100] if len(line) > 100 else line,
-                    )
+                    logger.warning("Failed to decode message from server: %s", e)
         except asyncio.CancelledError:
             logger.debug("Read loop cancelled")
             raise
@@ -409,6 +562,28 @@ class UnixSocketClient:
             logger.error("Unexpected error in read loop: %s", e, exc_info=True)
         finally:
             self._connected = False
+            self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Fail requests still waiting for results once the connection is gone."""
+        error = ConnectionError("Connection to server lost")
+        for future in self._pending_requests.values():
+            if not future.done():
+                future.set_exception(error)
+        for queue in self._pending_streams.values():
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"type": "result", "success": False, "error": str(error)})
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection is up."""
+        return self._connected
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is closed (by either side)."""
+        if self._reader_task is not None:
+            await asyncio.wait([self._reader_task])
 
     @property
     def last_error(self) -> Exception | None:
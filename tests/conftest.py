@@ -13,6 +13,13 @@ def load_fixture(filename: str) -> str:
     return (FIXTURES_DIR / filename).read_text()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Run each test in a temp dir, so session logs and history (written
+    under .nerve/ in the CWD by default) don't land in the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
 def sample_claude_output():
     """Sample Claude Code output for parser testing."""
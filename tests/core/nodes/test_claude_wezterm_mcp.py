@@ -32,6 +32,7 @@ class TestClaudeWezTermNodeMCPConfig:
         mock_inner = MagicMock()
         mock_inner.backend = MagicMock()
         mock_inner.backend.write = AsyncMock()
+        mock_inner.backend.capture_tail = AsyncMock(return_value="")
         mock_inner.stop = AsyncMock()
         mock_inner.pane_id = "mock-pane-123"
         return mock_inner
@@ -0,0 +1,206 @@
+"""Tests for nerve.core.nodes.concurrency module."""
+
+import asyncio
+
+import pytest
+
+from nerve.core.nodes.base import FunctionNode
+from nerve.core.nodes.bash import BashNode
+from nerve.core.nodes.concurrency import (
+    ConcurrencyLimiter,
+    node_concurrency,
+    node_resource_class,
+)
+from nerve.core.nodes.context import ExecutionContext
+from nerve.core.nodes.graph import Graph
+from nerve.core.nodes.llm import OpenRouterNode
+from nerve.core.nodes.terminal import PTYNode
+from nerve.core.session.session import Session
+
+
+class FakeNode:
+    """Minimal node that records how many executions overlap."""
+
+    persistent = False
+
+    def __init__(self, node_id, concurrency=None, resource_class=None, delay=0.01):
+        self.id = node_id
+        self.concurrency = concurrency
+        self.resource_class = resource_class
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, ctx):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return {"success": True, "output": ctx.input}
+
+    async def interrupt(self):
+        pass
+
+
+class TestNodeDeclarations:
+    """Tests for declared capacities and resource classes."""
+
+    def test_undeclared_node_is_unlimited(self):
+        """Test nodes without declarations have no limits."""
+        session = Session(name="test")
+        node = FunctionNode(id="fn", session=session, fn=lambda ctx: ctx.input)
+
+        assert node_concurrency(node) is None
+        assert node_resource_class(node) is None
+
+    def test_terminal_nodes_are_serialized(self):
+        """Test terminal nodes take one input at a time."""
+        assert PTYNode.concurrency == 1
+        assert PTYNode.resource_class == "terminal"
+
+    def test_bash_node_is_unlimited(self):
+        """Test bash nodes only declare a resource class."""
+        session = Session(name="test")
+        node = BashNode(id="sh", session=session)
+
+        assert node_concurrency(node) is None
+        assert node_resource_class(node) == "bash"
+
+    def test_llm_resource_class_includes_provider(self):
+        """Test LLM nodes use a provider-specific resource class."""
+        session = Session(name="test")
+        node = OpenRouterNode(id="llm", session=session, api_key="k", model="m")
+
+        assert node_concurrency(node) is None
+        assert node_resource_class(node) == "llm:openrouter"
+
+    def test_non_positive_capacity_means_unlimited(self):
+        """Test zero capacity is treated as unlimited."""
+        assert node_concurrency(FakeNode("n", concurrency=0)) is None
+
+
+class TestConcurrencyLimiter:
+    """Tests for ConcurrencyLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_node_capacity_serializes_executions(self):
+        """Test a capacity-1 node never runs twice at once."""
+        limiter = ConcurrencyLimiter()
+        node = FakeNode("term", concurrency=1)
+
+        async def run():
+            async with limiter.slot(node):
+                await node.execute(ExecutionContext(input="x"))
+
+        await asyncio.gather(*(run() for _ in range(4)))
+
+        assert node.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_class_limit_shared_across_nodes(self):
+        """Test a resource class limit spans all nodes in the class."""
+        limiter = ConcurrencyLimiter({"llm:test": 2})
+        nodes = [FakeNode(f"llm{i}", resource_class="llm:test") for i in range(4)]
+
+        active = 0
+        peak = 0
+
+        async def run(node):
+            nonlocal active, peak
+            async with limiter.slot(node):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(run(n) for n in nodes))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unlimited_class_runs_freely(self):
+        """Test classes without a configured limit are unbounded."""
+        limiter = ConcurrencyLimiter()
+        node = FakeNode("sh", resource_class="bash")
+
+        async def run():
+            async with limiter.slot(node):
+                await node.execute(ExecutionContext(input="x"))
+
+        await asyncio.gather(*(run() for _ in range(3)))
+
+        assert node.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_stats_reports_in_flight(self):
+        """Test stats() counts held slots per resource class."""
+        limiter = ConcurrencyLimiter({"terminal": 3})
+        node = FakeNode("term", resource_class="terminal")
+
+        async with limiter.slot(node):
+            stats = limiter.stats()
+            assert stats["in_flight"] == {"terminal": 1}
+            assert stats["limits"] == {"terminal": 3}
+
+        assert limiter.stats()["in_flight"] == {}
+
+    def test_set_class_limit_validates(self):
+        """Test non-positive limits are rejected."""
+        limiter = ConcurrencyLimiter()
+        with pytest.raises(ValueError, match="must be > 0"):
+            limiter.set_class_limit("bash", 0)
+
+    def test_set_class_limit_clear(self):
+        """Test None removes a class limit."""
+        limiter = ConcurrencyLimiter({"bash": 2})
+        limiter.set_class_limit("bash", None)
+        assert limiter.class_limits == {}
+
+
+class TestGraphEnforcement:
+    """Tests for limits enforced by Graph execution."""
+
+    @pytest.mark.asyncio
+    async def test_shared_terminal_node_serialized_in_parallel_graph(self):
+        """Test parallel steps on one capacity-1 node run one at a time."""
+        session = Session(name="test")
+        graph = Graph(id="g", session=session, max_parallel=4)
+        node = FakeNode("term", concurrency=1, resource_class="terminal")
+
+        for i in range(3):
+            graph.add_step(node, step_id=f"s{i}", input=str(i))
+
+        result = await graph.execute(ExecutionContext(session=session))
+
+        assert result["success"] is True
+        assert node.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_session_class_limit_applies_to_graph(self):
+        """Test session concurrency_limits cap a resource class in a graph."""
+        session = Session(name="test", concurrency_limits={"llm:test": 2})
+        graph = Graph(id="g", session=session, max_parallel=8)
+        nodes = [FakeNode(f"llm{i}", resource_class="llm:test") for i in range(5)]
+
+        active = 0
+        peak = 0
+        for node in nodes:
+            original = node.execute
+
+            async def tracked(ctx, _original=original):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                try:
+                    return await _original(ctx)
+                finally:
+                    active -= 1
+
+            node.execute = tracked
+
+        for i, node in enumerate(nodes):
+            graph.add_step(node, step_id=f"s{i}")
+
+        await graph.execute(ExecutionContext(session=session))
+
+        assert peak == 2
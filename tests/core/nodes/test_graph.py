@@ -500,6 +500,393 @@ class TestGraph:
         assert "step2" not in steps_executed
 
 
+class TestGraphParallel:
+    """Tests for concurrent step scheduling with max_parallel."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        """Test independent steps overlap when max_parallel allows it."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=3)
+
+        active = 0
+        peak = 0
+
+        async def work(ctx):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return ctx.input
+
+        for name in ("a", "b", "c"):
+            graph.add_step(
+                FunctionNode(id=f"fn-{name}", session=session, fn=work),
+                step_id=name,
+                input=name,
+            )
+
+        results = await graph.execute(ExecutionContext(session=session))
+
+        assert peak == 3
+        assert results["success"] is True
+        assert set(results["attributes"]["steps"]) == {"a", "b", "c"}
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_limits_concurrency(self):
+        """Test no more than max_parallel steps are in flight at once."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=2)
+
+        active = 0
+        peak = 0
+
+        async def work(ctx):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "ok"
+
+        for i in range(5):
+            graph.add_step(FunctionNode(id=f"fn{i}", session=session, fn=work), step_id=f"s{i}")
+
+        await graph.execute(ExecutionContext(session=session))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_default_is_sequential(self):
+        """Test max_parallel defaults to one step at a time."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session)
+
+        active = 0
+        peak = 0
+
+        async def work(ctx):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "ok"
+
+        for i in range(3):
+            graph.add_step(FunctionNode(id=f"fn{i}", session=session, fn=work), step_id=f"s{i}")
+
+        await graph.execute(ExecutionContext(session=session))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_dependent_starts_when_its_dependency_finishes(self):
+        """Test a dependent does not wait for unrelated slow steps."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=4)
+
+        order: list[str] = []
+        release_slow = asyncio.Event()
+
+        async def slow(ctx):
+            await release_slow.wait()
+            order.append("slow")
+            return "slow"
+
+        def fast(ctx):
+            order.append("fast")
+            return "fast"
+
+        def after_fast(ctx):
+            order.append("after_fast")
+            release_slow.set()
+            return ctx.upstream["fast"]["output"]
+
+        graph.add_step(FunctionNode(id="slow", session=session, fn=slow), step_id="slow")
+        graph.add_step(FunctionNode(id="fast", session=session, fn=fast), step_id="fast")
+        graph.add_step(
+            FunctionNode(id="after", session=session, fn=after_fast),
+            step_id="after_fast",
+            depends_on=["fast"],
+        )
+
+        results = await graph.execute(ExecutionContext(session=session))
+
+        assert order == ["fast", "after_fast", "slow"]
+        assert results["attributes"]["steps"]["after_fast"]["output"] == "fast"
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_in_flight_steps(self):
+        """Test a failing step cancels its running siblings."""
+        from nerve.core.nodes.policies import ErrorPolicy
+
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=2)
+
+        sibling_cancelled = False
+
+        class FailingNode:
+            id = "failing"
+            persistent = False
+
+            async def execute(self, ctx):
+                await asyncio.sleep(0.01)
+                raise RuntimeError("boom")
+
+            async def interrupt(self):
+                pass
+
+        async def long_running(ctx):
+            nonlocal sibling_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                sibling_cancelled = True
+                raise
+
+        graph.add_step(FailingNode(), step_id="fail", error_policy=ErrorPolicy(on_error="fail"))
+        graph.add_step(FunctionNode(id="long", session=session, fn=long_running), step_id="long")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await graph.execute(ExecutionContext(session=session))
+
+        assert sibling_cancelled
+
+    @pytest.mark.asyncio
+    async def test_interrupt_reaches_all_in_flight_nodes(self):
+        """Test interrupt() interrupts every concurrently running node."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=2)
+
+        interrupted: list[str] = []
+        started = 0
+        all_started = asyncio.Event()
+
+        class InterruptableNode:
+            persistent = False
+
+            def __init__(self, node_id):
+                self.id = node_id
+
+            async def execute(self, ctx):
+                nonlocal started
+                started += 1
+                if started == 2:
+                    all_started.set()
+                await asyncio.sleep(10)
+                return "done"
+
+            async def interrupt(self):
+                interrupted.append(self.id)
+
+        graph.add_step(InterruptableNode("n1"), step_id="a")
+        graph.add_step(InterruptableNode("n2"), step_id="b")
+
+        context = ExecutionContext(session=session, cancellation=CancellationToken())
+        task = asyncio.create_task(graph.execute(context))
+
+        await all_started.wait()
+        await graph.interrupt()
+
+        assert sorted(interrupted) == ["n1", "n2"]
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_parallel(self):
+        """Test streaming execution with concurrent steps."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=2)
+
+        async def work(ctx):
+            await asyncio.sleep(0.01)
+            return ctx.input
+
+        graph.add_step(FunctionNode(id="fn1", session=session, fn=work), step_id="a", input="a")
+        graph.add_step(FunctionNode(id="fn2", session=session, fn=work), step_id="b", input="b")
+        graph.add_step(
+            FunctionNode(id="fn3", session=session, fn=work),
+            step_id="c",
+            input="c",
+            depends_on=["a", "b"],
+        )
+
+        events = [e async for e in graph.execute_stream(ExecutionContext(session=session))]
+        kinds = [(e.event_type, e.step_id) for e in events]
+
+        # Both roots start before either completes; the join starts last
+        assert kinds[:2] == [("step_start", "a"), ("step_start", "b")]
+        assert kinds.index(("step_start", "c")) > kinds.index(("step_complete", "a"))
+        assert kinds.index(("step_start", "c")) > kinds.index(("step_complete", "b"))
+        assert kinds[-1] == ("step_complete", "c")
+
+    @pytest.mark.asyncio
+    async def test_cancelling_stream_consumer_cancels_running_steps(self):
+        """Test cancelling the task iterating execute_stream stops its steps."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session, max_parallel=2)
+
+        cancelled: list[str] = []
+
+        async def long_running(ctx):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(ctx.input)
+                raise
+
+        graph.add_step(
+            FunctionNode(id="fn1", session=session, fn=long_running), step_id="a", input="a"
+        )
+        graph.add_step(
+            FunctionNode(id="fn2", session=session, fn=long_running), step_id="b", input="b"
+        )
+
+        started = 0
+        both_started = asyncio.Event()
+
+        async def consume():
+            nonlocal started
+            async for event in graph.execute_stream(ExecutionContext(session=session)):
+                if event.event_type == "step_start":
+                    started += 1
+                    if started == 2:
+                        both_started.set()
+
+        task = asyncio.create_task(consume())
+        await both_started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sorted(cancelled) == ["a", "b"]
+        assert graph._current_nodes == {}
+
+
+class TestExecutionPlan:
+    """Tests for compiled execution plan caching."""
+
+    def _diamond(self):
+        session = Session(name="test")
+        graph = Graph(id="test", session=session)
+        node = FunctionNode(id="fn", session=session, fn=lambda ctx: ctx.input)
+        graph.add_step(node, step_id="a")
+        graph.add_step(node, step_id="b", depends_on=["a"])
+        graph.add_step(node, step_id="c", depends_on=["a"])
+        graph.add_step(node, step_id="d", depends_on=["b", "c"])
+        return session, graph, node
+
+    def test_compile_builds_levels_and_adjacency(self):
+        """Test plan levels, dependencies, dependents and resolved nodes."""
+        _, graph, node = self._diamond()
+
+        plan = graph.compile()
+
+        assert plan.levels[0] == ("a",)
+        assert set(plan.levels[1]) == {"b", "c"}
+        assert plan.levels[2] == ("d",)
+        assert plan.order == tuple(graph.execution_order())
+        assert plan.dependencies["d"] == ("b", "c")
+        assert set(plan.dependents["a"]) == {"b", "c"}
+        assert plan.dependents["d"] == ()
+        assert plan.nodes["a"] is node
+
+    def test_compile_is_cached(self):
+        """Test repeated compile() returns the same plan without revalidating."""
+        _, graph, _ = self._diamond()
+
+        plan = graph.compile()
+        calls = 0
+        original = graph._structural_errors
+
+        def counting():
+            nonlocal calls
+            calls += 1
+            return original()
+
+        graph._structural_errors = counting
+
+        assert graph.compile() is plan
+        assert graph.validate() == []
+        graph.execution_order()
+        assert calls == 0
+
+    def test_add_step_invalidates_plan(self):
+        """Test adding steps drops the cached plan."""
+        _, graph, node = self._diamond()
+        plan = graph.compile()
+
+        graph.add_step(node, step_id="e", depends_on=["d"])
+        assert graph.compile() is not plan
+        assert graph.execution_order()[-1] == "e"
+
+        plan = graph.compile()
+        graph.add_step_ref(node_id="fn", step_id="f", depends_on=["e"])
+        assert graph.compile() is not plan
+        assert "f" not in graph.compile().nodes
+
+    def test_chain_invalidates_plan(self):
+        """Test chain() drops the cached plan when it adds dependencies."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session)
+        node = FunctionNode(id="fn", session=session, fn=lambda ctx: ctx.input)
+        graph.add_step(node, step_id="a")
+        graph.add_step(node, step_id="b")
+
+        plan = graph.compile()
+        graph.chain("b", "a")
+
+        assert graph.compile() is not plan
+        assert graph.execution_order() == ["b", "a"]
+
+    def test_builder_invalidates_plan(self):
+        """Test >> on already-registered steps drops the cached plan."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session)
+        node = FunctionNode(id="fn", session=session, fn=lambda ctx: ctx.input)
+        a = graph.step("a", node)
+        b = graph.step("b", node)
+        c = graph.step("c", node)
+        a >> c
+        graph.add_step(node, step_id="x")  # registered independently
+
+        plan = graph.compile()
+        b >> c  # c already registered; dependency added in place
+
+        assert graph.compile() is not plan
+        assert set(graph.compile().dependencies["c"]) == {"a", "b"}
+
+    def test_invalid_graph_not_cached(self):
+        """Test compile() raises for invalid graphs and caches nothing."""
+        session = Session(name="test")
+        graph = Graph(id="test", session=session)
+        node = FunctionNode(id="fn", session=session, fn=lambda ctx: ctx.input)
+        graph.add_step(node, step_id="a", depends_on=["b"])
+        graph.add_step(node, step_id="b", depends_on=["a"])
+
+        with pytest.raises(ValueError, match="Cycle detected"):
+            graph.compile()
+        assert graph._plan is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_runs_reuse_plan(self):
+        """Test executing twice uses the same compiled plan."""
+        session, graph, _ = self._diamond()
+
+        await graph.execute(ExecutionContext(session=session, input="x"))
+        plan = graph._plan
+        result = await graph.execute(ExecutionContext(session=session, input="y"))
+
+        assert graph._plan is plan
+        assert result["attributes"]["final_step_id"] == "d"
+
+
 class TestStepEvent:
     """Tests for StepEvent dataclass."""
 
@@ -4,13 +4,16 @@ These tests use mocked backends to verify terminal node behavior
 without requiring actual PTY or WezTerm instances.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
 from nerve.core.nodes.base import NodeState
 from nerve.core.nodes.context import ExecutionContext
 from nerve.core.nodes.terminal import ClaudeWezTermNode, PTYNode, WezTermNode
+from nerve.core.parsers import IncrementalParser
+from nerve.core.pty.wezterm_backend import PaneCursor
 from nerve.core.session.session import Session
 from nerve.core.types import ParsedResponse, ParserType, Section
 
@@ -23,6 +26,11 @@ def create_mock_pty_backend():
     backend.stop = AsyncMock()
     backend.write = AsyncMock()
     backend.read_tail = MagicMock(return_value="HELLO\n$ ")
+    # No further output arrives, so readiness checks settle immediately
+    backend.wait_for_output = AsyncMock(return_value=False)
+    # Absolute offsets track the (mutable) buffer attribute
+    type(backend).output_offset = PropertyMock(side_effect=lambda: len(backend.buffer))
+    backend.read_since = MagicMock(side_effect=lambda offset: backend.buffer[offset:])
 
     # clear_buffer should actually clear the buffer attribute
     def _clear_buffer():
@@ -51,6 +59,18 @@ def create_mock_wezterm_backend():
     backend.focus = AsyncMock()
     backend.get_pane_info = AsyncMock(return_value={"pane_id": "42"})
     backend.read_tail = MagicMock(return_value="HELLO\n$ ")
+    backend.capture = AsyncMock(side_effect=lambda *args, **kwargs: backend.buffer)
+    backend.capture_tail = AsyncMock(return_value="HELLO\n$ ")
+    backend.cursor = AsyncMock(return_value=PaneCursor(("$ hello", "HELLO", "$")))
+    backend.capture_since = AsyncMock(side_effect=lambda cursor: backend.buffer)
+
+    @asynccontextmanager
+    async def mock_watch(*args, **kwargs):
+        pane = MagicMock()
+        pane.next = AsyncMock(side_effect=lambda: backend.buffer)
+        yield pane
+
+    backend.watch = mock_watch
 
     # clear_buffer should actually clear the buffer attribute
     def _clear_buffer():
@@ -58,7 +78,7 @@ def create_mock_wezterm_backend():
 
     backend.clear_buffer = MagicMock(side_effect=_clear_buffer)
 
-    async def mock_read_stream():
+    async def mock_read_stream(chunk_size=4096, since=None):
         yield "HELLO"
         yield "\n$ "
 
@@ -110,6 +130,9 @@ class TestPTYNode:
                     is_ready=True,
                 )
             )
+            parser_instance.incremental = MagicMock(
+                side_effect=lambda: IncrementalParser(parser_instance)
+            )
             mock_parser.return_value = parser_instance
 
             session = Session(history_enabled=False)
@@ -412,6 +435,40 @@ class TestWezTermNode:
             assert len(chunks) > 0
             await node.stop()
 
+    @pytest.mark.asyncio
+    async def test_wezterm_node_execute_stream_parses_turn(self):
+        """execute_stream() streams from the pre-input cursor and parses only the turn."""
+        mock_backend = create_mock_wezterm_backend()
+        streamed_since = []
+
+        async def read_stream(chunk_size=4096, since=None):
+            streamed_since.append(since)
+            yield "HELLO"
+
+        mock_backend.read_stream = read_stream
+        mock_backend.capture_since = AsyncMock(return_value="$ ls\nHELLO\n$ ")
+
+        with (
+            patch(
+                "nerve.core.nodes.terminal.wezterm_node.WezTermBackend", return_value=mock_backend
+            ),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            session = Session(history_enabled=False)
+            node = await WezTermNode.create(id="test-node", session=session, command="bash")
+            assert node.stream_response is None
+
+            context = ExecutionContext(session=session, input="ls", parser=ParserType.NONE)
+            chunks = [chunk async for chunk in node.execute_stream(context)]
+
+            cursor = mock_backend.cursor.return_value
+            assert chunks == ["HELLO"]
+            assert streamed_since == [cursor]
+            mock_backend.capture_since.assert_awaited_once_with(cursor)
+            assert node.stream_response is not None
+            assert node.stream_response.raw == "$ ls\nHELLO\n$ "
+            await node.stop()
+
     @pytest.mark.asyncio
     async def test_wezterm_node_attach(self):
         """Test WezTermNode.attach() method."""
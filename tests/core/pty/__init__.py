@@ -0,0 +1 @@
+"""Tests for nerve.core.pty module."""
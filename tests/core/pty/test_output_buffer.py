@@ -0,0 +1,119 @@
+"""Tests for nerve.core.pty.output_buffer module."""
+
+import pytest
+
+from nerve.core.pty.output_buffer import OutputBuffer
+
+
+def reference_tail(text, lines):
+    """Previous str-based read_tail implementation."""
+    return "\n".join(text.split("\n")[-lines:])
+
+
+class TestOutputBuffer:
+    """Tests for OutputBuffer."""
+
+    def test_append_and_text(self):
+        """Test chunks are joined in order."""
+        buf = OutputBuffer(max_size=100)
+        buf.append("hello ")
+        buf.append("world")
+
+        assert buf.text() == "hello world"
+        assert str(buf) == "hello world"
+        assert len(buf) == 11
+        assert buf.start == 0
+        assert buf.end == 11
+
+    def test_trims_oldest_output(self):
+        """Test only the last max_size characters are retained."""
+        buf = OutputBuffer(max_size=10)
+        for chunk in ["0123", "4567", "89ab", "cdef"]:
+            buf.append(chunk)
+
+        assert buf.text() == "6789abcdef"
+        assert buf.start == 6
+        assert buf.end == 16
+
+    def test_offsets_survive_trimming(self):
+        """Test an offset taken before trimming still marks new output."""
+        buf = OutputBuffer(max_size=8)
+        buf.append("old output")
+        mark = buf.end
+        buf.append("new")
+
+        assert buf.since(mark) == "new"
+
+    def test_since_trimmed_offset_returns_retained(self):
+        """Test offsets older than start return everything retained."""
+        buf = OutputBuffer(max_size=4)
+        buf.append("abcdefgh")
+
+        assert buf.since(0) == "efgh"
+
+    def test_since_spans_segments(self):
+        """Test since() stitches partial and whole segments."""
+        buf = OutputBuffer(max_size=100)
+        for chunk in ["ab", "cd", "ef"]:
+            buf.append(chunk)
+
+        assert buf.since(1) == "bcdef"
+        assert buf.since(4) == "ef"
+        assert buf.since(6) == ""
+        assert buf.since(99) == ""
+
+    def test_clear_keeps_counting(self):
+        """Test clear() drops content but offsets continue."""
+        buf = OutputBuffer(max_size=100)
+        buf.append("abc")
+        buf.clear()
+
+        assert buf.text() == ""
+        assert buf.start == buf.end == 3
+
+        buf.append("d")
+        assert buf.since(3) == "d"
+
+    @pytest.mark.parametrize("lines", [0, 1, 2, 3, 5, 50])
+    def test_tail_matches_split_semantics(self, lines):
+        """Test tail() matches splitting the whole buffer on newlines."""
+        buf = OutputBuffer(max_size=30)
+        text = ""
+        for chunk in ["line1\nli", "ne2\n", "\nline4", "\nline5\n", "x" * 7, "\nend"]:
+            buf.append(chunk)
+            text = (text + chunk)[-30:]
+
+            assert buf.tail(lines) == reference_tail(text, lines)
+
+    def test_invalid_max_size(self):
+        """Test max_size must be positive."""
+        with pytest.raises(ValueError, match="must be > 0"):
+            OutputBuffer(max_size=0)
+
+
+class TestByteOffsets:
+    """Tests for UTF-8 byte offsets."""
+
+    def test_offsets_count_utf8_bytes(self):
+        """Test offsets advance by encoded size, not characters."""
+        buf = OutputBuffer(max_size=100)
+        buf.append("⏺ hi")
+
+        assert buf.end == len("⏺ hi".encode())
+        assert buf.since(len("⏺ ".encode())) == "hi"
+
+    def test_tail_with_multibyte_lines(self):
+        """Test the newline index works with multibyte output."""
+        buf = OutputBuffer(max_size=100)
+        buf.append("⏺ one\n⎿ two\n∴ three")
+
+        assert buf.tail(2) == "⎿ two\n∴ three"
+
+    def test_trim_lands_on_character_boundary(self):
+        """Test trimming never leaves half a character."""
+        buf = OutputBuffer(max_size=5)
+        buf.append("⏺⏺")  # 6 bytes
+
+        assert buf.text() == "⏺"
+        assert len(buf) == 3
+        assert buf.start == 3
@@ -0,0 +1,278 @@
+"""Tests for nerve.core.pty.pty_backend module.
+
+These tests spawn real processes in a pseudo-terminal.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from nerve.core.nodes.context import ExecutionContext
+from nerve.core.nodes.terminal import PTYNode
+from nerve.core.pty import BackendConfig
+from nerve.core.pty.pty_backend import PTYBackend, get_reader_totals
+from nerve.core.session.session import Session
+from nerve.core.types import ParserType
+
+
+@pytest.fixture
+async def cat_backend():
+    """Running `cat` process with a background reader draining output."""
+    backend = PTYBackend(["cat"], BackendConfig())
+    await backend.start()
+
+    async def drain():
+        async for _ in backend.read_stream():
+            pass
+
+    reader = asyncio.create_task(drain())
+    yield backend
+    reader.cancel()
+    try:
+        await reader
+    except asyncio.CancelledError:
+        pass
+    await backend.stop()
+
+
+class TestOutputNotifications:
+    """Tests for wait_for_output() notifications."""
+
+    @pytest.mark.asyncio
+    async def test_wait_for_output_wakes_on_data(self, cat_backend):
+        """Test waiters wake as soon as output arrives."""
+        waiter = asyncio.create_task(cat_backend.wait_for_output(timeout=5.0))
+        await asyncio.sleep(0)
+
+        await cat_backend.write("ping\n")
+
+        assert await waiter is True
+        assert "ping" in cat_backend.buffer
+        assert cat_backend.last_output_at is not None
+
+    @pytest.mark.asyncio
+    async def test_wait_for_output_times_out_when_idle(self, cat_backend):
+        """Test waiting returns False when nothing arrives."""
+        # Let any startup output settle
+        while await cat_backend.wait_for_output(timeout=0.05):
+            pass
+
+        assert await cat_backend.wait_for_output(timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_all_waiters_wake(self, cat_backend):
+        """Test one arrival wakes every concurrent waiter."""
+        waiters = [asyncio.create_task(cat_backend.wait_for_output(timeout=5.0)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        await cat_backend.write("x\n")
+
+        assert await asyncio.gather(*waiters) == [True, True, True]
+
+
+class TestNativeReader:
+    """Tests for the event-loop reader (loop.add_reader)."""
+
+    @pytest.mark.asyncio
+    async def test_output_buffered_without_consumer(self):
+        """Test output is buffered even when nobody iterates read_stream()."""
+        backend = PTYBackend(["cat"], BackendConfig())
+        await backend.start()
+        try:
+            await backend.write("hello\n")
+            assert await backend.wait_for_output(timeout=5.0) is True
+            assert "hello" in backend.buffer
+        finally:
+            await backend.stop()
+
+    @pytest.mark.asyncio
+    async def test_no_threads_used(self):
+        """Test reading does not tie up executor threads."""
+        before = threading.active_count()
+        backend = PTYBackend(["cat"], BackendConfig())
+        await backend.start()
+        try:
+            for i in range(5):
+                await backend.write(f"line {i}\n")
+                await backend.wait_for_output(timeout=5.0)
+            assert threading.active_count() == before
+        finally:
+            await backend.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_backend_does_not_wake(self, cat_backend):
+        """Test an idle PTY causes no reader wakeups."""
+        while await cat_backend.wait_for_output(timeout=0.05):
+            pass
+        wakeups = cat_backend.reader_stats["wakeups"]
+
+        await asyncio.sleep(0.3)
+
+        assert cat_backend.reader_stats["wakeups"] == wakeups
+
+    @pytest.mark.asyncio
+    async def test_reader_stats_count_reads(self, cat_backend):
+        """Test wakeups, chunks and bytes are counted."""
+        await cat_backend.write("abc\n")
+        await cat_backend.wait_for_output(timeout=5.0)
+
+        stats = cat_backend.reader_stats
+        assert stats["wakeups"] >= 1
+        assert stats["chunks"] >= 1
+        assert stats["bytes"] >= 3
+
+    @pytest.mark.asyncio
+    async def test_reader_totals_outlive_the_backend(self):
+        """Test process-wide reader totals keep counting after a stop."""
+        before = get_reader_totals()
+        backend = PTYBackend(["echo", "hello"])
+        await backend.start()
+        await backend.wait_for_output(timeout=5.0)
+        await backend.stop()
+
+        totals = get_reader_totals()
+        assert totals["chunks"] > before["chunks"]
+        assert totals["bytes"] - before["bytes"] >= len("hello")
+
+    @pytest.mark.asyncio
+    async def test_each_stream_sees_every_chunk(self, cat_backend):
+        """Test concurrent read_stream() consumers do not steal chunks."""
+
+        async def collect():
+            received = ""
+            async for chunk in cat_backend.read_stream():
+                received += chunk
+                if "marker" in received:
+                    return received
+            return received
+
+        consumers = [asyncio.create_task(collect()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        await cat_backend.write("marker\n")
+
+        results = await asyncio.wait_for(asyncio.gather(*consumers), timeout=5.0)
+        assert all("marker" in r for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_when_process_exits(self):
+        """Test read_stream() finishes once the child closes the PTY."""
+        backend = PTYBackend(["sh", "-c", "echo bye"], BackendConfig())
+        await backend.start()
+        try:
+            chunks = [c async for c in backend.read_stream()]
+            assert "bye" in "".join(chunks) or "bye" in backend.buffer
+        finally:
+            await backend.stop()
+
+
+class TestPTYNodeReadiness:
+    """Tests for event-driven readiness in PTYNode."""
+
+    @pytest.mark.asyncio
+    async def test_fast_command_has_no_fixed_latency(self):
+        """Test a fast command completes well under the old ~1s polling floor."""
+        session = Session(name="test", history_enabled=False)
+        node = await PTYNode.create(
+            id="shell",
+            session=session,
+            command=["sh"],
+            env={"PS1": "$ "},
+        )
+        try:
+            context = ExecutionContext(session=session, input="echo ready", parser=ParserType.NONE)
+
+            start = time.monotonic()
+            result = await node.execute(context)
+            elapsed = time.monotonic() - start
+
+            assert result["success"] is True
+            assert "ready" in result["output"]
+            assert elapsed < 0.6
+        finally:
+            await node.stop()
+
+
+class TestStreamOffsets:
+    """Tests for absolute output offsets."""
+
+    @pytest.mark.asyncio
+    async def test_read_since_returns_new_output(self, cat_backend):
+        """Test read_since() returns only output after the offset."""
+        await cat_backend.write("first\n")
+        await cat_backend.wait_for_output(timeout=5.0)
+        while await cat_backend.wait_for_output(timeout=0.05):
+            pass
+
+        mark = cat_backend.output_offset
+        await cat_backend.write("second\n")
+        await cat_backend.wait_for_output(timeout=5.0)
+
+        new_output = cat_backend.read_since(mark)
+        assert "second" in new_output
+        assert "first" not in new_output
+
+    @pytest.mark.asyncio
+    async def test_offset_survives_clear(self, cat_backend):
+        """Test clearing the buffer does not reset the offset."""
+        await cat_backend.write("abc\n")
+        await cat_backend.wait_for_output(timeout=5.0)
+
+        before = cat_backend.output_offset
+        cat_backend.clear_buffer()
+
+        assert cat_backend.buffer == ""
+        assert cat_backend.output_offset == before
+
+
+@pytest.fixture
+def pipe_backend():
+    """Backend reading from a pipe, so tests control read boundaries."""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    backend = PTYBackend(["cat"], BackendConfig())
+    backend._master_fd = read_fd
+    yield backend, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+class TestDecoding:
+    """Tests for incremental decoding and adaptive reads."""
+
+    def test_multibyte_split_across_reads(self, pipe_backend):
+        """Test a character split across reads is decoded intact."""
+        backend, write_fd = pipe_backend
+        encoded = "⏺ done".encode()
+
+        os.write(write_fd, encoded[:2])
+        backend._on_readable()
+        os.write(write_fd, encoded[2:])
+        backend._on_readable()
+
+        assert backend.buffer == "⏺ done"
+        assert "�" not in backend.buffer
+        assert backend.output_offset == len(encoded)
+
+    def test_read_size_grows_when_bursty(self, pipe_backend):
+        """Test full reads increase the read size."""
+        backend, write_fd = pipe_backend
+        initial = backend.reader_stats["read_size"]
+
+        os.write(write_fd, b"x" * initial)
+        backend._on_readable()
+
+        assert backend.reader_stats["read_size"] == initial * 2
+
+    def test_read_size_shrinks_when_quiet(self, pipe_backend):
+        """Test small reads shrink the read size back."""
+        backend, write_fd = pipe_backend
+        backend._read_size = 16384
+
+        os.write(write_fd, b"$ ")
+        backend._on_readable()
+
+        assert backend.reader_stats["read_size"] == 8192
@@ -0,0 +1,535 @@
+"""Tests for nerve.core.pty.wezterm_backend module.
+
+These tests run the backend against a stub `wezterm` executable placed
+first on PATH. The stub keeps pane text in a file, logs every invocation
+and can be told to respond slowly.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from nerve.core.pty.wezterm_backend import WezTermBackend
+from nerve.core.pty.wezterm_cli import CLIResult, WezTermCLI
+from nerve.core.pty.wezterm_poller import PanePoller
+
+FAKE_WEZTERM = """#!{python}
+import json, os, sys, time
+
+state = os.environ["FAKE_WEZTERM_STATE"]
+args = sys.argv[1:]
+with open(os.path.join(state, "calls.jsonl"), "a") as f:
+    f.write(json.dumps(args) + "\\n")
+with open(os.path.join(state, "pid"), "w") as f:
+    f.write(str(os.getpid()))
+
+def opt(name, default=None):
+    return args[args.index(name) + 1] if name in args else default
+
+text_path = os.path.join(state, "text")
+delay_path = os.path.join(state, "delay")
+if os.path.exists(delay_path):
+    time.sleep(float(open(delay_path).read()))
+
+command = args[1] if len(args) > 1 else ""
+if command == "get-text":
+    lines = open(text_path).read().split("\\n") if os.path.exists(text_path) else []
+    rows = int(os.environ.get("FAKE_WEZTERM_ROWS", "24"))
+    top = max(0, len(lines) - rows)
+    start = max(0, top + int(opt("--start-line", "0")))
+    end = top + int(opt("--end-line", str(len(lines))))
+    sys.stdout.write("\\n".join(lines[start : end + 1]))
+elif command == "send-text":
+    with open(text_path, "a") as f:
+        f.write(args[-1].replace("\\r", "\\n"))
+elif command == "list":
+    pane = {{"pane_id": 42, "title": "fake", "cursor_x": 0, "cursor_y": 0}}
+    pane_path = os.path.join(state, "pane.json")
+    if os.path.exists(pane_path):
+        pane.update(json.load(open(pane_path)))
+    print(json.dumps([pane]))
+"""
+
+
+class FakeWezTerm:
+    """Handle on the stub wezterm's state directory."""
+
+    def __init__(self, state: Path) -> None:
+        self.state = state
+
+    def set_text(self, text: str) -> None:
+        (self.state / "text").write_text(text)
+
+    def set_delay(self, seconds: float) -> None:
+        (self.state / "delay").write_text(str(seconds))
+
+    def last_pid_alive(self) -> bool:
+        """Whether the most recently started stub process still exists."""
+        try:
+            os.kill(int((self.state / "pid").read_text()), 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def set_pane(self, **fields: object) -> None:
+        """Override fields of the pane reported by `list`."""
+        (self.state / "pane.json").write_text(json.dumps(fields))
+
+    def calls(self, command: str | None = None) -> list[list[str]]:
+        log = self.state / "calls.jsonl"
+        if not log.exists():
+            return []
+        calls = [json.loads(line) for line in log.read_text().splitlines()]
+        return [c for c in calls if command is None or c[1] == command]
+
+
+@pytest.fixture
+def fake_wezterm(tmp_path, monkeypatch):
+    """Stub `wezterm` executable first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "wezterm"
+    script.write_text(FAKE_WEZTERM.format(python=sys.executable))
+    script.chmod(0o755)
+
+    state = tmp_path / "state"
+    state.mkdir()
+    monkeypatch.setenv("FAKE_WEZTERM_STATE", str(state))
+    monkeypatch.setenv("PATH", f"{bin_dir}:{Path(sys.executable).parent}")
+    return FakeWezTerm(state)
+
+
+@pytest.fixture
+def backend(fake_wezterm):
+    """Backend attached to the stub's pane, with its own executor."""
+    return WezTermBackend([], pane_id="42", cli=WezTermCLI())
+
+
+class TestCapture:
+    """Tests for async pane capture and the snapshot cache."""
+
+    @pytest.mark.asyncio
+    async def test_capture_returns_pane_text(self, fake_wezterm, backend):
+        """Test capture() returns the pane text."""
+        fake_wezterm.set_text("line 1\nline 2")
+
+        assert await backend.capture() == "line 1\nline 2"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_captures_share_one_get_text(self, fake_wezterm, backend):
+        """Test concurrent readers share one in-flight get-text."""
+        fake_wezterm.set_text("shared")
+        fake_wezterm.set_delay(0.2)
+
+        results = await asyncio.gather(*(backend.capture(max_age=0) for _ in range(5)))
+
+        assert results == ["shared"] * 5
+        assert len(fake_wezterm.calls("get-text")) == 1
+        assert backend.capture_stats["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_is_reused(self, fake_wezterm, backend):
+        """Test a recent snapshot is served without another get-text."""
+        fake_wezterm.set_text("cached")
+
+        await backend.capture()
+        assert await backend.capture(max_age=10) == "cached"
+        assert backend.buffer == "cached"  # Sync accessor uses it too
+
+        assert len(fake_wezterm.calls("get-text")) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_snapshot(self, fake_wezterm, backend):
+        """Test output after a write is never served from an old snapshot."""
+        fake_wezterm.set_text("$ ")
+        await backend.capture(max_age=10)
+
+        await backend.write("ls\n")
+
+        assert await backend.capture(max_age=10) == "$ ls\n"
+        assert len(fake_wezterm.calls("get-text")) == 2
+
+    @pytest.mark.asyncio
+    async def test_capture_tail(self, fake_wezterm, backend):
+        """Test capture_tail() returns the last lines."""
+        fake_wezterm.set_text("\n".join(f"line {i}" for i in range(100)))
+
+        assert await backend.capture_tail(2) == "line 98\nline 99"
+
+    @pytest.mark.asyncio
+    async def test_capture_without_pane(self, fake_wezterm):
+        """Test capture() without a pane returns empty text."""
+        backend = WezTermBackend([], cli=WezTermCLI())
+
+        assert await backend.capture() == ""
+        assert fake_wezterm.calls() == []
+
+
+class TestReadSince:
+    """Tests for cursor-based delta reads."""
+
+    @pytest.mark.asyncio
+    async def test_appended_lines(self, fake_wezterm, backend):
+        """Test lines appended after the cursor are returned."""
+        fake_wezterm.set_text("$ ls")
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text("$ ls\na.txt\nb.txt\n$ ")
+        text, cursor = await backend.read_since(cursor)
+
+        assert text == "\na.txt\nb.txt\n$"
+        assert (await backend.read_since(cursor))[0] == ""
+
+    @pytest.mark.asyncio
+    async def test_line_growth_returns_added_characters(self, fake_wezterm, backend):
+        """Test a line that grew in place returns only the new characters."""
+        fake_wezterm.set_text("one\ntwo\nthree\nprogress: 10%")
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text("one\ntwo\nthree\nprogress: 10%... 20%")
+        text, _ = await backend.read_since(cursor)
+
+        assert text == "... 20%"
+
+    @pytest.mark.asyncio
+    async def test_lines_inserted_above_redrawn_footer(self, fake_wezterm, backend):
+        """Test output inserted above a TUI input box is found."""
+        footer = "────────\n>\n────────\n  status"
+        fake_wezterm.set_text(f"> prompt\n⏺ first\n{footer}")
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text(f"> prompt\n⏺ first\n⏺ second\n{footer}")
+        text, _ = await backend.read_since(cursor)
+
+        assert text == "\n⏺ second"
+
+    @pytest.mark.asyncio
+    async def test_polls_fetch_a_small_window(self, fake_wezterm, backend):
+        """Test a poll does not transfer the whole scrollback."""
+        history = "\n".join(f"line {i}" for i in range(5000))
+        fake_wezterm.set_text(history)
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text(history + "\nnew")
+        text, _ = await backend.read_since(cursor)
+
+        assert text == "\nnew"
+        assert all(c[c.index("--start-line") + 1] == "-200" for c in fake_wezterm.calls("get-text"))
+        assert backend.capture_stats["bytes"] < 2 * 250 * len("line 5000\n")
+
+    @pytest.mark.asyncio
+    async def test_window_widens_when_cursor_scrolled_out(self, fake_wezterm, backend):
+        """Test more new output than the window holds is still returned."""
+        fake_wezterm.set_text("start\nmarker a\nmarker b")
+        cursor = await backend.cursor()
+
+        burst = "\n".join(f"out {i}" for i in range(1000))
+        fake_wezterm.set_text(f"start\nmarker a\nmarker b\n{burst}")
+        text, _ = await backend.read_since(cursor)
+
+        assert text == "\n" + burst
+        assert backend.capture_stats["anchor_misses"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_cleared_screen_returns_recent_window(self, fake_wezterm, backend):
+        """Test a cursor whose lines are gone yields the current content."""
+        fake_wezterm.set_text("old 1\nold 2\nold 3")
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text("fresh\n$ ")
+        text, cursor = await backend.read_since(cursor)
+
+        assert text == "fresh\n$"
+        assert cursor.lines == ("fresh", "$")
+
+    @pytest.mark.asyncio
+    async def test_capture_since_returns_whole_lines_from_cursor(self, fake_wezterm, backend):
+        """Test capture_since() returns the pane from the cursor's lines on."""
+        history = "\n".join(f"line {i}" for i in range(5000))
+        fake_wezterm.set_text(f"{history}\n> ")
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text(f"{history}\n> hi\n⏺ hello\n> ")
+        text = await backend.capture_since(cursor)
+
+        assert text.endswith("line 4999\n> hi\n⏺ hello\n>")
+        assert text.startswith("line 48")  # The cursor's window, not the scrollback
+        assert all(c[c.index("--start-line") + 1] == "-200" for c in fake_wezterm.calls("get-text"))
+
+    @pytest.mark.asyncio
+    async def test_capture_since_lost_cursor_returns_full_capture(self, fake_wezterm, backend):
+        """Test capture_since() falls back to the whole pane when the cursor is gone."""
+        fake_wezterm.set_text("old 1\nold 2\nold 3")
+        cursor = await backend.cursor()
+
+        fake_wezterm.set_text("fresh\n$ ")
+
+        assert (await backend.capture_since(cursor)).rstrip() == "fresh\n$"
+        assert backend.capture_stats["anchor_misses"] >= 1
+
+
+class TestWrite:
+    """Tests for queued, chunked send-text."""
+
+    @pytest.mark.asyncio
+    async def test_large_write_is_chunked(self, fake_wezterm, backend):
+        """Test a write longer than CHUNK_SIZE is split in order."""
+        backend.CHUNK_DELAY = 0
+        fake_wezterm.set_text("")
+        data = "".join(str(i % 10) for i in range(2 * backend.CHUNK_SIZE + 10))
+
+        await backend.write(data)
+
+        sends = fake_wezterm.calls("send-text")
+        assert [len(c[-1]) for c in sends] == [backend.CHUNK_SIZE, backend.CHUNK_SIZE, 10]
+        assert await backend.capture(max_age=0) == data
+
+    @pytest.mark.asyncio
+    async def test_queued_writes_are_merged(self, fake_wezterm, backend):
+        """Test writes queued behind a send go out in one send-text."""
+        backend.CHUNK_DELAY = 0
+        fake_wezterm.set_text("")
+        fake_wezterm.set_delay(0.2)
+
+        first = asyncio.create_task(backend.write("a"))
+        await asyncio.sleep(0.05)  # "a" is being sent
+        await asyncio.gather(first, backend.write("b"), backend.write("c\n"))
+
+        assert [c[-1] for c in fake_wezterm.calls("send-text")] == ["a", "bc\r"]
+        assert backend.send_stats == {"writes": 3, "sends": 2}
+
+    @pytest.mark.asyncio
+    async def test_write_without_pane(self, fake_wezterm):
+        """Test write() without a pane raises."""
+        backend = WezTermBackend([], cli=WezTermCLI())
+
+        with pytest.raises(RuntimeError, match="not started"):
+            await backend.write("x")
+
+
+class TestWezTermCLI:
+    """Tests for the shared command executor."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, fake_wezterm):
+        """Test no more than max_concurrency processes run at once."""
+        fake_wezterm.set_text("text")
+        fake_wezterm.set_delay(0.2)
+        cli = WezTermCLI(max_concurrency=2)
+        backends = [WezTermBackend([], pane_id="42", cli=cli) for _ in range(5)]
+
+        results = await asyncio.gather(*(b.capture(max_age=0) for b in backends))
+
+        assert results == ["text"] * 5
+        assert cli.stats["peak_in_flight"] == 2
+        assert cli.stats["operations"]["get-text"]["wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_stats_per_operation(self, fake_wezterm, backend):
+        """Test spawns and latency are recorded per subcommand."""
+        fake_wezterm.set_text("$ ")
+
+        await backend.capture()
+        await backend.write("ls")
+        await backend.get_pane_info()
+
+        stats = backend.cli.stats
+        assert stats["spawns"] == 3
+        assert stats["in_flight"] == 0
+        assert set(stats["operations"]) == {"get-text", "send-text", "list"}
+        get_text = stats["operations"]["get-text"]
+        assert get_text["calls"] == 1
+        assert get_text["failures"] == 0
+        assert get_text["max_ms"] >= get_text["mean_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_hung_process_is_killed_on_timeout(self, fake_wezterm):
+        """Test a process past its timeout is killed and frees its slot."""
+        fake_wezterm.set_delay(30)
+        cli = WezTermCLI(max_concurrency=1)
+
+        with pytest.raises(TimeoutError):
+            await cli.run("list", timeout=0.2)
+
+        assert not fake_wezterm.last_pid_alive()
+        assert cli.stats["in_flight"] == 0
+        assert cli.stats["operations"]["list"]["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_kills_its_process(self, fake_wezterm):
+        """Test cancelling the caller does not leave the process running."""
+        fake_wezterm.set_delay(30)
+        cli = WezTermCLI()
+        run = asyncio.create_task(cli.run("list"))
+        while not (fake_wezterm.state / "pid").exists():
+            await asyncio.sleep(0.01)
+
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        assert not fake_wezterm.last_pid_alive()
+        assert cli.stats["in_flight"] == 0
+
+    def test_run_sync_missing_executable(self):
+        """Test a missing wezterm binary raises FileNotFoundError."""
+        cli = WezTermCLI(executable="/nonexistent/wezterm")
+
+        with pytest.raises(FileNotFoundError):
+            cli.run_sync("list")
+
+
+class FlakyListCLI(WezTermCLI):
+    """Executor whose first `list` calls raise and then return a non-list."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures: list[Exception | CLIResult] = [
+            RuntimeError("wezterm cli crashed"),
+            OSError(24, "Too many open files"),
+            CLIResult(0, b'{"panes": []}', b""),
+        ]
+
+    async def run(self, subcommand: str, *args: str, timeout: float | None = 5.0) -> CLIResult:
+        if subcommand == "list" and self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return await super().run(subcommand, *args, timeout=timeout)
+
+
+@pytest.fixture
+def poller():
+    """Fast-ticking poller that never refreshes unchanged panes."""
+    return PanePoller(cli=WezTermCLI(), fast_interval=0.02, idle_interval=0.5, max_staleness=60)
+
+
+def watched_backend(poller: PanePoller) -> WezTermBackend:
+    return WezTermBackend([], pane_id="42", cli=WezTermCLI(), poller=poller)
+
+
+class TestPanePoller:
+    """Tests for the shared pane poller."""
+
+    @pytest.mark.asyncio
+    async def test_first_update_is_current_text(self, fake_wezterm, poller):
+        """Test a new watch receives the pane text right away."""
+        fake_wezterm.set_text("hello")
+
+        async with watched_backend(poller).watch() as pane:
+            assert await asyncio.wait_for(pane.next(), 2) == "hello"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pane_is_not_fetched(self, fake_wezterm, poller):
+        """Test ticks without a change in `list` skip get-text."""
+        fake_wezterm.set_text("hello")
+        backend = watched_backend(poller)
+
+        async with backend.watch() as pane:
+            await asyncio.wait_for(pane.next(), 2)
+            await asyncio.sleep(0.3)
+
+        assert poller.stats["ticks"] > 2
+        assert poller.stats["skipped"] >= poller.stats["ticks"] - 2
+        assert len(fake_wezterm.calls("get-text")) == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_pane_is_delivered(self, fake_wezterm, poller):
+        """Test a cursor move makes the poller fetch and deliver new text."""
+        fake_wezterm.set_text("$ ")
+
+        async with watched_backend(poller).watch() as pane:
+            await asyncio.wait_for(pane.next(), 2)
+
+            fake_wezterm.set_text("$ ls\na.txt\n$ ")
+            fake_wezterm.set_pane(cursor_y=2)
+
+            assert await asyncio.wait_for(pane.next(), 2) == "$ ls\na.txt\n$ "
+
+    @pytest.mark.asyncio
+    async def test_watchers_of_one_pane_share_fetches(self, fake_wezterm, poller):
+        """Test several nodes watching a pane cost one get-text per change."""
+        fake_wezterm.set_text("shared")
+
+        async with (
+            watched_backend(poller).watch() as first,
+            watched_backend(poller).watch() as second,
+        ):
+            assert await asyncio.wait_for(first.next(), 2) == "shared"
+            assert await asyncio.wait_for(second.next(), 2) == "shared"
+            assert poller.stats["watched_panes"] == 1
+
+        assert len(fake_wezterm.calls("get-text")) == 1
+        assert poller.stats["watched_panes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_interval_follows_busy_watchers(self, fake_wezterm, poller):
+        """Test the tick is fast only while a watcher is busy."""
+        fake_wezterm.set_text("")
+        backend = watched_backend(poller)
+
+        async with backend.watch(busy=False) as pane:
+            assert poller.stats["interval"] == poller.idle_interval
+            pane.busy = True
+            assert poller.stats["interval"] == poller.fast_interval
+
+    @pytest.mark.asyncio
+    async def test_stale_pane_is_refreshed(self, fake_wezterm):
+        """Test an unchanged pane is still fetched every max_staleness."""
+        fake_wezterm.set_text("spinner")
+        poller = PanePoller(cli=WezTermCLI(), fast_interval=0.02, max_staleness=0.1)
+
+        async with watched_backend(poller).watch() as pane:
+            await asyncio.wait_for(pane.next(), 2)
+            fake_wezterm.set_text("spinner done")
+
+            assert await asyncio.wait_for(pane.next(), 2) == "spinner done"
+
+    @pytest.mark.asyncio
+    async def test_failing_list_does_not_stop_the_poller(self, fake_wezterm):
+        """Test an error or bad payload from `list` only costs one tick."""
+        fake_wezterm.set_text("still here")
+        cli = FlakyListCLI()
+        poller = PanePoller(cli=cli, fast_interval=0.02, max_staleness=60)
+
+        async with watched_backend(poller).watch() as pane:
+            assert await asyncio.wait_for(pane.next(), 2) == "still here"
+            fake_wezterm.set_text("still here\n$ ")
+            fake_wezterm.set_pane(cursor_y=1)
+
+            assert await asyncio.wait_for(pane.next(), 2) == "still here\n$ "
+        assert cli.failures == []
+
+    @pytest.mark.asyncio
+    async def test_read_stream_uses_poller(self, fake_wezterm, poller):
+        """Test read_stream() yields deltas for changes the poller sees."""
+        fake_wezterm.set_text("one\ntwo\n$ ")
+        backend = watched_backend(poller)
+        stream = backend.read_stream()
+
+        try:
+            assert await asyncio.wait_for(anext(stream), 2) == "one\ntwo\n$"
+            fake_wezterm.set_text("one\ntwo\n$ ls\na.txt")
+            fake_wezterm.set_pane(cursor_y=3)
+            assert await asyncio.wait_for(anext(stream), 2) == " ls\na.txt"
+        finally:
+            await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_read_stream_from_cursor(self, fake_wezterm, poller):
+        """Test read_stream(since=...) yields only output after the cursor."""
+        fake_wezterm.set_text("one\ntwo\n$ ")
+        backend = watched_backend(poller)
+        cursor = await backend.cursor()
+        fake_wezterm.set_text("one\ntwo\n$ ls\na.txt")
+        stream = backend.read_stream(since=cursor)
+
+        try:
+            assert await asyncio.wait_for(anext(stream), 2) == " ls\na.txt"
+        finally:
+            await stream.aclose()
@@ -112,6 +112,22 @@ class TestHistoryWriter:
             assert entry["buffer"] == "buffer content here"
             assert entry["lines"] == 50
 
+    def test_log_read_strips_ansi(self, tmp_path: Path):
+        """Test escape sequences are stripped from buffer captures."""
+        writer = HistoryWriter.create(
+            node_id="test-node",
+            server_name="test-server",
+            session_name="test-session",
+            base_dir=tmp_path,
+        )
+
+        writer.log_read("\x1b[32mok\x1b[0m\n$ ", lines=50)
+        writer.close()
+
+        with open(writer.file_path) as f:
+            entry = json.loads(f.readline())
+            assert entry["buffer"] == "ok\n$ "
+
     def test_log_send(self, tmp_path: Path):
         """Test logging a send operation."""
         writer = HistoryWriter.create(
@@ -460,6 +476,20 @@ class TestHistoryReader:
         assert len(inputs) == 2  # run and send
         assert all(e["op"] in {"send", "write", "run"} for e in inputs)
 
+    def test_iter_entries_streams_in_order(self, history_file: Path):
+        """Test iter_entries yields entries lazily, in file order."""
+        reader = HistoryReader.create(
+            node_id="test-node",
+            server_name="test-server",
+            session_name="test-session",
+            base_dir=history_file,
+        )
+
+        entries = reader.iter_entries()
+
+        assert next(entries)["op"] == "run"
+        assert [e["op"] for e in entries] == ["read", "send", "delete"]
+
     def test_reader_not_found_raises(self, tmp_path: Path):
         """Test reader raises FileNotFoundError for missing node."""
         with pytest.raises(FileNotFoundError):
@@ -4,7 +4,23 @@ These tests use real-world captured Claude Code pane output to ensure
 the ClaudeCodeParser handles actual production output correctly.
 """
 
-from nerve.core.parsers import ClaudeCodeParser
+import pytest
+
+from nerve.core.parsers import (
+    AnsiStripper,
+    ClaudeCodeParser,
+    GeminiParser,
+    IncrementalParser,
+    NoneParser,
+    strip_ansi,
+)
+
+
+def feed_in_chunks(state, content, size):
+    """Feed content to an incremental parser in fixed-size chunks."""
+    for i in range(0, len(content), size):
+        state.feed(content[i : i + size])
+    return state
 
 
 class TestClaudeCodeParser:
@@ -536,3 +552,121 @@ class TestClaudeCodeParserRawExtraction:
 
         # Should contain the thinking and text
         assert "Thinking" in response.raw or "∴" in response.raw or "answer" in response.raw.lower()
+
+
+class TestClaudeCodeIncrementalParser:
+    """Tests for ClaudeCodeParser.incremental()."""
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 4096])
+    def test_chunked_result_matches_parse(self, claude_code_pane_03, size):
+        """Test feeding chunks gives the same result as parsing at once."""
+        parser = ClaudeCodeParser()
+        state = feed_in_chunks(parser.incremental(), claude_code_pane_03, size)
+
+        assert state.result() == parser.parse(claude_code_pane_03)
+        assert state.is_ready() == parser.is_ready(claude_code_pane_03)
+
+    def test_is_ready_tracks_every_prefix(self, claude_code_pane_content):
+        """Test is_ready() agrees with the stateless check at every point."""
+        parser = ClaudeCodeParser()
+        state = parser.incremental()
+
+        content = claude_code_pane_content
+        for i in range(0, len(content), 37):
+            state.feed(content[i : i + 37])
+            prefix = content[: i + 37]
+            assert state.is_ready() == parser.is_ready(prefix)
+
+    def test_hint_split_across_chunks(self):
+        """Test an interrupt hint split between chunks is still seen."""
+        state = ClaudeCodeParser().incremental()
+        state.feed("> prompt\n∴ Thinking…\n  (esc to int")
+        state.feed("errupt)")
+
+        assert state.is_ready() is False
+
+    def test_ready_once_hint_scrolls_out(self):
+        """Test the hint stops counting after 50 newer lines."""
+        state = ClaudeCodeParser().incremental()
+        state.feed("> prompt\n(esc to interrupt)\n")
+        assert state.is_ready() is False
+
+        state.feed("line\n" * 50)
+        assert state.is_ready() is True
+
+    def test_text_returns_fed_output(self):
+        """Test text() reassembles everything fed so far."""
+        state = ClaudeCodeParser().incremental()
+        state.feed("a\nb")
+        state.feed("c\n")
+
+        assert state.text() == "a\nbc\n"
+
+
+class TestDefaultIncrementalParser:
+    """Tests for the default IncrementalParser."""
+
+    def test_delegates_to_parser(self):
+        """Test the default state re-runs the stateless parser."""
+        parser = GeminiParser()
+        state = parser.incremental()
+
+        assert type(state) is IncrementalParser
+        state.feed("output\n")
+        assert state.is_ready() is False
+        state.feed("gemini>")
+        assert state.is_ready() is True
+        assert state.result() == parser.parse("output\ngemini>")
+
+
+class TestNoneParser:
+    """Tests for NoneParser prompt detection."""
+
+    def test_prompt_with_ansi_codes(self):
+        """Test a colored prompt is detected."""
+        content = "build ok\n\x1b[32muser@host\x1b[0m:~$ \x1b[?2004h"
+        assert NoneParser().is_ready(content) is True
+
+    def test_escape_only_trailing_line_is_skipped(self):
+        """Test lines with no visible text do not hide the prompt."""
+        assert NoneParser().is_ready("$ \n\x1b[?2004l\r\n") is True
+
+    def test_not_ready_mid_output(self):
+        """Test output that does not end at a prompt."""
+        assert NoneParser().is_ready("compiling...\n\x1b[1mstep 3/9\x1b[0m") is False
+
+    @pytest.mark.parametrize("size", [1, 3, 64])
+    def test_incremental_matches_is_ready(self, size):
+        """Test the incremental state agrees with is_ready() on every prefix."""
+        parser = NoneParser()
+        content = "\x1b[1mlog\x1b[0m\n" * 5 + "\x1b[32m~\x1b[0m$ \x1b[?2004h"
+        state = parser.incremental()
+
+        for i in range(0, len(content), size):
+            state.feed(content[i : i + size])
+            assert state.is_ready() == parser.is_ready(content[: i + size])
+        assert state.result() == parser.parse(content)
+
+
+class TestAnsi:
+    """Tests for ANSI escape sequence stripping."""
+
+    def test_strip_ansi(self):
+        """Test CSI, OSC and two-character sequences are removed."""
+        text = "\x1b]0;title\x07\x1b[1;31mred\x1b[0m \x1b(Bplain\x1bM"
+        assert strip_ansi(text) == "red plain"
+
+    def test_strip_ansi_without_escapes(self):
+        """Test text without escapes is returned unchanged."""
+        text = "plain text\n"
+        assert strip_ansi(text) is text
+
+    @pytest.mark.parametrize("size", [1, 2, 5])
+    def test_stripper_matches_strip_ansi(self, size):
+        """Test sequences split across chunks are stripped."""
+        text = "a\x1b[38;5;196mb\x1b]8;;http://x\x1b\\c\x1b[0m\x1b["
+        stripper = AnsiStripper()
+        out = [stripper.feed(text[i : i + size]) for i in range(0, len(text), size)]
+        out.append(stripper.flush())
+
+        assert "".join(out) == strip_ansi(text)
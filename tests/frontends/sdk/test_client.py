@@ -1,5 +1,6 @@
 """Tests for nerve.frontends.sdk.client module."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -277,3 +278,76 @@ class TestNerveClientFactory:
 
         # After context, client should be disconnected
         # (no explicit check needed, just verify no exceptions)
+
+
+class TestNerveClientBatch:
+    """Tests for NerveClient.batch()."""
+
+    @pytest.mark.asyncio
+    async def test_unordered_commands_are_pipelined(self):
+        """Test every command is sent before any result is awaited."""
+        from nerve.server.protocols import Command, CommandResult, CommandType
+
+        sent = []
+        all_sent = asyncio.Event()
+
+        async def send_command(command):
+            sent.append(command)
+            if len(sent) == 3:
+                all_sent.set()
+            await asyncio.wait_for(all_sent.wait(), timeout=1)
+            return CommandResult(success=True, data={"node_id": command.params["node_id"]})
+
+        transport = MagicMock()
+        transport.send_command = send_command
+        client = NerveClient(_transport=transport)
+
+        results = await client.batch(
+            [Command(CommandType.CREATE_NODE, {"node_id": f"n{i}"}) for i in range(3)]
+        )
+
+        assert [r.data["node_id"] for r in results] == ["n0", "n1", "n2"]
+
+    @pytest.mark.asyncio
+    async def test_ordered_commands_are_one_batch_command(self):
+        """Test ordering constraints are sent as a single BATCH."""
+        from nerve.server.protocols import Command, CommandResult, CommandType
+
+        transport = MagicMock()
+        transport.send_command = AsyncMock(
+            return_value=CommandResult(
+                success=True,
+                data={
+                    "results": [
+                        {"success": True, "data": {}, "error": None},
+                        {"success": False, "data": None, "error": "Skipped: command 0 failed"},
+                    ],
+                    "failed": 1,
+                },
+            )
+        )
+        client = NerveClient(_transport=transport)
+
+        results = await client.batch(
+            [Command(CommandType.CREATE_GRAPH), Command(CommandType.RUN_GRAPH)], after={1: [0]}
+        )
+
+        transport.send_command.assert_called_once()
+        command = transport.send_command.call_args[0][0]
+        assert command.type is CommandType.BATCH
+        assert [c["after"] for c in command.params["commands"]] == [[], [0]]
+        assert [r.success for r in results] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_raises(self):
+        """Test a batch the server rejects raises RuntimeError."""
+        from nerve.server.protocols import Command, CommandResult, CommandType
+
+        transport = MagicMock()
+        transport.send_command = AsyncMock(
+            return_value=CommandResult(success=False, error="Command 0: bad")
+        )
+        client = NerveClient(_transport=transport)
+
+        with pytest.raises(RuntimeError, match="Command 0: bad"):
+            await client.batch([Command(CommandType.PING)], sequential=True)
@@ -0,0 +1,135 @@
+"""Tests for AdmissionController."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nerve.server.admission import AdmissionController, AdmissionRejectedError, parse_limit
+from nerve.server.engine import build_nerve_engine
+from nerve.server.protocols import Command, CommandType
+
+
+async def hold(admission: AdmissionController, release: asyncio.Event, log: list[str], name: str):
+    async with admission.slot(CommandType.EXECUTE_INPUT):
+        log.append(name)
+        await release.wait()
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_limit_queues_in_arrival_order(self):
+        admission = AdmissionController({CommandType.EXECUTE_INPUT: 2})
+        release = asyncio.Event()
+        started: list[str] = []
+
+        tasks = [asyncio.create_task(hold(admission, release, started, str(i))) for i in range(4)]
+        await settle()
+
+        assert started == ["0", "1"]
+        stats = admission.stats["EXECUTE_INPUT"]
+        assert (stats["running"], stats["queued"]) == (2, 2)
+        release.set()
+        await asyncio.gather(*tasks)
+        assert started == ["0", "1", "2", "3"]
+        assert admission.stats["EXECUTE_INPUT"]["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unlimited_types_do_not_wait(self):
+        admission = AdmissionController({CommandType.EXECUTE_INPUT: 1})
+        release = asyncio.Event()
+        busy = asyncio.create_task(hold(admission, release, [], "busy"))
+        await settle()
+
+        async with asyncio.timeout(1):
+            async with admission.slot(CommandType.LIST_NODES):
+                pass
+
+        release.set()
+        await busy
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_retry_hint(self):
+        admission = AdmissionController({CommandType.EXECUTE_INPUT: 1}, max_queued=1)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(hold(admission, release, [], str(i))) for i in range(2)]
+        await settle()
+
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            async with admission.slot(CommandType.EXECUTE_INPUT):
+                pass
+
+        assert rejected.value.retry_after > 0
+        assert admission.stats["EXECUTE_INPUT"]["rejected"] == 1
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        admission = AdmissionController({CommandType.EXECUTE_INPUT: 1})
+        release = asyncio.Event()
+        started: list[str] = []
+        first = asyncio.create_task(hold(admission, release, started, "first"))
+        cancelled = asyncio.create_task(hold(admission, release, started, "cancelled"))
+        last = asyncio.create_task(hold(admission, release, started, "last"))
+        await settle()
+
+        cancelled.cancel()
+        release.set()
+        await asyncio.gather(first, last)
+
+        assert started == ["first", "last"]
+        assert admission.stats["EXECUTE_INPUT"]["running"] == 0
+
+    def test_priority_commands_cannot_be_limited(self):
+        with pytest.raises(ValueError, match="SEND_INTERRUPT"):
+            AdmissionController({CommandType.SEND_INTERRUPT: 1})
+
+    def test_parse_limit(self):
+        assert parse_limit("execute_input=8") == (CommandType.EXECUTE_INPUT, 8)
+        for spec in ["EXECUTE_INPUT", "NOPE=1", "EXECUTE_INPUT=x", "EXECUTE_INPUT=0"]:
+            with pytest.raises(ValueError):
+                parse_limit(spec)
+
+
+class MockEventSink:
+    """Mock event sink for testing."""
+
+    async def emit(self, event):
+        pass
+
+
+class TestEngineAdmission:
+    """Tests for admission in NerveEngine.execute."""
+
+    @pytest.mark.asyncio
+    async def test_rejected_command_fails_with_retry_after(self):
+        admission = AdmissionController({CommandType.EXECUTE_INPUT: 1}, max_queued=0)
+        engine = build_nerve_engine(event_sink=MockEventSink(), admission=admission)
+        release = asyncio.Event()
+
+        async def execute_input(params):
+            await release.wait()
+            return {"done": True}
+
+        engine._handlers[CommandType.EXECUTE_INPUT] = execute_input
+        running = asyncio.create_task(engine.execute(Command(CommandType.EXECUTE_INPUT)))
+        await settle()
+
+        rejected = await engine.execute(Command(CommandType.EXECUTE_INPUT, request_id="r2"))
+        ping = await engine.execute(Command(CommandType.PING))
+
+        assert not rejected.success
+        assert rejected.request_id == "r2"
+        assert rejected.data["retry_after"] > 0
+        assert ping.data["admission"]["EXECUTE_INPUT"]["running"] == 1
+        release.set()
+        assert (await running).data == {"done": True}
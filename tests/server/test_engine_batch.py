@@ -0,0 +1,134 @@
+"""Tests for NerveEngine BATCH commands."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nerve.server.engine import build_nerve_engine
+from nerve.server.protocols import Command, CommandType
+
+
+class MockEventSink:
+    """Mock event sink for testing."""
+
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event):
+        self.events.append(event)
+
+
+def batch(*commands: dict, **params) -> Command:
+    return Command(type=CommandType.BATCH, params={"commands": list(commands), **params})
+
+
+class TestBatch:
+    """Tests for the BATCH command."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create engine with test configuration."""
+        return build_nerve_engine(event_sink=MockEventSink(), server_name="test-server")
+
+    @pytest.mark.asyncio
+    async def test_sequential_commands_see_earlier_effects(self, engine):
+        result = await engine.execute(
+            batch(
+                {"type": "CREATE_SESSION", "params": {"name": "batched"}},
+                {"type": "GET_SESSION", "params": {"session_id": "batched"}},
+                sequential=True,
+            )
+        )
+
+        assert result.success
+        assert result.data["failed"] == 0
+        assert result.data["results"][1]["data"]["name"] == "batched"
+
+    @pytest.mark.asyncio
+    async def test_unordered_commands_run_concurrently(self, engine):
+        first_started = asyncio.Event()
+
+        async def waits_for_second(params):
+            await asyncio.wait_for(first_started.wait(), timeout=1)
+            return {"waited": True}
+
+        async def second(params):
+            first_started.set()
+            return {}
+
+        engine._handlers[CommandType.PING] = waits_for_second
+        engine._handlers[CommandType.LIST_SESSIONS] = second
+
+        result = await engine.execute(batch({"type": "PING"}, {"type": "LIST_SESSIONS"}))
+
+        assert result.data["results"][0]["data"] == {"waited": True}
+
+    @pytest.mark.asyncio
+    async def test_after_orders_commands(self, engine):
+        order = []
+
+        async def record(params):
+            await asyncio.sleep(params["delay"])
+            order.append(params["name"])
+            return {}
+
+        engine._handlers[CommandType.PING] = record
+
+        await engine.execute(
+            batch(
+                {"type": "PING", "params": {"name": "slow", "delay": 0.05}},
+                {"type": "PING", "params": {"name": "fast", "delay": 0}},
+                {"type": "PING", "params": {"name": "last", "delay": 0}, "after": [0]},
+            )
+        )
+
+        assert order == ["fast", "slow", "last"]
+
+    @pytest.mark.asyncio
+    async def test_dependents_of_failed_command_are_skipped(self, engine):
+        result = await engine.execute(
+            batch(
+                {"type": "GET_SESSION", "params": {"session_id": "missing"}},
+                {"type": "PING", "after": [0]},
+                {"type": "PING"},
+            )
+        )
+
+        results = result.data["results"]
+        assert "Session not found" in results[0]["error"]
+        assert results[1]["error"] == "Skipped: command 0 failed"
+        assert results[2]["success"]
+        assert result.data["failed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_skips_the_rest(self, engine):
+        result = await engine.execute(
+            batch(
+                {"type": "PING"},
+                {"type": "GET_SESSION", "params": {"session_id": "missing"}},
+                {"type": "PING"},
+                sequential=True,
+                stop_on_error=True,
+            )
+        )
+
+        assert [r["success"] for r in result.data["results"]] == [True, False, False]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "commands, error",
+        [
+            ([], "non-empty"),
+            ([{"type": "NOPE"}], "unknown command type"),
+            ([{"type": ["PING"]}], "unknown command type"),
+            ([{"type": "BATCH"}], "cannot be nested"),
+            ([{"type": "PING", "after": [0]}], "earlier commands"),
+        ],
+    )
+    async def test_malformed_batch_fails(self, engine, commands, error):
+        result = await engine.execute(batch(*commands))
+
+        assert not result.success
+        assert error in result.error
@@ -62,6 +62,15 @@ class TestEngineSessionCommands:
         registry = get_session_registry(engine)
         assert registry.has_session(session_id)
 
+    @pytest.mark.asyncio
+    async def test_create_session_event_carries_session_id(self, engine, event_sink):
+        """SESSION_CREATED is tagged with the session for subscription filters."""
+        await engine.execute(
+            Command(type=CommandType.CREATE_SESSION, params={"name": "tagged"}),
+        )
+
+        assert event_sink.events[-1].session_id == "tagged"
+
     @pytest.mark.asyncio
     async def test_delete_session(self, engine):
         """DELETE_SESSION removes session."""
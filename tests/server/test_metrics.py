@@ -0,0 +1,120 @@
+"""Tests for MetricsRegistry and GET_METRICS."""
+
+from __future__ import annotations
+
+import pytest
+
+from nerve.server.engine import build_nerve_engine
+from nerve.server.metrics import Histogram, MetricsRegistry, render_prometheus
+from nerve.server.protocols import Command, CommandType, Event, EventType
+from nerve.transport.fanout import TrafficCounter
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_values_fall_in_inclusive_buckets(self):
+        histogram = Histogram(bounds=(0.1, 1.0))
+
+        for value in [0.05, 0.1, 0.5, 2.0]:
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.stats == {
+            "count": 4,
+            "sum": 2.65,
+            "buckets": [[0.1, 2], [1.0, 3], [None, 4]],
+        }
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_snapshot_lists_only_what_was_recorded(self):
+        metrics = MetricsRegistry(buckets=(1.0,))
+        metrics.observe_command(CommandType.PING, 0.5, success=True)
+        metrics.observe_command(CommandType.PING, 2.0, success=False)
+        metrics.observe_node("default", "claude", 3.0)
+        metrics.count_event(Event(type=EventType.NODE_READY))
+        metrics.add_source("transport", lambda: {"bytes_in_total": 10})
+
+        snapshot = metrics.snapshot()
+
+        assert list(snapshot["commands"]) == ["PING"]
+        assert snapshot["commands"]["PING"]["errors"] == 1
+        assert snapshot["commands"]["PING"]["buckets"] == [[1.0, 1], [None, 2]]
+        assert snapshot["nodes"][0]["node_id"] == "claude"
+        assert snapshot["events"] == {"NODE_READY": 1}
+        assert snapshot["gauges"] == {"transport_bytes_in_total": 10}
+
+    def test_node_series_are_bounded(self, monkeypatch):
+        monkeypatch.setattr("nerve.server.metrics.MAX_NODE_SERIES", 2)
+        metrics = MetricsRegistry()
+
+        for node_id in ["a", "b", "c"]:
+            metrics.observe_node("default", node_id, 0.1)
+
+        assert [n["node_id"] for n in metrics.snapshot()["nodes"]] == ["b", "c"]
+
+
+class TestRenderPrometheus:
+    """Tests for render_prometheus."""
+
+    def test_renders_histograms_counters_and_gauges(self):
+        metrics = MetricsRegistry(buckets=(1.0,))
+        metrics.observe_command(CommandType.EXECUTE_INPUT, 0.5, success=True)
+        metrics.observe_node("default", 'we"ird', 0.5)
+        metrics.count_event(Event(type=EventType.OUTPUT_CHUNK))
+        metrics.add_source("transport", lambda: {"bytes_out_total": 7, "clients": 2})
+
+        text = render_prometheus(metrics.snapshot())
+
+        assert "# TYPE nerve_command_duration_seconds histogram" in text
+        assert 'nerve_command_duration_seconds_bucket{command="EXECUTE_INPUT",le="1.0"} 1' in text
+        assert 'nerve_command_duration_seconds_count{command="EXECUTE_INPUT"} 1' in text
+        assert 'nerve_command_errors_total{command="EXECUTE_INPUT"} 0' in text
+        assert 'node="we\\"ird",le="+Inf"} 1' in text
+        assert 'nerve_events_total{type="OUTPUT_CHUNK"} 1' in text
+        assert "# TYPE nerve_transport_bytes_out_total counter" in text
+        assert "# TYPE nerve_transport_clients gauge" in text
+        assert text.endswith("nerve_transport_clients 2\n")
+
+
+class RecordingTransport:
+    """Event sink with traffic counters, like the server transports."""
+
+    def __init__(self):
+        self.events = []
+        self.traffic = TrafficCounter()
+
+    async def emit(self, event):
+        self.events.append(event)
+
+
+class TestEngineMetrics:
+    """Tests for metrics recorded by NerveEngine."""
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_reports_commands_events_and_gauges(self):
+        transport = RecordingTransport()
+        engine = build_nerve_engine(event_sink=transport)
+        transport.traffic.received(100)
+
+        await engine.execute(Command(CommandType.PING))
+        await engine.execute(Command(CommandType.GET_NODE, {"node_id": "missing"}))
+        await engine.event_sink.emit(Event(type=EventType.NODE_READY))
+
+        result = await engine.execute(Command(CommandType.GET_METRICS))
+
+        assert result.success
+        commands = result.data["commands"]
+        assert commands["PING"]["count"] == 1
+        assert commands["GET_NODE"]["errors"] == 1
+        assert result.data["events"] == {"NODE_READY": 1}
+        assert len(transport.events) == 1
+        gauges = result.data["gauges"]
+        assert gauges["transport_bytes_in_total"] == 100
+        assert gauges["sessions"] == 1
+        assert gauges["graphs_running"] == 0
+        assert "wezterm_poll_ticks_total" in gauges
+        assert "nerve_command_duration_seconds" in render_prometheus(result.data)
@@ -0,0 +1,248 @@
+"""Tests for NodePool and its use by CREATE_NODE."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from nerve.core.nodes import NodeState
+from nerve.server.engine import build_nerve_engine
+from nerve.server.node_pool import NodePool, PoolTemplate
+from nerve.server.protocols import Command, CommandType
+
+
+class MockEventSink:
+    """Mock event sink for testing."""
+
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event):
+        self.events.append(event)
+
+
+def mock_create():
+    """Patchable create() returning a fresh mock node per call."""
+
+    async def create(id, session, **kwargs):
+        node = MagicMock()
+        node.id = id
+        node.session = session
+        node.state = NodeState.READY
+        node.persistent = True
+        node.backend.is_running = True
+        node.stop = AsyncMock()
+        session.nodes[id] = node
+        return node
+
+    return AsyncMock(side_effect=create)
+
+
+async def settle(pool: NodePool) -> None:
+    """Wait until no template is warming."""
+    for _ in range(100):
+        if all(t["warming"] == 0 for t in pool.stats["templates"].values()):
+            return
+        await asyncio.sleep(0.01)
+
+
+def pty_stats(pool: NodePool) -> dict:
+    return pool.stats["templates"]["pty:bash"]
+
+
+class TestPoolTemplate:
+    """Tests for PoolTemplate parsing."""
+
+    def test_parse(self):
+        template = PoolTemplate.parse("claude-wezterm:2:claude --dangerously-skip-permissions")
+
+        assert template.backend == "claude-wezterm"
+        assert template.size == 2
+        assert template.command == "claude --dangerously-skip-permissions"
+
+    @pytest.mark.parametrize("spec", ["pty:bash", "pty:x:bash", "pty:1:", "bash:1:ls"])
+    def test_parse_invalid(self, spec):
+        with pytest.raises(ValueError):
+            PoolTemplate.parse(spec)
+
+
+class TestNodePool:
+    """Tests for warm-up, claiming and refill."""
+
+    @pytest.mark.asyncio
+    async def test_start_fills_templates(self):
+        pool = NodePool([PoolTemplate("pty", "bash", size=2)])
+
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()) as create:
+            await pool.start()
+            await settle(pool)
+
+        assert create.await_count == 2
+        assert create.await_args.kwargs["history"] is False
+        assert pty_stats(pool)["ready"] == 2
+        assert pty_stats(pool)["cold_start_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_claim_rebinds_and_refills(self):
+        pool = NodePool([PoolTemplate("pty", "bash", size=1)])
+        session = MagicMock()
+
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()) as create:
+            await pool.start()
+            await settle(pool)
+
+            node = await pool.claim("pty", ["bash"], None, "shell", session, history=True)
+            await settle(pool)
+
+        node.rebind.assert_called_once_with(
+            "shell", session, history=True, ready_timeout=None, response_timeout=None
+        )
+        assert create.await_count == 2  # Initial fill + refill
+        stats = pty_stats(pool)
+        assert stats["claims"] == 1
+        assert stats["ready"] == 1
+        assert stats["claim_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_claim_without_match_or_ready_node(self):
+        pool = NodePool([PoolTemplate("pty", "bash", size=1)])
+
+        assert await pool.claim("pty", "zsh", None, "shell", MagicMock()) is None
+        assert await pool.claim("pty", "bash", "/tmp", "shell", MagicMock()) is None
+        # Matching, but the pool was never started
+        assert await pool.claim("pty", "bash", None, "shell", MagicMock()) is None
+        assert pty_stats(pool)["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dead_node_is_discarded(self):
+        pool = NodePool([PoolTemplate("pty", "bash", size=1)])
+
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()):
+            await pool.start()
+            await settle(pool)
+            pool._states[("pty", "bash", None)].ready[0].backend.is_running = False
+
+            assert await pool.claim("pty", "bash", None, "shell", MagicMock()) is None
+            await settle(pool)
+
+        assert pty_stats(pool)["misses"] == 1
+        assert pty_stats(pool)["ready"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_rebind_returns_node_to_pool(self):
+        pool = NodePool([PoolTemplate("pty", "bash", size=1)])
+
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()):
+            await pool.start()
+            await settle(pool)
+            pool._states[("pty", "bash", None)].ready[0].rebind.side_effect = ValueError("taken")
+
+            with pytest.raises(ValueError, match="taken"):
+                await pool.claim("pty", "bash", None, "shell", MagicMock())
+
+        assert pty_stats(pool)["ready"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_stops_unclaimed_nodes(self):
+        pool = NodePool([PoolTemplate("pty", "bash", size=2)])
+
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()):
+            await pool.start()
+            await settle(pool)
+            nodes = list(pool._states[("pty", "bash", None)].ready)
+
+            await pool.stop()
+
+        for node in nodes:
+            node.stop.assert_awaited_once()
+        assert pty_stats(pool)["ready"] == 0
+
+
+class TestCreateNodeWithPool:
+    """Tests for CREATE_NODE claiming from the pool."""
+
+    @pytest.fixture
+    def pool(self):
+        return NodePool(
+            [
+                PoolTemplate("pty", "bash", size=1),
+                PoolTemplate("claude-wezterm", "claude", size=1),
+            ]
+        )
+
+    @pytest.fixture
+    def engine(self, pool):
+        return build_nerve_engine(event_sink=MockEventSink(), node_pool=pool)
+
+    @pytest.mark.asyncio
+    async def test_matching_request_claims_pooled_node(self, engine, pool):
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()) as create:
+            await pool.start()
+            await settle(pool)
+            pooled = pool._states[("pty", "bash", None)].ready[0]
+
+            result = await engine.execute(
+                Command(
+                    type=CommandType.CREATE_NODE,
+                    params={"node_id": "shell", "backend": "pty", "command": "bash"},
+                )
+            )
+            await settle(pool)
+
+        assert result.success
+        pooled.rebind.assert_called_once()
+        assert pooled.rebind.call_args.args[0] == "shell"
+        assert create.await_count == 2  # Warm-up + refill, no cold start
+
+    @pytest.mark.asyncio
+    async def test_other_cwd_starts_cold(self, engine, pool):
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()) as create:
+            await pool.start()
+            await settle(pool)
+
+            await engine.execute(
+                Command(
+                    type=CommandType.CREATE_NODE,
+                    params={"node_id": "shell", "backend": "pty", "command": "bash", "cwd": "/"},
+                )
+            )
+
+        assert create.await_args.kwargs["id"] == "shell"
+        assert pty_stats(pool)["claims"] == 0
+
+    @pytest.mark.asyncio
+    async def test_explicit_claude_session_is_not_pooled(self, pool):
+        from nerve.server.factories.node_factory import NodeFactory
+
+        factory = NodeFactory(pool=pool)
+        session = MagicMock()
+        with (
+            patch("nerve.core.nodes.terminal.ClaudeWezTermNode.create", mock_create()) as create,
+            patch.object(pool, "claim", AsyncMock()) as claim,
+        ):
+            await factory.create(
+                backend="claude-wezterm",
+                session=session,
+                node_id="claude",
+                command="claude",
+                claude_session_id="abc",
+            )
+
+        claim.assert_not_awaited()
+        create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_pool_records_cold_start(self, pool):
+        from nerve.server.factories.node_factory import NodeFactory
+
+        factory = NodeFactory(pool=pool)
+        with patch("nerve.core.nodes.terminal.PTYNode.create", mock_create()):
+            await factory.create(
+                backend="pty", session=MagicMock(), node_id="shell", command="bash"
+            )
+
+        stats = pty_stats(pool)
+        assert stats["misses"] == 1
+        assert stats["cold_start_ms"] is not None
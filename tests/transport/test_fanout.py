@@ -0,0 +1,320 @@
+"""Tests for per-client send queues and subscriptions (nerve.transport.fanout)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from nerve.server.protocols import Command, CommandType, Event, EventFilter, EventType
+from nerve.transport.fanout import (
+    ClientChannel,
+    OverflowPolicy,
+    broadcast,
+    event_message,
+    handle_subscription_command,
+)
+
+
+class SlowClient:
+    """Collects sent messages; blocks sends until released."""
+
+    def __init__(self, blocked: bool = False):
+        self.received: list[str] = []
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send(self, messages: list[str]) -> None:
+        await self.gate.wait()
+        self.received.extend(messages)
+
+
+def chunk(node_id: str, text: str) -> Event:
+    return Event(type=EventType.OUTPUT_CHUNK, node_id=node_id, data={"chunk": text})
+
+
+def offer(channel: ClientChannel[str], event: Event) -> bool:
+    return channel.offer(event, json.dumps(event_message(event)))
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestClientChannel:
+    """Tests for ClientChannel."""
+
+    @pytest.mark.asyncio
+    async def test_messages_are_sent_in_order(self):
+        client = SlowClient()
+        channel = ClientChannel(send=client.send, encode=json.dumps)
+        channel.start()
+
+        offer(channel, chunk("a", "1"))
+        channel.send(json.dumps({"type": "result"}))
+        offer(channel, chunk("a", "2"))
+        await settle()
+
+        assert [json.loads(m).get("data", {}).get("chunk") for m in client.received] == [
+            "1",
+            None,
+            "2",
+        ]
+        assert channel.stats["sent"] == 3
+        channel.close()
+
+    @pytest.mark.asyncio
+    async def test_offer_does_not_wait_for_slow_client(self):
+        slow = SlowClient(blocked=True)
+        fast = SlowClient()
+        channels = [
+            ClientChannel(send=slow.send, encode=json.dumps, name="slow"),
+            ClientChannel(send=fast.send, encode=json.dumps, name="fast"),
+        ]
+        for channel in channels:
+            channel.start()
+
+        for i in range(10):
+            for channel in channels:
+                offer(channel, chunk("a", str(i)))
+        await settle()
+
+        assert len(fast.received) == 10
+        assert slow.received == []
+        slow.gate.set()
+        await settle()
+        assert len(slow.received) == 10
+        for channel in channels:
+            channel.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_responses(self):
+        client = SlowClient(blocked=True)
+        channel = ClientChannel(send=client.send, encode=json.dumps, max_queue=3)
+
+        channel.send("response")
+        for i in range(5):
+            offer(channel, chunk("a", str(i)))
+
+        stats = channel.stats
+        assert stats["depth"] == 3
+        assert stats["dropped"] == 3
+        channel.start()
+        client.gate.set()
+        await settle()
+        assert client.received[0] == "response"
+        assert [json.loads(m)["data"]["chunk"] for m in client.received[1:]] == ["3", "4"]
+        channel.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_merges_chunks_of_same_node(self):
+        client = SlowClient()
+        channel = ClientChannel(
+            send=client.send, encode=json.dumps, max_queue=2, policy=OverflowPolicy.COALESCE
+        )
+
+        offer(channel, chunk("a", "he"))
+        offer(channel, chunk("b", "x"))
+        offer(channel, chunk("a", "llo"))  # Full: merged into a's chunk
+        offer(channel, Event(type=EventType.NODE_READY, node_id="b"))  # Full: drops oldest
+
+        assert channel.stats["coalesced"] == 1
+        assert channel.stats["dropped"] == 1
+        channel.start()
+        await settle()
+        assert [json.loads(m)["event_type"] for m in client.received] == [
+            "OUTPUT_CHUNK",
+            "NODE_READY",
+        ]
+        assert json.loads(client.received[0])["data"]["chunk"] == "x"
+        channel.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_does_not_merge_past_other_events(self):
+        channel = ClientChannel(
+            send=SlowClient().send, encode=json.dumps, max_queue=2, policy=OverflowPolicy.COALESCE
+        )
+
+        offer(channel, chunk("a", "1"))
+        offer(channel, Event(type=EventType.NODE_READY, node_id="a"))
+        offer(channel, chunk("a", "2"))
+
+        assert channel.stats["coalesced"] == 0
+        assert channel.stats["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes_connection(self):
+        closed = []
+        channel = ClientChannel(
+            send=SlowClient(blocked=True).send,
+            encode=json.dumps,
+            max_queue=1,
+            policy=OverflowPolicy.DISCONNECT,
+            on_close=lambda: closed.append(True),
+        )
+
+        assert offer(channel, chunk("a", "1")) is True
+        assert offer(channel, chunk("a", "2")) is False
+
+        assert closed == [True]
+        assert channel.closed
+        assert channel.stats["depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_send_closes_channel(self):
+        closed = []
+
+        async def broken(messages):
+            raise ConnectionResetError
+
+        channel = ClientChannel(send=broken, encode=json.dumps, on_close=lambda: closed.append(1))
+        channel.start()
+        offer(channel, chunk("a", "1"))
+        await settle()
+
+        assert channel.closed
+        assert closed == [1]
+        assert offer(channel, chunk("a", "2")) is False
+
+
+class TestBroadcast:
+    """Tests for broadcast()."""
+
+    def test_encodes_once_per_encoder_and_skips_unwanted(self):
+        calls = []
+
+        def encode(message):
+            calls.append(message)
+            return json.dumps(message)
+
+        channels = [ClientChannel(send=SlowClient().send, encode=encode) for _ in range(3)]
+        channels.append(ClientChannel(send=SlowClient().send, encode=json.dumps))
+        channels[0].subscribe(EventFilter(node_ids=frozenset({"other"})))
+
+        assert broadcast(channels, chunk("a", "x")) == []
+
+        assert len(calls) == 1
+        assert [c.stats["depth"] for c in channels] == [0, 1, 1, 1]
+
+    def test_returns_closed_channels(self):
+        channel = ClientChannel(send=SlowClient().send, encode=json.dumps)
+        channel.close()
+
+        assert broadcast([channel], chunk("a", "x")) == [channel]
+
+
+class TestEventFilter:
+    """Tests for EventFilter."""
+
+    def test_empty_filter_matches_everything(self):
+        assert EventFilter().matches(chunk("a", "x"))
+        assert EventFilter().matches(Event(type=EventType.SERVER_STOPPED))
+
+    def test_all_restrictions_must_match(self):
+        event_filter = EventFilter(
+            event_types=frozenset({EventType.OUTPUT_CHUNK}),
+            node_ids=frozenset({"a"}),
+        )
+
+        assert event_filter.matches(chunk("a", "x"))
+        assert not event_filter.matches(chunk("b", "x"))
+        assert not event_filter.matches(Event(type=EventType.NODE_READY, node_id="a"))
+
+    def test_session_filter_excludes_events_without_session(self):
+        event_filter = EventFilter(session_ids=frozenset({"s1"}))
+
+        assert event_filter.matches(Event(type=EventType.NODE_READY, session_id="s1"))
+        assert not event_filter.matches(Event(type=EventType.NODE_READY, session_id="s2"))
+        assert not event_filter.matches(Event(type=EventType.SERVER_STOPPED))
+
+    def test_params_round_trip(self):
+        event_filter = EventFilter(
+            event_types=frozenset({EventType.NODE_READY, EventType.OUTPUT_CHUNK}),
+            session_ids=frozenset({"s1"}),
+        )
+
+        assert EventFilter.from_params(event_filter.to_params()) == event_filter
+
+    def test_unknown_event_type_raises(self):
+        with pytest.raises(ValueError, match="NOPE"):
+            EventFilter.from_params({"event_types": ["NOPE"]})
+
+
+class TestSubscriptions:
+    """Tests for per-client subscriptions."""
+
+    def test_unsubscribed_client_wants_everything(self):
+        channel = ClientChannel(send=SlowClient().send, encode=json.dumps)
+
+        assert channel.wants(chunk("a", "x"))
+        assert channel.wants(Event(type=EventType.SESSION_CREATED))
+
+    def test_wants_events_matching_any_subscription(self):
+        channel = ClientChannel(send=SlowClient().send, encode=json.dumps)
+        first = channel.subscribe(EventFilter(node_ids=frozenset({"a"})))
+        channel.subscribe(EventFilter(event_types=frozenset({EventType.NODE_DELETED})))
+
+        assert channel.wants(chunk("a", "x"))
+        assert channel.wants(Event(type=EventType.NODE_DELETED, node_id="b"))
+        assert not channel.wants(chunk("b", "x"))
+
+        assert channel.unsubscribe(first) is True
+        assert not channel.wants(chunk("a", "x"))
+        assert channel.unsubscribe(first) is False
+
+    def test_subscription_commands(self):
+        channel = ClientChannel(send=SlowClient().send, encode=json.dumps)
+
+        result = handle_subscription_command(
+            channel,
+            Command(
+                type=CommandType.SUBSCRIBE,
+                params={"event_types": ["OUTPUT_CHUNK"], "node_ids": ["a"]},
+                request_id="r1",
+            ),
+        )
+        assert result.success
+        assert result.request_id == "r1"
+        assert channel.stats["subscriptions"] == 1
+        assert not channel.wants(Event(type=EventType.NODE_READY, node_id="a"))
+
+        result = handle_subscription_command(
+            channel,
+            Command(
+                type=CommandType.UNSUBSCRIBE,
+                params={"subscription_id": result.data["subscription_id"]},
+            ),
+        )
+        assert result.data == {"unsubscribed": True}
+        assert channel.wants(Event(type=EventType.NODE_READY, node_id="a"))
+
+    def test_invalid_subscribe_fails(self):
+        channel = ClientChannel(send=SlowClient().send, encode=json.dumps)
+
+        result = handle_subscription_command(
+            channel, Command(type=CommandType.SUBSCRIBE, params={"event_types": ["NOPE"]})
+        )
+
+        assert not result.success
+        assert channel.stats["subscriptions"] == 0
+
+    @pytest.mark.parametrize(
+        "command_type, params",
+        [
+            (CommandType.SUBSCRIBE, ["OUTPUT_CHUNK"]),
+            (CommandType.SUBSCRIBE, {"node_ids": "abc"}),
+            (CommandType.SUBSCRIBE, {"node_ids": 1}),
+            (CommandType.SUBSCRIBE, {"session_ids": [1]}),
+            (CommandType.UNSUBSCRIBE, ["sub-1"]),
+        ],
+    )
+    def test_malformed_subscription_params_fail(self, command_type, params):
+        channel = ClientChannel(send=SlowClient().send, encode=json.dumps)
+
+        result = handle_subscription_command(channel, Command(type=command_type, params=params))
+
+        assert not result.success
+        assert channel.stats["subscriptions"] == 0
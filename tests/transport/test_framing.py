@@ -0,0 +1,177 @@
+"""Tests for socket wire formats (nerve.transport.framing)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from nerve.server.protocols import Command, CommandResult, CommandType
+from nerve.transport.fanout import TrafficCounter
+from nerve.transport.framing import (
+    CODECS,
+    COMPRESSORS,
+    JSON_LINES,
+    MessageDecodeError,
+    WireFormat,
+    accept_reply,
+    hello_message,
+    hello_reply,
+    negotiate,
+)
+from nerve.transport.unix_socket import UnixSocketClient, UnixSocketServer
+
+
+def read_back(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class EchoEngine:
+    """Engine stand-in returning the command's params."""
+
+    shutdown_requested = False
+
+    async def execute(self, command: Command) -> CommandResult:
+        return CommandResult(success=True, data=command.params, request_id=command.request_id)
+
+
+class TestWireFormat:
+    """Tests for WireFormat encoding."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec", list(CODECS))
+    async def test_round_trip(self, codec):
+        wire = WireFormat(codec=CODECS[codec], compressor=COMPRESSORS["deflate"])
+        messages = [{"type": "result", "data": {"buffer": "x" * 100_000}}, {"type": "event"}]
+
+        reader = read_back(b"".join(wire.encode(m) for m in messages))
+
+        assert [await wire.read(reader) for _ in messages] == messages
+        assert await wire.read(reader) is None
+
+    def test_large_bodies_are_compressed(self):
+        wire = WireFormat(codec=CODECS["json"], compressor=COMPRESSORS["deflate"])
+        small = wire.encode({"buffer": "x" * 10})
+        large = wire.encode({"buffer": "x" * 100_000})
+
+        assert small[4] == 0
+        assert large[4] == 1
+        assert len(large) < 1000
+
+    @pytest.mark.asyncio
+    async def test_json_lines_is_the_original_protocol(self):
+        assert JSON_LINES.encode({"type": "event"}) == b'{"type": "event"}\n'
+
+        reader = read_back(b"not json\n")
+        with pytest.raises(MessageDecodeError):
+            await JSON_LINES.read(reader)
+
+    @pytest.mark.asyncio
+    async def test_bad_frame_does_not_break_the_stream(self):
+        wire = WireFormat(codec=CODECS["json"])
+        bad = b"\x00\x00\x00\x03\x00{{{"
+
+        reader = read_back(bad + wire.encode({"ok": True}))
+
+        with pytest.raises(MessageDecodeError):
+            await wire.read(reader)
+        assert await wire.read(reader) == {"ok": True}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compressor", list(COMPRESSORS))
+    async def test_decompression_is_bounded(self, compressor):
+        wire = WireFormat(
+            codec=CODECS["json"], compressor=COMPRESSORS[compressor], max_size=64 * 1024
+        )
+        bomb = wire.encode({"buffer": "x" * 1_000_000})
+        assert len(bomb) < wire.max_size
+
+        reader = read_back(bomb + wire.encode({"ok": True}))
+
+        with pytest.raises(MessageDecodeError, match="exceeds"):
+            await wire.read(reader)
+        assert await wire.read(reader) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_read_counts_wire_bytes(self):
+        wire = WireFormat(codec=CODECS["json"])
+        data = wire.encode({"ok": True}) + JSON_LINES.encode({"ok": True})
+        traffic = TrafficCounter()
+
+        reader = read_back(data)
+        await wire.read(reader, traffic)
+        await JSON_LINES.read(reader, traffic)
+        assert await JSON_LINES.read(reader, traffic) is None
+
+        assert (traffic.bytes_in, traffic.messages_in) == (len(data), 2)
+
+
+class TestNegotiation:
+    """Tests for the framing handshake."""
+
+    def test_negotiate_takes_preferred_common_choice(self):
+        wire = negotiate({"codecs": ["nope", "json"], "compression": ["deflate"]})
+
+        assert wire.name == "json+deflate"
+        assert accept_reply(hello_reply(wire)) == wire
+
+    def test_negotiate_without_compression(self):
+        assert negotiate({"codecs": ["json"]}).compressor is None
+
+    def test_accept_reply_rejects_unknown_codec(self):
+        with pytest.raises(ValueError):
+            accept_reply({"type": "hello", "codec": "nope", "compression": None})
+
+    def test_hello_offers_all_available(self):
+        hello = hello_message()
+
+        assert hello["codecs"] == list(CODECS)
+        assert "json" in hello["codecs"]
+
+
+class TestSocketFraming:
+    """End-to-end negotiation over a Unix socket."""
+
+    async def round_trip(self, server_framing: bool, client_framing: bool) -> tuple[str, dict]:
+        path = os.path.join(tempfile.mkdtemp(), "nerve.sock")
+        server = UnixSocketServer(path, binary_framing=server_framing)
+        serving = asyncio.create_task(server.serve(EchoEngine()))
+        while not os.path.exists(path):
+            await asyncio.sleep(0.01)
+
+        client = UnixSocketClient(path, binary_framing=client_framing)
+        await client.connect()
+        try:
+            params = {"buffer": "line\n" * 20_000}
+            result = await client.send_command(Command(type=CommandType.PING, params=params))
+            return client._wire.name, result.data or {}
+        finally:
+            await client.disconnect()
+            await server.stop()
+            serving.cancel()
+
+    @pytest.mark.asyncio
+    async def test_framed_connection(self):
+        name, data = await self.round_trip(server_framing=True, client_framing=True)
+
+        assert name != "json-lines"
+        assert data["buffer"] == "line\n" * 20_000
+
+    @pytest.mark.asyncio
+    async def test_server_declining_keeps_json_lines(self):
+        name, data = await self.round_trip(server_framing=False, client_framing=True)
+
+        assert name == "json-lines"
+        assert data["buffer"] == "line\n" * 20_000
+
+    @pytest.mark.asyncio
+    async def test_old_client_keeps_json_lines(self):
+        name, data = await self.round_trip(server_framing=True, client_framing=False)
+
+        assert name == "json-lines"
+        assert data["buffer"] == "line\n" * 20_000
@@ -0,0 +1,106 @@
+"""Tests for InProcessTransport and its event ring (nerve.transport.ring)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nerve.server.protocols import Event, EventFilter, EventType
+from nerve.transport.in_process import InProcessTransport
+from nerve.transport.ring import BroadcastRing
+
+
+def chunk(node_id: str, text: str) -> Event:
+    return Event(type=EventType.OUTPUT_CHUNK, node_id=node_id, data={"chunk": text})
+
+
+class TestBroadcastRing:
+    """Tests for BroadcastRing."""
+
+    def test_readers_read_at_their_own_pace(self):
+        ring = BroadcastRing[int](capacity=8)
+        fast, slow = ring.reader(), ring.reader()
+
+        for i in range(3):
+            ring.publish(i)
+
+        assert [fast.poll() for _ in range(3)] == [0, 1, 2]
+        assert fast.poll() is None
+        assert slow.poll() == 0
+        assert [r["pending"] for r in ring.stats["readers"]] == [0, 2]
+
+    def test_overrun_is_counted(self):
+        ring = BroadcastRing[int](capacity=4)
+        reader = ring.reader()
+
+        for i in range(10):
+            ring.publish(i)
+
+        assert [reader.poll() for _ in range(4)] == [6, 7, 8, 9]
+        assert reader.lagged == 6
+
+    def test_new_reader_starts_at_head(self):
+        ring = BroadcastRing[int](capacity=4)
+        ring.publish(1)
+
+        assert ring.reader().poll() is None
+        assert ring.reader(from_start=True).poll() == 1
+
+    @pytest.mark.asyncio
+    async def test_waiting_readers_are_woken(self):
+        ring = BroadcastRing[int]()
+        readers = [ring.reader() for _ in range(3)]
+        waits = [asyncio.create_task(r.next()) for r in readers]
+        await asyncio.sleep(0)
+
+        # A cancelled waiter must not take the others down with it
+        waits[0].cancel()
+        ring.publish(42)
+
+        assert await asyncio.gather(*waits[1:]) == [42, 42]
+        assert await readers[0].next() == 42
+
+
+class TestInProcessTransport:
+    """Tests for InProcessTransport events."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_filtered_per_subscriber(self):
+        transport = InProcessTransport()
+        everything = transport.events()
+        only_a = transport.events(EventFilter(node_ids=frozenset({"a"})))
+        first = asyncio.create_task(anext(everything))
+        first_a = asyncio.create_task(anext(only_a))
+        await asyncio.sleep(0)
+
+        await transport.emit(chunk("b", "1"))
+        await transport.emit(chunk("a", "2"))
+
+        assert (await first).node_id == "b"
+        assert (await first_a).node_id == "a"
+        await everything.aclose()
+        await only_a.aclose()
+        assert transport.event_stats["readers"] == [
+            {"name": "next_event", "pending": 2, "lagged": 0}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_skips_oldest_events(self):
+        transport = InProcessTransport(ring_capacity=4)
+
+        for i in range(10):
+            await transport.emit(chunk("a", str(i)))
+
+        assert (await transport.next_event()).data["chunk"] == "6"
+        assert transport.event_stats["readers"][0]["lagged"] == 6
+
+    @pytest.mark.asyncio
+    async def test_next_event_and_clear_events(self):
+        transport = InProcessTransport()
+        await transport.emit(chunk("a", "1"))
+        await transport.emit(chunk("a", "2"))
+
+        assert (await transport.next_event(timeout=1)).data["chunk"] == "1"
+        transport.clear_events()
+        assert await transport.next_event(timeout=0.01) is None
@@ -0,0 +1,135 @@
+"""Tests for the socket client pool (nerve.transport.pool)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from nerve.server.protocols import (
+    Command,
+    CommandResult,
+    CommandType,
+    Event,
+    EventFilter,
+    EventType,
+)
+from nerve.transport.pool import ClientPool
+from nerve.transport.unix_socket import UnixSocketServer
+
+
+class GatedEngine:
+    """Engine stand-in; PING waits for the gate, other commands echo params."""
+
+    shutdown_requested = False
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+
+    async def execute(self, command: Command) -> CommandResult:
+        if command.type is CommandType.PING:
+            await self.gate.wait()
+        return CommandResult(success=True, data=command.params, request_id=command.request_id)
+
+
+@asynccontextmanager
+async def serving(size: int) -> AsyncIterator[tuple[UnixSocketServer, GatedEngine, ClientPool]]:
+    path = os.path.join(tempfile.mkdtemp(), "nerve.sock")
+    server = UnixSocketServer(path)
+    engine = GatedEngine()
+    task = asyncio.create_task(server.serve(engine))
+    while not os.path.exists(path):
+        await asyncio.sleep(0.01)
+
+    pool = ClientPool.unix(path, size=size, backoff_initial=0.01)
+    await pool.connect()
+    try:
+        yield server, engine, pool
+    finally:
+        await pool.disconnect()
+        await server.stop()
+        task.cancel()
+
+
+def drop(pool: ClientPool, index: int) -> None:
+    """Simulate a network failure on one pooled connection."""
+    pool._connections[index].client._writer.transport.abort()
+
+
+async def until(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+class TestClientPool:
+    """Tests for ClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_requests_go_to_least_busy_connection(self):
+        async with serving(size=3) as (_server, engine, pool):
+            pings = [
+                asyncio.create_task(pool.send_command(Command(CommandType.PING))) for _ in range(6)
+            ]
+            await until(lambda: pool.stats["in_flight"] == 6)
+
+            assert [c["in_flight"] for c in pool.stats["connections"]] == [2, 2, 2]
+            engine.gate.set()
+            assert all(r.success for r in await asyncio.gather(*pings))
+            assert pool.stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_fails_its_requests_and_reconnects(self):
+        async with serving(size=2) as (_server, _engine, pool):
+            ping = asyncio.create_task(pool.send_command(Command(CommandType.PING)))
+            await until(lambda: pool.stats["in_flight"] == 1)
+
+            drop(pool, 0)
+
+            with pytest.raises(ConnectionError):
+                await ping
+            await until(lambda: pool.stats["connected"] == 2)
+            stats = pool.stats["connections"][0]
+            assert stats["failed"] == 1
+            assert stats["reconnects"] == 1
+            result = await pool.send_command(Command(CommandType.LIST_NODES, {"ok": True}))
+            assert result.data == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_requests_wait_for_a_connection(self):
+        async with serving(size=1) as (server, _engine, pool):
+            # Make reconnects fail until the socket is back
+            os.rename(server.socket_path, server.socket_path + ".away")
+            drop(pool, 0)
+            await until(lambda: pool.stats["connected"] == 0)
+
+            request = asyncio.create_task(
+                pool.send_command(Command(CommandType.LIST_NODES), timeout=2)
+            )
+            await asyncio.sleep(0.05)
+            assert not request.done()
+            os.rename(server.socket_path + ".away", server.socket_path)
+
+            assert (await request).success
+            assert pool.stats["connections"][0]["reconnects"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_survive_reconnect(self):
+        async with serving(size=2) as (server, _engine, pool):
+            await pool.subscribe(EventFilter(node_ids=frozenset({"a"})))
+            drop(pool, 0)
+            await until(lambda: pool.stats["connections"][0]["reconnects"] == 1)
+            await until(lambda: len(server.client_stats) == 2)
+
+            # The event connection's filter was replayed; the other one wants nothing
+            assert sorted(c["subscriptions"] for c in server.client_stats) == [1, 1]
+            events = pool.events()
+            await server.emit(Event(type=EventType.NODE_READY, node_id="b"))
+            await server.emit(Event(type=EventType.NODE_READY, node_id="a"))
+
+            event = await asyncio.wait_for(anext(events), timeout=2)
+            assert event.node_id == "a"
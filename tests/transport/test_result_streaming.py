@@ -0,0 +1,163 @@
+"""Tests for streamed command results over the socket transports."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from nerve.server.protocols import Command, CommandResult, CommandType
+from nerve.transport.fanout import STREAM_WINDOW, ClientChannel, send_result
+from nerve.transport.in_process import InProcessTransport
+from nerve.transport.unix_socket import UnixSocketClient, UnixSocketServer
+
+
+async def numbered_parts(count: int, fail_at: int | None = None):
+    for i in range(count):
+        if i == fail_at:
+            raise OSError("disk gone")
+        yield {"n": i}
+
+
+class StreamingEngine:
+    """Engine stand-in: PING streams "count" parts, other commands echo params."""
+
+    shutdown_requested = False
+
+    async def execute(self, command: Command) -> CommandResult:
+        if command.type is CommandType.PING:
+            return CommandResult(
+                success=True,
+                data={"kind": "numbers"},
+                request_id=command.request_id,
+                parts=numbered_parts(command.params["count"], command.params.get("fail_at")),
+            )
+        return CommandResult(success=True, data=command.params, request_id=command.request_id)
+
+
+@asynccontextmanager
+async def connected_client() -> AsyncIterator[UnixSocketClient]:
+    path = os.path.join(tempfile.mkdtemp(), "nerve.sock")
+    server = UnixSocketServer(path)
+    serving = asyncio.create_task(server.serve(StreamingEngine()))
+    while not os.path.exists(path):
+        await asyncio.sleep(0.01)
+
+    client = UnixSocketClient(path)
+    await client.connect()
+    try:
+        yield client
+    finally:
+        await client.disconnect()
+        await server.stop()
+        serving.cancel()
+
+
+class TestSendResult:
+    """Tests for send_result() pacing."""
+
+    @pytest.mark.asyncio
+    async def test_parts_are_paced_to_the_client(self):
+        sent: list[list[str]] = []
+        gate = asyncio.Event()
+
+        async def slow_send(batch: list[str]) -> None:
+            await gate.wait()
+            sent.append(batch)
+
+        channel = ClientChannel(send=slow_send, encode=json.dumps)
+        channel.start()
+        result = CommandResult(success=True, request_id="r", parts=numbered_parts(100))
+        streaming = asyncio.create_task(send_result(channel, result))
+
+        await asyncio.sleep(0.01)
+        assert channel.stats["depth"] <= STREAM_WINDOW
+        assert not streaming.done()
+
+        gate.set()
+        await streaming
+        await asyncio.sleep(0.01)
+        messages = [json.loads(m) for batch in sent for m in batch]
+        assert len(messages) == 101
+        assert messages[-1]["data"] == {"parts": 100}
+        assert channel.stats["peak_depth"] <= STREAM_WINDOW + 1
+        channel.close()
+
+
+class TestSendCommandStream:
+    """End-to-end streamed results over a Unix socket."""
+
+    @pytest.mark.asyncio
+    async def test_parts_arrive_in_order(self):
+        async with connected_client() as client:
+            parts = [
+                part
+                async for part in client.send_command_stream(
+                    Command(type=CommandType.PING, params={"count": 50})
+                )
+            ]
+
+            assert parts[:-1] == [{"n": i} for i in range(50)]
+            assert parts[-1] == {"kind": "numbers", "parts": 50}
+
+    @pytest.mark.asyncio
+    async def test_failure_mid_stream_raises(self):
+        async with connected_client() as client:
+            received = []
+            with pytest.raises(RuntimeError, match="disk gone"):
+                async for part in client.send_command_stream(
+                    Command(type=CommandType.PING, params={"count": 10, "fail_at": 3})
+                ):
+                    received.append(part)
+
+            assert len(received) == 3
+
+    @pytest.mark.asyncio
+    async def test_unstreamed_result_is_one_part(self):
+        async with connected_client() as client:
+            parts = [
+                part
+                async for part in client.send_command_stream(
+                    Command(type=CommandType.GET_BUFFER, params={"buffer": "abc"})
+                )
+            ]
+
+            assert parts == [{"buffer": "abc"}]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_does_not_block_the_connection(self):
+        async with connected_client() as client:
+            stream = client.send_command_stream(
+                Command(type=CommandType.PING, params={"count": 1000})
+            )
+            async for _part in stream:
+                break
+            await stream.aclose()
+
+            result = await client.send_command(
+                Command(type=CommandType.GET_BUFFER, params={"ok": True}), timeout=5
+            )
+            assert result.data == {"ok": True}
+
+
+class TestInProcessSendCommandStream:
+    """Streamed results over InProcessTransport."""
+
+    @pytest.mark.asyncio
+    async def test_final_data_follows_the_parts(self):
+        transport = InProcessTransport()
+        transport.bind(StreamingEngine())
+
+        parts = [
+            part
+            async for part in transport.send_command_stream(
+                Command(type=CommandType.PING, params={"count": 3})
+            )
+        ]
+
+        assert parts == [{"n": 0}, {"n": 1}, {"n": 2}, {"kind": "numbers", "parts": 3}]